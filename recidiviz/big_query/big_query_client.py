@@ -19,7 +19,7 @@ tables and views.
 """
 import abc
 import logging
-from typing import List, Optional, Iterator, Callable
+from typing import Any, Dict, List, Optional, Iterator, Callable
 
 from google.cloud import bigquery, exceptions
 
@@ -281,6 +281,18 @@ class BigQueryClient:
             A QueryJob which will contain the results once the query is complete.
         """
 
+    @abc.abstractmethod
+    def get_referenced_tables(self, query_str: str) -> List[bigquery.TableReference]:
+        """Returns the tables that the given query reads from, as parsed by BigQuery in a dry run of the query. The
+        dry run does not read any data. Raises if the query is not valid.
+
+        Args:
+            query_str: The query to parse
+
+        Returns:
+            A list of references to the tables and views the query reads from.
+        """
+
     @abc.abstractmethod
     def paged_read_and_process(self,
                                query_job: bigquery.QueryJob,
@@ -424,6 +436,17 @@ class BigQueryClient:
             A QueryJob which will contain the results once the query is complete.
         """
 
+    @abc.abstractmethod
+    def stream_into_table(self, dataset_id: str, table_id: str, rows: List[Dict[str, Any]]) -> None:
+        """Inserts the given rows into an existing table using the streaming API. Rows are available to queries as soon
+        as this returns. Raises if any row could not be inserted.
+
+        Args:
+            dataset_id: The name of the dataset where the table lives.
+            table_id: The name of the table to insert into.
+            rows: The rows to insert, as dictionaries mapping column names to values.
+        """
+
     @abc.abstractmethod
     def delete_from_table_async(self, dataset_id: str, table_id: str, filter_clause: str) -> bigquery.QueryJob:
         """Deletes rows from the given table that match the filter clause.
@@ -707,6 +730,17 @@ class BigQueryClientImpl(BigQueryClient):
             job_config=job_config,
         )
 
+    def get_referenced_tables(self, query_str: str) -> List[bigquery.TableReference]:
+        job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+
+        query_job = self.client.query(
+            query=query_str,
+            location=self.LOCATION,
+            job_config=job_config,
+        )
+
+        return list(query_job.referenced_tables)
+
     def paged_read_and_process(self,
                                query_job: bigquery.QueryJob,
                                page_size: int,
@@ -905,6 +939,14 @@ class BigQueryClientImpl(BigQueryClient):
                                                          destination_table_schema=destination_table_schema,
                                                          write_disposition=bigquery.WriteDisposition.WRITE_APPEND)
 
+    def stream_into_table(self, dataset_id: str, table_id: str, rows: List[Dict[str, Any]]) -> None:
+        table = self.get_table(self.dataset_ref_for_id(dataset_id), table_id)
+
+        logging.info("Streaming [%d] rows into table [%s.%s]", len(rows), dataset_id, table_id)
+        errors = self.client.insert_rows(table, rows)
+        if errors:
+            raise ValueError(f"Failed to stream rows into table [{dataset_id}.{table_id}]: {errors}")
+
     def delete_from_table_async(self, dataset_id: str, table_id: str, filter_clause: str) -> bigquery.QueryJob:
         if not filter_clause.startswith('WHERE'):
             raise ValueError("Cannot delete from a table without a valid filter clause starting with WHERE.")
@@ -0,0 +1,150 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""A directed acyclic graph of BigQueryViews, where each view depends on the other views that its view_query reads
+from."""
+import re
+from typing import Dict, List, Set, Tuple
+
+from recidiviz.big_query.big_query_view import BigQueryView
+
+# A (dataset_id, table_id) address of a view or of the table that a view is materialized into.
+TableAddress = Tuple[str, str]
+
+# Matches dotted references such as project.dataset.table or dataset.table, with or without backticks. Only the last
+# two parts of each reference are used, so that references with and without a project id are treated the same.
+_TABLE_REFERENCE_REGEX = re.compile(r'[\w-]+(?:\.[\w-]+)+')
+
+
+class BigQueryViewDag:
+    """The dependencies between a set of BigQueryViews.
+
+    A view is a parent of another view if the child's view_query references the parent view, or the table the parent
+    is materialized into, as {dataset}.{table}. References to tables or views that are not in the set are ignored.
+    Raises a ValueError if the views do not form a DAG.
+    """
+
+    def __init__(self, views: List[BigQueryView]):
+        self._views: Dict[TableAddress, BigQueryView] = {}
+        view_by_table_address: Dict[TableAddress, TableAddress] = {}
+        for view in views:
+            view_address = (view.dataset_id, view.view_id)
+            self._views[view_address] = view
+            view_by_table_address[view_address] = view_address
+            if view.materialized_view_table_id:
+                view_by_table_address[(view.dataset_id, view.materialized_view_table_id)] = view_address
+
+        self._parents: Dict[TableAddress, Set[TableAddress]] = {address: set() for address in self._views}
+        self._children: Dict[TableAddress, Set[TableAddress]] = {address: set() for address in self._views}
+        for address, view in self._views.items():
+            for reference_address in referenced_table_addresses(view.view_query):
+                parent_address = view_by_table_address.get(reference_address)
+                if parent_address is None or parent_address == address:
+                    continue
+                self._parents[address].add(parent_address)
+                self._children[parent_address].add(address)
+
+        self._waves = self._build_waves()
+
+    def _build_waves(self) -> List[List[TableAddress]]:
+        """Groups the views into waves, where each view is in the wave after the latest wave of any of its parents."""
+        remaining_parent_counts = {address: len(parents) for address, parents in self._parents.items()}
+        wave = sorted(address for address, count in remaining_parent_counts.items() if count == 0)
+
+        waves = []
+        while wave:
+            waves.append(wave)
+            next_wave = []
+            for address in wave:
+                for child_address in self._children[address]:
+                    remaining_parent_counts[child_address] -= 1
+                    if remaining_parent_counts[child_address] == 0:
+                        next_wave.append(child_address)
+            wave = sorted(next_wave)
+
+        cycle_addresses = sorted(address for address, count in remaining_parent_counts.items() if count > 0)
+        if cycle_addresses:
+            raise ValueError(f'Found a dependency cycle among views: '
+                             f'{[_address_str(address) for address in cycle_addresses]}')
+
+        return waves
+
+    @property
+    def waves(self) -> List[List[BigQueryView]]:
+        """The views in topological waves. Every parent of a view is in an earlier wave than the view itself, so the
+        views in each wave can be updated in parallel once all earlier waves are done."""
+        return [[self._views[address] for address in wave] for wave in self._waves]
+
+    def parents(self, view: BigQueryView) -> List[BigQueryView]:
+        """Returns the views that the given |view| reads from."""
+        return [self._views[address] for address in sorted(self._parents[(view.dataset_id, view.view_id)])]
+
+    def descendants(self, view: BigQueryView) -> List[BigQueryView]:
+        """Returns every view that reads from the given |view|, directly or through other views."""
+        descendant_addresses: Set[TableAddress] = set()
+        stack = [(view.dataset_id, view.view_id)]
+        while stack:
+            for child_address in self._children[stack.pop()]:
+                if child_address not in descendant_addresses:
+                    descendant_addresses.add(child_address)
+                    stack.append(child_address)
+
+        return [self._views[address] for address in sorted(descendant_addresses)]
+
+    def critical_path(self) -> List[BigQueryView]:
+        """Returns the longest chain of views where each view reads from the one before it. Since the views in a chain
+        must be updated one after another, this bounds how quickly all views can be updated."""
+        longest_path_to: Dict[TableAddress, List[TableAddress]] = {}
+        for wave in self._waves:
+            for address in wave:
+                longest_parent_path: List[TableAddress] = max(
+                    (longest_path_to[parent_address] for parent_address in sorted(self._parents[address])),
+                    key=len, default=[])
+                longest_path_to[address] = longest_parent_path + [address]
+
+        critical_path = max(longest_path_to.values(), key=len, default=[])
+        return [self._views[address] for address in critical_path]
+
+    def describe(self) -> str:
+        """Returns a human-readable description of the DAG, listing the views in each wave with their parents,
+        followed by the critical path."""
+        lines = []
+        for wave_index, wave in enumerate(self._waves):
+            lines.append(f'Wave {wave_index} ({len(wave)} views):')
+            for address in wave:
+                view_description = _address_str(address)
+                if self._views[address].materialized_view_table_id:
+                    view_description += ' [materialized]'
+                parents = sorted(self._parents[address])
+                if parents:
+                    view_description += f' <- {", ".join(_address_str(parent) for parent in parents)}'
+                lines.append(f'    {view_description}')
+
+        critical_path = self.critical_path()
+        lines.append(f'Critical path ({len(critical_path)} views):')
+        lines.append(f'    {" -> ".join(_address_str((view.dataset_id, view.view_id)) for view in critical_path)}')
+
+        return '\n'.join(lines)
+
+
+def referenced_table_addresses(query: str) -> Set[TableAddress]:
+    """Returns the (dataset_id, table_id) of every dotted reference in the |query|. This may include some addresses
+    that are not tables, such as table_alias.column references."""
+    return {tuple(reference.split('.')[-2:]) for reference in _TABLE_REFERENCE_REGEX.findall(query)}  # type: ignore
+
+
+def _address_str(address: TableAddress) -> str:
+    return '.'.join(address)
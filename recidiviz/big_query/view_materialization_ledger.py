@@ -0,0 +1,227 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""A ledger in BigQuery of the inputs each view was materialized from, used to skip materializing views whose inputs
+have not changed since they were last materialized.
+
+The fingerprint of a view is a hash of its view_query and the state of every table it reads from, as listed by a
+BigQuery dry run of the query: the last_modified time of each table, or, for each view it reads from, that view's query
+and the state of the tables that view reads from. Views whose results depend on more than their inputs, such as views
+that use CURRENT_DATE(), read from external tables or read from tables in other projects, have no fingerprint and are
+always materialized, as are views that read from them.
+
+The fingerprints recorded in the ledger are read once per process for each project, and kept up to date as views are
+materialized, so that updating views several times in one process does not query the ledger table again.
+"""
+import datetime
+import hashlib
+import re
+import threading
+from typing import Dict, Optional, Set
+
+from google.cloud import bigquery, exceptions
+
+from recidiviz.big_query.big_query_client import BigQueryClient
+from recidiviz.big_query.big_query_view import BigQueryView
+from recidiviz.big_query.big_query_view_dag import TableAddress
+
+VIEW_UPDATE_METADATA_DATASET = 'view_update_metadata'
+
+VIEW_MATERIALIZATION_LEDGER_TABLE = 'view_materialization_ledger'
+
+VIEW_MATERIALIZATION_LEDGER_SCHEMA = [
+    bigquery.SchemaField('dataset_id', 'STRING', mode='REQUIRED'),
+    bigquery.SchemaField('materialized_table_id', 'STRING', mode='REQUIRED'),
+    bigquery.SchemaField('fingerprint', 'STRING', mode='REQUIRED'),
+    bigquery.SchemaField('materialized_time', 'TIMESTAMP', mode='REQUIRED'),
+]
+
+# Functions whose results differ between runs of the same query over the same tables
+_NON_DETERMINISTIC_FUNCTION_REGEX = re.compile(
+    r'\b(CURRENT_DATE|CURRENT_DATETIME|CURRENT_TIME|CURRENT_TIMESTAMP|RAND|GENERATE_UUID)\b', re.IGNORECASE)
+
+# Wildcard table references, which may match tables that did not exist when the view was last materialized
+_WILDCARD_TABLE_REGEX = re.compile(r'\*`')
+
+
+class _RecordedFingerprints:
+    """The fingerprints recorded in the ledger of a single project, keyed by the address of the materialized table."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.fingerprints: Optional[Dict[TableAddress, str]] = None
+        self.ledger_table_exists = False
+
+
+# The recorded fingerprints for each project, shared by every ledger in this process
+_RECORDED_FINGERPRINTS_BY_PROJECT: Dict[str, _RecordedFingerprints] = {}
+_RECORDED_FINGERPRINTS_BY_PROJECT_LOCK = threading.Lock()
+
+
+def clear_recorded_fingerprints_cache() -> None:
+    """Forgets the fingerprints read from the ledger in this process, so that they are read again. Used in tests."""
+    with _RECORDED_FINGERPRINTS_BY_PROJECT_LOCK:
+        _RECORDED_FINGERPRINTS_BY_PROJECT.clear()
+
+
+class ViewMaterializationLedger:
+    """Records the fingerprint of each view when it is materialized, so that a view can be skipped if its fingerprint
+    still matches the one recorded for the last time it was materialized.
+
+    A ledger caches the state of the tables its views read from, so a new ledger should be created for each update of
+    the views. Its methods may be called from multiple threads at once.
+    """
+
+    def __init__(self, bq_client: BigQueryClient):
+        self._bq_client = bq_client
+
+        self._table_states: Dict[TableAddress, Optional[str]] = {}
+        self._table_states_lock = threading.Lock()
+
+        with _RECORDED_FINGERPRINTS_BY_PROJECT_LOCK:
+            self._recorded = _RECORDED_FINGERPRINTS_BY_PROJECT.setdefault(bq_client.project_id,
+                                                                         _RecordedFingerprints())
+
+    def _recorded_fingerprints(self) -> Dict[TableAddress, str]:
+        """Returns the most recently recorded fingerprint for each materialized table in the ledger, reading them from
+        the ledger table the first time they are needed in this process."""
+        with self._recorded.lock:
+            if self._recorded.fingerprints is None:
+                self._recorded.fingerprints = self._load_recorded_fingerprints()
+            return self._recorded.fingerprints
+
+    def _load_recorded_fingerprints(self) -> Dict[TableAddress, str]:
+        query = f"""
+            SELECT dataset_id, materialized_table_id,
+              ARRAY_AGG(fingerprint ORDER BY materialized_time DESC LIMIT 1)[OFFSET(0)] AS fingerprint
+            FROM `{self._bq_client.project_id}.{VIEW_UPDATE_METADATA_DATASET}.{VIEW_MATERIALIZATION_LEDGER_TABLE}`
+            GROUP BY dataset_id, materialized_table_id
+        """
+
+        try:
+            rows = self._bq_client.run_query_async(query).result()
+            fingerprints = {(row['dataset_id'], row['materialized_table_id']): row['fingerprint'] for row in rows}
+        except exceptions.NotFound:
+            # The ledger table is created when the first view is recorded
+            return {}
+
+        self._recorded.ledger_table_exists = True
+        return fingerprints
+
+    def _create_ledger_table_if_necessary(self) -> None:
+        with self._recorded.lock:
+            if self._recorded.ledger_table_exists:
+                return
+
+            dataset_ref = self._bq_client.dataset_ref_for_id(VIEW_UPDATE_METADATA_DATASET)
+            self._bq_client.create_dataset_if_necessary(dataset_ref)
+            if not self._bq_client.table_exists(dataset_ref, VIEW_MATERIALIZATION_LEDGER_TABLE):
+                self._bq_client.create_table_with_schema(VIEW_UPDATE_METADATA_DATASET,
+                                                         VIEW_MATERIALIZATION_LEDGER_TABLE,
+                                                         VIEW_MATERIALIZATION_LEDGER_SCHEMA)
+            self._recorded.ledger_table_exists = True
+
+    def fingerprint(self, view: BigQueryView) -> Optional[str]:
+        """Returns the fingerprint of the |view| given the current state of the tables it reads from, or None if the
+        results of the view may change without any change to the view or those tables."""
+        query_state = self._query_state(view.view_query, visited_addresses={(view.dataset_id, view.view_id)})
+        if query_state is None:
+            return None
+        return hashlib.sha256(query_state.encode()).hexdigest()
+
+    def is_up_to_date(self, view: BigQueryView, fingerprint: Optional[str]) -> bool:
+        """Returns True if the |view| was last materialized with the given |fingerprint| and its materialized table
+        still exists, meaning materializing it again would not change the table."""
+        if fingerprint is None or view.materialized_view_table_id is None:
+            return False
+
+        if self._recorded_fingerprints().get((view.dataset_id, view.materialized_view_table_id)) != fingerprint:
+            return False
+
+        return self._bq_client.table_exists(self._bq_client.dataset_ref_for_id(view.dataset_id),
+                                            view.materialized_view_table_id)
+
+    def record(self, view: BigQueryView, fingerprint: Optional[str]) -> None:
+        """Records that the |view| was just materialized with the given |fingerprint|."""
+        if fingerprint is None or view.materialized_view_table_id is None:
+            return
+
+        self._create_ledger_table_if_necessary()
+
+        self._bq_client.stream_into_table(VIEW_UPDATE_METADATA_DATASET, VIEW_MATERIALIZATION_LEDGER_TABLE, [{
+            'dataset_id': view.dataset_id,
+            'materialized_table_id': view.materialized_view_table_id,
+            'fingerprint': fingerprint,
+            'materialized_time': datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        }])
+
+        recorded_fingerprints = self._recorded_fingerprints()
+        with self._recorded.lock:
+            recorded_fingerprints[(view.dataset_id, view.materialized_view_table_id)] = fingerprint
+
+    def _query_state(self, query: str, visited_addresses: Set[TableAddress]) -> Optional[str]:
+        """Returns a string describing the |query| and the state of every table it reads from, or None if the results
+        of the query are not determined by those alone."""
+        if _NON_DETERMINISTIC_FUNCTION_REGEX.search(query) or _WILDCARD_TABLE_REGEX.search(query):
+            return None
+
+        try:
+            table_refs = self._bq_client.get_referenced_tables(query)
+        except exceptions.GoogleCloudError:
+            # The query does not parse, for example because a table it reads from does not exist yet
+            return None
+
+        if any(table_ref.project != self._bq_client.project_id for table_ref in table_refs):
+            return None
+
+        table_states = []
+        for address in sorted({(table_ref.dataset_id, table_ref.table_id) for table_ref in table_refs}):
+            if address in visited_addresses:
+                continue
+            table_state = self._table_state(address, visited_addresses | {address})
+            if table_state is None:
+                return None
+            table_states.append(f'{address[0]}.{address[1]}:{table_state}')
+
+        return '\n'.join([query, *table_states])
+
+    def _table_state(self, address: TableAddress, visited_addresses: Set[TableAddress]) -> Optional[str]:
+        """Returns a string describing the state of the table or view at |address|, or None if the contents of the table
+        may change without any change to its state."""
+        with self._table_states_lock:
+            if address in self._table_states:
+                return self._table_states[address]
+
+        dataset_id, table_id = address
+        try:
+            table = self._bq_client.get_table(self._bq_client.dataset_ref_for_id(dataset_id), table_id)
+        except exceptions.NotFound:
+            # The table was deleted since the query was parsed
+            return None
+
+        table_state: Optional[str]
+        if table.table_type == 'VIEW':
+            table_state = self._query_state(table.view_query, visited_addresses)
+        elif table.table_type == 'TABLE':
+            table_state = table.modified.isoformat() if table.modified else None
+        else:
+            # The last_modified time of external tables does not change when the data they read from changes
+            table_state = None
+
+        with self._table_states_lock:
+            self._table_states[address] = table_state
+
+        return table_state
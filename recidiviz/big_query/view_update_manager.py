@@ -21,17 +21,29 @@ This can be run on-demand whenever a set of views needs to be updated. Run local
         --project_id [PROJECT_ID]
         --views_to_update [state, county, validation, all]
         --materialized_views_only [True, False]
+        --dry_run [True, False]
+        --force_materialize [True, False]
+
+Views are created and materialized in parallel, in topological waves of the DAG formed by the views that each view's
+query reads from. If a view fails to update, the views that depend on it are skipped, and the first failure is raised
+once every other view has been updated. With --dry_run, the DAG and its critical path are printed instead.
+
+Views are only materialized if their query or the tables they read from have changed since they were last
+materialized, according to the ViewMaterializationLedger. With --force_materialize, every view is materialized.
 """
 import argparse
 import logging
 import sys
+from concurrent import futures
 from enum import Enum
-from typing import Dict, List, Sequence, Tuple, Optional
+from typing import Dict, List, Sequence, Set, Tuple, Optional
 
 from opencensus.stats import measure, view as opencensus_view, aggregation
 
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.big_query.big_query_view import BigQueryView, BigQueryViewBuilder
+from recidiviz.big_query.big_query_view_dag import BigQueryViewDag
+from recidiviz.big_query.view_materialization_ledger import ViewMaterializationLedger
 from recidiviz.calculator.query.county.view_config import VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE as COUNTY_VIEW_BUILDERS
 from recidiviz.calculator.query.state.view_config import VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE as STATE_VIEW_BUILDERS
 from recidiviz.utils import monitoring
@@ -69,26 +81,37 @@ VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE: Dict[BigQueryViewNamespace, Dict[str, Sequenc
 # When creating temporary datasets with prefixed names, set the default table expiration to 24 hours
 TEMP_DATASET_DEFAULT_TABLE_EXPIRATION_MS = 24 * 60 * 60 * 1000
 
+# The maximum number of views that are created or materialized at the same time
+MAX_VIEW_UPDATE_WORKERS = 8
+
 
 def create_dataset_and_update_all_views(dataset_overrides: Optional[Dict[str, str]] = None,
-                                        materialized_views_only: bool = False) -> None:
+                                        materialized_views_only: bool = False,
+                                        dry_run: bool = False,
+                                        force_materialize: bool = False) -> None:
     """Creates or updates all registered BigQuery views."""
     for namespace, builders in VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE.items():
         create_dataset_and_update_views_for_view_builders(namespace,
                                                           builders,
                                                           dataset_overrides=dataset_overrides,
-                                                          materialized_views_only=materialized_views_only)
+                                                          materialized_views_only=materialized_views_only,
+                                                          dry_run=dry_run,
+                                                          force_materialize=force_materialize)
 
 
 def create_dataset_and_update_views_for_view_builders(
         bq_view_namespace: BigQueryViewNamespace,
         view_builders_to_update: Dict[str, Sequence[BigQueryViewBuilder]],
         dataset_overrides: Optional[Dict[str, str]] = None,
-        materialized_views_only: bool = False) -> None:
+        materialized_views_only: bool = False,
+        dry_run: bool = False,
+        force_materialize: bool = False) -> None:
     """Converts the map of dataset_ids to BigQueryViewBuilders lists into a map of dataset_ids to BigQueryViews by
     building each of the views. Then, calls create_dataset_and_update_views with those views and their parent
     datasets. Will override the default dataset_ids for any dataset_id specified in dataset_overrides. If
-    materialized_views_only is True, will only update views that have a set materialized_view_table_id field."""
+    materialized_views_only is True, will only update views that have a set materialized_view_table_id field. If
+    dry_run is True, prints the DAG of the views that would be updated instead of updating them. If force_materialize is
+    True, materializes every view with a set materialized_view_table_id, even if its inputs are unchanged."""
     set_default_table_expiration_for_new_datasets = bool(dataset_overrides)
     if set_default_table_expiration_for_new_datasets:
         logging.info("Found non-empty dataset overrides. New datasets created in this process will have a "
@@ -101,7 +124,13 @@ def create_dataset_and_update_views_for_view_builders(
                 if not materialized_views_only or view.materialized_view_table_id is not None:
                     views_to_update.append(view)
 
-        _create_dataset_and_update_views(views_to_update, set_default_table_expiration_for_new_datasets)
+        if dry_run:
+            print(f'Views to update in namespace [{bq_view_namespace.value}]:')
+            print(BigQueryViewDag(views_to_update).describe())
+            return
+
+        _create_dataset_and_update_views(views_to_update, set_default_table_expiration_for_new_datasets,
+                                         force_materialize=force_materialize)
     except Exception as e:
         with monitoring.measurements({
                 monitoring.TagKey.CREATE_UPDATE_VIEWS_NAMESPACE: bq_view_namespace.value
@@ -111,13 +140,18 @@ def create_dataset_and_update_views_for_view_builders(
 
 
 def _create_dataset_and_update_views(views_to_update: List[BigQueryView],
-                                     set_temp_dataset_table_expiration: bool = False) -> None:
+                                     set_temp_dataset_table_expiration: bool = False,
+                                     force_materialize: bool = False) -> None:
     """Create and update the given views and their parent datasets.
 
-    For each dataset key in the given dictionary, creates the dataset if it does not exist, and creates or updates the
-    underlying views mapped to that dataset.
+    Creates each dataset of the given views if it does not exist. Then creates or updates the views in topological
+    waves of their dependency DAG, updating the views in each wave in parallel. If a view has a set
+    materialized_view_table_id field, materializes the view into a table before any of the views that depend on it
+    are updated, unless the view and the tables it reads from are unchanged since it was last materialized and
+    force_materialize is False.
 
-    If a view has a set materialized_view_table_id field, materializes the view into a table.
+    If a view fails to update, none of its descendants are updated, but all other views are. The first failure is
+    raised once every other view has been updated.
 
     Args:
         views_to_update: A list of view objects to be created or updated.
@@ -125,18 +159,54 @@ def _create_dataset_and_update_views(views_to_update: List[BigQueryView],
     new_dataset_table_expiration_ms = (TEMP_DATASET_DEFAULT_TABLE_EXPIRATION_MS
                                        if set_temp_dataset_table_expiration else None)
 
+    view_dag = BigQueryViewDag(views_to_update)
+
     bq_client = BigQueryClientImpl()
-    dataset_ids = set()
+    dataset_refs = {}
     for view in views_to_update:
-        views_dataset_ref = bq_client.dataset_ref_for_id(view.dataset_id)
-        if view.dataset_id not in dataset_ids:
+        if view.dataset_id not in dataset_refs:
+            views_dataset_ref = bq_client.dataset_ref_for_id(view.dataset_id)
             bq_client.create_dataset_if_necessary(views_dataset_ref, new_dataset_table_expiration_ms)
-            dataset_ids.add(view.dataset_id)
+            dataset_refs[view.dataset_id] = views_dataset_ref
+
+    materialization_ledger = ViewMaterializationLedger(bq_client)
 
-        bq_client.create_or_update_view(views_dataset_ref, view)
+    def update_view(view: BigQueryView) -> None:
+        bq_client.create_or_update_view(dataset_refs[view.dataset_id], view)
 
         if view.materialized_view_table_id:
+            fingerprint = materialization_ledger.fingerprint(view)
+            if not force_materialize and materialization_ledger.is_up_to_date(view, fingerprint):
+                logging.info('Skipping materialization of view [%s.%s], which is unchanged since it was last '
+                             'materialized', view.dataset_id, view.view_id)
+                return
+
             bq_client.materialize_view_to_table(view)
+            materialization_ledger.record(view, fingerprint)
+
+    first_exception: Optional[Exception] = None
+    skipped_view_addresses: Set[Tuple[str, str]] = set()
+    with futures.ThreadPoolExecutor(max_workers=MAX_VIEW_UPDATE_WORKERS) as executor:
+        for wave in view_dag.waves:
+            future_to_views = {executor.submit(update_view, view): view
+                               for view in wave if (view.dataset_id, view.view_id) not in skipped_view_addresses}
+
+            for future in futures.as_completed(future_to_views):
+                view = future_to_views[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    descendants = view_dag.descendants(view)
+                    logging.error('Failed to update view [%s.%s] due to error: %s. Skipping [%s] dependent views: %s',
+                                  view.dataset_id, view.view_id, e, len(descendants),
+                                  [f'{descendant.dataset_id}.{descendant.view_id}' for descendant in descendants])
+                    skipped_view_addresses.update((descendant.dataset_id, descendant.view_id)
+                                                  for descendant in descendants)
+                    if first_exception is None:
+                        first_exception = e
+
+    if first_exception is not None:
+        raise first_exception
 
 
 def parse_arguments(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
@@ -160,6 +230,16 @@ def parse_arguments(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
                         type=str_to_bool,
                         default=False)
 
+    parser.add_argument('--dry_run',
+                        dest='dry_run',
+                        type=str_to_bool,
+                        default=False)
+
+    parser.add_argument('--force_materialize',
+                        dest='force_materialize',
+                        type=str_to_bool,
+                        default=False)
+
     return parser.parse_known_args(argv)
 
 
@@ -172,7 +252,9 @@ if __name__ == '__main__':
 
     with local_project_id_override(known_args.project_id):
         if known_args.views_to_update == 'all':
-            create_dataset_and_update_all_views(materialized_views_only=known_args.materialized_views_only)
+            create_dataset_and_update_all_views(materialized_views_only=known_args.materialized_views_only,
+                                                dry_run=known_args.dry_run,
+                                                force_materialize=known_args.force_materialize)
         else:
             view_namespace_ = BigQueryViewNamespace(known_args.views_to_update)
             view_builders_ = VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE[view_namespace_]
@@ -180,4 +262,6 @@ if __name__ == '__main__':
                 bq_view_namespace=view_namespace_,
                 view_builders_to_update=view_builders_,
                 materialized_views_only=known_args.materialized_views_only,
+                dry_run=known_args.dry_run,
+                force_materialize=known_args.force_materialize,
             )
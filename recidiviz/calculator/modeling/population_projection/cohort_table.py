@@ -16,63 +16,135 @@
 # =============================================================================
 """Encapsulate the population data per cohort and time step"""
 
+from typing import Union
+
+import numpy as np
 import pandas as pd
 
 
 class CohortTable:
-    """Store population counts for one cohort of people that enter one category in the same year"""
+    """Store population counts for one cohort of people that enter one category in the same year
 
-    def __init__(self, starting_ts: int, transition_table_max_length: int):
-        self.cohort_df = pd.DataFrame(dtype=float, index=range(starting_ts - transition_table_max_length, starting_ts))
+    Counts are kept in a cohort x time step NumPy array that is allocated ahead of the simulation and grown
+    geometrically, so that each time step only writes its own column instead of copying the whole table.
+    """
 
-        self.retired_cohort_df = pd.DataFrame()
+    # Number of time steps to allocate room for up front, before the table is first grown
+    INITIAL_TS_CAPACITY = 64
 
-    def get_latest_population(self) -> pd.Series:
-        if self.cohort_df.empty:
-            return pd.Series({start_ts: 0 for start_ts in self.cohort_df.index})
+    def __init__(self, starting_ts: int, transition_table_max_length: int):
+        # start ts of the cohort in the first row, and the ts of the first column
+        self.first_cohort_ts = starting_ts - transition_table_max_length
+        self.starting_ts = starting_ts
+
+        # number of rows (cohorts) and columns (time steps) of `self._populations` that are filled
+        self.num_cohorts = transition_table_max_length
+        self.num_ts = 0
+
+        self._populations = np.zeros((transition_table_max_length + self.INITIAL_TS_CAPACITY,
+                                      self.INITIAL_TS_CAPACITY))
+
+    @property
+    def cohort_df(self) -> pd.DataFrame:
+        """The population counts as a DataFrame indexed by cohort start ts, with one column per ts"""
+        return pd.DataFrame(self._populations[:self.num_cohorts, :self.num_ts].copy(),
+                            index=self._get_cohort_index(), columns=self._get_ts_index())
+
+    def _get_cohort_index(self) -> pd.Index:
+        return pd.Index(np.arange(self.first_cohort_ts, self.first_cohort_ts + self.num_cohorts))
+
+    def _get_ts_index(self) -> pd.Index:
+        return pd.Index(np.arange(self.starting_ts, self.starting_ts + self.num_ts))
+
+    def _reserve(self, num_cohorts: int, num_ts: int) -> None:
+        """Grow the populations array, if necessary, so it has room for the given number of cohorts and ts"""
+        rows, columns = self._populations.shape
+        if num_cohorts <= rows and num_ts <= columns:
+            return
+        if num_cohorts > rows:
+            rows = max(num_cohorts, 2 * rows)
+        if num_ts > columns:
+            columns = max(num_ts, 2 * columns)
+        populations = np.zeros((rows, columns))
+        populations[:self.num_cohorts, :self.num_ts] = self._populations[:self.num_cohorts, :self.num_ts]
+        self._populations = populations
+
+    def get_latest_population_array(self) -> np.ndarray:
+        """Return the population of each cohort at the end of the latest ts, ordered by cohort start ts"""
+        if self.num_ts == 0:
+            return np.zeros(self.num_cohorts)
+        return self._populations[:self.num_cohorts, self.num_ts - 1]
 
-        return self.cohort_df.iloc[:, -1]
+    def get_latest_population(self) -> pd.Series:
+        return pd.Series(self.get_latest_population_array().copy(), index=self._get_cohort_index())
 
     def get_per_ts_population(self) -> pd.Series:
-        return self.cohort_df.sum(axis=0)
+        return pd.Series(self._populations[:self.num_cohorts, :self.num_ts].sum(axis=0), index=self._get_ts_index())
+
+    def append_ts_end_count(self, cohort_sizes: Union[pd.Series, np.ndarray], projection_ts: int) -> None:
+        """Append the cohort sizes for the end of the projection ts
 
-    def append_ts_end_count(self, cohort_sizes: pd.Series, projection_ts: int) -> None:
-        """Append the cohort sizes for the end of the projection ts"""
-        latest_population = self.get_latest_population()
+        `cohort_sizes` can also be an array of sizes ordered by cohort start ts
+        """
+        if isinstance(cohort_sizes, pd.Series):
+            if not cohort_sizes.index.equals(self._get_cohort_index()):
+                raise ValueError("Cohort sizes must be given for exactly the cohorts in the table\n"
+                                 f"Expected: {self._get_cohort_index()}, Actual: {cohort_sizes.index}")
+            cohort_sizes = cohort_sizes.to_numpy()
+
+        latest_population = self.get_latest_population_array()
         if (cohort_sizes > latest_population).any():
             raise ValueError("Cannot append cohort data that is larger than the latest population\n"
                              f"Latest population: {latest_population}\n"
                              f"Attempting to append: {cohort_sizes}")
 
-        if projection_ts in self.cohort_df.columns:
+        if self.starting_ts <= projection_ts < self.starting_ts + self.num_ts:
             raise ValueError(f"Cannot overwrite cohort for time {projection_ts}")
+        if projection_ts != self.starting_ts + self.num_ts:
+            raise ValueError(f"Cannot append cohort data for time {projection_ts} out of order, the next time in the "
+                             f"CohortTable timeline is {self.starting_ts + self.num_ts}")
 
-        self.cohort_df[projection_ts] = cohort_sizes
+        self._reserve(self.num_cohorts, self.num_ts + 1)
+        self._populations[:self.num_cohorts, self.num_ts] = cohort_sizes
+        self.num_ts += 1
 
     def append_cohort(self, cohort_size: float, projection_ts: int) -> None:
         """Add a new cohort to the bottom of the cohort table"""
-        if projection_ts not in self.cohort_df.columns:
+        if not self.starting_ts <= projection_ts < self.starting_ts + self.num_ts:
             raise ValueError(f"Cannot append cohort with start time {projection_ts} outside of CohortTable timeline "
-                             f"{self.cohort_df.columns}")
-        if projection_ts in self.cohort_df.index:
+                             f"{self._get_ts_index()}")
+        if projection_ts < self.first_cohort_ts + self.num_cohorts:
             raise ValueError(f"Cannot overwrite cohort for time {projection_ts}")
-        self.cohort_df = \
-            self.cohort_df.append(pd.DataFrame({projection_ts: [cohort_size]}, index=[projection_ts])).fillna(0)
+        if projection_ts != self.first_cohort_ts + self.num_cohorts:
+            raise ValueError(f"Cannot append cohort with start time {projection_ts} out of order, the next cohort in "
+                             f"the CohortTable starts at {self.first_cohort_ts + self.num_cohorts}")
+
+        self._reserve(self.num_cohorts + 1, self.num_ts)
+        self._populations[self.num_cohorts, projection_ts - self.starting_ts] = cohort_size
+        self.num_cohorts += 1
 
     def scale_cohort_size(self, scalar: float) -> None:
         if scalar < 0:
             raise ValueError(f"Cannot scale cohort by a negative factor: {scalar}")
-        self.cohort_df *= scalar
+        self._populations[:self.num_cohorts, :self.num_ts] *= scalar
 
-    def get_cohort_timeline(self, cohort_start_year: int) -> pd.DataFrame:
+    def get_cohort_timeline(self, cohort_start_year: int) -> pd.Series:
         return self.cohort_df.loc[cohort_start_year]
 
-    def pop_cohorts(self):
+    def pop_cohorts(self) -> pd.DataFrame:
         """pop cohort_df for cross-simulation flow"""
         cohort_df = self.cohort_df
-        self.cohort_df = pd.DataFrame()
+        self._populations[:self.num_cohorts, :self.num_ts] = 0
         return cohort_df
 
     def ingest_cross_simulation_cohorts(self, cross_simulation_flows: pd.DataFrame):
         """ingest new cohort_df from cross-simulation flow"""
-        self.cohort_df = cross_simulation_flows
+        cohort_df = cross_simulation_flows.astype(float).groupby(level=0).sum()
+        cohort_df.columns = cohort_df.columns.astype(int)
+        if not set(cohort_df.index).issubset(self._get_cohort_index()) or \
+                not set(cohort_df.columns).issubset(self._get_ts_index()):
+            raise ValueError(f"Cannot ingest cohorts outside of the CohortTable cohorts {self._get_cohort_index()} "
+                             f"and timeline {self._get_ts_index()}")
+
+        self._populations[:self.num_cohorts, :self.num_ts] = \
+            cohort_df.reindex(index=self._get_cohort_index(), columns=self._get_ts_index(), fill_value=0).to_numpy()
@@ -16,7 +16,7 @@
 # =============================================================================
 """SparkCompartment that tracks cohorts internally to determine population size and outflows"""
 
-from typing import Dict
+from typing import Dict, List, Tuple
 import pandas as pd
 import numpy as np
 
@@ -42,8 +42,16 @@ class FullCompartment(SparkCompartment):
         # transition tables object from compartment out
         self.transition_tables = transition_tables
 
-        # Series containing compartment population at the end of each ts in the simulation
-        self.end_ts_populations = pd.Series(dtype=float)
+        # transition tables converted to arrays for the stepping kernel, keyed by ts relative to the policy ts
+        self._transition_arrays: Dict[int, Tuple[List[str], np.ndarray, np.ndarray]] = {}
+
+        # compartment population at the end of each ts in the simulation
+        self._end_ts_populations: Dict[int, float] = {}
+
+    @property
+    def end_ts_populations(self) -> pd.Series:
+        """Series containing compartment population at the end of each ts in the simulation"""
+        return pd.Series(self._end_ts_populations, dtype=float)
 
     def microsim_initialize(self):
         """populate cohort table with single starting cohort of microsim"""
@@ -52,42 +60,62 @@ class FullCompartment(SparkCompartment):
         self.ingest_incoming_cohort({self.tag: starting_size})
         self.prepare_for_next_step()
 
+    def _get_transition_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Return the outflows, the per-ts transition table as an array with one row per year in the compartment, and
+        the long sentence transitions as an array, for the `current_ts`. The array columns are in outflow order."""
+        # the per-ts table is the same for every ts before the policy ts, and for every ts at least max_sentence after
+        ts_since_policy = min(max(self.current_ts - self.policy_ts, -1), self.transition_tables.max_sentence)
+
+        if ts_since_policy not in self._transition_arrays:
+            per_ts_transitions, long_sentence_transitions = self.transition_tables.get_per_ts_transition_table(
+                self.current_ts, self.policy_ts)
+
+            outflows = list(dict.fromkeys([*long_sentence_transitions.columns, *per_ts_transitions.columns]))
+            per_ts_transitions = per_ts_transitions.reindex(index=range(1, len(per_ts_transitions) + 1),
+                                                            columns=outflows).fillna(0)
+            long_sentence_transitions = long_sentence_transitions.reindex(columns=outflows).fillna(0)
+
+            self._transition_arrays[ts_since_policy] = (outflows,
+                                                        per_ts_transitions.to_numpy(dtype=float),
+                                                        long_sentence_transitions.iloc[0].to_numpy(dtype=float))
+
+        return self._transition_arrays[ts_since_policy]
+
     def _generate_outflow_dict(self):
         """step forward all cohorts one time step and generate outflow dict"""
 
-        per_ts_transitions, long_sentence_transitions = self.transition_tables.get_per_ts_transition_table(
-            self.current_ts, self.policy_ts)
+        outflows, per_ts_transitions, long_sentence_transitions = self._get_transition_arrays()
 
-        latest_ts_pop = self.cohorts.get_latest_population()
+        latest_ts_pop = self.cohorts.get_latest_population_array()
 
-        # convert index from starting year to years in compartment
-        latest_ts_pop.index = self.current_ts - latest_ts_pop.index
+        # cohorts are ordered by start ts, so the number of years each has been in the compartment is decreasing
+        num_cohorts = self.cohorts.num_cohorts
+        max_years = self.current_ts - self.cohorts.first_cohort_ts
+        min_years = max_years - num_cohorts + 1
 
         # no cohort should start in cohort after current_ts
-        if any(latest_ts_pop.index <= 0):
+        if min_years <= 0 < num_cohorts:
             raise ValueError("Cohort cannot start after current time step\n"
                              f"Current time step: {self.current_ts}\n"
-                             f"Cohort start times: {self.current_ts - latest_ts_pop.index}")
-
-        latest_ts_pop_short = latest_ts_pop[latest_ts_pop.index <= len(per_ts_transitions)]
-        latest_ts_pop_long = pd.DataFrame(latest_ts_pop[latest_ts_pop.index > len(per_ts_transitions)])
-        if not latest_ts_pop_long.empty:
-            latest_ts_pop_long.columns = [0]
-
-        # broadcast latest cohort populations onto transition table
-        latest_ts_pop_short = per_ts_transitions.mul(latest_ts_pop_short, axis=0)
-
-        # dot latest long sentence cohort populations with long sentence probabilities
-        latest_ts_pop_long = latest_ts_pop_long.dot(long_sentence_transitions)
+                             f"Cohort start times: {self.cohorts.first_cohort_ts} to {self.current_ts - min_years}")
 
-        latest_ts_pop = latest_ts_pop_long.append(latest_ts_pop_short).fillna(0)
+        # cohorts that have been in the compartment longer than the per-ts transition table use the long sentence
+        # transitions, and come first
+        num_long = min(max(max_years - len(per_ts_transitions), 0), num_cohorts)
+        latest_ts_pop_long = latest_ts_pop[:num_long]
+        latest_ts_pop_short = latest_ts_pop[num_long:]
 
-        # convert index back to starting year from years in compartment
-        latest_ts_pop.index = self.current_ts - latest_ts_pop.index
+        # broadcast latest cohort populations onto the per-ts transition table rows for their years in the compartment
+        short_transitions = per_ts_transitions[min_years - 1:max_years - num_long][::-1]
+        short_outflows = latest_ts_pop_short[:, np.newaxis] * short_transitions
 
-        self.cohorts.append_ts_end_count(latest_ts_pop['remaining'].sort_index(), self.current_ts)
+        remaining = outflows.index('remaining')
+        self.cohorts.append_ts_end_count(
+            np.concatenate([latest_ts_pop_long * long_sentence_transitions[remaining], short_outflows[:, remaining]]),
+            self.current_ts)
 
-        outflow_dict = {outflow: latest_ts_pop.sum(axis=0)[outflow] for outflow in latest_ts_pop.columns
+        outflow_totals = latest_ts_pop_long.sum() * long_sentence_transitions + short_outflows.sum(axis=0)
+        outflow_dict = {outflow: outflow_totals[i] for i, outflow in enumerate(outflows)
                         if outflow not in ['death', 'remaining']}
         return outflow_dict
 
@@ -107,7 +135,7 @@ class FullCompartment(SparkCompartment):
         """Simulate one time step in the projection"""
         super().step_forward()
         outflow_dict = self._generate_outflow_dict()
-        self.outflows[self.current_ts] = pd.Series(outflow_dict, dtype=float)
+        self.record_outflows(outflow_dict)
 
         # if historical data available, use that instead
         if self.current_ts in self.outflows_data.columns and self.current_ts < self.policy_ts:
@@ -136,11 +164,10 @@ class FullCompartment(SparkCompartment):
         self.cohorts.append_cohort(self.incoming_cohorts, self.current_ts)
         self.incoming_cohorts = 0
 
-        if self.current_ts in self.end_ts_populations:
+        if self.current_ts in self._end_ts_populations:
             raise ValueError(f"Cannot prepare_for_next_step() if population already recorded for this time step \n"
                              f"time step {self.current_ts} already in end_ts_populations {self.end_ts_populations}")
-        self.end_ts_populations = \
-            self.end_ts_populations.append(pd.Series({self.current_ts: self.get_current_population()}))
+        self._end_ts_populations[self.current_ts] = self.get_current_population()
 
         super().prepare_for_next_step()
 
@@ -163,7 +190,7 @@ class FullCompartment(SparkCompartment):
         return self.cohorts.get_per_ts_population()
 
     def get_current_population(self):
-        return self.cohorts.get_latest_population().sum()
+        return self.cohorts.get_latest_population_array().sum()
 
     def get_cohort_df(self):
         return self.cohorts.pop_cohorts()
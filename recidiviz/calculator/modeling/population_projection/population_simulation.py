@@ -203,26 +203,37 @@ class PopulationSimulation:
                 simulation_obj.scale_total_populations()
 
     def step_forward(self, num_ts: int):
+        # Passing the cohorts through update_cohort_attributes() copies every cohort table, so skip it each ts unless
+        # it has been overridden to actually move cohorts between sub-simulations
+        cross_flow_cohorts = \
+            type(self).update_cohort_attributes is not PopulationSimulation.update_cohort_attributes
+
         for _ in range(num_ts):
             for simulation_obj in self.sub_simulations.values():
                 simulation_obj.step_forward()
 
-            cross_simulation_flows = pd.DataFrame(columns=['sub_group_id', 'compartment'])
-            for sub_group_id, simulation_obj in self.sub_simulations.items():
-                simulation_cohorts = simulation_obj.cross_flow()
-                simulation_cohorts['sub_group_id'] = sub_group_id
-                cross_simulation_flows = pd.concat([cross_simulation_flows, simulation_cohorts], sort=True)
+            if cross_flow_cohorts:
+                self._cross_flow()
+
+    def _cross_flow(self):
+        """Pass the cohorts of every sub-simulation through update_cohort_attributes() and back into the
+        sub-simulations they are assigned to"""
+        cross_simulation_flows = pd.DataFrame(columns=['sub_group_id', 'compartment'])
+        for sub_group_id, simulation_obj in self.sub_simulations.items():
+            simulation_cohorts = simulation_obj.cross_flow()
+            simulation_cohorts['sub_group_id'] = sub_group_id
+            cross_simulation_flows = pd.concat([cross_simulation_flows, simulation_cohorts], sort=True)
 
-            unassigned_cohorts = cross_simulation_flows[cross_simulation_flows.compartment.isnull()]
-            if len(unassigned_cohorts) > 0:
-                raise ValueError(f'cohorts passed up without compartment: {unassigned_cohorts}')
+        unassigned_cohorts = cross_simulation_flows[cross_simulation_flows.compartment.isnull()]
+        if len(unassigned_cohorts) > 0:
+            raise ValueError(f'cohorts passed up without compartment: {unassigned_cohorts}')
 
-            cross_simulation_flows = self.update_cohort_attributes(cross_simulation_flows)
+        cross_simulation_flows = self.update_cohort_attributes(cross_simulation_flows)
 
-            for sub_group_id, simulation_obj in self.sub_simulations.items():
-                sub_group_cohorts = cross_simulation_flows[cross_simulation_flows.sub_group_id
-                                                           == sub_group_id].drop('sub_group_id', axis=1)
-                simulation_obj.ingest_cross_simulation_cohorts(sub_group_cohorts)
+        for sub_group_id, simulation_obj in self.sub_simulations.items():
+            sub_group_cohorts = cross_simulation_flows[cross_simulation_flows.sub_group_id
+                                                       == sub_group_id].drop('sub_group_id', axis=1)
+            simulation_obj.ingest_cross_simulation_cohorts(sub_group_cohorts)
 
     @staticmethod
     def update_cohort_attributes(cross_simulation_flows):
@@ -46,7 +46,22 @@ class SparkCompartment(ABC):
 
         # validation features
         self.error = pd.DataFrame(0, index=outflows_data.index, columns=outflows_data.columns)
-        self.outflows = pd.DataFrame(index=outflows_data.index)
+
+        # outflow dicts recorded per ts, combined into the `outflows` DataFrame when it is read
+        self._outflows_per_ts: Dict[int, Dict[str, float]] = {}
+        self._outflows: Optional[pd.DataFrame] = None
+
+    @property
+    def outflows(self) -> pd.DataFrame:
+        """DataFrame of the modeled outflows to each compartment (rows) at each ts (columns)"""
+        if self._outflows is None:
+            self._outflows = pd.DataFrame(self._outflows_per_ts, index=self.outflows_data.index, dtype=float)
+        return self._outflows
+
+    def record_outflows(self, outflow_dict: Dict[str, float]):
+        """Record the modeled outflows for the `current_ts`"""
+        self._outflows_per_ts[self.current_ts] = outflow_dict
+        self._outflows = None
 
     def initialize_edges(self, edges: List):
         self.edges = edges
@@ -0,0 +1,88 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Runs the entity hydration pipeline, which reads each person-level state table once, builds one hydrated entity graph
+per person, and writes those graphs to files at the given --hydrated_entities_output path prefix. Calculation pipelines
+run with --hydrated_entities_input set to the same prefix load their root entities from those graphs. See
+recidiviz/tools/run_calculation_pipelines.py for details on how to run.
+"""
+import argparse
+from typing import List, Optional
+
+import apache_beam as beam
+from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
+
+from recidiviz.calculator.pipeline.utils.hydrated_entities_utils import WriteHydratedEntities
+from recidiviz.calculator.query.state.dataset_config import STATE_BASE_DATASET
+from recidiviz.persistence.database.schema.state import schema
+
+
+def get_arg_parser() -> argparse.ArgumentParser:
+    """Returns the parser for the command-line arguments for this pipeline."""
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--data_input',
+                        type=str,
+                        help='BigQuery dataset to query.',
+                        default=STATE_BASE_DATASET)
+
+    parser.add_argument('--state_code',
+                        dest='state_code',
+                        type=str,
+                        help='The state_code of the people whose entities should be written.')
+
+    parser.add_argument('--person_filter_ids', type=int, nargs='+',
+                        help='An optional list of DB person_id values. When present, the pipeline will only write '
+                             'the entities of these people.')
+
+    parser.add_argument('--hydrated_entities_output',
+                        type=str,
+                        help='The path prefix of the files to write, e.g. gs://bucket/hydrated_entities/US_XX/run.',
+                        required=True)
+
+    return parser
+
+
+def run(apache_beam_pipeline_options: PipelineOptions,
+        data_input: str,
+        state_code: Optional[str],
+        person_filter_ids: Optional[List[int]],
+        hydrated_entities_output: str):
+    """Runs the entity hydration pipeline."""
+
+    # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the WriteHydratedEntities
+    # transform tries to access attributes of relationship properties on the SQLAlchemy schema classes before they
+    # have been loaded. However, if *any* SQLAlchemy objects have been instantiated, then the relationship properties
+    # are loaded and their attributes can be successfully accessed.
+    _ = schema.StatePerson()
+
+    apache_beam_pipeline_options.view_as(SetupOptions).save_main_session = True
+
+    # Get pipeline job details
+    all_pipeline_options = apache_beam_pipeline_options.get_all_options()
+    project_id = all_pipeline_options['project']
+
+    input_dataset = project_id + '.' + data_input
+
+    person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
+
+    with beam.Pipeline(options=apache_beam_pipeline_options) as p:
+        _ = (p
+             | 'Write hydrated entities' >>
+             WriteHydratedEntities(dataset=input_dataset,
+                                   output_path_prefix=hydrated_entities_output,
+                                   unifying_id_field_filter_set=person_id_filter_set,
+                                   state_code=state_code))
@@ -41,12 +41,13 @@ from recidiviz.calculator.pipeline.incarceration.metrics import \
     IncarcerationReleaseMetric, IncarcerationPopulationMetric, IncarcerationMetricType
 from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict, \
     ImportTableAsKVTuples, ImportTable
+from recidiviz.calculator.pipeline.utils.entity_field_projection import EntityFieldProjection
 from recidiviz.calculator.pipeline.utils.entity_hydration_utils import SetSentencesOnSentenceGroup, \
     ConvertSentencesToStateSpecificType
 from recidiviz.calculator.pipeline.utils.event_utils import IdentifierEvent
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier, \
     select_all_by_person_query
-from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
+from recidiviz.calculator.pipeline.utils.hydrated_entities_utils import RootEntityLoader
 from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata, BuildPersonMetadata, \
     ExtractPersonEventsMetadata
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
@@ -59,6 +60,18 @@ from recidiviz.persistence.database.schema.state import schema
 from recidiviz.persistence.entity.state import entities
 from recidiviz.utils import environment
 
+# The fields of the root entities that are read by the calculations in this pipeline. Only the columns for these
+# fields (and the id and join columns) are read from BigQuery; all other fields of these entities are None. A field
+# must be added here before a calculation in this pipeline can read it.
+ENTITY_FIELD_PROJECTION = EntityFieldProjection({
+    entities.StatePerson: {'birthdate', 'gender'},
+    entities.StateSentenceGroup: {'external_id', 'status'},
+    entities.StateIncarcerationSentence: {'external_id', 'status', 'incarceration_type', 'start_date',
+                                          'completion_date'},
+    entities.StateSupervisionSentence: {'external_id', 'status', 'supervision_type', 'supervision_type_raw_text',
+                                        'start_date', 'completion_date'},
+})
+
 # Cached job_id value
 _job_id = None
 
@@ -298,7 +311,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         metric_types: List[str],
         state_code: Optional[str],
         calculation_end_month: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        hydrated_entities_input: Optional[str] = None):
     """Runs the incarceration calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
@@ -320,46 +334,30 @@ def run(apache_beam_pipeline_options: PipelineOptions,
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
+        root_entity_loader = RootEntityLoader(pipeline=p,
+                                              dataset=input_dataset,
+                                              hydrated_entities_input=hydrated_entities_input,
+                                              unifying_id_field_filter_set=person_id_filter_set,
+                                              state_code=state_code,
+                                              entity_field_projection=ENTITY_FIELD_PROJECTION)
+
         # Get StatePersons
-        persons = (p | 'Load StatePersons' >>
-                   BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StatePerson,
-                                   unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                   build_related_entities=True,
-                                   unifying_id_field_filter_set=person_id_filter_set,
-                                   state_code=state_code))
+        persons = root_entity_loader.load('Load StatePersons', entities.StatePerson, build_related_entities=True)
 
         # Get StateSentenceGroups
-        sentence_groups = (p | 'Load StateSentenceGroups' >>
-                           BuildRootEntity(
-                               dataset=input_dataset,
-                               root_entity_class=entities.StateSentenceGroup,
-                               unifying_id_field=entities.StatePerson.get_class_id_name(),
-                               build_related_entities=True,
-                               unifying_id_field_filter_set=person_id_filter_set,
-                               state_code=state_code
-                           ))
+        sentence_groups = root_entity_loader.load('Load StateSentenceGroups',
+                                                  entities.StateSentenceGroup,
+                                                  build_related_entities=True)
 
         # Get StateIncarcerationSentences
-        incarceration_sentences = (p | 'Load StateIncarcerationSentences' >>
-                                   BuildRootEntity(
-                                       dataset=input_dataset,
-                                       root_entity_class=entities.StateIncarcerationSentence,
-                                       unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                       build_related_entities=True,
-                                       unifying_id_field_filter_set=person_id_filter_set,
-                                       state_code=state_code
-                                   ))
+        incarceration_sentences = root_entity_loader.load('Load StateIncarcerationSentences',
+                                                          entities.StateIncarcerationSentence,
+                                                          build_related_entities=True)
 
         # Get StateSupervisionSentences
-        supervision_sentences = (p | 'Load StateSupervisionSentences' >>
-                                 BuildRootEntity(
-                                     dataset=input_dataset,
-                                     root_entity_class=entities.StateSupervisionSentence,
-                                     unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                     build_related_entities=True,
-                                     unifying_id_field_filter_set=person_id_filter_set,
-                                     state_code=state_code
-                                 ))
+        supervision_sentences = root_entity_loader.load('Load StateSupervisionSentences',
+                                                        entities.StateSupervisionSentence,
+                                                        build_related_entities=True)
 
         if state_code is None or state_code == 'US_MO':
             # Bring in the reference table that includes sentence status ranking information
@@ -35,9 +35,10 @@ from recidiviz.calculator.pipeline.program.metrics import ProgramMetricType
 from recidiviz.calculator.pipeline.program.program_event import ProgramEvent
 from recidiviz.calculator.pipeline.utils.beam_utils import RecidivizMetricWritableDict, ImportTableAsKVTuples, \
     ImportTable
+from recidiviz.calculator.pipeline.utils.entity_field_projection import EntityFieldProjection
 from recidiviz.calculator.pipeline.utils.event_utils import IdentifierEvent
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier
-from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
+from recidiviz.calculator.pipeline.utils.hydrated_entities_utils import RootEntityLoader
 from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata, BuildPersonMetadata, \
     ExtractPersonEventsMetadata
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
@@ -47,6 +48,21 @@ from recidiviz.persistence.database.schema.state import schema
 from recidiviz.persistence.entity.state import entities
 from recidiviz.utils import environment
 
+# The fields of the root entities that are read by the calculations in this pipeline. Only the columns for these
+# fields (and the id and join columns) are read from BigQuery; all other fields of these entities are None. A field
+# must be added here before a calculation in this pipeline can read it.
+ENTITY_FIELD_PROJECTION = EntityFieldProjection({
+    entities.StatePerson: {'birthdate', 'gender'},
+    entities.StateProgramAssignment: {'external_id', 'participation_status', 'referral_date', 'start_date',
+                                      'discharge_date', 'program_id', 'program_location_id'},
+    entities.StateAssessment: {'external_id', 'assessment_class', 'assessment_type', 'assessment_date',
+                               'assessment_score', 'assessment_level'},
+    entities.StateSupervisionPeriod: {'external_id', 'status', 'supervision_type', 'supervision_type_raw_text',
+                                      'supervision_period_supervision_type', 'start_date', 'termination_date',
+                                      'supervision_site', 'admission_reason', 'admission_reason_raw_text',
+                                      'supervision_level', 'supervision_level_raw_text', 'custodial_authority'},
+})
+
 # Cached job_id value
 _job_id = None
 
@@ -282,7 +298,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         metric_types: List[str],
         state_code: Optional[str],
         calculation_end_month: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        hydrated_entities_input: Optional[str] = None):
     """Runs the program calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
@@ -304,39 +321,30 @@ def run(apache_beam_pipeline_options: PipelineOptions,
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
+        root_entity_loader = RootEntityLoader(pipeline=p,
+                                              dataset=input_dataset,
+                                              hydrated_entities_input=hydrated_entities_input,
+                                              unifying_id_field_filter_set=person_id_filter_set,
+                                              state_code=state_code,
+                                              entity_field_projection=ENTITY_FIELD_PROJECTION)
+
         # Get StatePersons
-        persons = (p | 'Load Persons' >>
-                   BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StatePerson,
-                                   unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                   build_related_entities=True,
-                                   unifying_id_field_filter_set=person_id_filter_set,
-                                   state_code=state_code))
+        persons = root_entity_loader.load('Load Persons', entities.StatePerson, build_related_entities=True)
 
         # Get StateProgramAssignments
-        program_assignments = (p | 'Load Program Assignments' >>
-                               BuildRootEntity(dataset=input_dataset,
-                                               root_entity_class=entities.
-                                               StateProgramAssignment,
-                                               unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                               build_related_entities=True,
-                                               unifying_id_field_filter_set=person_id_filter_set,
-                                               state_code=state_code))
+        program_assignments = root_entity_loader.load('Load Program Assignments',
+                                                      entities.StateProgramAssignment,
+                                                      build_related_entities=True)
 
         # Get StateAssessments
-        assessments = (p | 'Load Assessments' >>
-                       BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StateAssessment,
-                                       unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                       build_related_entities=False,
-                                       unifying_id_field_filter_set=person_id_filter_set,
-                                       state_code=state_code))
+        assessments = root_entity_loader.load('Load Assessments',
+                                              entities.StateAssessment,
+                                              build_related_entities=False)
 
         # Get StateSupervisionPeriods
-        supervision_periods = (p | 'Load SupervisionPeriods' >>
-                               BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StateSupervisionPeriod,
-                                               unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                               build_related_entities=False,
-                                               unifying_id_field_filter_set=person_id_filter_set,
-                                               state_code=state_code))
+        supervision_periods = root_entity_loader.load('Load SupervisionPeriods',
+                                                      entities.StateSupervisionPeriod,
+                                                      build_related_entities=False)
 
         supervision_period_to_agent_associations_as_kv = (
                 p | 'Load supervision_period_to_agent_associations_as_kv' >>
@@ -44,10 +44,11 @@ from recidiviz.calculator.pipeline.recidivism.metrics import \
 from recidiviz.calculator.pipeline.recidivism.metrics import ReincarcerationRecidivismMetricType
 from recidiviz.calculator.pipeline.utils.beam_utils import RecidivizMetricWritableDict, \
     ImportTableAsKVTuples, ImportTable
+from recidiviz.calculator.pipeline.utils.entity_field_projection import EntityFieldProjection
 from recidiviz.calculator.pipeline.utils.entity_hydration_utils import \
     SetViolationResponseOnIncarcerationPeriod, SetViolationOnViolationsResponse
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier
-from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
+from recidiviz.calculator.pipeline.utils.hydrated_entities_utils import RootEntityLoader
 from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata, BuildPersonMetadata
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
 from recidiviz.calculator.query.state.views.reference.persons_to_recent_county_of_residence import \
@@ -56,6 +57,22 @@ from recidiviz.persistence.entity.state import entities
 from recidiviz.persistence.database.schema.state import schema
 from recidiviz.utils import environment
 
+# The fields of the root entities that are read by the calculations in this pipeline. Only the columns for these
+# fields (and the id and join columns) are read from BigQuery; all other fields of these entities are None. A field
+# must be added here before a calculation in this pipeline can read it.
+ENTITY_FIELD_PROJECTION = EntityFieldProjection({
+    entities.StatePerson: {'birthdate', 'gender'},
+    entities.StateIncarcerationPeriod: {'external_id', 'status', 'incarceration_type', 'admission_date', 'release_date',
+                                        'facility', 'housing_unit', 'facility_security_level',
+                                        'facility_security_level_raw_text', 'admission_reason',
+                                        'admission_reason_raw_text', 'projected_release_reason',
+                                        'projected_release_reason_raw_text', 'release_reason',
+                                        'release_reason_raw_text', 'specialized_purpose_for_incarceration',
+                                        'specialized_purpose_for_incarceration_raw_text', 'custodial_authority'},
+    entities.StateSupervisionViolation: {'external_id', 'violation_type', 'violation_type_raw_text'},
+    entities.StateSupervisionViolationResponse: {'external_id', 'response_type', 'response_subtype'},
+})
+
 # Cached job_id value
 _job_id = None
 
@@ -319,7 +336,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         output: str,
         metric_types: List[str],
         state_code: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        hydrated_entities_input: Optional[str] = None):
     """Runs the recidivism calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is
@@ -343,45 +361,31 @@ def run(apache_beam_pipeline_options: PipelineOptions,
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
+        root_entity_loader = RootEntityLoader(pipeline=p,
+                                              dataset=input_dataset,
+                                              hydrated_entities_input=hydrated_entities_input,
+                                              unifying_id_field_filter_set=person_id_filter_set,
+                                              state_code=state_code,
+                                              entity_field_projection=ENTITY_FIELD_PROJECTION)
+
         # Get StatePersons
-        persons = (p
-                   | 'Load Persons' >>
-                   BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StatePerson,
-                                   unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                   build_related_entities=True, unifying_id_field_filter_set=person_id_filter_set,
-                                   state_code=state_code))
+        persons = root_entity_loader.load('Load Persons', entities.StatePerson, build_related_entities=True)
 
         # Get StateIncarcerationPeriods
-        incarceration_periods = (p
-                                 | 'Load IncarcerationPeriods' >>
-                                 BuildRootEntity(dataset=input_dataset,
-                                                 root_entity_class=entities.StateIncarcerationPeriod,
-                                                 unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                                 build_related_entities=True,
-                                                 unifying_id_field_filter_set=person_id_filter_set,
-                                                 state_code=state_code
-                                                 ))
+        incarceration_periods = root_entity_loader.load('Load IncarcerationPeriods',
+                                                        entities.StateIncarcerationPeriod,
+                                                        build_related_entities=True)
 
         # Get StateSupervisionViolations
-        supervision_violations = \
-            (p
-             | 'Load SupervisionViolations' >>
-             BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StateSupervisionViolation,
-                             unifying_id_field=entities.StatePerson.get_class_id_name(), build_related_entities=True,
-                             unifying_id_field_filter_set=person_id_filter_set,
-                             state_code=state_code
-                             ))
+        supervision_violations = root_entity_loader.load('Load SupervisionViolations',
+                                                         entities.StateSupervisionViolation,
+                                                         build_related_entities=True)
 
         # TODO(#2769): Don't bring this in as a root entity
         # Get StateSupervisionViolationResponses
-        supervision_violation_responses = \
-            (p
-             | 'Load SupervisionViolationResponses' >>
-             BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StateSupervisionViolationResponse,
-                             unifying_id_field=entities.StatePerson.get_class_id_name(), build_related_entities=True,
-                             unifying_id_field_filter_set=person_id_filter_set,
-                             state_code=state_code
-                             ))
+        supervision_violation_responses = root_entity_loader.load('Load SupervisionViolationResponses',
+                                                                  entities.StateSupervisionViolationResponse,
+                                                                  build_related_entities=True)
 
         # Group StateSupervisionViolationResponses and
         # StateSupervisionViolations by person_id
@@ -48,7 +48,8 @@ from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_ma
     revoked_supervision_periods_if_revocation_occurred, \
     state_specific_violation_response_pre_processing_function
 from recidiviz.calculator.pipeline.utils.supervision_period_index import SupervisionPeriodIndex
-from recidiviz.calculator.pipeline.utils.supervision_period_utils import prepare_supervision_periods_for_calculations
+from recidiviz.calculator.pipeline.utils.supervision_period_utils import prepare_supervision_periods_for_calculations, \
+    SUPERVISION_PERIOD_PROXIMITY_MONTH_LIMIT
 from recidiviz.calculator.pipeline.utils.supervision_type_identification import \
     get_supervision_type_from_sentences
 from recidiviz.calculator.pipeline.utils.violation_utils import identify_most_severe_violation_type_and_subtype, \
@@ -237,7 +238,7 @@ def find_supervision_time_buckets(
     supervision_time_buckets = supervision_time_buckets + find_revocation_return_buckets(
         supervision_sentences,
         incarceration_sentences,
-        supervision_periods,
+        supervision_period_index,
         assessments,
         violation_responses,
         ssvr_agent_associations,
@@ -290,6 +291,10 @@ def find_time_buckets_for_supervision_period(
     if start_date is None:
         return supervision_day_buckets
 
+    if incarceration_period_index.is_fully_incarcerated_for_range(supervision_period.duration):
+        # The person is not counted as on supervision on any day they are incarcerated
+        return supervision_day_buckets
+
     bucket_date = start_date
 
     end_date = termination_date if termination_date else date.today() + relativedelta(days=1)
@@ -754,10 +759,34 @@ def _get_responses_in_window_before_revocation(revocation_date: date,
     return responses_in_window
 
 
+def _supervision_periods_relevant_to_admission(
+        incarceration_period: StateIncarcerationPeriod,
+        preceding_incarceration_period: Optional[StateIncarcerationPeriod],
+        supervision_period_index: SupervisionPeriodIndex) -> List[StateSupervisionPeriod]:
+    """Returns the supervision periods that could have been revoked by the admission to the |incarceration_period|. A
+    revoked period must either overlap with the date of the admission, or have terminated within
+    |SUPERVISION_PERIOD_PROXIMITY_MONTH_LIMIT| months before the admission. For transfers from a parole board hold, the
+    admission to the hold is used instead, so the window starts before the earlier of the two admission dates."""
+    if not incarceration_period.admission_date:
+        raise ValueError(f"Admission date for null for {incarceration_period}")
+
+    earliest_admission_date = incarceration_period.admission_date
+
+    if preceding_incarceration_period and preceding_incarceration_period.admission_date:
+        earliest_admission_date = min(earliest_admission_date, preceding_incarceration_period.admission_date)
+
+    revocation_window = DateRange(
+        lower_bound_inclusive_date=earliest_admission_date - relativedelta(
+            months=SUPERVISION_PERIOD_PROXIMITY_MONTH_LIMIT),
+        upper_bound_exclusive_date=incarceration_period.admission_date + relativedelta(days=1))
+
+    return supervision_period_index.supervision_periods_overlapping_or_terminated_in_range(revocation_window)
+
+
 def find_revocation_return_buckets(
         supervision_sentences: List[StateSupervisionSentence],
         incarceration_sentences: List[StateIncarcerationSentence],
-        supervision_periods: List[StateSupervisionPeriod],
+        supervision_period_index: SupervisionPeriodIndex,
         assessments: List[StateAssessment],
         violation_responses: List[StateSupervisionViolationResponse],
         ssvr_agent_associations: Dict[int, Dict[Any, Any]],
@@ -776,8 +805,6 @@ def find_revocation_return_buckets(
     if not incarceration_period_index.incarceration_periods:
         return revocation_return_buckets
 
-    filtered_supervision_periods = filter_supervision_periods_for_revocation_identification(supervision_periods)
-
     for index, incarceration_period in enumerate(incarceration_period_index.incarceration_periods):
         if not incarceration_period.admission_date:
             raise ValueError(f"Admission date for null for {incarceration_period}")
@@ -785,6 +812,10 @@ def find_revocation_return_buckets(
         previous_incarceration_period = (incarceration_period_index.incarceration_periods[index - 1]
                                          if index > 0 else None)
 
+        filtered_supervision_periods = filter_supervision_periods_for_revocation_identification(
+            _supervision_periods_relevant_to_admission(
+                incarceration_period, previous_incarceration_period, supervision_period_index))
+
         admission_is_revocation, revoked_supervision_periods = revoked_supervision_periods_if_revocation_occurred(
             incarceration_period, filtered_supervision_periods, previous_incarceration_period)
 
@@ -20,7 +20,7 @@ run.
 import argparse
 import datetime
 import logging
-from typing import Dict, Any, List, Tuple, Set, Optional, cast
+from typing import Dict, Any, List, Tuple, Set, Optional, Type, cast
 
 import apache_beam as beam
 from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
@@ -40,12 +40,14 @@ from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import \
     SupervisionTimeBucket
 from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict, \
     ImportTableAsKVTuples, ImportTable
+from recidiviz.calculator.pipeline.utils.entity_field_projection import EntityFieldProjection
 from recidiviz.calculator.pipeline.utils.entity_hydration_utils import \
     SetViolationResponseOnIncarcerationPeriod, SetViolationOnViolationsResponse, ConvertSentencesToStateSpecificType
 from recidiviz.calculator.pipeline.utils.event_utils import IdentifierEvent
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier, \
     select_all_by_person_query
-from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
+from recidiviz.calculator.pipeline.utils.hydrated_entities_utils import RootEntityLoader
+from recidiviz.calculator.pipeline.utils.metric_utils import decode_metric_key, encode_metric_key
 from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata, BuildPersonMetadata, \
     ExtractPersonEventsMetadata
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
@@ -60,9 +62,60 @@ from recidiviz.persistence.database.schema.state import schema
 from recidiviz.persistence.entity.state import entities
 from recidiviz.utils import environment
 
+# The fields of the root entities that are read by the calculations in this pipeline. Only the columns for these
+# fields (and the id and join columns) are read from BigQuery; all other fields of these entities are None. A field
+# must be added here before a calculation in this pipeline can read it.
+ENTITY_FIELD_PROJECTION = EntityFieldProjection({
+    entities.StatePerson: {'birthdate', 'gender'},
+    entities.StateIncarcerationPeriod: {'external_id', 'status', 'incarceration_type', 'admission_date', 'release_date',
+                                        'facility', 'housing_unit', 'facility_security_level',
+                                        'facility_security_level_raw_text', 'admission_reason',
+                                        'admission_reason_raw_text', 'projected_release_reason',
+                                        'projected_release_reason_raw_text', 'release_reason',
+                                        'release_reason_raw_text', 'specialized_purpose_for_incarceration',
+                                        'specialized_purpose_for_incarceration_raw_text', 'custodial_authority'},
+    entities.StateSupervisionViolation: {'external_id', 'violation_type', 'violation_type_raw_text'},
+    entities.StateSupervisionViolationResponse: {'external_id', 'response_type', 'response_subtype', 'response_date',
+                                                 'decision', 'revocation_type', 'is_draft'},
+    entities.StateSupervisionSentence: {'external_id', 'status', 'supervision_type', 'supervision_type_raw_text',
+                                        'start_date', 'projected_completion_date', 'completion_date'},
+    entities.StateIncarcerationSentence: {'external_id', 'status', 'incarceration_type', 'start_date',
+                                          'completion_date'},
+    entities.StateSupervisionPeriod: {'external_id', 'status', 'supervision_type', 'supervision_type_raw_text',
+                                      'supervision_period_supervision_type', 'start_date', 'termination_date',
+                                      'supervision_site', 'admission_reason', 'admission_reason_raw_text',
+                                      'termination_reason', 'supervision_level', 'supervision_level_raw_text',
+                                      'custodial_authority'},
+    entities.StateAssessment: {'external_id', 'assessment_class', 'assessment_type', 'assessment_date',
+                               'assessment_score', 'assessment_level'},
+    entities.StateSupervisionContact: {'external_id', 'status', 'contact_date', 'contact_type', 'location'},
+})
+
 # Cached job_id value
 _job_id = None
 
+SUPERVISION_METRIC_TYPE_TO_CLASS: Dict[SupervisionMetricType, Type[SupervisionMetric]] = {
+    SupervisionMetricType.SUPERVISION_COMPLIANCE: SupervisionCaseComplianceMetric,
+    SupervisionMetricType.SUPERVISION_POPULATION: SupervisionPopulationMetric,
+    SupervisionMetricType.SUPERVISION_REVOCATION: SupervisionRevocationMetric,
+    SupervisionMetricType.SUPERVISION_REVOCATION_ANALYSIS: SupervisionRevocationAnalysisMetric,
+    SupervisionMetricType.SUPERVISION_REVOCATION_VIOLATION_TYPE_ANALYSIS:
+        SupervisionRevocationViolationTypeAnalysisMetric,
+    SupervisionMetricType.SUPERVISION_SUCCESS: SupervisionSuccessMetric,
+    SupervisionMetricType.SUPERVISION_SUCCESSFUL_SENTENCE_DAYS_SERVED: SuccessfulSupervisionSentenceDaysServedMetric,
+    SupervisionMetricType.SUPERVISION_TERMINATION: SupervisionTerminationMetric,
+}
+
+# Metric types that do not describe a single person, whose values for the same metric key are summed before the
+# metrics are produced
+AGGREGATE_SUPERVISION_METRIC_TYPES = {
+    SupervisionMetricType.SUPERVISION_REVOCATION_VIOLATION_TYPE_ANALYSIS,
+}
+
+# A metric combination whose metric key has been encoded with encode_metric_key, in the form
+# ((metric_type, encoded_metric_key), value)
+EncodedMetricCombination = Tuple[Tuple[SupervisionMetricType, Tuple[Any, ...]], Any]
+
 
 def job_id(pipeline_options: Dict[str, str]) -> str:
     global _job_id
@@ -110,9 +163,18 @@ class GetSupervisionMetrics(beam.PTransform):
             beam.ParDo(CalculateSupervisionMetricCombinations(),
                        self._calculation_end_month, self._calculation_month_count, self._metric_inclusions))
 
+        person_level_combinations, aggregate_combinations = (
+            supervision_metric_combinations | 'Partition aggregate metric combinations' >>
+            beam.Partition(_partition_aggregate_metric_combinations, 2))
+
+        # Sum the values of the aggregate metric combinations that share a metric key
+        aggregated_combinations = (aggregate_combinations | 'Sum aggregate metric values' >>
+                                   beam.CombinePerKey(sum))
+
         # Produce SupervisionMetrics
-        supervision_metrics = (supervision_metric_combinations |
-                               'Produce SupervisionMetrics' >>
+        supervision_metrics = ((person_level_combinations, aggregated_combinations)
+                               | 'Merge metric combinations' >> beam.Flatten()
+                               | 'Produce SupervisionMetrics' >>
                                beam.ParDo(ProduceSupervisionMetrics(), **self._pipeline_options))
 
         # Return SupervisionMetrics objects
@@ -155,7 +217,7 @@ class ClassifySupervisionTimeBuckets(beam.DoFn):
                   beam.typehints.Optional[str],
                   beam.typehints.Optional[int],
                   beam.typehints.Dict[SupervisionMetricType, bool])
-@with_output_types(beam.typehints.Tuple[Dict[str, Any], Any])
+@with_output_types(EncodedMetricCombination)
 class CalculateSupervisionMetricCombinations(beam.DoFn):
     """Calculates supervision metric combinations."""
 
@@ -173,7 +235,7 @@ class CalculateSupervisionMetricCombinations(beam.DoFn):
             metric_inclusions: A dictionary where the keys are each SupervisionMetricType, and the values are boolean
                 values for whether or not to include that metric type in the calculations
         Yields:
-            Each supervision metric combination.
+            Each supervision metric combination, in the form ((metric_type, encoded_metric_key), value).
         """
         person, supervision_time_buckets, person_metadata = element
 
@@ -188,15 +250,17 @@ class CalculateSupervisionMetricCombinations(beam.DoFn):
                                                                       calculation_month_count,
                                                                       person_metadata)
 
-        # Return each of the supervision metric combinations
-        for metric_combination in metric_combinations:
-            yield metric_combination
+        # Return each of the supervision metric combinations, with the metric key encoded to keep the elements small
+        for metric_key, value in metric_combinations:
+            metric_type = metric_key['metric_type']
+            encoded_metric_key = encode_metric_key(SUPERVISION_METRIC_TYPE_TO_CLASS[metric_type], metric_key)
+            yield (metric_type, encoded_metric_key), value
 
     def to_runner_api_parameter(self, _):
         pass  # Passing unused abstract method.
 
 
-@with_input_types(beam.typehints.Tuple[Dict[str, Any], Any])
+@with_input_types(EncodedMetricCombination)
 @with_output_types(SupervisionMetric)
 class ProduceSupervisionMetrics(beam.DoFn):
     """Produces SupervisionMetrics ready for persistence."""
@@ -205,67 +269,36 @@ class ProduceSupervisionMetrics(beam.DoFn):
 
         pipeline_job_id = job_id(pipeline_options)
 
-        (dict_metric_key, value) = element
+        (metric_type, encoded_metric_key), value = element
 
         if value is None:
             # Due to how the pipeline arrives at this function, this should be impossible.
             raise ValueError("No value associated with this metric key.")
 
-        if not dict_metric_key:
-            # Due to how the pipeline arrives at this function, this should be impossible.
-            raise ValueError("Empty dict_metric_key.")
-
-        metric_type = dict_metric_key.pop('metric_type')
-
-        if metric_type == SupervisionMetricType.SUPERVISION_TERMINATION:
-            dict_metric_key['count'] = 1
+        metric_class = SUPERVISION_METRIC_TYPE_TO_CLASS.get(metric_type)
 
-            supervision_metric = SupervisionTerminationMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id
-            )
-        elif metric_type == SupervisionMetricType.SUPERVISION_POPULATION:
-            dict_metric_key['count'] = 1
+        if not metric_class:
+            logging.error("Unexpected metric of type: %s", metric_type)
+            return
 
-            supervision_metric = SupervisionPopulationMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id)
-        elif metric_type == SupervisionMetricType.SUPERVISION_REVOCATION:
-            dict_metric_key['count'] = 1
+        dict_metric_key = decode_metric_key(metric_class, encoded_metric_key)
 
-            supervision_metric = SupervisionRevocationMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id)
-        elif metric_type == SupervisionMetricType.SUPERVISION_REVOCATION_ANALYSIS:
-            dict_metric_key['count'] = 1
+        if not dict_metric_key:
+            # Due to how the pipeline arrives at this function, this should be impossible.
+            raise ValueError("Empty dict_metric_key.")
 
-            supervision_metric = SupervisionRevocationAnalysisMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id
-            )
-        elif metric_type == SupervisionMetricType.SUPERVISION_REVOCATION_VIOLATION_TYPE_ANALYSIS:
+        if metric_type == SupervisionMetricType.SUPERVISION_REVOCATION_VIOLATION_TYPE_ANALYSIS:
             dict_metric_key['count'] = value
-
-            supervision_metric = SupervisionRevocationViolationTypeAnalysisMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id
-            )
         elif metric_type == SupervisionMetricType.SUPERVISION_SUCCESS:
             dict_metric_key['successful_completion_count'] = value
             dict_metric_key['projected_completion_count'] = 1
-
-            supervision_metric = SupervisionSuccessMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id)
         elif metric_type == SupervisionMetricType.SUPERVISION_SUCCESSFUL_SENTENCE_DAYS_SERVED:
             dict_metric_key['successful_completion_count'] = 1
             dict_metric_key['average_days_served'] = value
-
-            supervision_metric = SuccessfulSupervisionSentenceDaysServedMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id
-            )
-        elif metric_type == SupervisionMetricType.SUPERVISION_COMPLIANCE:
+        else:
             dict_metric_key['count'] = 1
 
-            supervision_metric = SupervisionCaseComplianceMetric.build_from_metric_key_group(
-                dict_metric_key, pipeline_job_id)
-        else:
-            logging.error("Unexpected metric of type: %s", metric_type)
-            return
+        supervision_metric = metric_class.build_from_metric_key_group(dict_metric_key, pipeline_job_id)
 
         if supervision_metric:
             yield supervision_metric
@@ -274,6 +307,12 @@ class ProduceSupervisionMetrics(beam.DoFn):
         pass  # Passing unused abstract method.
 
 
+def _partition_aggregate_metric_combinations(element: EncodedMetricCombination, _num_partitions: int) -> int:
+    """Partitions metric combinations into person-level combinations (0) and aggregate combinations (1)."""
+    (metric_type, _), _ = element
+    return 1 if metric_type in AGGREGATE_SUPERVISION_METRIC_TYPES else 0
+
+
 def get_arg_parser() -> argparse.ArgumentParser:
     """Returns the parser for the command-line arguments for this pipeline."""
     parser = argparse.ArgumentParser()
@@ -307,7 +346,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         metric_types: List[str],
         state_code: Optional[str],
         calculation_end_month: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        hydrated_entities_input: Optional[str] = None):
     """Runs the supervision calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
@@ -329,93 +369,55 @@ def run(apache_beam_pipeline_options: PipelineOptions,
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
+        root_entity_loader = RootEntityLoader(pipeline=p,
+                                              dataset=input_dataset,
+                                              hydrated_entities_input=hydrated_entities_input,
+                                              unifying_id_field_filter_set=person_id_filter_set,
+                                              state_code=state_code,
+                                              entity_field_projection=ENTITY_FIELD_PROJECTION)
+
         # Get StatePersons
-        persons = (p | 'Load Persons' >> BuildRootEntity(dataset=input_dataset,
-                                                         root_entity_class=entities.StatePerson,
-                                                         unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                                         build_related_entities=True,
-                                                         unifying_id_field_filter_set=person_id_filter_set,
-                                                         state_code=state_code))
+        persons = root_entity_loader.load('Load Persons', entities.StatePerson, build_related_entities=True)
 
         # Get StateIncarcerationPeriods
-        incarceration_periods = (p | 'Load IncarcerationPeriods' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateIncarcerationPeriod,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=True,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        incarceration_periods = root_entity_loader.load('Load IncarcerationPeriods',
+                                                        entities.StateIncarcerationPeriod,
+                                                        build_related_entities=True)
 
         # Get StateSupervisionViolations
-        supervision_violations = (p | 'Load SupervisionViolations' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateSupervisionViolation,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=True,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        supervision_violations = root_entity_loader.load('Load SupervisionViolations',
+                                                         entities.StateSupervisionViolation,
+                                                         build_related_entities=True)
 
         # TODO(#2769): Don't bring this in as a root entity
         # Get StateSupervisionViolationResponses
-        supervision_violation_responses = (p | 'Load SupervisionViolationResponses' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateSupervisionViolationResponse,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=True,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        supervision_violation_responses = root_entity_loader.load('Load SupervisionViolationResponses',
+                                                                  entities.StateSupervisionViolationResponse,
+                                                                  build_related_entities=True)
 
         # Get StateSupervisionSentences
-        supervision_sentences = (p | 'Load SupervisionSentences' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateSupervisionSentence,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=True,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        supervision_sentences = root_entity_loader.load('Load SupervisionSentences',
+                                                        entities.StateSupervisionSentence,
+                                                        build_related_entities=True)
 
         # Get StateIncarcerationSentences
-        incarceration_sentences = (p | 'Load IncarcerationSentences' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateIncarcerationSentence,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=True,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        incarceration_sentences = root_entity_loader.load('Load IncarcerationSentences',
+                                                          entities.StateIncarcerationSentence,
+                                                          build_related_entities=True)
 
         # Get StateSupervisionPeriods
-        supervision_periods = (p | 'Load SupervisionPeriods' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateSupervisionPeriod,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=True,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        supervision_periods = root_entity_loader.load('Load SupervisionPeriods',
+                                                      entities.StateSupervisionPeriod,
+                                                      build_related_entities=True)
 
         # Get StateAssessments
-        assessments = (p | 'Load Assessments' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateAssessment,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=False,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        assessments = root_entity_loader.load('Load Assessments',
+                                              entities.StateAssessment,
+                                              build_related_entities=False)
 
-        supervision_contacts = (p | 'Load StateSupervisionContacts' >> BuildRootEntity(
-            dataset=input_dataset,
-            root_entity_class=entities.StateSupervisionContact,
-            unifying_id_field=entities.StatePerson.get_class_id_name(),
-            build_related_entities=False,
-            unifying_id_field_filter_set=person_id_filter_set,
-            state_code=state_code
-        ))
+        supervision_contacts = root_entity_loader.load('Load StateSupervisionContacts',
+                                                       entities.StateSupervisionContact,
+                                                       build_related_entities=False)
 
         ssvr_agent_associations_as_kv = (p | 'Load ssvr_agent_associations_as_kv' >> ImportTableAsKVTuples(
             dataset_id=reference_dataset,
@@ -16,7 +16,9 @@
 # =============================================================================
 """Utils for the various calculation pipelines."""
 import datetime
-from typing import Optional, List, Any, Dict, Type, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, List, Any, Dict, Type, Union, Callable, FrozenSet, Tuple
 
 import dateutil
 import attr
@@ -36,6 +38,34 @@ from recidiviz.common.constants.state.state_supervision_violation_response \
 from recidiviz.common.date import first_day_of_month, last_day_of_month, year_and_month_for_today
 from recidiviz.persistence.entity.state.entities import StatePerson
 
+# Metric fields that are never populated from the attributes of an event
+_FIELDS_NOT_IN_EVENTS = frozenset([
+    *attr.fields_dict(RecidivizMetric).keys(),
+    *attr.fields_dict(PersonLevelMetric).keys(),
+
+    # These are determined by the period of time the metric describes
+    'year',
+    'month',
+    'follow_up_period',
+    'metric_period_months',
+
+    # This is set by the contents of the `violation_type_frequency_counter` on
+    # RevocationReturnSupervisionTimeBuckets
+    'violation_count_type',
+
+    # TODO(#3873): Remove deprecated aggregate fields from metrics
+    # These are deprecated aggregated values from before when all metric outputs were aggregates. These are
+    # currently being set in the `Produce...Metrics` step of each pipeline.
+    'count',
+    'total_releases',
+    'recidivated_releases',
+    'returns',
+    'recidivism_rate',
+    'successful_completion_count',
+    'projected_completion_count',
+    'average_days_served',
+])
+
 # Relevant metric period month lengths for dashboard person-based calculations
 METRIC_PERIOD_MONTHS = [36, 12, 6, 3]
 
@@ -363,54 +393,55 @@ def characteristics_dict_builder(
             metrics.
 
     """
+    plan = _get_characteristics_plan(type(event), metric_class)
     characteristics: Dict[str, Any] = {}
-    metric_attributes = attr.fields_dict(metric_class).keys()
 
     if include_person_attributes:
         person_attributes = person_characteristics(person, event_date, person_metadata, pipeline)
 
         # Add relevant demographic and person-level dimensions
         for attribute, value in person_attributes.items():
-            if attribute in metric_attributes:
+            if attribute in plan.metric_attributes:
                 characteristics[attribute] = value
 
-    fields_not_in_events = list(attr.fields_dict(RecidivizMetric).keys())
-    fields_not_in_events.extend(attr.fields_dict(PersonLevelMetric).keys())
-    fields_not_in_events.extend([
-        # These are determined by the period of time the metric describes
-        'year',
-        'month',
-        'follow_up_period',
-        'metric_period_months',
-
-        # This is set by the contents of the `violation_type_frequency_counter` on
-        # RevocationReturnSupervisionTimeBuckets
-        'violation_count_type',
-
-        # TODO(#3873): Remove deprecated aggregate fields from metrics
-        # These are deprecated aggregated values from before when all metric outputs were aggregates. These are
-        # currently being set in the `Produce...Metrics` step of each pipeline.
-        'count',
-        'total_releases',
-        'recidivated_releases',
-        'returns',
-        'recidivism_rate',
-        'successful_completion_count',
-        'projected_completion_count',
-        'average_days_served',
-    ])
-
     # Add attributes from the event that are relevant to the metric_class
+    for metric_attribute, get_attribute_value in plan.event_attribute_getters:
+        attribute_value = get_attribute_value(event)
+        if attribute_value is not None:
+            characteristics[metric_attribute] = attribute_value
+
+    return characteristics
+
+
+@attr.s(frozen=True)
+class _CharacteristicsPlan:
+    """The attributes to copy from an event of a given class onto the characteristics dict for a given metric class."""
+
+    # The names of all fields on the metric class
+    metric_attributes: FrozenSet[str] = attr.ib()
+
+    # The name of and getter for each metric field that is populated from the event
+    event_attribute_getters: Tuple[Tuple[str, Callable[[Any], Any]], ...] = attr.ib()
+
+
+@lru_cache(maxsize=None)
+def _get_characteristics_plan(event_class: Type[Any], metric_class: Type[RecidivizMetric]) -> _CharacteristicsPlan:
+    """Returns the _CharacteristicsPlan for building characteristics dicts from events of the |event_class| for the
+    |metric_class|, validating that the event class has every metric field that is expected to come from the event."""
+    metric_attributes = attr.fields_dict(metric_class).keys()
+    event_fields = attr.fields_dict(event_class).keys()
+
+    event_attribute_getters = []
     for metric_attribute in metric_attributes:
-        if hasattr(event, metric_attribute) and metric_attribute not in fields_not_in_events:
-            attribute_value = getattr(event, metric_attribute)
-            if attribute_value is not None:
-                characteristics[metric_attribute] = attribute_value
-        elif metric_attribute not in fields_not_in_events:
+        if metric_attribute in _FIELDS_NOT_IN_EVENTS:
+            continue
+        if metric_attribute not in event_fields and not hasattr(event_class, metric_attribute):
             raise ValueError(
-                f'Did not find expected field [{metric_attribute}] in {event.__class__}. Metric class: {metric_class}')
+                f'Did not find expected field [{metric_attribute}] in {event_class}. Metric class: {metric_class}')
+        event_attribute_getters.append((metric_attribute, attrgetter(metric_attribute)))
 
-    return characteristics
+    return _CharacteristicsPlan(metric_attributes=frozenset(metric_attributes),
+                                event_attribute_getters=tuple(event_attribute_getters))
 
 
 def safe_list_index(list_of_values: List[Any], value: Any, default: int) -> int:
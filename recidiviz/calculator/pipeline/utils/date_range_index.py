@@ -0,0 +1,110 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""A class for looking up the periods that overlap a given date range in logarithmic time."""
+from bisect import bisect_left, bisect_right
+from datetime import date
+from itertools import accumulate
+from typing import Generic, List, TypeVar
+
+from recidiviz.common.date import DateRange, DurationMixin
+
+PeriodType = TypeVar('PeriodType', bound=DurationMixin)
+
+
+class DateRangeIndex(Generic[PeriodType]):
+    """Indexes a list of periods by the endpoints of their durations.
+
+    The periods are sorted by the start of their durations, alongside the running maximum of their end dates, so that
+    the periods overlapping a date range can be found with two binary searches. The union of all durations is also
+    stored as a sorted list of disjoint ranges, so that whether a date range is fully covered by the periods can be
+    answered with a single binary search. Periods with empty durations do not overlap any date range, and are not
+    indexed.
+    """
+
+    def __init__(self, periods: List[PeriodType]):
+        durations_and_periods = sorted(
+            ((period.duration, period) for period in periods),
+            key=lambda duration_and_period: duration_and_period[0].lower_bound_inclusive_date)
+
+        self._periods: List[PeriodType] = []
+        self._lower_bounds: List[date] = []
+        self._upper_bounds: List[date] = []
+
+        # Disjoint, non-adjacent ranges covering the same days as the union of all period durations
+        self._covered_lower_bounds: List[date] = []
+        self._covered_upper_bounds: List[date] = []
+
+        for duration, period in durations_and_periods:
+            lower_bound = duration.lower_bound_inclusive_date
+            upper_bound = duration.upper_bound_exclusive_date
+
+            if upper_bound <= lower_bound:
+                continue
+
+            self._periods.append(period)
+            self._lower_bounds.append(lower_bound)
+            self._upper_bounds.append(upper_bound)
+
+            if self._covered_upper_bounds and lower_bound <= self._covered_upper_bounds[-1]:
+                self._covered_upper_bounds[-1] = max(self._covered_upper_bounds[-1], upper_bound)
+            else:
+                self._covered_lower_bounds.append(lower_bound)
+                self._covered_upper_bounds.append(upper_bound)
+
+        # The latest end date of the periods up to and including each index. Since this never decreases, the first
+        # period that may end after a given date can be found with a binary search.
+        self._max_upper_bounds: List[date] = list(accumulate(self._upper_bounds, max))
+
+    @property
+    def covered_ranges(self) -> List[DateRange]:
+        """The disjoint, non-adjacent date ranges covering the same days as the union of all period durations, in
+        chronological order."""
+        return [DateRange(lower_bound_inclusive_date=lower_bound, upper_bound_exclusive_date=upper_bound)
+                for lower_bound, upper_bound in zip(self._covered_lower_bounds, self._covered_upper_bounds)]
+
+    def periods_overlapping_range(self, date_range: DateRange) -> List[PeriodType]:
+        """Returns the periods whose durations overlap with the |date_range|, sorted by the start of their durations."""
+        lower_bound = date_range.lower_bound_inclusive_date
+        upper_bound = date_range.upper_bound_exclusive_date
+
+        if upper_bound <= lower_bound:
+            return []
+
+        # Periods before this index all end on or before the start of the range
+        start_index = bisect_right(self._max_upper_bounds, lower_bound)
+        # Periods at or after this index all start on or after the end of the range
+        end_index = bisect_left(self._lower_bounds, upper_bound)
+
+        return [self._periods[index] for index in range(start_index, end_index)
+                if self._upper_bounds[index] > lower_bound]
+
+    def periods_overlapping_date(self, overlap_date: date) -> List[PeriodType]:
+        """Returns the periods whose durations include the |overlap_date|."""
+        return self.periods_overlapping_range(DateRange.for_day(overlap_date))
+
+    def is_range_fully_covered(self, date_range: DateRange) -> bool:
+        """Returns True if every day in the |date_range| falls within the duration of at least one period. An empty
+        |date_range| is never considered covered."""
+        lower_bound = date_range.lower_bound_inclusive_date
+        upper_bound = date_range.upper_bound_exclusive_date
+
+        if upper_bound <= lower_bound:
+            return False
+
+        covered_range_index = bisect_right(self._covered_lower_bounds, lower_bound) - 1
+
+        return covered_range_index >= 0 and self._covered_upper_bounds[covered_range_index] >= upper_bound
@@ -0,0 +1,72 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Utils for limiting the columns that are read from BigQuery when building entities for a calculation pipeline.
+
+Each pipeline declares an EntityFieldProjection that explicitly lists, for each entity class whose reads are
+projected, the entity fields that the pipeline's calculations read. Only the columns for those fields (plus the id and
+join columns) are selected, and every other field is None (or its default value) on the hydrated entities. Entities of
+classes that are not listed are read in full. When a calculation starts reading a new field of a projected entity
+class, that field must be added to the pipeline's projection.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Type
+
+import attr
+
+from recidiviz.persistence.database.base_schema import StateBase
+from recidiviz.persistence.entity.state import entities as state_entities
+
+
+class EntityFieldProjection:
+    """The entity fields that a calculation pipeline reads, for each entity class whose reads are projected."""
+
+    def __init__(self, fields_by_entity_class: Dict[Type[state_entities.Entity], Iterable[str]]):
+        self._fields_by_entity_class: Dict[Type[state_entities.Entity], FrozenSet[str]] = {}
+
+        for entity_class, fields in fields_by_entity_class.items():
+            fields = frozenset(fields)
+            unknown_fields = fields - set(attr.fields_dict(entity_class))
+            if unknown_fields:
+                raise ValueError(f'Fields {sorted(unknown_fields)} are not fields of [{entity_class.__name__}].')
+
+            self._fields_by_entity_class[entity_class] = fields
+
+    def columns_for_entity(self,
+                           entity_class: Type[state_entities.Entity],
+                           schema_class: Type[StateBase],
+                           join_columns: Iterable[str]) -> Optional[List[str]]:
+        """Returns the sorted list of columns of the |schema_class| table that should be selected to build instances of
+        |entity_class|: every column for a projected field, plus any of the |join_columns| that are in the table.
+        Returns None if all columns should be selected because |entity_class| is not projected."""
+        fields = self._fields_by_entity_class.get(entity_class)
+        if fields is None:
+            return None
+
+        table_columns: Set[str] = {column.name for column in schema_class.__table__.columns}
+
+        columns = {column for column in join_columns if column in table_columns}
+        columns.update(field for field in fields if field in table_columns)
+
+        return sorted(columns)
+
+    @staticmethod
+    def unselected_required_fields(entity_class: Type[state_entities.Entity],
+                                   selected_columns: Iterable[str]) -> List[str]:
+        """Returns the fields of |entity_class| without a default value that are not in |selected_columns|. These must
+        be set to None on each row read from BigQuery before the entity can be built from it."""
+        selected = set(selected_columns)
+        return [field for field, attribute in attr.fields_dict(entity_class).items()
+                if attribute.default is attr.NOTHING and field not in selected]
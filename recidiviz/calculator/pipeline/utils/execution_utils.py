@@ -192,10 +192,13 @@ def select_all_query(dataset: str,
                      table: str,
                      state_code_filter: Optional[str],
                      unifying_id_field: Optional[str],
-                     unifying_id_field_filter_set: Optional[Set[int]]) -> str:
+                     unifying_id_field_filter_set: Optional[Set[int]],
+                     columns: Optional[List[str]] = None) -> str:
     """Returns a query string formatted to select all contents of the table in the given dataset, filtering by the
-    provided state code and unifying id filter sets, if necessary."""
-    entity_query = f"SELECT * FROM `{dataset}.{table}`"
+    provided state code and unifying id filter sets, if necessary. If |columns| is set, only those columns are
+    selected."""
+    columns_str = ', '.join(columns) if columns else '*'
+    entity_query = f"SELECT {columns_str} FROM `{dataset}.{table}`"
 
     if unifying_id_field_filter_set:
         if not unifying_id_field:
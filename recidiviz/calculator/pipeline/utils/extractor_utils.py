@@ -18,7 +18,7 @@
 calculations."""
 import abc
 import logging
-from typing import Any, Dict, Optional, Type, Tuple, Set, TypeVar, Iterable
+from typing import Any, Dict, List, Optional, Type, Tuple, Set, TypeVar, Iterable
 
 from apache_beam import Pipeline
 from more_itertools import one
@@ -26,6 +26,7 @@ from more_itertools import one
 import apache_beam as beam
 from apache_beam.typehints import with_input_types, with_output_types
 
+from recidiviz.calculator.pipeline.utils.entity_field_projection import EntityFieldProjection
 from recidiviz.calculator.pipeline.utils.execution_utils import select_all_query
 from recidiviz.common.attr_mixins import BuildableAttr
 from recidiviz.persistence.database.base_schema import StateBase
@@ -47,7 +48,8 @@ class BuildRootEntity(beam.PTransform):
                  unifying_id_field: str,
                  build_related_entities: bool,
                  unifying_id_field_filter_set: Optional[Set[int]] = None,
-                 state_code: Optional[str] = None):
+                 state_code: Optional[str] = None,
+                 entity_field_projection: Optional[EntityFieldProjection] = None):
         """Initializes the PTransform with the required arguments.
 
         Arguments:
@@ -63,6 +65,9 @@ class BuildRootEntity(beam.PTransform):
             unifying_id_field_filter_set: When non-empty, we will only build entity
                 objects that can be connected to root entities with one of these
                 unifying ids.
+            entity_field_projection: When set, we will only read the columns
+                for the fields in this projection, setting all other fields
+                to None on the built entities.
         """
 
         super().__init__()
@@ -79,6 +84,7 @@ class BuildRootEntity(beam.PTransform):
         self._build_related_entities = build_related_entities
         self._unifying_id_field_filter_set = unifying_id_field_filter_set
         self._state_code = state_code
+        self._entity_field_projection = entity_field_projection
 
         if not dataset:
             raise ValueError("No valid data source passed to the pipeline.")
@@ -108,7 +114,8 @@ class BuildRootEntity(beam.PTransform):
                                         unifying_id_field=self._unifying_id_field,
                                         parent_id_field=None,
                                         unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                        state_code=self._state_code))
+                                        state_code=self._state_code,
+                                        entity_field_projection=self._entity_field_projection))
 
         if self._build_related_entities:
             # Get the related property entities
@@ -122,7 +129,8 @@ class BuildRootEntity(beam.PTransform):
                                    parent_id_field=self._root_entity_class.get_class_id_name(),
                                    unifying_id_field=self._unifying_id_field,
                                    unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                   state_code=self._state_code
+                                   state_code=self._state_code,
+                                   entity_field_projection=self._entity_field_projection
                                ))
         else:
             properties_dict = {}
@@ -198,7 +206,8 @@ class _ExtractEntityBase(beam.PTransform):
                  unifying_id_field: str,
                  parent_id_field: Optional[str],
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
+                 state_code: Optional[str],
+                 entity_field_projection: Optional[EntityFieldProjection]):
         super().__init__()
         self._dataset = dataset
 
@@ -213,6 +222,7 @@ class _ExtractEntityBase(beam.PTransform):
         self._entity_table_name = self._schema_class.__tablename__
         self._entity_id_field = self._entity_class.get_class_id_name()
         self._state_code = state_code
+        self._entity_field_projection = entity_field_projection
 
     def _entity_has_unifying_id_field(self):
         return hasattr(self._schema_class, self._unifying_id_field)
@@ -226,6 +236,16 @@ class _ExtractEntityBase(beam.PTransform):
 
         return getattr(association_raw_tuple, self._unifying_id_field) in self._unifying_id_field_filter_set
 
+    def _get_selected_columns(self) -> Optional[List[str]]:
+        """Returns the columns to read from the entity table, or None if all columns should be read."""
+        if not self._entity_field_projection:
+            return None
+
+        join_columns = [self._entity_id_field, self._unifying_id_field, 'state_code']
+        if self._parent_id_field:
+            join_columns.append(self._parent_id_field)
+        return self._entity_field_projection.columns_for_entity(self._entity_class, self._schema_class, join_columns)
+
     def _get_entities_table_sql_query(self):
         if not self._entity_has_unifying_id_field():
             raise ValueError(f"Shouldn't be querying table for entity {self._entity_class} that doesn't have field "
@@ -235,11 +255,13 @@ class _ExtractEntityBase(beam.PTransform):
         unifying_id_field_filter_set = \
             self._unifying_id_field_filter_set if self._entity_has_unifying_id_field() else None
         state_code_filter = self._state_code if self._entity_has_state_code_field() else None
+
         entity_query = select_all_query(self._dataset,
                                         self._entity_table_name,
                                         state_code_filter,
                                         self._unifying_id_field,
-                                        unifying_id_field_filter_set)
+                                        unifying_id_field_filter_set,
+                                        self._get_selected_columns())
 
         return entity_query
 
@@ -256,6 +278,14 @@ class _ExtractEntityBase(beam.PTransform):
                         | f"Read {self._entity_table_name} from BigQuery" >>
                         ReadFromBigQuery(query=entity_query))
 
+        selected_columns = self._get_selected_columns()
+        if selected_columns is not None:
+            unselected_fields = EntityFieldProjection.unselected_required_fields(self._entity_class, selected_columns)
+            if unselected_fields:
+                entities_raw = (entities_raw
+                                | f"Fill unselected {self._entity_table_name} fields" >>
+                                beam.Map(_fill_unselected_fields, unselected_fields=unselected_fields))
+
         return entities_raw
 
     @abc.abstractmethod
@@ -285,9 +315,10 @@ class _ExtractEntity(_ExtractEntityBase):
                  unifying_id_field: str,
                  parent_id_field: Optional[str],
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
+                 state_code: Optional[str],
+                 entity_field_projection: Optional[EntityFieldProjection] = None):
         super().__init__(dataset, entity_class, unifying_id_field, parent_id_field,
-                         unifying_id_field_filter_set, state_code)
+                         unifying_id_field_filter_set, state_code, entity_field_projection)
 
     def expand(self, input_or_inputs):
         entities_raw = self._get_entities_raw_pcollection(input_or_inputs)
@@ -323,7 +354,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                  parent_id_field: str,
                  unifying_id_field: str,
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
+                 state_code: Optional[str],
+                 entity_field_projection: Optional[EntityFieldProjection] = None):
         super().__init__()
         self._dataset = dataset
         self._parent_schema_class = parent_schema_class
@@ -331,6 +363,7 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
         self._unifying_id_field = unifying_id_field
         self._unifying_id_field_filter_set = unifying_id_field_filter_set
         self._state_code = state_code
+        self._entity_field_projection = entity_field_projection
 
     @staticmethod
     def _property_class_from_property_object(property_object) -> Type:
@@ -371,7 +404,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                                     association_table_parent_id_field=self._parent_id_field,
                                     association_table_entity_id_field=entity_id_field,
                                     unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                    state_code=self._state_code)
+                                    state_code=self._state_code,
+                                    entity_field_projection=self._entity_field_projection)
                                 )
 
                 # 1-to-many relationship
@@ -385,7 +419,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                                     unifying_id_field=self._unifying_id_field,
                                     parent_id_field=self._parent_id_field,
                                     unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                    state_code=self._state_code)
+                                    state_code=self._state_code,
+                                    entity_field_projection=self._entity_field_projection)
                                 )
 
                 # 1-to-1 relationship (from parent class perspective)
@@ -405,7 +440,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                                     association_table_parent_id_field=self._parent_id_field,
                                     association_table_entity_id_field=association_table_entity_id_field,
                                     unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                    state_code=self._state_code)
+                                    state_code=self._state_code,
+                                    entity_field_projection=self._entity_field_projection)
                                 )
 
                 properties_dict[property_name] = entities
@@ -430,9 +466,10 @@ class _ExtractEntityWithAssociationTable(_ExtractEntityBase):
                  association_table_parent_id_field: str,
                  association_table_entity_id_field: str,
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
-        super().__init__(
-            dataset, entity_class, unifying_id_field, parent_id_field, unifying_id_field_filter_set, state_code)
+                 state_code: Optional[str],
+                 entity_field_projection: Optional[EntityFieldProjection] = None):
+        super().__init__(dataset, entity_class, unifying_id_field, parent_id_field, unifying_id_field_filter_set,
+                         state_code, entity_field_projection)
 
         self._association_table_parent_id_field = association_table_parent_id_field
         self._association_table_entity_id_field = association_table_entity_id_field
@@ -781,6 +818,14 @@ class _FormAssociationIDTuples(beam.DoFn):
         pass
 
 
+def _fill_unselected_fields(element: Dict[str, Any], unselected_fields: List[str]) -> Dict[str, Any]:
+    """Returns a copy of |element| with each of the |unselected_fields| set to None, so that an entity can be built from
+    it."""
+    filled_element = dict.fromkeys(unselected_fields)
+    filled_element.update(element)
+    return filled_element
+
+
 def _get_value_from_element(element: Dict[str, Any], field: str) -> Any:
     value = element.get(field)
 
@@ -0,0 +1,421 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Utils for writing the hydrated entity graph of each person that the calculation pipelines load to an intermediate
+set of files, and for loading root entities back from those files in place of building them from BigQuery.
+
+The entity hydration pipeline reads each person-level state table (and each association table between them) once,
+groups all rows by person_id, and stitches every forward edge between the entities into a single graph per person. Each
+person's graph is written, as a pickled record holding all of the person's entities keyed by entity table, to TFRecord
+files (on GCS, or on local disk when running with the DirectRunner). Calculation pipelines that are given the path
+prefix of those files read them once and pull the root entities they need out of each person's graph, instead of
+building each root entity from BigQuery.
+"""
+import copy
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, cast
+
+import attr
+import apache_beam as beam
+from apache_beam import Pipeline
+from apache_beam.typehints import with_input_types, with_output_types
+
+from recidiviz.calculator.pipeline.utils.entity_field_projection import EntityFieldProjection
+from recidiviz.calculator.pipeline.utils.execution_utils import select_all_query
+from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity, ReadFromBigQuery
+from recidiviz.common.attr_mixins import BuildableAttr
+from recidiviz.common.attr_utils import is_forward_ref, is_list
+from recidiviz.persistence.database import schema_utils
+from recidiviz.persistence.database.base_schema import StateBase
+from recidiviz.persistence.entity import entity_utils
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.persistence.entity.entity_utils import SchemaEdgeDirectionChecker
+from recidiviz.persistence.entity.state import entities
+
+HYDRATED_ENTITIES_FILE_SUFFIX = '.tfrecord'
+
+
+@attr.s(frozen=True)
+class _ForwardEdge:
+    """Describes how to connect the entities on one forward-edge relationship property in a person graph."""
+
+    # The table of the parent entity, which holds the relationship property
+    parent_table: str = attr.ib()
+
+    # The name of the relationship property on the parent entity
+    property_name: str = attr.ib()
+
+    # The table of the child entities
+    child_table: str = attr.ib()
+
+    # Whether the relationship property holds a list of child entities
+    is_list: bool = attr.ib()
+
+    # The column that holds the parent entity id, on either the association table or the child table
+    parent_id_field: str = attr.ib()
+
+    # The column that holds the child entity id, on either the association table or the parent table
+    child_id_field: str = attr.ib()
+
+    # The table that links parent and child ids in a many-to-many relationship, if any
+    association_table: Optional[str] = attr.ib(default=None)
+
+
+def hydrated_schema_classes() -> List[Type[StateBase]]:
+    """Returns the schema class of every state entity that is written to the hydrated person graphs, which is every
+    entity with a person_id column."""
+    unifying_id_field = entities.StatePerson.get_class_id_name()
+    schema_classes = [schema_utils.get_state_database_entity_with_name(entity_class.__name__)
+                      for entity_class in entity_utils.get_all_entity_classes_in_module(entities)]
+
+    return sorted([schema_class for schema_class in schema_classes if hasattr(schema_class, unifying_id_field)],
+                  key=lambda schema_class: schema_class.__tablename__)
+
+
+def _get_forward_edges(schema_classes: List[Type[StateBase]]) -> List[_ForwardEdge]:
+    """Returns a _ForwardEdge for each forward-edge relationship property between two of the given schema classes."""
+    direction_checker = SchemaEdgeDirectionChecker.state_direction_checker()
+    table_names = {schema_class.__tablename__ for schema_class in schema_classes}
+
+    edges = []
+    for parent_schema_class in schema_classes:
+        parent_entity_class = entity_utils.get_entity_class_in_module_with_name(entities,
+                                                                                parent_schema_class.__name__)
+        parent_id_field = parent_entity_class.get_class_id_name()
+
+        for property_name, property_object in \
+                parent_schema_class.get_relationship_property_names_and_properties().items():
+            child_schema_class = property_object.argument.class_ \
+                if hasattr(property_object.argument, 'class_') else property_object.argument()
+
+            if not direction_checker.is_higher_ranked(parent_schema_class, child_schema_class):
+                continue
+
+            if child_schema_class.__tablename__ not in table_names or \
+                    property_name not in attr.fields_dict(parent_entity_class):
+                continue
+
+            child_entity_class = entity_utils.get_entity_class_in_module_with_name(entities,
+                                                                                   child_schema_class.__name__)
+            child_id_field = child_entity_class.get_class_id_name()
+
+            # Many-to-many relationship
+            if property_object.secondary is not None:
+                edges.append(_ForwardEdge(parent_table=parent_schema_class.__tablename__,
+                                          property_name=property_name,
+                                          child_table=child_schema_class.__tablename__,
+                                          is_list=True,
+                                          parent_id_field=parent_id_field,
+                                          child_id_field=child_id_field,
+                                          association_table=property_object.secondary.name))
+            # 1-to-many relationship, where the child table holds the parent id
+            elif property_object.uselist:
+                edges.append(_ForwardEdge(parent_table=parent_schema_class.__tablename__,
+                                          property_name=property_name,
+                                          child_table=child_schema_class.__tablename__,
+                                          is_list=True,
+                                          parent_id_field=parent_id_field,
+                                          child_id_field=child_id_field))
+            # 1-to-1 relationship (from parent class perspective), where the parent table holds the child id
+            else:
+                edges.append(_ForwardEdge(parent_table=parent_schema_class.__tablename__,
+                                          property_name=property_name,
+                                          child_table=child_schema_class.__tablename__,
+                                          is_list=False,
+                                          parent_id_field=parent_id_field,
+                                          child_id_field=property_object.key + '_id'))
+
+    return edges
+
+
+class WriteHydratedEntities(beam.PTransform):
+    """Reads every person-level state table once, builds one hydrated entity graph per person, and writes each person's
+    graph to TFRecord files."""
+
+    def __init__(self,
+                 dataset: str,
+                 output_path_prefix: str,
+                 unifying_id_field_filter_set: Optional[Set[int]] = None,
+                 state_code: Optional[str] = None):
+        """Initializes the PTransform with the required arguments.
+
+        Arguments:
+            dataset: The name of the dataset to read from BigQuery.
+            output_path_prefix: The path prefix of the files to write, e.g. gs://bucket/hydrated_entities/US_XX/run.
+            unifying_id_field_filter_set: When non-empty, we will only write the entities of people with these ids.
+            state_code: When set, we will only write the entities of people in this state.
+        """
+        super().__init__()
+        self._dataset = dataset
+        self._output_path_prefix = output_path_prefix
+        self._unifying_id_field_filter_set = unifying_id_field_filter_set
+        self._state_code = state_code
+
+    def _entities_table_query(self, table_name: str) -> str:
+        return select_all_query(self._dataset,
+                                table_name,
+                                self._state_code,
+                                entities.StatePerson.get_class_id_name(),
+                                self._unifying_id_field_filter_set)
+
+    def _association_table_query(self, edge: _ForwardEdge) -> str:
+        """Returns a query for the rows of the edge's association table, joined to the child entity table so that each
+        row can be grouped by the person_id of the child entity."""
+        unifying_id_field = entities.StatePerson.get_class_id_name()
+        return f"SELECT " \
+               f"{edge.association_table}.{edge.parent_id_field}, " \
+               f"{edge.association_table}.{edge.child_id_field}, " \
+               f"{edge.child_table}.{unifying_id_field} " \
+               f"FROM `{self._dataset}.{edge.association_table}` {edge.association_table} " \
+               f"JOIN ({self._entities_table_query(edge.child_table)}) {edge.child_table} " \
+               f"ON {edge.child_table}.{edge.child_id_field} = {edge.association_table}.{edge.child_id_field}"
+
+    def expand(self, input_or_inputs):
+        schema_classes = hydrated_schema_classes()
+        edges = _get_forward_edges(schema_classes)
+
+        rows_by_table = {}
+        for schema_class in schema_classes:
+            table_name = schema_class.__tablename__
+            rows_by_table[table_name] = (input_or_inputs
+                                         | f"Read {table_name} from BigQuery" >>
+                                         ReadFromBigQuery(query=self._entities_table_query(table_name))
+                                         | f"Key {table_name} rows by person" >>
+                                         beam.Map(_key_row_by_person_id))
+
+        for edge in edges:
+            if edge.association_table and edge.association_table not in rows_by_table:
+                rows_by_table[edge.association_table] = (input_or_inputs
+                                                         | f"Read {edge.association_table} from BigQuery" >>
+                                                         ReadFromBigQuery(query=self._association_table_query(edge))
+                                                         | f"Key {edge.association_table} rows by person" >>
+                                                         beam.Map(_key_row_by_person_id))
+
+        entity_classes_by_table = {
+            schema_class.__tablename__: entity_utils.get_entity_class_in_module_with_name(entities,
+                                                                                          schema_class.__name__)
+            for schema_class in schema_classes
+        }
+
+        return (rows_by_table
+                | 'Group all rows by person' >> beam.CoGroupByKey()
+                | 'Build hydrated person graphs' >>
+                beam.ParDo(_BuildHydratedPerson(), entity_classes_by_table=entity_classes_by_table, edges=edges)
+                | 'Write hydrated entities' >>
+                beam.io.WriteToTFRecord(self._output_path_prefix,
+                                        coder=beam.coders.PickleCoder(),
+                                        file_name_suffix=HYDRATED_ENTITIES_FILE_SUFFIX))
+
+
+class ReadHydratedEntities(beam.PTransform):
+    """Reads the files written by WriteHydratedEntities, returning a PCollection of (person_id, person graph) tuples,
+    where each person graph holds all of that person's connected entities, keyed by entity table name."""
+
+    def __init__(self,
+                 input_path_prefix: str,
+                 unifying_id_field_filter_set: Optional[Set[int]] = None):
+        """Initializes the PTransform with the required arguments.
+
+        Arguments:
+            input_path_prefix: The path prefix that the files were written with.
+            unifying_id_field_filter_set: When non-empty, we will only output the graphs of people with these ids.
+        """
+        super().__init__()
+        self._input_path_prefix = input_path_prefix
+        self._unifying_id_field_filter_set = unifying_id_field_filter_set
+
+    def expand(self, input_or_inputs):
+        hydrated_persons = (input_or_inputs
+                            | 'Read hydrated entities' >>
+                            beam.io.ReadFromTFRecord(f'{self._input_path_prefix}*{HYDRATED_ENTITIES_FILE_SUFFIX}',
+                                                     coder=beam.coders.PickleCoder()))
+
+        if not self._unifying_id_field_filter_set:
+            return hydrated_persons
+
+        unifying_id_field_filter_set = self._unifying_id_field_filter_set
+        return (hydrated_persons
+                | 'Filter hydrated persons' >>
+                beam.Filter(lambda element: element[0] in unifying_id_field_filter_set))
+
+
+class RootEntityLoader:
+    """Loads the root entities for a calculation pipeline, either by building them from BigQuery or, when a
+    |hydrated_entities_input| is provided, from the hydrated person graphs written by the entity hydration pipeline. The
+    files are only read once, no matter how many root entities are loaded, and each root entity is loaded in the same
+    shape that BuildRootEntity builds it in. The |entity_field_projection| only applies to entities built from BigQuery,
+    since the files hold every field of each entity."""
+
+    def __init__(self,
+                 pipeline: Pipeline,
+                 dataset: str,
+                 hydrated_entities_input: Optional[str],
+                 unifying_id_field_filter_set: Optional[Set[int]] = None,
+                 state_code: Optional[str] = None,
+                 entity_field_projection: Optional[EntityFieldProjection] = None):
+        self._pipeline = pipeline
+        self._dataset = dataset
+        self._unifying_id_field_filter_set = unifying_id_field_filter_set
+        self._state_code = state_code
+        self._entity_field_projection = entity_field_projection
+
+        self._hydrated_persons = None
+        if hydrated_entities_input:
+            self._hydrated_persons = (pipeline
+                                      | 'Load hydrated entities' >>
+                                      ReadHydratedEntities(
+                                          input_path_prefix=hydrated_entities_input,
+                                          unifying_id_field_filter_set=unifying_id_field_filter_set))
+
+    def load(self, label: str, root_entity_class: Type[Entity], build_related_entities: bool):
+        """Returns a PCollection of (person_id, root entity) tuples for all root entities of the given class."""
+        if self._hydrated_persons is None:
+            return (self._pipeline
+                    | label >> BuildRootEntity(dataset=self._dataset,
+                                               root_entity_class=root_entity_class,
+                                               unifying_id_field=entities.StatePerson.get_class_id_name(),
+                                               build_related_entities=build_related_entities,
+                                               unifying_id_field_filter_set=self._unifying_id_field_filter_set,
+                                               state_code=self._state_code,
+                                               entity_field_projection=self._entity_field_projection))
+
+        if root_entity_class.__name__ not in {schema_class.__name__ for schema_class in hydrated_schema_classes()}:
+            raise ValueError(f'Root entity class [{root_entity_class.__name__}] is not written by the entity hydration '
+                             f'pipeline.')
+
+        return (self._hydrated_persons
+                | label >> beam.ParDo(_ExtractRootEntities(),
+                                      root_entity_class=root_entity_class,
+                                      build_related_entities=build_related_entities))
+
+
+def _key_row_by_person_id(row: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    return row[entities.StatePerson.get_class_id_name()], row
+
+
+def build_person_graph(rows_by_table: Dict[str, Any],
+                       entity_classes_by_table: Dict[str, Type[Entity]],
+                       edges: List[_ForwardEdge]) -> Dict[str, List[Entity]]:
+    """Builds an entity from each entity table row of a single person and connects the entities along each of the
+    given forward edges. Returns every entity in the resulting graph, keyed by entity table name, so that entities
+    that are not reachable from the StatePerson (e.g. an incarceration period that is not attached to any sentence) can
+    still be found. Back edges are not set, since BuildRootEntity never sets them either."""
+    rows_and_entities_by_table: Dict[str, Dict[int, Tuple[Dict[str, Any], Entity]]] = {}
+    for table_name, entity_class in entity_classes_by_table.items():
+        if not issubclass(entity_class, BuildableAttr):
+            raise ValueError(f'Entity class [{entity_class.__name__}] for table [{table_name}] is not buildable.')
+        entity_id_field = entity_class.get_class_id_name()
+        rows_and_entities_by_table[table_name] = {
+            row[entity_id_field]: (row, cast(Entity, entity_class.build_from_dictionary(row)))
+            for row in rows_by_table.get(table_name, [])
+        }
+
+    for edge in edges:
+        parents = rows_and_entities_by_table[edge.parent_table]
+        children = rows_and_entities_by_table[edge.child_table]
+
+        if edge.association_table:
+            id_pairs = [(row.get(edge.parent_id_field), row.get(edge.child_id_field))
+                        for row in rows_by_table.get(edge.association_table, [])]
+        elif edge.is_list:
+            id_pairs = [(row.get(edge.parent_id_field), child_id) for child_id, (row, _) in children.items()]
+        else:
+            id_pairs = [(parent_id, row.get(edge.child_id_field)) for parent_id, (row, _) in parents.items()]
+
+        for parent_id, child_id in id_pairs:
+            if parent_id not in parents or child_id not in children:
+                continue
+
+            _, parent = parents[parent_id]
+            _, child = children[child_id]
+
+            if edge.is_list:
+                getattr(parent, edge.property_name).append(child)
+            else:
+                setattr(parent, edge.property_name, child)
+
+    return {table_name: [entity for _, entity in rows_and_entities.values()]
+            for table_name, rows_and_entities in rows_and_entities_by_table.items()
+            if rows_and_entities}
+
+
+def _copy_without_relationships(entity: Entity) -> Entity:
+    """Returns a shallow copy of the given entity with every relationship field unset."""
+    entity_copy = copy.copy(entity)
+    for field, attribute in attr.fields_dict(entity.__class__).items():
+        if is_list(attribute):
+            setattr(entity_copy, field, [])
+        elif is_forward_ref(attribute):
+            setattr(entity_copy, field, None)
+    return entity_copy
+
+
+def copy_as_root_entity(entity: Entity, build_related_entities: bool) -> Entity:
+    """Returns a copy of the given entity from a hydrated person graph in the shape that BuildRootEntity builds it in:
+    only the entity's forward-edge children are set when |build_related_entities| is True, and none of those children
+    have any relationships set. The graph itself is never modified."""
+    root_entity = _copy_without_relationships(entity)
+
+    if not build_related_entities:
+        return root_entity
+
+    for field in entity_utils.get_set_entity_field_names(entity, entity_utils.EntityFieldType.FORWARD_EDGE):
+        children = getattr(entity, field)
+        if isinstance(children, list):
+            setattr(root_entity, field, [_copy_without_relationships(child) for child in children])
+        else:
+            setattr(root_entity, field, _copy_without_relationships(children))
+
+    return root_entity
+
+
+@with_input_types(beam.typehints.Tuple[int, Dict[str, Any]],
+                  **{'entity_classes_by_table': Dict[str, Type[Entity]], 'edges': List[_ForwardEdge]})
+@with_output_types(beam.typehints.Tuple[int, Dict[str, List[Entity]]])
+class _BuildHydratedPerson(beam.DoFn):
+    """Builds the hydrated entity graph of a person from all of that person's grouped table rows."""
+
+    def process(self, element, *args, **kwargs):
+        person_id, rows_by_table = element
+
+        person_graph = build_person_graph({table_name: list(rows) for table_name, rows in rows_by_table.items()},
+                                          kwargs.get('entity_classes_by_table'),
+                                          kwargs.get('edges'))
+
+        if person_graph:
+            yield person_id, person_graph
+
+    def to_runner_api_parameter(self, _):
+        pass  # Passing unused abstract method.
+
+
+@with_input_types(beam.typehints.Tuple[int, Dict[str, List[Entity]]],
+                  **{'root_entity_class': Type[Entity], 'build_related_entities': bool})
+@with_output_types(beam.typehints.Tuple[int, Entity])
+class _ExtractRootEntities(beam.DoFn):
+    """Yields a copy, shaped like a root entity built by BuildRootEntity, of every entity of the given class in a
+    person's hydrated graph."""
+
+    def process(self, element, *args, **kwargs):
+        person_id, person_graph = element
+
+        root_entity_class = kwargs.get('root_entity_class')
+        build_related_entities = kwargs.get('build_related_entities')
+
+        for entity in person_graph.get(root_entity_class.get_entity_name(), []):
+            yield person_id, copy_as_root_entity(entity, build_related_entities)
+
+    def to_runner_api_parameter(self, _):
+        pass  # Passing unused abstract method.
@@ -16,14 +16,16 @@
 # =============================================================================
 """A class for caching information about a set of incarceration periods for use in the calculation pipelines."""
 
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import date
 from typing import List, Set, Tuple, Dict
 
 import attr
 
+from recidiviz.calculator.pipeline.utils.date_range_index import DateRangeIndex
 from recidiviz.calculator.pipeline.utils.incarceration_period_utils import standard_date_sort_for_incarceration_periods
-from recidiviz.common.date import DateRange, DateRangeDiff
+from recidiviz.common.date import DateRange
 from recidiviz.persistence.entity.state.entities import StateIncarcerationPeriod
 
 
@@ -38,47 +40,13 @@ class IncarcerationPeriodIndex:
 
     incarceration_periods: List[StateIncarcerationPeriod] = attr.ib(converter=_incarceration_periods_converter)
 
-    # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for any
-    # portion of the month.
-    month_to_overlapping_incarceration_periods: Dict[int, Dict[int, List[StateIncarcerationPeriod]]] = attr.ib()
-
-    @month_to_overlapping_incarceration_periods.default
-    def _month_to_overlapping_incarceration_periods(self) -> Dict[int, Dict[int, List[StateIncarcerationPeriod]]]:
-        month_to_overlapping_incarceration_periods: Dict[int, Dict[int, List[StateIncarcerationPeriod]]] = \
-            defaultdict(lambda: defaultdict(list))
-
-        for incarceration_period in self.incarceration_periods:
-            for year, month in incarceration_period.duration.get_months_range_overlaps_at_all():
-                month_to_overlapping_incarceration_periods[year][month].append(incarceration_period)
-
-        return month_to_overlapping_incarceration_periods
-
-    # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for the full
-    # month.
-    months_fully_incarcerated: Set[Tuple[int, int]] = attr.ib()
-
-    @months_fully_incarcerated.default
-    def _months_fully_incarcerated(self) -> Set[Tuple[int, int]]:
-        """For each StateIncarcerationPeriod, identifies months where the person was incarcerated for every day during
-        that month. Returns a set of months in the format (year, month) for which the person spent the entire month in a
-        prison.
-        """
-        months_fully_incarcerated: Set[Tuple[int, int]] = set()
-
-        for incarceration_period in self.incarceration_periods:
-            months_overlaps_at_all = incarceration_period.duration.get_months_range_overlaps_at_all()
-
-            for year, month in months_overlaps_at_all:
-                overlapping_periods = self.month_to_overlapping_incarceration_periods[year][month]
-
-                remaining_ranges_to_cover = self._get_portions_of_range_not_covered_by_periods_subset(
-                    DateRange.for_month(year, month),
-                    overlapping_periods
-                )
-                if not remaining_ranges_to_cover:
-                    months_fully_incarcerated.add((year, month))
+    # An index of the incarceration periods by the date ranges they cover, used to find whether the person was
+    # incarcerated for all of a given range.
+    incarceration_periods_date_range_index: DateRangeIndex[StateIncarcerationPeriod] = attr.ib()
 
-        return months_fully_incarcerated
+    @incarceration_periods_date_range_index.default
+    def _incarceration_periods_date_range_index(self) -> DateRangeIndex[StateIncarcerationPeriod]:
+        return DateRangeIndex(self.incarceration_periods)
 
     # A dictionary mapping admission dates of admissions to prison to the StateIncarcerationPeriods that happened on
     # that day.
@@ -96,63 +64,51 @@ class IncarcerationPeriodIndex:
 
         return incarceration_periods_by_admission_date
 
-    def is_fully_incarcerated_for_range(self, range_to_cover: DateRange) -> bool:
-        """Returns True if this person is incarcerated for the full duration of the date range."""
+    # The sorted admission dates of all incarceration periods with an admission date.
+    sorted_admission_dates: List[date] = attr.ib()
 
-        months_range_overlaps = range_to_cover.get_months_range_overlaps_at_all()
+    @sorted_admission_dates.default
+    def _sorted_admission_dates(self) -> List[date]:
+        return sorted(self.incarceration_periods_by_admission_date.keys())
 
-        if not months_range_overlaps:
-            return False
+    # A dictionary mapping years and months to the incarceration periods that overlap with any portion of that month.
+    month_to_overlapping_incarceration_periods: Dict[int, Dict[int, List[StateIncarcerationPeriod]]] = attr.ib()
 
-        months_without_complete_incarceration = []
-        for year, month in months_range_overlaps:
-            was_incarcerated_all_month = (year, month) in self.months_fully_incarcerated
-            if not was_incarcerated_all_month:
-                months_without_complete_incarceration.append((year, month))
+    @month_to_overlapping_incarceration_periods.default
+    def _month_to_overlapping_incarceration_periods(self) -> Dict[int, Dict[int, List[StateIncarcerationPeriod]]]:
+        month_to_overlapping_incarceration_periods: Dict[int, Dict[int, List[StateIncarcerationPeriod]]] = \
+            defaultdict(lambda: defaultdict(list))
 
-        for year, month in months_without_complete_incarceration:
-            overlapping_periods = self.month_to_overlapping_incarceration_periods[year][month]
+        for incarceration_period in self.incarceration_periods:
+            for year, month in incarceration_period.duration.get_months_range_overlaps_at_all():
+                month_to_overlapping_incarceration_periods[year][month].append(incarceration_period)
 
-            range_portion_overlapping_month = range_to_cover.portion_overlapping_with_month(year, month)
-            if not range_portion_overlapping_month:
-                raise ValueError(
-                    f'Expecting only months that overlap with the range, month ({year}, {month}) does not.')
+        return month_to_overlapping_incarceration_periods
 
-            remaining_ranges_to_cover = self._get_portions_of_range_not_covered_by_periods_subset(
-                range_portion_overlapping_month,
-                overlapping_periods
-            )
-            if remaining_ranges_to_cover:
-                return False
+    # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for the
+    # full month.
+    months_fully_incarcerated: Set[Tuple[int, int]] = attr.ib()
+
+    @months_fully_incarcerated.default
+    def _months_fully_incarcerated(self) -> Set[Tuple[int, int]]:
+        """Finds the full months within each of the disjoint ranges of days on which this person was incarcerated."""
+        months_fully_incarcerated: Set[Tuple[int, int]] = set()
 
-        return True
+        for covered_range in self.incarceration_periods_date_range_index.covered_ranges:
+            for year, month in covered_range.get_months_range_overlaps_at_all():
+                if covered_range.portion_overlapping_with_month(year, month) == DateRange.for_month(year, month):
+                    months_fully_incarcerated.add((year, month))
+
+        return months_fully_incarcerated
+
+    def is_fully_incarcerated_for_range(self, range_to_cover: DateRange) -> bool:
+        """Returns True if this person is incarcerated for the full duration of the date range."""
+        return self.incarceration_periods_date_range_index.is_range_fully_covered(range_to_cover)
 
     def incarceration_admissions_between_dates(
             self, start_date: date, end_date: date) -> bool:
         """Returns whether there were incarceration admissions between the start_date and end_date, not inclusive of
         the end date."""
-        return any(ip.admission_date and start_date <= ip.admission_date < end_date
-                   for ip in self.incarceration_periods)
-
-    @staticmethod
-    def _get_portions_of_range_not_covered_by_periods_subset(
-            time_range_to_cover: DateRange,
-            incarceration_periods_subset: List[StateIncarcerationPeriod]) -> List[DateRange]:
-        """Returns a list of date ranges within the provided |time_range_to_cover| which the provided set of
-        incarceration periods does not fully overlap.
-        """
-
-        remaining_ranges_to_cover = [time_range_to_cover]
-
-        for incarceration_period in incarceration_periods_subset:
-            new_remaining_ranges_to_cover = []
-            for time_range in remaining_ranges_to_cover:
-                new_remaining_ranges_to_cover.extend(
-                    DateRangeDiff(range_1=incarceration_period.duration,
-                                  range_2=time_range).range_2_non_overlapping_parts)
-
-            remaining_ranges_to_cover = new_remaining_ranges_to_cover
-            if not remaining_ranges_to_cover:
-                break
-
-        return remaining_ranges_to_cover
+        first_admission_index = bisect_left(self.sorted_admission_dates, start_date)
+        return (first_admission_index < len(self.sorted_admission_dates)
+                and self.sorted_admission_dates[first_admission_index] < end_date)
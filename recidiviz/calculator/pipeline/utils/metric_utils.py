@@ -18,7 +18,8 @@
 
 import datetime
 from datetime import date
-from typing import Any, Dict, Optional, cast, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, cast, List, Tuple, Type
 from enum import Enum
 
 import attr
@@ -194,3 +195,31 @@ def json_serializable_metric_key(metric_key: Dict[str, Any]) -> Dict[str, Any]:
             serializable_dict[key] = v
 
     return serializable_dict
+
+
+def encode_metric_key(metric_class: Type[RecidivizMetric], metric_key: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Encodes a metric key into a compact, hashable tuple that can be decoded with decode_metric_key.
+
+    The tuple holds the value of each field of the |metric_class| in the order the fields are defined, with None for
+    each field that is not in the |metric_key|. Keys that are not fields of the |metric_class| are dropped, since they
+    would be ignored when building the metric. List values are stored as tuples.
+    """
+    return tuple(_hashable_metric_key_value(metric_key.get(field)) for field in _metric_key_fields(metric_class))
+
+
+def decode_metric_key(metric_class: Type[RecidivizMetric], encoded_metric_key: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Decodes a tuple created by encode_metric_key for the |metric_class| into a new metric key dictionary, which
+    only includes the fields that have a value."""
+    return {field: list(value) if isinstance(value, tuple) else value
+            for field, value in zip(_metric_key_fields(metric_class), encoded_metric_key)
+            if value is not None}
+
+
+@lru_cache(maxsize=None)
+def _metric_key_fields(metric_class: Type[RecidivizMetric]) -> Tuple[str, ...]:
+    """Returns the names of the fields of the |metric_class| that can be set from a metric key."""
+    return tuple(field for field, attribute in attr.fields_dict(metric_class).items() if attribute.init)
+
+
+def _hashable_metric_key_value(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
@@ -58,6 +58,12 @@ def add_shared_pipeline_arguments(parser: argparse.ArgumentParser, include_calcu
                         help='An optional list of DB person_id values. When present, the pipeline will only calculate '
                              'metrics for these people and will not output to BQ.')
 
+    parser.add_argument('--hydrated_entities_input',
+                        type=str,
+                        help='An optional path prefix of files written by the entity hydration pipeline for the same '
+                             'state_code. When present, root entities are read from these files instead of being '
+                             'built from the data_input dataset.')
+
     if include_calculation_limit_args:
         # Only for pipelines that may receive these arguments
         parser.add_argument('--calculation_end_month',
@@ -16,14 +16,17 @@
 # =============================================================================
 """A class for caching information about a set of supervision periods for use in the calculation pipelines."""
 
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import date
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 import attr
 
+from recidiviz.calculator.pipeline.utils.date_range_index import DateRangeIndex
 from recidiviz.common.constants.state.state_supervision_period import StateSupervisionPeriodAdmissionReason, \
     StateSupervisionPeriodSupervisionType
+from recidiviz.common.date import DateRange
 from recidiviz.persistence.entity.state.entities import StateSupervisionPeriod
 
 
@@ -113,6 +116,73 @@ class SupervisionPeriodIndex:
 
         return supervision_periods_by_termination_month
 
+    # An index of the supervision periods by the date ranges they cover, used to find the periods overlapping a given
+    # date or range.
+    supervision_periods_date_range_index: DateRangeIndex[StateSupervisionPeriod] = attr.ib()
+
+    @supervision_periods_date_range_index.default
+    def _supervision_periods_date_range_index(self) -> DateRangeIndex[StateSupervisionPeriod]:
+        return DateRangeIndex(self.supervision_periods)
+
+    # The (termination_date, supervision period) pairs for the supervision periods with a termination_date, sorted by
+    # termination_date.
+    termination_dates_and_supervision_periods: List[Tuple[date, StateSupervisionPeriod]] = attr.ib()
+
+    @termination_dates_and_supervision_periods.default
+    def _termination_dates_and_supervision_periods(self) -> List[Tuple[date, StateSupervisionPeriod]]:
+        return sorted(((supervision_period.termination_date, supervision_period)
+                       for supervision_period in self.supervision_periods
+                       if supervision_period.termination_date is not None),
+                      key=lambda termination_date_and_period: termination_date_and_period[0])
+
+    # The supervision periods with a termination_date, sorted by termination_date, alongside their sorted termination
+    # dates.
+    supervision_periods_by_termination_date: List[StateSupervisionPeriod] = attr.ib()
+
+    @supervision_periods_by_termination_date.default
+    def _supervision_periods_by_termination_date(self) -> List[StateSupervisionPeriod]:
+        return [supervision_period for _, supervision_period in self.termination_dates_and_supervision_periods]
+
+    sorted_termination_dates: List[date] = attr.ib()
+
+    @sorted_termination_dates.default
+    def _sorted_termination_dates(self) -> List[date]:
+        return [termination_date for termination_date, _ in self.termination_dates_and_supervision_periods]
+
+    # A dictionary mapping the id() of each supervision period to its position in |supervision_periods|.
+    supervision_period_positions: Dict[int, int] = attr.ib()
+
+    @supervision_period_positions.default
+    def _supervision_period_positions(self) -> Dict[int, int]:
+        return {id(supervision_period): position
+                for position, supervision_period in enumerate(self.supervision_periods)}
+
+    def supervision_periods_overlapping_range(self, date_range: DateRange) -> List[StateSupervisionPeriod]:
+        """Returns the supervision periods that overlap with any portion of the date range."""
+        return self.supervision_periods_date_range_index.periods_overlapping_range(date_range)
+
+    def supervision_periods_overlapping_or_terminated_in_range(self, date_range: DateRange) -> \
+            List[StateSupervisionPeriod]:
+        """Returns the supervision periods that overlap with any portion of the date range, or that have a
+        termination_date within the date range, in the order they appear in |supervision_periods|. Unlike
+        supervision_periods_overlapping_range, this includes periods that start and terminate on the same day within
+        the range."""
+        first_termination_index = bisect_left(self.sorted_termination_dates, date_range.lower_bound_inclusive_date)
+        last_termination_index = bisect_left(self.sorted_termination_dates, date_range.upper_bound_exclusive_date)
+
+        periods_by_id = {
+            id(supervision_period): supervision_period
+            for supervision_period in self.supervision_periods_overlapping_range(date_range)
+        }
+        periods_by_id.update({
+            id(supervision_period): supervision_period
+            for supervision_period in self.supervision_periods_by_termination_date[
+                first_termination_index:last_termination_index]
+        })
+
+        return sorted(periods_by_id.values(),
+                      key=lambda supervision_period: self.supervision_period_positions[id(supervision_period)])
+
 
 def _is_official_supervision_admission(admission_reason: Optional[StateSupervisionPeriodAdmissionReason]) -> bool:
     """Returns whether or not the |admission_reason| is considered an official start of supervision."""
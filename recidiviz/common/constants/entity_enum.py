@@ -33,7 +33,25 @@ enum_errors_view = view.View("recidiviz/converter/enum_error_count",
                              [monitoring.TagKey.REGION,
                               monitoring.TagKey.ENTITY_TYPE],
                              m_enum_errors, aggregation.SumAggregation())
-monitoring.register_views([enum_errors_view])
+m_enum_parse_cache_hits = measure.MeasureInt("converter/enum_parse_cache_hits",
+                                             "The number of enum labels parsed from a memoized parsing table", "1")
+m_enum_parse_cache_misses = measure.MeasureInt("converter/enum_parse_cache_misses",
+                                               "The number of enum labels that ran the full override and mapper chain",
+                                               "1")
+enum_parse_cache_hits_view = view.View("recidiviz/converter/enum_parse_cache_hits",
+                                       "The sum of enum parsing table hits",
+                                       [monitoring.TagKey.REGION,
+                                        monitoring.TagKey.ENTITY_TYPE],
+                                       m_enum_parse_cache_hits, aggregation.SumAggregation())
+enum_parse_cache_misses_view = view.View("recidiviz/converter/enum_parse_cache_misses",
+                                         "The sum of enum parsing table misses",
+                                         [monitoring.TagKey.REGION,
+                                          monitoring.TagKey.ENTITY_TYPE],
+                                         m_enum_parse_cache_misses, aggregation.SumAggregation())
+monitoring.register_views([enum_errors_view, enum_parse_cache_hits_view, enum_parse_cache_misses_view])
+
+# Max number of distinct labels memoized by each EnumParsingTable, to bound memory for free text fields.
+_MAX_MEMOIZED_LABELS = 10000
 
 
 class EnumParsingError(Exception):
@@ -87,7 +105,14 @@ class EntityEnumMeta(EnumMeta):
     def _parse_to_enum(cls, label: str, enum_overrides: 'EnumOverrides') -> Optional['EntityEnum']:
         """Attempts to parse |label| using the default map of |cls| and the
         provided |override_map|. Ignores punctuation by treating punctuation as
-        a separator, e.g. `(N/A)` will map to the same value as `N A`."""
+        a separator, e.g. `(N/A)` will map to the same value as `N A`.
+
+        Results are memoized in the EnumParsingTable for this enum class and |enum_overrides|."""
+        return enum_overrides.get_parsing_table(cls).parse(label)
+
+    def parse_uncached(cls, label: str, enum_overrides: 'EnumOverrides') -> Optional['EntityEnum']:
+        """Parses |label| by running through the ignores, overrides, mappers and default map for |cls|, without
+        consulting or updating any EnumParsingTable."""
         label = normalize(label, remove_punctuation=True)
         if enum_overrides.should_ignore(label, cls):
             return None
@@ -138,3 +163,58 @@ class EntityEnum(Enum, metaclass=EntityEnumMeta):
     @classmethod
     def _missing_value_(cls, name: str):
         return cls.parse_from_canonical_string(name.upper())
+
+
+class EnumParsingTable:
+    """Memoized label parsing for a single EntityEnum class and EnumOverrides pair.
+
+    Ignores, overrides, mappers and default maps only depend on the normalized label, so the result of the full parsing
+    chain for a label is stored and every later occurrence of that label (raw or normalized) resolves in a dict lookup.
+    Labels that fail to parse are not stored, so they re-raise with their original cause each time. Only the first
+    _MAX_MEMOIZED_LABELS distinct labels are stored.
+
+    Hits and misses are only counted locally, and are reported as metrics when report_metrics() is called.
+    """
+
+    def __init__(self, enum_cls: EntityEnumMeta, enum_overrides: 'EnumOverrides'):
+        self.enum_cls = enum_cls
+        self.enum_overrides = enum_overrides
+        self._results_by_label: Dict[str, Optional[EntityEnum]] = {}
+        self._results_by_normalized_label: Dict[str, Optional[EntityEnum]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._reported_hits = 0
+        self._reported_misses = 0
+
+    def parse(self, label: str) -> Optional[EntityEnum]:
+        if label in self._results_by_label:
+            self.hits += 1
+            return self._results_by_label[label]
+
+        normalized_label = normalize(label, remove_punctuation=True)
+        if normalized_label in self._results_by_normalized_label:
+            result = self._results_by_normalized_label[normalized_label]
+            self.hits += 1
+        else:
+            result = self._parse_miss(normalized_label)
+            if len(self._results_by_normalized_label) < _MAX_MEMOIZED_LABELS:
+                self._results_by_normalized_label[normalized_label] = result
+        if len(self._results_by_label) < _MAX_MEMOIZED_LABELS:
+            self._results_by_label[label] = result
+        return result
+
+    def _parse_miss(self, normalized_label: str) -> Optional[EntityEnum]:
+        self.misses += 1
+        return self.enum_cls.parse_uncached(normalized_label, self.enum_overrides)
+
+    def report_metrics(self) -> None:
+        """Reports the hits and misses counted since the last call, if there are any, as a single measurement."""
+        new_hits = self.hits - self._reported_hits
+        new_misses = self.misses - self._reported_misses
+        if not new_hits and not new_misses:
+            return
+        with monitoring.measurements({monitoring.TagKey.ENTITY_TYPE: self.enum_cls.__name__}) as m:
+            m.measure_int_put(m_enum_parse_cache_hits, new_hits)
+            m.measure_int_put(m_enum_parse_cache_misses, new_misses)
+        self._reported_hits = self.hits
+        self._reported_misses = self.misses
@@ -23,7 +23,7 @@ from typing import Dict, Optional
 import attr
 
 from recidiviz.common.str_field_utils import normalize
-from recidiviz.common.constants.entity_enum import EntityEnum, EntityEnumMeta
+from recidiviz.common.constants.entity_enum import EntityEnum, EntityEnumMeta, EnumParsingTable
 
 EnumMapper = Callable[[str], Optional[EntityEnum]]
 EnumIgnorePredicate = Callable[[str], bool]
@@ -41,6 +41,23 @@ class EnumOverrides:
     _ignores: Dict[EntityEnumMeta, Set[str]] = attr.ib()
     _ignore_predicates_dict: Dict[EntityEnumMeta, Set[EnumIgnorePredicate]] = attr.ib()
 
+    # Memoized parsing tables for each enum class parsed with these overrides, built on first use.
+    _parsing_tables: Dict[EntityEnumMeta, EnumParsingTable] = attr.ib(factory=dict, init=False, eq=False, repr=False)
+
+    def get_parsing_table(self, enum_class: EntityEnumMeta) -> EnumParsingTable:
+        """Returns the EnumParsingTable used to parse labels into |enum_class| with these overrides."""
+        parsing_table = self._parsing_tables.get(enum_class)
+        if parsing_table is None:
+            parsing_table = EnumParsingTable(enum_class, self)
+            self._parsing_tables[enum_class] = parsing_table
+        return parsing_table
+
+    def report_parsing_table_metrics(self) -> None:
+        """Reports the hits and misses of every parsing table built for these overrides since they were last
+        reported."""
+        for parsing_table in list(self._parsing_tables.values()):
+            parsing_table.report_metrics()
+
     def should_ignore(self, label: str, enum_class: EntityEnumMeta) -> bool:
         label = normalize(label, remove_punctuation=True)
         predicate_calls = (predicate(label) for predicate in self._ignore_predicates_dict[enum_class])
@@ -66,11 +83,16 @@ class EnumOverrides:
 
     # pylint: disable=protected-access
     def to_builder(self) -> 'Builder':
+        # Copy the mappings so that adding to the builder cannot change the results of this (memoized) EnumOverrides.
         builder = self.Builder()
-        builder._str_mappings_dict = self._str_mappings_dict
-        builder._mappers_dict = self._mappers_dict
-        builder._ignores = self._ignores
-        builder._ignore_predicates_dict = self._ignore_predicates_dict
+        for enum_class, str_mappings in self._str_mappings_dict.items():
+            builder._str_mappings_dict[enum_class].update(str_mappings)
+        for enum_class, mappers in self._mappers_dict.items():
+            builder._mappers_dict[enum_class].update(mappers)
+        for enum_class, ignores in self._ignores.items():
+            builder._ignores[enum_class].update(ignores)
+        for enum_class, predicates in self._ignore_predicates_dict.items():
+            builder._ignore_predicates_dict[enum_class].update(predicates)
         return builder
 
     @classmethod
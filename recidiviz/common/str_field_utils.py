@@ -23,8 +23,10 @@ import datetime
 import locale
 import re
 import string
+from collections import Counter
 from distutils.util import strtobool  # pylint: disable=no-name-in-module
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Pattern
 
 import dateparser
 from dateutil.relativedelta import relativedelta
@@ -181,22 +183,152 @@ def _is_str_field_zeros(str_field: str) -> bool:
     return False
 
 
+# Names of the paths that parse_datetime can take to produce a result, used as keys in the path counter.
+PARSE_DATETIME_PATH_EMPTY = 'empty'
+PARSE_DATETIME_PATH_YYYYMMDD = 'yyyymmdd'
+PARSE_DATETIME_PATH_FAST = 'fast_path'
+PARSE_DATETIME_PATH_FALLBACK = 'fallback'
+PARSE_DATETIME_PATH_DATEPARSER = 'dateparser'
+
+_parse_datetime_path_counts: Counter = Counter()
+
+# Max number of distinct (date string, relative base) pairs whose dateparser results are memoized.
+_PARSE_DATETIME_MEMO_SIZE = 2 ** 16
+
+_ISO_DATETIME_REGEX = re.compile(
+    r'^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})'
+    r'(?:[T ](?P<hour>\d{2}):(?P<minute>\d{2})(?::(?P<second>\d{2})(?:\.(?P<fraction>\d{1,6}))?)?)?$')
+_MDY_SLASH_DATETIME_REGEX = re.compile(
+    r'^(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4})'
+    r'(?:\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?(?:\s*(?P<meridiem>[AaPp][Mm]))?)?$')
+_MDY_DASH_DATE_REGEX = re.compile(r'^(?P<month>\d{2})-(?P<day>\d{2})-(?P<year>\d{2}|\d{4})$')
+_YYYYMMDD_DATETIME_REGEX = re.compile(
+    r'^(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})[T ](?P<hour>\d{2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?$')
+
+# Words that may appear in a date string whose parsed value does not depend on the current time.
+_ABSOLUTE_DATE_WORDS = {
+    'JAN', 'JANUARY', 'FEB', 'FEBRUARY', 'MAR', 'MARCH', 'APR', 'APRIL', 'MAY', 'JUN', 'JUNE', 'JUL', 'JULY', 'AUG',
+    'AUGUST', 'SEP', 'SEPT', 'SEPTEMBER', 'OCT', 'OCTOBER', 'NOV', 'NOVEMBER', 'DEC', 'DECEMBER', 'AM', 'PM', 'T',
+}
+
+
+def _datetime_from_match(match: re.Match) -> datetime.datetime:
+    """Builds a datetime from the named groups of a fast path date regex match. Raises ValueError for out of range
+    components, e.g. a month of 13."""
+    groups = match.groupdict()
+    year = int(groups['year'])
+    if len(groups['year']) == 2:
+        # Follow strptime's %y convention for two-digit years
+        year = datetime.datetime.strptime(groups['year'], '%y').year
+
+    hour = int(groups.get('hour') or 0)
+    meridiem = groups.get('meridiem')
+    if meridiem:
+        if hour > 12 or (hour == 0 and meridiem.upper() == 'PM'):
+            raise ValueError(f'Hour [{hour}] is out of range for a 12-hour clock')
+        hour = hour % 12 + (12 if meridiem.upper() == 'PM' else 0)
+
+    fraction = groups.get('fraction') or ''
+    return datetime.datetime(year=year,
+                             month=int(groups['month']),
+                             day=int(groups['day']),
+                             hour=hour,
+                             minute=int(groups.get('minute') or 0),
+                             second=int(groups.get('second') or 0),
+                             microsecond=int(fraction.ljust(6, '0')) if fraction else 0)
+
+
+_FAST_PATH_REGEXES: List[Pattern] = [
+    _ISO_DATETIME_REGEX,
+    _MDY_SLASH_DATETIME_REGEX,
+    _MDY_DASH_DATE_REGEX,
+    _YYYYMMDD_DATETIME_REGEX,
+]
+
+
+def get_parse_datetime_path_counts() -> Dict[str, int]:
+    """Returns the number of times each path in parse_datetime has produced a result in this process.
+
+    Calls that reach the |PARSE_DATETIME_PATH_FALLBACK| path are answered from the memo unless they also count towards
+    |PARSE_DATETIME_PATH_DATEPARSER|, so memo hits are the difference between the two.
+    """
+    return dict(_parse_datetime_path_counts)
+
+
+def clear_parse_datetime_caches() -> None:
+    """Clears the parse_datetime memo and path counts."""
+    _parse_datetime_path_counts.clear()
+    _parse_datetime_with_dateparser.cache_clear()
+
+
 def parse_datetime(
         date_string: str, from_dt: Optional[datetime.datetime] = None
     ) -> Optional[datetime.datetime]:
     """
     Parses a string into a datetime.datetime object, using |from_dt| as a base
     for any relative dates.
+
+    Strings in the common formats emitted by our regions are parsed with precompiled regexes. Everything else falls
+    back to dateparser, whose results are memoized on (date string, relative base) when they cannot depend on the
+    current time.
     """
     if date_string == '' or date_string.isspace() or _is_str_field_zeros(date_string) or is_str_field_none(date_string):
+        _parse_datetime_path_counts[PARSE_DATETIME_PATH_EMPTY] += 1
         return None
 
     if is_yyyymmdd_date(date_string):
         as_date = parse_yyyymmdd_date(date_string)
         if not as_date:
             raise ValueError(f'Parsed date for string [{date_string}] is unexpectedly None.')
+        _parse_datetime_path_counts[PARSE_DATETIME_PATH_YYYYMMDD] += 1
         return datetime.datetime(year=as_date.year, month=as_date.month, day=as_date.day)
 
+    fast_parsed = _parse_datetime_fast_path(date_string.strip())
+    if fast_parsed:
+        _parse_datetime_path_counts[PARSE_DATETIME_PATH_FAST] += 1
+        return fast_parsed
+
+    _parse_datetime_path_counts[PARSE_DATETIME_PATH_FALLBACK] += 1
+    if from_dt or _is_absolute_date_string(date_string):
+        parsed = _parse_datetime_with_dateparser(date_string, from_dt)
+    else:
+        # Strings like '2 years' parsed relative to the current time must not be memoized.
+        parsed = _parse_datetime_with_dateparser.__wrapped__(date_string, from_dt)
+    if parsed:
+        return parsed
+
+    raise ValueError("cannot parse date: %s" % date_string)
+
+
+def _parse_datetime_fast_path(date_string: str) -> Optional[datetime.datetime]:
+    for regex in _FAST_PATH_REGEXES:
+        match = regex.match(date_string)
+        if match:
+            try:
+                return _datetime_from_match(match)
+            except ValueError:
+                # Leave out of range values to dateparser, so that errors are unchanged
+                return None
+    return None
+
+
+def _is_absolute_date_string(date_string: str) -> bool:
+    """Returns True if |date_string| has a four-digit year, some other date component and no words that could make it
+    relative to the current time, i.e. its parsed value does not depend on when it is parsed."""
+    if not re.search(r'\d{4}', date_string):
+        return False
+    words = re.findall(r'[A-Za-z]+', date_string)
+    if not words and len(re.findall(r'\d+', date_string)) < 2:
+        # A bare year is filled in with the current month
+        return False
+    return all(word.upper() in _ABSOLUTE_DATE_WORDS for word in words)
+
+
+@lru_cache(maxsize=_PARSE_DATETIME_MEMO_SIZE)
+def _parse_datetime_with_dateparser(
+        date_string: str, from_dt: Optional[datetime.datetime]) -> Optional[datetime.datetime]:
+    _parse_datetime_path_counts[PARSE_DATETIME_PATH_DATEPARSER] += 1
+
     settings: Dict[str, Any] = {'PREFER_DAY_OF_MONTH': 'first'}
     if from_dt:
         settings['RELATIVE_BASE'] = from_dt
@@ -207,14 +339,8 @@ def parse_datetime(
     # timestamps like '2016-05-14') and that include non punctuation (to avoid
     # ingested values like '--')
     if date_string.startswith('-') and _has_non_punctuation(date_string):
-        parsed = parse_datetime_with_negative_component(date_string, settings)
-    else:
-        parsed = dateparser.parse(
-            date_string, languages=['en'], settings=settings)
-    if parsed:
-        return parsed
-
-    raise ValueError("cannot parse date: %s" % date_string)
+        return parse_datetime_with_negative_component(date_string, settings)
+    return dateparser.parse(date_string, languages=['en'], settings=settings)
 
 
 def _has_non_punctuation(date_string: str) -> bool:
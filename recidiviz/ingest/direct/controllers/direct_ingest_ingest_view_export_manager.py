@@ -16,12 +16,15 @@
 # =============================================================================
 """Logic related to exporting ingest views to a region's direct ingest bucket."""
 import datetime
+import hashlib
 import logging
+import re
 from collections import defaultdict
 from typing import List, Optional, Dict, Tuple
 
 import attr
 from google.cloud import bigquery
+from google.cloud import exceptions
 
 from recidiviz.big_query.big_query_client import BigQueryClient
 from recidiviz.big_query.big_query_view_collector import BigQueryViewCollector
@@ -45,6 +48,9 @@ UPPER_BOUND_TIMESTAMP_PARAM_NAME = 'update_timestamp_upper_bound_inclusive'
 LOWER_BOUND_TIMESTAMP_PARAM_NAME = 'update_timestamp_lower_bound_exclusive'
 SELECT_SUBQUERY = 'SELECT * FROM `{project_id}.{dataset_id}.{table_name}`;'
 TABLE_NAME_DATE_FORMAT = '%Y_%m_%d_%H_%M_%S'
+DATE_BOUNDED_TABLE_NAME = '{file_tag}_{date_bound}_{query_hash}_date_bounded'
+# Matches date bounded table names for a given file tag, including names from before the query hash was added
+DATE_BOUNDED_TABLE_NAME_REGEX = r'{file_tag}_\d{{4}}(_\d{{2}}){{5}}(_[0-9a-f]+)?_date_bounded'
 
 
 @attr.s(frozen=True)
@@ -99,6 +105,9 @@ class DirectIngestIngestViewExportManager:
         """Looks at what files have been exported for a given region and returns args for all the export jobs that
         should be started, given what has updated in the raw data tables since the last time we exported data. Also
         returns any tasks that have not yet completed.
+
+        This must only be called while no export jobs are running, since it deletes any intermediate tables that are
+        not needed by a pending export.
         """
         if not self.region.are_ingest_view_exports_enabled_in_env():
             raise ValueError(f'Ingest view exports not enabled for region [{self.region.region_code}]')
@@ -117,6 +126,14 @@ class DirectIngestIngestViewExportManager:
 
         jobs_to_schedule = []
         metadata_pending_export = self.file_metadata_manager.get_ingest_view_metadata_pending_export()
+        table_ids_by_dataset: Dict[str, List[str]] = {}
+        for ingest_view in self.ingest_views_by_tag.values():
+            if ingest_view.dataset_id not in table_ids_by_dataset:
+                table_ids_by_dataset[ingest_view.dataset_id] = self._list_table_ids(ingest_view.dataset_id)
+            self._delete_unused_date_bounded_tables(ingest_view,
+                                                    table_ids_by_dataset[ingest_view.dataset_id],
+                                                    metadata_pending_export)
+
         if metadata_pending_export:
             args_list = self._export_args_from_metadata(metadata_pending_export)
             jobs_to_schedule.extend(args_list)
@@ -151,12 +168,11 @@ class DirectIngestIngestViewExportManager:
             self,
             table_name: str,
             ingest_view: DirectIngestPreProcessedIngestView,
-            date_bound: datetime.datetime) -> bigquery.QueryJob:
-        """Generates a query for the provided |ingest view| on the given |date bound| and starts a job to load the
-        results of that query into the provided |table_name|. Returns the potentially in progress QueryJob to the
-        caller.
+            query: str,
+            query_params: List[bigquery.ScalarQueryParameter]) -> bigquery.QueryJob:
+        """Starts a job to load the results of the provided date bounded |query| for the |ingest view| into the
+        provided |table_name|. Returns the potentially in progress QueryJob to the caller.
         """
-        query, query_params = self._generate_query_and_params_for_date(ingest_view, date_bound)
         query_job = self.big_query_client.create_table_from_query_async(
             dataset_id=ingest_view.dataset_id,
             table_id=table_name,
@@ -165,6 +181,79 @@ class DirectIngestIngestViewExportManager:
             overwrite=True)
         return query_job
 
+    def _get_or_create_date_bounded_table_async(
+            self,
+            ingest_view: DirectIngestPreProcessedIngestView,
+            date_bound: datetime.datetime,
+            job_creation_time: datetime.datetime) -> Tuple[str, Optional[bigquery.QueryJob]]:
+        """Returns the name of the table holding the results of the provided |ingest view| on the given |date bound|,
+        along with the potentially in progress QueryJob loading those results, or None if the table can be reused.
+
+        A table is reused if it was created after the export job with the given |job_creation_time| was registered,
+        for instance as the upper bound table of the previous export in the same backlog of exports. Since new raw data
+        is only ever added with later update datetimes (or else all exports after it are invalidated and registered
+        again), and the table name includes a hash of the view query, the results of the view on that date bound
+        cannot have changed since the table was created.
+        """
+        query, query_params = self._generate_query_and_params_for_date(ingest_view, date_bound)
+        table_name = self._date_bounded_table_name(ingest_view, date_bound)
+
+        dataset_ref = self.big_query_client.dataset_ref_for_id(ingest_view.dataset_id)
+        if self.big_query_client.table_exists(dataset_ref, table_name):
+            table_created = self.big_query_client.get_table(dataset_ref, table_name).created
+            if table_created and table_created.replace(tzinfo=None) >= job_creation_time:
+                logging.info('Reusing intermediate table [%s]', table_name)
+                return table_name, None
+
+        return table_name, self._generate_export_job_for_date(
+            table_name=table_name,
+            ingest_view=ingest_view,
+            query=query,
+            query_params=query_params)
+
+    @staticmethod
+    def _date_bounded_table_name(ingest_view: DirectIngestPreProcessedIngestView, date_bound: datetime.datetime) -> str:
+        """Returns the name of the table holding the results of the provided |ingest view| on the given |date bound|.
+        The name includes a hash of the view query, so that a table is never reused after the view query changes."""
+        query = ingest_view.date_parametrized_view_query(UPDATE_TIMESTAMP_PARAM_NAME)
+        return DATE_BOUNDED_TABLE_NAME.format(file_tag=ingest_view.file_tag,
+                                              date_bound=date_bound.strftime(TABLE_NAME_DATE_FORMAT),
+                                              query_hash=hashlib.sha256(query.encode()).hexdigest()[:16])
+
+    def _list_table_ids(self, dataset_id: str) -> List[str]:
+        """Returns the ids of all tables in the provided |dataset_id|, or an empty list if it does not exist."""
+        try:
+            return [table.table_id for table in self.big_query_client.list_tables(dataset_id)]
+        except exceptions.NotFound:
+            return []
+
+    def _delete_unused_date_bounded_tables(self,
+                                           ingest_view: DirectIngestPreProcessedIngestView,
+                                           table_ids: List[str],
+                                           metadata_pending_export: List[DirectIngestIngestFileMetadata]) -> None:
+        """Deletes the date bounded tables for the provided |ingest_view| among the |table_ids| in its dataset that
+        are not the lower bound table of any pending export, e.g. tables kept for a next export that has since been
+        invalidated, or tables created for a previous version of the view query."""
+        tables_to_keep = {
+            self._date_bounded_table_name(ingest_view, metadata.datetimes_contained_lower_bound_exclusive)
+            for metadata in metadata_pending_export
+            if metadata.file_tag == ingest_view.file_tag and metadata.datetimes_contained_lower_bound_exclusive}
+        table_name_regex = re.compile(DATE_BOUNDED_TABLE_NAME_REGEX.format(file_tag=re.escape(ingest_view.file_tag)))
+
+        for table_id in table_ids:
+            if table_name_regex.fullmatch(table_id) and table_id not in tables_to_keep:
+                self.big_query_client.delete_table(dataset_id=ingest_view.dataset_id, table_id=table_id)
+                logging.info('Deleted unused intermediate table [%s]', table_id)
+
+    def _has_pending_export_starting_at(self, ingest_view_export_args: GcsfsIngestViewExportArgs) -> bool:
+        """Returns True if there is an export pending for the same view whose lower bound is the upper bound of the
+        export for the provided args."""
+        return any(
+            metadata.file_tag == ingest_view_export_args.ingest_view_name and
+            metadata.datetimes_contained_lower_bound_exclusive ==
+            ingest_view_export_args.upper_bound_datetime_to_export
+            for metadata in self.file_metadata_manager.get_ingest_view_metadata_pending_export())
+
     @staticmethod
     def create_date_diff_query(upper_bound_query: str, upper_bound_prev_query: str, do_reverse_date_diff: bool) -> str:
         """Provided the given |upper_bound_query| and |upper_bound_prev_query| returns a query which will return the
@@ -186,7 +275,9 @@ class DirectIngestIngestViewExportManager:
         Note: In order to prevent resource exhaustion in BigQuery, the ultimate query in this method is broken down
         into distinct parts. This method first persists the results of historical queries for each given bound date
         (upper and lower) into temporary tables. The delta between those tables is then queried separately using
-        SQL's `EXCEPT DISTINCT` and those final results are exported to Cloud Storage.
+        SQL's `EXCEPT DISTINCT` and those final results are exported to Cloud Storage. When exports for a backlog of
+        dates are processed in order, the upper bound table of each export is kept and reused as the lower bound table
+        of the next export, and is deleted once there is no next export pending.
         """
         if not self.region.are_ingest_view_exports_enabled_in_env():
             raise ValueError(f'Ingest view exports not enabled for region [{self.region.region_code}]')
@@ -217,36 +308,28 @@ class DirectIngestIngestViewExportManager:
             self.file_metadata_manager.mark_ingest_view_exported(metadata)
             return True
 
-        single_date_table_ids = []
         single_date_table_export_jobs = []
 
-        upper_bound_table_name = \
-            f'{ingest_view_export_args.ingest_view_name}_' \
-            f'{ingest_view_export_args.upper_bound_datetime_to_export.strftime(TABLE_NAME_DATE_FORMAT)}_' \
-            f'upper_bound'
-        export_job = self._generate_export_job_for_date(
-            table_name=upper_bound_table_name,
+        upper_bound_table_name, export_job = self._get_or_create_date_bounded_table_async(
             ingest_view=ingest_view,
-            date_bound=ingest_view_export_args.upper_bound_datetime_to_export)
-        single_date_table_ids.append(upper_bound_table_name)
-        single_date_table_export_jobs.append(export_job)
+            date_bound=ingest_view_export_args.upper_bound_datetime_to_export,
+            job_creation_time=metadata.job_creation_time)
+        if export_job is not None:
+            single_date_table_export_jobs.append(export_job)
 
         query = SELECT_SUBQUERY.format(
             project_id=self.big_query_client.project_id,
             dataset_id=ingest_view.dataset_id,
             table_name=upper_bound_table_name)
 
+        lower_bound_table_name = None
         if ingest_view_export_args.upper_bound_datetime_prev:
-            lower_bound_table_name = \
-                f'{ingest_view_export_args.ingest_view_name}_' \
-                f'{ingest_view_export_args.upper_bound_datetime_prev.strftime(TABLE_NAME_DATE_FORMAT)}_' \
-                f'lower_bound'
-            export_job = self._generate_export_job_for_date(
-                table_name=lower_bound_table_name,
+            lower_bound_table_name, export_job = self._get_or_create_date_bounded_table_async(
                 ingest_view=ingest_view,
-                date_bound=ingest_view_export_args.upper_bound_datetime_prev)
-            single_date_table_export_jobs.append(export_job)
-            single_date_table_ids.append(lower_bound_table_name)
+                date_bound=ingest_view_export_args.upper_bound_datetime_prev,
+                job_creation_time=metadata.job_creation_time)
+            if export_job is not None:
+                single_date_table_export_jobs.append(export_job)
 
             upper_bound_prev_query = SELECT_SUBQUERY.format(
                 project_id=self.big_query_client.project_id,
@@ -282,6 +365,17 @@ class DirectIngestIngestViewExportManager:
         self.big_query_client.export_query_results_to_cloud_storage(export_configs=export_configs)
         logging.info('Export to cloud storage complete.')
 
+        # The upper bound table is kept if a pending export for this view starts where this one ends, so that the next
+        # export can use it as its lower bound table instead of creating it again.
+        single_date_table_ids = []
+        if self._has_pending_export_starting_at(ingest_view_export_args):
+            logging.info('Keeping intermediate table [%s] for the next export of [%s]',
+                         upper_bound_table_name, ingest_view_export_args.ingest_view_name)
+        else:
+            single_date_table_ids.append(upper_bound_table_name)
+        if lower_bound_table_name:
+            single_date_table_ids.append(lower_bound_table_name)
+
         for table_id in single_date_table_ids:
             self.big_query_client.delete_table(dataset_id=ingest_view.dataset_id, table_id=table_id)
             logging.info('Deleted intermediate table [%s]', table_id)
@@ -16,7 +16,10 @@
 # =============================================================================
 """Streaming read functionality for Google Cloud Storage CSV files."""
 import abc
-from typing import Iterator, List, Optional
+import codecs
+import io
+import logging
+from typing import Iterator, List, Optional, BinaryIO, Callable
 
 import gcsfs
 import pandas as pd
@@ -49,6 +52,13 @@ class GcsfsCsvReaderDelegate:
         we can successfully terminate the read.
         """
 
+    @abc.abstractmethod
+    def on_encoding_switch(self, from_encoding: str, to_encoding: str, e: UnicodeError) -> None:
+        """Called when the file read hits a decode error for |from_encoding| partway through the file, but all data
+        passed to on_dataframe() so far decodes identically with |to_encoding|. The read continues from the current
+        position with |to_encoding| instead of restarting, so no clean up of already processed chunks is necessary.
+        """
+
     @abc.abstractmethod
     def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
         """Called when the file read hits a decode error for a given encoding. Any necessary clean up for the partially
@@ -72,14 +82,87 @@ class GcsfsCsvReaderDelegate:
         """Called when the streaming read has successfully completed."""
 
 
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Returns True if ASCII bytes decode to the same characters with |encoding| as with ASCII."""
+    ascii_bytes = bytes(range(128))
+    try:
+        return codecs.decode(ascii_bytes, encoding) == ascii_bytes.decode('ascii')
+    except UnicodeError:
+        return False
+
+
+class _FallbackDecodingTextStream(io.TextIOBase):
+    """A text stream that incrementally decodes a binary stream, falling back to the next of |encodings| in place when a
+    block fails to decode.
+
+    Falling back in place is only possible while every block returned so far is pure ASCII (and the next encoding is
+    ASCII compatible), since only then is text already handed to the consumer guaranteed to be identical under the
+    next encoding. Otherwise, the decode error is raised and the caller must restart the read.
+    """
+
+    def __init__(self,
+                 binary_fp: BinaryIO,
+                 encodings: List[str],
+                 on_encoding_switch: Callable[[str, str, UnicodeError], None]):
+        super().__init__()
+        self._binary_fp = binary_fp
+        self._encodings = encodings
+        self._encoding_index = 0
+        self._decoder = codecs.getincrementaldecoder(encodings[0])()
+        self._on_encoding_switch = on_encoding_switch
+        self._returned_ascii_only = True
+        self._at_eof = False
+
+    @property
+    def current_encoding(self) -> str:
+        return self._encodings[self._encoding_index]
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        """Reads the next block of bytes and returns it decoded. As with a raw read, the returned text may be shorter
+        or longer than |size|, but is only empty at the end of the stream."""
+        while not self._at_eof:
+            block = self._binary_fp.read(size if size is not None and size > 0 else -1)
+            final = not block or size is None or size < 0
+
+            while True:
+                try:
+                    text = self._decoder.decode(block, final=final)
+                    break
+                except UnicodeDecodeError as e:
+                    self._switch_encoding_or_raise(e)
+
+            self._at_eof = final
+            self._returned_ascii_only = self._returned_ascii_only and block.isascii()
+            if text:
+                return text
+        return ''
+
+    def _switch_encoding_or_raise(self, e: UnicodeDecodeError) -> None:
+        next_index = self._encoding_index + 1
+        if not self._returned_ascii_only \
+                or next_index >= len(self._encodings) \
+                or not _is_ascii_compatible(self._encodings[next_index]):
+            raise e
+
+        from_encoding = self.current_encoding
+        self._encoding_index = next_index
+        self._decoder = codecs.getincrementaldecoder(self.current_encoding)()
+        logging.info('Switching from encoding [%s] to [%s] without restarting read',
+                     from_encoding, self.current_encoding)
+        self._on_encoding_switch(from_encoding, self.current_encoding, e)
+
+
 class GcsfsCsvReader:
     """Class providing streaming read functionality for Google Cloud Storage CSV files."""
 
     def __init__(self, fs: gcsfs.GCSFileSystem):
         self.gcs_file_system = fs
 
-    def _file_pointer_for_path(self, path: GcsfsFilePath, encoding: str):
-        """Returns a file pointer for the given path."""
+    def _file_pointer_for_path(self, path: GcsfsFilePath) -> BinaryIO:
+        """Returns a binary file pointer for the given path."""
 
         # From the GCSFileSystem docs (https://gcsfs.readthedocs.io/en/latest/api.html#gcsfs.core.GCSFileSystem),
         # 'google_default' means we should look for local credentials set up via `gcloud login`. The project this is
@@ -87,7 +170,7 @@ class GcsfsCsvReader:
         # `gcloud config set project [PROJECT_ID]`. If we are running in the GAE environment, we should be able to query
         # the internal metadata for credentials.
         token = 'google_default' if not environment.in_gae() else 'cloud'
-        return self.gcs_file_system.open(path.uri(), encoding=encoding, token=token)
+        return self.gcs_file_system.open(path.uri(), mode='rb', token=token)
 
     def streaming_read(self,
                        path: GcsfsFilePath,
@@ -100,6 +183,11 @@ class GcsfsCsvReader:
         types. For large files, this allows us to read and process the whole file without ever storing the whole file in
         local memory/disk.
 
+        Bytes are decoded incrementally as they are read. If a block fails to decode while everything read so far has
+        been ASCII, decoding continues in place with the next encoding (see _FallbackDecodingTextStream), so in the
+        common case the file is read from GCS exactly once. The read is only restarted with the next encoding if
+        non-ASCII data has already been decoded with the failing encoding.
+
         Args:
             path: The GCS path to read.
             delegate: A delegate for handling read chunks one by one.
@@ -112,17 +200,19 @@ class GcsfsCsvReader:
         if not encodings_to_try:
             encodings_to_try = COMMON_RAW_FILE_ENCODINGS
 
-        for encoding in encodings_to_try:
-            delegate.on_start_read_with_encoding(encoding)
+        remaining_encodings = list(encodings_to_try)
+        while remaining_encodings:
+            delegate.on_start_read_with_encoding(remaining_encodings[0])
+            stream: Optional[_FallbackDecodingTextStream] = None
             try:
-                with self._file_pointer_for_path(path, encoding=encoding) as fp:
+                with self._file_pointer_for_path(path) as fp:
+                    stream = _FallbackDecodingTextStream(fp, remaining_encodings, delegate.on_encoding_switch)
                     try:
                         reader: Iterator[pd.DataFrame] = pd.read_csv(
                             # Note: Pandas read_csv() also accepts GCS gs:// URIs directly, but it does not properly
                             # close the file stream in the case of an EmptyDataError, which we catch below, so we are
                             # creating and passing in a file pointer instead so that we have control over the scope.
-                            fp,
-                            encoding=encoding,
+                            stream,
                             dtype=str,
                             chunksize=chunk_size,
                             **kwargs
@@ -131,20 +221,24 @@ class GcsfsCsvReader:
                         reader = iter([])
 
                     for i, df in enumerate(reader):
-                        continue_iteration = delegate.on_dataframe(encoding=encoding, chunk_num=i, df=df)
+                        continue_iteration = delegate.on_dataframe(encoding=stream.current_encoding, chunk_num=i, df=df)
                         if not continue_iteration:
                             break
 
-                    delegate.on_file_read_success(encoding)
+                    delegate.on_file_read_success(stream.current_encoding)
                     return
             except UnicodeError as e:
+                encoding = stream.current_encoding if stream else remaining_encodings[0]
                 should_throw = delegate.on_unicode_decode_error(encoding, e)
                 if should_throw:
                     raise e
+                remaining_encodings = remaining_encodings[remaining_encodings.index(encoding) + 1:]
                 continue
             except Exception as e:
+                encoding = stream.current_encoding if stream else remaining_encodings[0]
                 should_throw = delegate.on_exception(encoding, e)
                 if should_throw:
                     raise e
+                remaining_encodings = remaining_encodings[remaining_encodings.index(encoding) + 1:]
 
         raise ValueError(f'Unable to read path [{path.abs_path()}] for any of these encodings: {encodings_to_try}')
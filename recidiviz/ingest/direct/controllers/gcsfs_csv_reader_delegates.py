@@ -39,6 +39,9 @@ class SimpleGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
     def on_dataframe(self, encoding: str, chunk_num: int, df: pd.DataFrame) -> bool:
         return True
 
+    def on_encoding_switch(self, from_encoding: str, to_encoding: str, e: UnicodeError) -> None:
+        pass
+
     def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
         return False
 
@@ -101,6 +104,11 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
         self.output_paths_with_columns.append((output_path, transformed_df.columns))
         return True
 
+    def on_encoding_switch(self, from_encoding: str, to_encoding: str, e: UnicodeError) -> None:
+        logging.info('Continuing read of file [%s] with encoding [%s] after failing to decode with [%s] - keeping '
+                     '[%d] already uploaded chunks', self.path.abs_path(), to_encoding, from_encoding,
+                     len(self.output_paths_with_columns))
+
     def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
         logging.info('Unable to read file [%s] with encoding [%s]', self.path.abs_path(), encoding)
         self._delete_temp_output_paths()
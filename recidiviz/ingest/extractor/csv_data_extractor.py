@@ -23,8 +23,9 @@ import collections.abc
 import csv
 import logging
 from collections import defaultdict, OrderedDict
-from typing import Dict, Set, List, Callable, Optional, Iterable, Union
+from typing import Dict, Set, List, Callable, Optional, Iterable, Union, Tuple
 
+import attr
 import more_itertools
 
 from recidiviz.common.ingest_metadata import SystemLevel
@@ -60,6 +61,23 @@ class IngestFieldCoordinates:
 _DUMMY_KEY_PREFIX = 'CSV_EXTRACTOR_DUMMY_KEY'
 
 
+@attr.s(frozen=True)
+class _CsvColumnPlan:
+    """Everything about how a single CSV column is extracted that can be determined from the YAML mappings alone,
+    compiled once per column rather than for every cell."""
+
+    # The column name with surrounding whitespace removed
+    stripped_key: str = attr.ib()
+
+    # The '<class_name>.<field_name>' this column is set on, or None if the column is not set on any object
+    lookup_key: Optional[str] = attr.ib()
+    class_name: Optional[str] = attr.ib()
+    field_name: Optional[str] = attr.ib()
+
+    # Whether this column sets a field on a child of the primary object for the row
+    is_child: bool = attr.ib()
+
+
 class CsvDataExtractor(DataExtractor):
     """Data extractor for CSV text."""
 
@@ -129,6 +147,15 @@ class CsvDataExtractor(DataExtractor):
             self.child_keys.keys()) | set(self.keys_to_ignore) | set(
                 self.ancestor_keys.keys()) | set(self.primary_key.keys())
 
+        # Sorted CSV column names whose values make up the dummy primary key of each child class
+        self._child_cols_by_class: Dict[str, List[str]] = defaultdict(list)
+        for col, field in sorted(self.child_keys.items()):
+            child_class_name, _ = field.split('.')
+            self._child_cols_by_class[child_class_name].append(col.strip())
+
+        self._column_plans: Dict[str, _CsvColumnPlan] = {}
+        self._header_needs_stripping: Dict[Tuple[str, ...], bool] = {}
+
     def extract_and_populate_data(self,
                                   content: Union[str, Iterable[str]],
                                   ingest_info: IngestInfo = None) -> IngestInfo:
@@ -176,52 +203,58 @@ class CsvDataExtractor(DataExtractor):
             raise ValueError('Ingest object cache unexpectedly None')
 
         seen_map: Dict[int, Set[str]] = defaultdict(set)
-        for row in rows:
-            row_with_stripped_cols = OrderedDict()
-            for key in row:
-                row_with_stripped_cols[key.strip()] = row[key]
-            row = row_with_stripped_cols
+        for raw_row in rows:
+            row = self._with_stripped_keys(raw_row)
 
             self._pre_process_row(row)
             primary_coordinates = self._primary_coordinates(row)
             ancestor_chain: Dict[str, str] = self._ancestor_chain(row)
 
+            # The ancestor chain and creation args are the same for every column in this row that sets a field on a
+            # given class, so they are only built once per class.
+            column_args_by_class: Dict[Tuple[str, bool], Tuple[Dict[str, str], Dict[str, str]]] = {}
+
             extracted_objects_for_row = []
             for k, v in row.items():
-                k = k.strip()
-                if k not in self.all_keys:
-                    raise ValueError("Unmapped key: [%s]" % k)
-
-                if k in self.keys:
-                    cls, field = self.keys[k].split('.')
-                    if cls == primary_coordinates.class_name and field == primary_coordinates.field_name:
-                        # It's possible that the primary key field has been listed in key_mappings in the YAML to make
-                        # it so that section is not empty. However, if there is a primary coordinates override, we want
-                        # the value to match the overridden value so we don't skip this field if the row value is empty.
-                        v = primary_coordinates.field_value
+                plan = self._get_column_plan(k)
+                if plan.lookup_key is None:
+                    # Only mapped keys are set on ingest objects
+                    continue
+                if plan.class_name is None:
+                    raise ValueError(f'No class name for mapped key [{plan.lookup_key}]')
+                class_name: str = plan.class_name
+
+                if plan.class_name == primary_coordinates.class_name \
+                        and plan.field_name == primary_coordinates.field_name:
+                    # It's possible that the primary key field has been listed in key_mappings in the YAML to make
+                    # it so that section is not empty. However, if there is a primary coordinates override, we want
+                    # the value to match the overridden value so we don't skip this field if the row value is empty.
+                    v = primary_coordinates.field_value
 
                 if not v and not self.set_with_empty_value:
                     continue
 
-                column_ancestor_chain = ancestor_chain.copy()
-                if k in self.child_keys:
-                    child_class_to_set, _ = self.child_keys[k].split('.')
-                    self._update_column_ancestor_chain_for_child_object(
-                        row,
-                        primary_coordinates,
-                        child_class_to_set,
-                        column_ancestor_chain)
-
-                create_args = self._get_creation_args(row,
-                                                      k,
-                                                      column_ancestor_chain)
-
-                extracted_objects_for_column = \
-                    self._set_value_if_key_exists(k, v,
-                                                  ingest_info,
-                                                  seen_map,
-                                                  column_ancestor_chain,
-                                                  **create_args)
+                class_key = (class_name, plan.is_child)
+                if class_key not in column_args_by_class:
+                    column_ancestor_chain = ancestor_chain
+                    if plan.is_child:
+                        column_ancestor_chain = ancestor_chain.copy()
+                        self._update_column_ancestor_chain_for_child_object(
+                            row,
+                            primary_coordinates,
+                            class_name,
+                            column_ancestor_chain)
+
+                    create_args = self._get_creation_args(row,
+                                                          plan.stripped_key,
+                                                          column_ancestor_chain,
+                                                          primary_coordinates=primary_coordinates)
+                    column_args_by_class[class_key] = (column_ancestor_chain, create_args)
+
+                column_ancestor_chain, create_args = column_args_by_class[class_key]
+                extracted_objects_for_column = self._set_or_create_object(
+                    ingest_info, plan.lookup_key, [v], seen_map,
+                    column_ancestor_chain, self.enforced_ancestor_types, **create_args)
                 extracted_objects_for_row.extend(extracted_objects_for_column)
 
             self._post_process_row(row, extracted_objects_for_row)
@@ -230,6 +263,44 @@ class CsvDataExtractor(DataExtractor):
             for obj in obj_dict.values():
                 self._clear_dummy_id(obj)
 
+    def _with_stripped_keys(self, row: Dict[str, str]) -> Dict[str, str]:
+        """Returns |row|, or a copy of it with surrounding whitespace removed from every column name if any of them
+        have some."""
+        header = tuple(row.keys())
+        needs_stripping = self._header_needs_stripping.get(header)
+        if needs_stripping is None:
+            needs_stripping = any(key != key.strip() for key in header)
+            self._header_needs_stripping[header] = needs_stripping
+
+        if not needs_stripping:
+            return row
+
+        row_with_stripped_cols = OrderedDict()
+        for key in row:
+            row_with_stripped_cols[key.strip()] = row[key]
+        return row_with_stripped_cols
+
+    def _get_column_plan(self, key: str) -> _CsvColumnPlan:
+        """Returns the plan for extracting the column with name |key|, compiling it the first time the column is seen.
+        Raises a ValueError if the column is not mapped in the YAML."""
+        plan = self._column_plans.get(key)
+        if plan is not None:
+            return plan
+
+        stripped_key = key.strip()
+        if stripped_key not in self.all_keys:
+            raise ValueError("Unmapped key: [%s]" % stripped_key)
+
+        lookup_key = self.keys.get(stripped_key)
+        class_name, field_name = lookup_key.split('.') if lookup_key else (None, None)
+        plan = _CsvColumnPlan(stripped_key=stripped_key,
+                              lookup_key=lookup_key,
+                              class_name=class_name,
+                              field_name=field_name,
+                              is_child=stripped_key in self.child_keys)
+        self._column_plans[key] = plan
+        return plan
+
     def _update_column_ancestor_chain_for_child_object(
             self,
             row: Dict[str, str],
@@ -280,21 +351,6 @@ class CsvDataExtractor(DataExtractor):
         for post_hook in self.file_post_hooks:
             post_hook(ingest_info, self.ingest_object_cache)
 
-    def _set_value_if_key_exists(self,
-                                 lookup_key: str, value: str,
-                                 ingest_info: IngestInfo,
-                                 seen_map: Dict[int, Set[str]],
-                                 ancestor_chain: Dict[str, str] = None,
-                                 **create_args) -> List[IngestObject]:
-        """If the column key is one we want to set on the object, set it on the
-        appropriate object instance."""
-        if lookup_key in self.keys:
-            return self._set_or_create_object(
-                ingest_info, self.keys[lookup_key], [value], seen_map,
-                ancestor_chain, self.enforced_ancestor_types, **create_args)
-
-        return []
-
     def _instantiate_person(self, ingest_info: IngestInfo):
         if self.system_level == SystemLevel.COUNTY:
             ingest_info.create_person()
@@ -335,12 +391,7 @@ class CsvDataExtractor(DataExtractor):
 
         # Append all values in this row that are relevant to this child object,
         # ordered by CSV column name
-        cols_for_id = []
-        for col, field in self.child_keys.items():
-            this_col_class_name, _ = field.split('.')
-            if child_class_name == this_col_class_name:
-                cols_for_id.append(col)
-        child_primary_key_parts += [row[col.strip()] for col in sorted(cols_for_id)]
+        child_primary_key_parts += [row[col] for col in self._child_cols_by_class.get(child_class_name, [])]
 
         return '|'.join(child_primary_key_parts)
 
@@ -358,20 +409,24 @@ class CsvDataExtractor(DataExtractor):
     def _get_creation_args(self,
                            row: Dict[str, str],
                            lookup_key: str,
-                           column_ancestor_chain: Dict[str, str]) \
+                           column_ancestor_chain: Dict[str, str],
+                           primary_coordinates: Optional[IngestFieldCoordinates] = None) \
             -> Dict[str, str]:
         """Gets arguments needed to create a new entity, if necessary.
 
         For now, this just returns the primary key-esque id for the entity to
         be created or updated, to help with assembling object graphs when a
         row contains data for multiple entities.
+
+        |primary_coordinates| may be provided if they have already been computed for this row.
         """
 
         current_field = self.keys.get(lookup_key, None)
         if not current_field:
             return {}
 
-        primary_coordinates = self._primary_coordinates(row)
+        if primary_coordinates is None:
+            primary_coordinates = self._primary_coordinates(row)
 
         current_class_name, _current_field_name = current_field.split('.')
         if current_class_name == primary_coordinates.class_name:
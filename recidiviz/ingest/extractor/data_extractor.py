@@ -35,8 +35,11 @@ list of objects; or create new objects as needed.
 """
 
 import abc
+import copy
 import logging
-from typing import Union, List, Optional, Sequence, Dict, Set, Tuple
+import os
+from functools import lru_cache
+from typing import Union, List, Optional, Sequence, Dict, Set, Tuple, Any
 
 import yaml
 from lxml.html import HtmlElement
@@ -48,6 +51,14 @@ from recidiviz.ingest.models.ingest_object_hierarchy import \
     get_ancestor_class_sequence
 
 
+@lru_cache(maxsize=256)
+def _load_key_mapping_file(key_mapping_file: str, _mtime: float) -> Dict[str, Any]:
+    """Parses the YAML mappings in |key_mapping_file|. Memoized on the file path and modification time, since the same
+    mappings are loaded for every file with a given file tag."""
+    with open(key_mapping_file, 'r') as ymlfile:
+        return yaml.full_load(ymlfile)
+
+
 class DataExtractor(metaclass=abc.ABCMeta):
     """Base class for automatically extracting data from a file."""
 
@@ -63,8 +74,9 @@ class DataExtractor(metaclass=abc.ABCMeta):
                 stitching together IngestInfo object graphs where id mappings
                 don't suffice.
         """
-        with open(key_mapping_file, 'r') as ymlfile:
-            self.manifest = yaml.full_load(ymlfile)
+        # Extractors modify their mappings, so each gets its own copy of the cached manifest.
+        self.manifest = copy.deepcopy(
+            _load_key_mapping_file(key_mapping_file, os.path.getmtime(key_mapping_file)))
         self.keys = self.manifest.get('key_mappings', {})
         self.multi_keys = self.manifest.get('multi_key_mapping', {})
 
@@ -17,7 +17,8 @@
 
 """Represents data scraped for a single individual."""
 from abc import abstractmethod
-from typing import List, Optional
+from collections import Counter
+from typing import List, Optional, Hashable
 
 from recidiviz.common.str_field_utils import to_snake_case
 
@@ -69,6 +70,11 @@ class IngestObject:
     def class_name(self) -> str:
         return to_snake_case(self.__class__.__name__)
 
+    def fingerprint(self) -> Hashable:
+        """Returns a hashable value that is equal for two objects if and only if they would be equal after both are
+        sorted, i.e. the fingerprint ignores the order of repeated fields."""
+        return to_fingerprint(self)
+
 
 class IngestInfo(IngestObject):
     """Class for information about multiple people."""
@@ -89,6 +95,9 @@ class IngestInfo(IngestObject):
     def __repr__(self):
         return to_repr(self, exclude=['_state_people_by_id'])
 
+    def fingerprint(self) -> Hashable:
+        return to_fingerprint(self, exclude=['_state_people_by_id'])
+
     def __setattr__(self, name, value):
         restricted_setattr(self, '_state_people_by_id', name, value)
 
@@ -1663,6 +1672,22 @@ def to_repr(obj, exclude=None):
     return '{}({})'.format(obj.__class__.__name__, ', '.join(args))
 
 
+def to_fingerprint(obj, exclude=None) -> Hashable:
+    if exclude is None:
+        exclude = []
+    return (obj.__class__.__name__,
+            frozenset((key, _value_fingerprint(val)) for key, val in vars(obj).items() if key not in exclude))
+
+
+def _value_fingerprint(val) -> Hashable:
+    if isinstance(val, IngestObject):
+        return val.fingerprint()
+    if isinstance(val, list):
+        # Repeated fields are compared as multisets
+        return frozenset(Counter(_value_fingerprint(elem) for elem in val).items())
+    return val
+
+
 def restricted_setattr(self, last_field, name, value):
     if isinstance(value, str) and (value == '' or value.isspace()):
         value = None
@@ -38,8 +38,11 @@ In order to subclass this the following functions must be implemented:
 """
 
 import abc
+import copy
 import json
 import logging
+import time
+from concurrent import futures
 from typing import Any, Dict, List, Optional, Tuple
 
 import attr
@@ -73,6 +76,15 @@ class BaseScraper(Scraper):
     # TODO(#1055): Remove this when batch reader is complete.
     BATCH_WRITES = True
 
+    # The maximum number of pages fetched at once for tasks whose task types
+    # should_fetch_concurrently. This should be no larger than HTTP_POOL_SIZE.
+    CONCURRENT_FETCH_WORKERS = 4
+
+    # How long a task may spend fetching pages concurrently before it queues
+    # the rest as their own tasks. This leaves headroom under the 10 minute
+    # deadline Cloud Tasks gives a scrape task.
+    CONCURRENT_FETCH_TIMEOUT_SECONDS = 8 * 60
+
     def __init__(self, region_name):
         super().__init__(region_name)
 
@@ -177,121 +189,13 @@ class BaseScraper(Scraper):
         Args:
             params: dict of parameters passed from the last scrape session.
         """
+        concurrent_fetch_deadline = \
+            time.monotonic() + self.CONCURRENT_FETCH_TIMEOUT_SECONDS
         try:
             task = request.next_task
-
-            # Here we handle a special case where we weren't really sure
-            # we were going to get data when we submitted a task, but then
-            # we ended up with data, so no more requests are required,
-            # just the content we already have.
-            # TODO(#680): remove this
-            if task.content is not None:
-                content = self._parse_html_content(task.content)
-                cookies = None
-            else:
-                post_data = task.post_data
-
-                # Let the child transform the post_data if it wants before
-                # sending the requests.  This hook is in here in case the
-                # child did something like compress the post_data before
-                # it put it on the queue.
-                self.transform_post_data(post_data)
-
-                # We always fetch some content before doing anything.
-                # Note that we use get here for the post_data to return a
-                # default value of None if this scraper doesn't set it.
-                try:
-                    content, cookies = self._fetch_content(
-                        task.endpoint, task.response_type, headers=task.headers,
-                        cookies=task.cookies, params=task.params,
-                        post_data=post_data, json_data=task.json)
-                except Exception as e:
-                    raise ScraperFetchError(str(e)) from e
-
-            scraped_data = None
-            if self.should_scrape_data(task.task_type):
-                # If we want to scrape data, we should either create an
-                # ingest_info object or get the one that already exists.
-                logging.info("Scraping data for [%s] and endpoint: [%s]",
-                             self.region.region_code, task.endpoint)
-                try:
-                    scraped_data = self.populate_data(
-                        content, task, request.ingest_info or IngestInfo())
-                except Exception as e:
-                    raise ScraperPopulateDataError(str(e)) from e
-
-            if self.should_get_more_tasks(task.task_type):
-                logging.info("Getting more tasks for [%s] and endpoint: [%s]",
-                             self.region.region_code, task.endpoint)
-
-                # Only send along ingest info if it will not be persisted now.
-                ingest_info_to_send = None
-                if scraped_data is not None and not scraped_data.persist:
-                    ingest_info_to_send = scraped_data.ingest_info
-
-                try:
-                    # pylint: disable=assignment-from-no-return
-                    next_tasks = self.get_more_tasks(content, task)
-                except Exception as e:
-                    raise ScraperGetMoreTasksError(str(e)) from e
-                for next_task in next_tasks:
-                    # Include cookies received from response, if any
-                    if cookies:
-                        cookies.update(next_task.cookies)
-                        next_task = Task.evolve(next_task, cookies=cookies)
-                    self.add_task('_generic_scrape', QueueRequest(
-                        scrape_type=request.scrape_type,
-                        scraper_start_time=request.scraper_start_time,
-                        next_task=next_task,
-                        ingest_info=ingest_info_to_send,
-                    ))
-
-            if scraped_data is not None and scraped_data.persist:
-                if scraped_data.ingest_info:
-                    logging.info("Logging at most 4 people (were %d):",
-                                 len(scraped_data.ingest_info.people))
-                    loop_count = min(len(scraped_data.ingest_info.people),
-                                     constants.MAX_PEOPLE_TO_LOG)
-                    for i in range(loop_count):
-                        logging.info("[%s]",
-                                     str(scraped_data.ingest_info.people[i]))
-                    logging.info("Last seen time of person being set as: [%s]",
-                                 request.scraper_start_time)
-                    metadata = IngestMetadata(self.region.region_code,
-                                              self.region.jurisdiction_id,
-                                              request.scraper_start_time,
-                                              self.get_enum_overrides())
-                    if self.BATCH_WRITES:
-                        logging.info(
-                            "Queuing ingest_info ([%d] people) to "
-                            "batch_persistence for [%s]",
-                            len(scraped_data.ingest_info.people),
-                            self.region.region_code)
-                        scrape_key = ScrapeKey(
-                            self.region.region_code, request.scrape_type)
-                        batch_persistence.write(
-                            ingest_info=scraped_data.ingest_info,
-                            scrape_key=scrape_key,
-                            task=task,
-                        )
-                    else:
-                        logging.info(
-                            "Writing ingest_info ([%d] people) to the database"
-                            " for [%s]",
-                            len(scraped_data.ingest_info.people),
-                            self.region.region_code)
-                        persistence.write(
-                            ingest_utils.convert_ingest_info_to_proto(
-                                scraped_data.ingest_info), metadata)
-                for sc in scraped_data.single_counts:
-                    if not sc.date:
-                        scrape_key = ScrapeKey(self.region.region_code,
-                                               constants.ScrapeType.BACKGROUND)
-                        session = sessions.get_current_session(scrape_key)
-                        if session:
-                            sc = attr.evolve(sc, date=session.start.date())
-                    single_count.store_single_count(sc,
-                                                    self.region.jurisdiction_id)
+            content, cookies = self._fetch_task_content(task)
+            self._scrape_content(request, content, cookies,
+                                 concurrent_fetch_deadline)
         except Exception as e:
             if self.BATCH_WRITES:
                 scrape_key = ScrapeKey(
@@ -304,6 +208,198 @@ class BaseScraper(Scraper):
                 )
             raise e
 
+    def _fetch_task_content(self, task: Task) \
+            -> Tuple[Any, Optional[Dict[str, str]]]:
+        """Returns the content of the page for the given task and the cookies
+        received with it."""
+        # Here we handle a special case where we weren't really sure
+        # we were going to get data when we submitted a task, but then
+        # we ended up with data, so no more requests are required,
+        # just the content we already have.
+        # TODO(#680): remove this
+        if task.content is not None:
+            return self._parse_html_content(task.content), None
+
+        post_data = task.post_data
+
+        # Let the child transform the post_data if it wants before
+        # sending the requests.  This hook is in here in case the
+        # child did something like compress the post_data before
+        # it put it on the queue.
+        self.transform_post_data(post_data)
+
+        # We always fetch some content before doing anything.
+        # Note that we use get here for the post_data to return a
+        # default value of None if this scraper doesn't set it.
+        try:
+            content, cookies = self._fetch_content(
+                task.endpoint, task.response_type, headers=task.headers,
+                cookies=task.cookies, params=task.params,
+                post_data=post_data, json_data=task.json)
+        except Exception as e:
+            raise ScraperFetchError(str(e)) from e
+        return content, cookies
+
+    def _scrape_content(self, request: QueueRequest, content: Any,
+                        cookies: Optional[Dict[str, str]],
+                        concurrent_fetch_deadline: Optional[float]):
+        """Scrapes data and more tasks from the content fetched for the request,
+        as determined by its task type.
+
+        More tasks whose task types should_fetch_concurrently are fetched
+        concurrently until |concurrent_fetch_deadline|, a time.monotonic()
+        value. If it is None, they are queued like any other task instead.
+        """
+        task = request.next_task
+        scraped_data = None
+        concurrent_requests = []
+        if self.should_scrape_data(task.task_type):
+            # If we want to scrape data, we should either create an
+            # ingest_info object or get the one that already exists.
+            logging.info("Scraping data for [%s] and endpoint: [%s]",
+                         self.region.region_code, task.endpoint)
+            try:
+                scraped_data = self.populate_data(
+                    content, task, request.ingest_info or IngestInfo())
+            except Exception as e:
+                raise ScraperPopulateDataError(str(e)) from e
+
+        if self.should_get_more_tasks(task.task_type):
+            logging.info("Getting more tasks for [%s] and endpoint: [%s]",
+                         self.region.region_code, task.endpoint)
+
+            # Only send along ingest info if it will not be persisted now.
+            ingest_info_to_send = None
+            if scraped_data is not None and not scraped_data.persist:
+                ingest_info_to_send = scraped_data.ingest_info
+
+            try:
+                # pylint: disable=assignment-from-no-return
+                next_tasks = self.get_more_tasks(content, task)
+            except Exception as e:
+                raise ScraperGetMoreTasksError(str(e)) from e
+            for next_task in next_tasks:
+                # Include cookies received from response, if any
+                if cookies:
+                    cookies.update(next_task.cookies)
+                    next_task = Task.evolve(next_task, cookies=cookies)
+                next_request = QueueRequest(
+                    scrape_type=request.scrape_type,
+                    scraper_start_time=request.scraper_start_time,
+                    next_task=next_task,
+                    ingest_info=ingest_info_to_send,
+                )
+                if concurrent_fetch_deadline is not None and \
+                        self.should_fetch_concurrently(next_task.task_type):
+                    concurrent_requests.append(next_request)
+                else:
+                    self.add_task('_generic_scrape', next_request)
+
+        if scraped_data is not None and scraped_data.persist:
+            if scraped_data.ingest_info:
+                logging.info("Logging at most 4 people (were %d):",
+                             len(scraped_data.ingest_info.people))
+                loop_count = min(len(scraped_data.ingest_info.people),
+                                 constants.MAX_PEOPLE_TO_LOG)
+                for i in range(loop_count):
+                    logging.info("[%s]",
+                                 str(scraped_data.ingest_info.people[i]))
+                logging.info("Last seen time of person being set as: [%s]",
+                             request.scraper_start_time)
+                metadata = IngestMetadata(self.region.region_code,
+                                          self.region.jurisdiction_id,
+                                          request.scraper_start_time,
+                                          self.get_enum_overrides())
+                if self.BATCH_WRITES:
+                    logging.info(
+                        "Queuing ingest_info ([%d] people) to "
+                        "batch_persistence for [%s]",
+                        len(scraped_data.ingest_info.people),
+                        self.region.region_code)
+                    scrape_key = ScrapeKey(
+                        self.region.region_code, request.scrape_type)
+                    batch_persistence.write(
+                        ingest_info=scraped_data.ingest_info,
+                        scrape_key=scrape_key,
+                        task=task,
+                    )
+                else:
+                    logging.info(
+                        "Writing ingest_info ([%d] people) to the database"
+                        " for [%s]",
+                        len(scraped_data.ingest_info.people),
+                        self.region.region_code)
+                    persistence.write(
+                        ingest_utils.convert_ingest_info_to_proto(
+                            scraped_data.ingest_info), metadata)
+            for sc in scraped_data.single_counts:
+                if not sc.date:
+                    scrape_key = ScrapeKey(self.region.region_code,
+                                           constants.ScrapeType.BACKGROUND)
+                    session = sessions.get_current_session(scrape_key)
+                    if session:
+                        sc = attr.evolve(sc, date=session.start.date())
+                single_count.store_single_count(sc,
+                                                self.region.jurisdiction_id)
+
+        # Requests are only collected for concurrent fetching when a deadline
+        # is set.
+        if concurrent_fetch_deadline is not None and concurrent_requests:
+            self._scrape_concurrently(concurrent_requests,
+                                      concurrent_fetch_deadline)
+
+    def _scrape_concurrently(self, requests: List[QueueRequest],
+                             deadline: float):
+        """Fetches the pages for the given requests concurrently, using at most
+        CONCURRENT_FETCH_WORKERS threads, then scrapes each of them in turn
+        rather than queueing a separate task for each one.
+
+        Any request that cannot be fetched or scraped, or whose page has not
+        been fetched by |deadline|, is queued as its own task instead, so that
+        it is retried on its own. Tasks found while scraping these pages are
+        always queued, so at most one level of pages is fetched concurrently.
+        """
+        # Requests scraped here are not serialized onto the queue, so give each
+        # one its own copy of anything it shares with its siblings.
+        isolated_requests = [
+            attr.evolve(
+                request,
+                next_task=Task.evolve(request.next_task,
+                                      cookies=dict(request.next_task.cookies)),
+                ingest_info=copy.deepcopy(request.ingest_info))
+            for request in requests]
+
+        executor = futures.ThreadPoolExecutor(
+            max_workers=self.CONCURRENT_FETCH_WORKERS)
+        try:
+            fetches = [
+                executor.submit(self._fetch_task_content, request.next_task)
+                for request in isolated_requests]
+            for request, isolated_request, fetch in zip(
+                    requests, isolated_requests, fetches):
+                try:
+                    content, cookies = fetch.result(
+                        timeout=max(deadline - time.monotonic(), 0))
+                    self._scrape_content(isolated_request, content, cookies,
+                                         None)
+                except futures.TimeoutError:
+                    fetch.cancel()
+                    logging.warning(
+                        "Ran out of time to fetch endpoint [%s] for [%s] "
+                        "concurrently, queueing it instead",
+                        request.next_task.endpoint, self.region.region_code)
+                    self.add_task('_generic_scrape', request)
+                except Exception as e:
+                    logging.warning(
+                        "Failed to scrape endpoint [%s] for [%s] concurrently, "
+                        "queueing it instead: %s",
+                        request.next_task.endpoint, self.region.region_code, e)
+                    self.add_task('_generic_scrape', request)
+        finally:
+            # Don't hold the task up waiting for any fetches that are still
+            # running after the deadline; their pages have been queued.
+            executor.shutdown(wait=False)
+
     def is_initial_task(self, task_type):
         """Tells us if the task_type is initial task_type.
 
@@ -337,6 +433,23 @@ class BaseScraper(Scraper):
         """
         return task_type & constants.TaskType.SCRAPE_DATA
 
+    def should_fetch_concurrently(self, task_type):
+        """Tells us if tasks of this type should be fetched concurrently with
+        the other tasks of this type returned by the same call to
+        get_more_tasks, rather than each being queued as its own task.
+
+        This suits task types for independent detail pages that a single page
+        fans out to many of. By default no task types are fetched concurrently.
+
+        Args:
+            A hexcode representing the task_type
+
+        Returns:
+            boolean whether or not to fetch tasks of this type concurrently.
+        """
+        # pylint: disable=unused-argument
+        return False
+
     def get_more_tasks(self, content, task: Task) -> List[Task]:
         """
         Gets more tasks based on the content and task passed in.  This
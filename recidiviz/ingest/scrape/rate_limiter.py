@@ -0,0 +1,66 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Limits the rate at which a scraper sends requests to a region's website.
+
+Limits are enforced locally, within a single process, and are shared by all
+scrapers and threads in that process that are scraping the same region.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class RateLimiter:
+    """Spaces out calls to |wait| so that, across all threads sharing the
+    limiter, they return at most |max_per_second| times per second."""
+
+    def __init__(self, max_per_second: float):
+        if max_per_second <= 0:
+            raise ValueError(
+                'Invalid rate limit: {}'.format(max_per_second))
+        self._interval = 1.0 / max_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Blocks until the next request is allowed to be sent."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_REGION_RATE_LIMITERS: Dict[Tuple[str, float], RateLimiter] = {}
+_REGION_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter_for_region(
+        region_code: str,
+        max_requests_per_second: Optional[float]) -> Optional[RateLimiter]:
+    """Returns the limiter shared by every scraper for |region_code| in this
+    process, or None if the region's requests are not rate limited."""
+    if not max_requests_per_second:
+        return None
+
+    key = (region_code, max_requests_per_second)
+    with _REGION_RATE_LIMITERS_LOCK:
+        if key not in _REGION_RATE_LIMITERS:
+            _REGION_RATE_LIMITERS[key] = RateLimiter(max_requests_per_second)
+        return _REGION_RATE_LIMITERS[key]
@@ -21,22 +21,48 @@ inherit from.
 """
 
 import abc
+import http.cookiejar
 import logging
+import threading
 from datetime import datetime
+from typing import Dict, Optional
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from recidiviz.ingest.ingestor import Ingestor
 from recidiviz.ingest.models.scrape_key import ScrapeKey
 from recidiviz.ingest.scrape import (constants, scraper_utils, sessions,
                                      tracker)
+from recidiviz.ingest.scrape.rate_limiter import get_rate_limiter_for_region
 from recidiviz.ingest.scrape.constants import BATCH_PUBSUB_TYPE
 from recidiviz.ingest.scrape.scraper_cloud_task_manager import \
     ScraperCloudTaskManager
 from recidiviz.ingest.scrape.task_params import QueueRequest, Task
 from recidiviz.utils import regions, pubsub_helper
 
+# The HTTP sessions shared by every scraper for a region in this process, keyed
+# by region code, so that connections are kept alive across tasks.
+_REGION_HTTP_SESSIONS: Dict[str, requests.Session] = {}
+_REGION_HTTP_SESSIONS_LOCK = threading.Lock()
+
+
+def close_http_sessions(region_code: Optional[str] = None) -> None:
+    """Closes the HTTP session shared by the scrapers for |region_code| in
+    this process, or those for every region if no region is given, and closes
+    their pooled connections. Later requests will open a new session."""
+    with _REGION_HTTP_SESSIONS_LOCK:
+        if region_code is None:
+            closed_sessions = list(_REGION_HTTP_SESSIONS.values())
+            _REGION_HTTP_SESSIONS.clear()
+        else:
+            session = _REGION_HTTP_SESSIONS.pop(region_code, None)
+            closed_sessions = [session] if session else []
+    for session in closed_sessions:
+        session.close()
+
 
 class FetchPageError(Exception):
 
@@ -70,6 +96,18 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
 
     """
 
+    # The maximum number of connections kept open to each host. Scrapers that
+    # fetch pages concurrently should keep this at least as large as the number
+    # of pages they fetch at once.
+    HTTP_POOL_SIZE = 10
+
+    # The number of times a request that fails to connect or receives one of
+    # HTTP_RETRY_STATUS_CODES is retried before giving up, and the factor by
+    # which the delay between those retries grows.
+    HTTP_MAX_RETRIES = 3
+    HTTP_RETRY_BACKOFF_FACTOR = 0.5
+    HTTP_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
     def __init__(self, region_name):
         """Initialize the parent scraper object.
 
@@ -85,6 +123,40 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
         self.region = regions.get_region(region_name)
         self.scraper_work_url = '/scraper/work/{}'.format(region_name)
         self.cloud_task_manager = ScraperCloudTaskManager()
+        self.rate_limiter = get_rate_limiter_for_region(
+            self.region.region_code, self.region.max_requests_per_second)
+
+    @property
+    def session(self) -> requests.Session:
+        """The session used for all of this scraper's requests, which is
+        shared with every other scraper for the region in this process until
+        close_http_sessions is called for the region."""
+        region_code = self.region.region_code
+        with _REGION_HTTP_SESSIONS_LOCK:
+            if region_code not in _REGION_HTTP_SESSIONS:
+                _REGION_HTTP_SESSIONS[region_code] = self._create_session()
+            return _REGION_HTTP_SESSIONS[region_code]
+
+    def _create_session(self) -> requests.Session:
+        """Creates a session that keeps connections alive so that they are
+        reused across pages and retries requests that fail transiently.
+
+        The session never stores the cookies it receives, as it is shared by
+        all of the region's tasks. Cookies are only sent when they are passed
+        to fetch_page, e.g. from a task's cookies."""
+        retry = Retry(total=self.HTTP_MAX_RETRIES,
+                      backoff_factor=self.HTTP_RETRY_BACKOFF_FACTOR,
+                      status_forcelist=self.HTTP_RETRY_STATUS_CODES,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self.HTTP_POOL_SIZE,
+                              pool_maxsize=self.HTTP_POOL_SIZE,
+                              max_retries=retry)
+        session = requests.Session()
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     @abc.abstractmethod
     def get_initial_task_method(self):
@@ -178,6 +250,10 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
                           "tasks. The message was:\n%s", str(e))
             return False
 
+        # Connections to the region's site are not needed until the next task
+        # for it runs.
+        close_http_sessions(region.region_code)
+
         # Check for other running scrapes, and if found kick off a delayed
         # resume for them since the taskqueue purge will kill them.
         other_scrapes = set([])
@@ -255,13 +331,16 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
                                    scraper_start_time=datetime.now(),
                                    next_task=self.get_initial_task()))
 
-    @staticmethod
-    def fetch_page(url, headers=None, cookies=None, params=None,
+    def fetch_page(self, url, headers=None, cookies=None, params=None,
                    post_data=None, json_data=None, should_proxy=True):
         """Fetch content from a URL. If data is None (the default), we perform
         a GET for the page. If the data is set, it must be a dict of parameters
         to use as POST data in a POST request to the url.
 
+        Requests are sent through the region's shared session, and wait for the
+        region's rate limit, if it has one. This is safe to call from multiple
+        threads at once.
+
         Args:
             url: (string) URL to fetch content from
             headers: (dict) any headers to send in addition to the default
@@ -286,13 +365,16 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
         if 'User-Agent' not in headers:
             headers.update(scraper_utils.get_headers())
 
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+
         try:
             if post_data is None and json_data is None:
-                page = requests.get(
+                page = self.session.get(
                     url, proxies=proxies, headers=headers, cookies=cookies,
                     params=params, verify=False)
             elif params is None:
-                page = requests.post(
+                page = self.session.post(
                     url, proxies=proxies, headers=headers, cookies=cookies,
                     data=post_data, json=json_data, verify=False)
             else:
@@ -30,6 +30,8 @@ import gzip
 import io
 import json
 import logging
+import threading
+from concurrent import futures
 from typing import List, Dict, Tuple, Set, Any, Callable, Union, Sequence
 
 import attr
@@ -49,6 +51,9 @@ QUERY_PAGE_SIZE = 10000
 
 DEFAULT_DATA_VALUE = 0
 
+# The maximum number of export configs that are queried and written to Cloud Storage at the same time
+MAX_EXPORT_WORKERS = 8
+
 
 @attr.s(frozen=True)
 class OptimizedMetricRepresentation:
@@ -75,15 +80,21 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
         self.should_compress = should_compress
 
     def export(self, export_configs: Sequence[ExportBigQueryViewConfig[MetricBigQueryView]]) -> List[GcsfsFilePath]:
-        storage_client = storage.Client()
-        output_paths = []
-        for config in export_configs:
+        # storage.Client is not thread-safe, so each export thread creates its own
+        thread_local = threading.local()
+
+        def export_config(config: ExportBigQueryViewConfig[MetricBigQueryView]) -> GcsfsFilePath:
+            if not hasattr(thread_local, 'storage_client'):
+                thread_local.storage_client = storage.Client()
+
             query_job = self.bq_client.run_query_async(config.query, [])
 
             optimized_format = self.convert_query_results_to_optimized_value_matrix(query_job, config)
-            output_path = self._export_optimized_format(config, optimized_format, storage_client)
-            output_paths.append(output_path)
-        return output_paths
+            return self._export_optimized_format(config, optimized_format, thread_local.storage_client)
+
+        # Each export spends most of its time waiting on BigQuery and Cloud Storage, so they are run concurrently
+        with futures.ThreadPoolExecutor(max_workers=MAX_EXPORT_WORKERS) as executor:
+            return list(executor.map(export_config, export_configs))
 
     def convert_query_results_to_optimized_value_matrix(self,
                                                         query_job: bigquery.QueryJob,
@@ -108,23 +119,25 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
         dimension_keys = export_view.dimensions
         value_keys = sorted(list(set(all_keys) - set(dimension_keys)))
 
-        # Look at all records to identify full range of values for each dimension
-        dimension_values_by_key: Dict[str, Set[str]] = _initialize_dimension_manifest(dimension_keys)
-        assemble_manifest_fn = _gen_assemble_manifest(dimension_values_by_key)
-        self.bq_client.paged_read_and_process(query_job, QUERY_PAGE_SIZE, assemble_manifest_fn)
-        logging.debug("Produced dictionary-based manifest of: %s", dimension_values_by_key)
+        # Read all records once, buffering the normalized value of each dimension and the value of each value key in
+        # columns
+        dimension_columns: Dict[str, List[str]] = {key.lower(): [] for key in dimension_keys}
+        value_columns: List[List[Any]] = [[] for _ in value_keys]
+        buffer_in_columns_fn = _gen_buffer_in_columns(dimension_columns, value_columns, value_keys)
+        self.bq_client.paged_read_and_process(query_job, QUERY_PAGE_SIZE, buffer_in_columns_fn)
 
-        # Transform dimension ranges into list of tuples first ordered by dimension key and internally by values
+        # Identify the full range of values for each dimension, ordered by dimension key and internally by values
+        dimension_values_by_key: Dict[str, Set[str]] = {key: set(column) for key, column in dimension_columns.items()}
         dimension_manifest: List[Tuple[str, List[str]]] = transform_manifest_to_order_enforced_form(
             dimension_values_by_key)
         logging.debug("Produced ordered dimension manifest of: %s", dimension_manifest)
 
-        # Allocate an array with nested arrays for each dimension and value key
-        data_values: List[List[Any]] = [[] for _ in range(len(dimension_keys) + len(value_keys))]
-
-        # For each data point, set its numeric values in the spot determined by its dimensional combination
-        place_value_in_matrix_fn = _gen_place_in_compact_matrix(data_values, value_keys, dimension_manifest)
-        self.bq_client.paged_read_and_process(query_job, QUERY_PAGE_SIZE, place_value_in_matrix_fn)
+        # For each data point, replace each dimension value with its index in the manifest, followed by its values
+        data_values: List[List[Any]] = []
+        for dimension_key, dimension_values in dimension_manifest:
+            index_by_dimension_value = {value: index for index, value in enumerate(dimension_values)}
+            data_values.append([index_by_dimension_value[value] for value in dimension_columns[dimension_key]])
+        data_values.extend(value_columns)
 
         # Return the array and the dimensional manifest
         return OptimizedMetricRepresentation(value_matrix=data_values,
@@ -202,38 +215,21 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
         return out.getvalue()
 
 
-def _initialize_dimension_manifest(dimension_keys: List[str]) -> Dict[str, Set[str]]:
-    """Initializes an empty dictionary-based dimension manifest.
-
-    Each of the given keys will be put in the dictionary with an empty set as its value.
-    """
-    dimension_values_by_key: Dict[str, Set[str]] = {}
-
-    for key in dimension_keys:
-        dimension_values_by_key[key.lower()] = set()
-
-    return dimension_values_by_key
-
-
-def _gen_assemble_manifest(dimension_values_by_key: Dict[str, Set[str]]) -> Callable[[bigquery.table.Row], None]:
-    """Generates and returns a function which will take a given result set row from BigQuery and update the given
-    mapping of dimension keys to sets of possible values."""
-    def _assemble_by_row(row: bigquery.table.Row) -> None:
-        add_to_dimension_manifest(dict(row), dimension_values_by_key)
-
-    return _assemble_by_row
-
+def _gen_buffer_in_columns(dimension_columns: Dict[str, List[str]],
+                           value_columns: List[List[Any]],
+                           value_keys: List[str]) -> Callable[[bigquery.table.Row], None]:
+    """Generates and returns a function which will take a given result set row from BigQuery and append the
+    normalized value of each dimension to the given dimension columns, and each of its values to the given value
+    columns, which are ordered in the same way as the given value keys."""
+    def _buffer_row(row: bigquery.table.Row) -> None:
+        data_point = dict(row)
+        for key, dimension_column in dimension_columns.items():
+            dimension_column.append(_normalize_dimension_value(data_point[key]))
 
-def add_to_dimension_manifest(data_point: Dict[str, Any],
-                              dimension_values_by_key: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
-    """Updates the given dictionary-based dimension manifest with the dimensional contents of the given data point,
-    i.e. ensures that any new values for any dimensions in the data point are included in the manifest."""
-    for key in dimension_values_by_key.keys():
-        dimension_value = data_point[key]
-        normalized_value = _normalize_dimension_value(dimension_value)
-        dimension_values_by_key[key].add(normalized_value)
+        for value_column, value in zip(value_columns, get_row_values(data_point, value_keys)):
+            value_column.append(value)
 
-    return dimension_values_by_key
+    return _buffer_row
 
 
 def transform_manifest_to_order_enforced_form(dimension_values_by_key: Dict[str, Set[str]]) \
@@ -253,51 +249,5 @@ def get_row_values(data_point: Dict[str, Any], value_keys: List[str]) -> List[An
     return [data_point.get(vk, DEFAULT_DATA_VALUE) for vk in value_keys]
 
 
-def _gen_place_in_compact_matrix(data_values: List[List[Any]],
-                                 value_keys: List[str],
-                                 dimension_manifest: List[Tuple[str, List[str]]]) \
-        -> Callable[[bigquery.table.Row], None]:
-    def _place_by_row(row: bigquery.table.Row) -> None:
-        data_point = dict(row)
-        place_in_compact_matrix(data_point, data_values, value_keys, dimension_manifest)
-
-    return _place_by_row
-
-
-def place_in_compact_matrix(data_point: Dict[str, Any],
-                            data_values: List[List[Any]],
-                            value_keys: List[str],
-                            dimension_manifest: List[Tuple[str, List[str]]]) -> None:
-    """Places the given data point within the compact matrix representation of the dataset.
-
-    The compact matrix is composed of an array of arrays: one for each dimension key and for each value key. They are
-    ordered in alphabetical order of each dimension key and then in alphabetical order of each value key. Each
-    internal array should be the same length: for each non-empty data point in the dataset, there will be a value
-    in each array at the same index. A data point's value in a given dimensional array will be the index of that
-    data point's value for the dimension within the dimension manifest. Its value in a given value array will simply
-    be that particular value.
-    """
-    for i, manifest_kv in enumerate(dimension_manifest):
-        dimension_key = manifest_kv[0].lower()
-        dimension_values = manifest_kv[1]
-
-        dimension_value = data_point.get(dimension_key, None)
-        normalized_value = _normalize_dimension_value(dimension_value)
-
-        try:
-            value_index = dimension_values.index(normalized_value)
-        except ValueError as e:
-            raise KeyError(f'Dimension of [{dimension_key}: {dimension_value}] not found in dimension manifest: '
-                           f'[{dimension_manifest}]. This indicates that either the manifest was not constructed from '
-                           'a dataset containing the given data point or a bug in the optimized view exporter. '
-                           f'Data point: {data_point}') from e
-
-        data_values[i].append(value_index)
-
-    row_values = get_row_values(data_point, value_keys)
-    for i, value in enumerate(row_values):
-        data_values[len(dimension_manifest) + i].append(value)
-
-
 def _normalize_dimension_value(dimension_value: Any) -> str:
     return str(dimension_value).lower()
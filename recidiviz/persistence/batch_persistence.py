@@ -19,7 +19,7 @@ import datetime
 import logging
 import json
 from http import HTTPStatus
-from typing import List, Optional, Set, Dict, Tuple
+from typing import Optional, Set, Dict, Tuple, Hashable, Iterable, Iterator
 
 from flask import Blueprint, request, url_for
 from opencensus.stats import aggregation, measure, view
@@ -73,21 +73,20 @@ class DatastoreError(Exception):
         super().__init__(msg)
 
 
-def _get_proto_from_batch_ingest_info_data_list(
-        batch_ingest_info_data_list: List[BatchIngestInfoData]) -> \
-        Tuple[ingest_info_pb2.IngestInfo, Dict[int, BatchIngestInfoData]]:
-    """Merges an ingest_info_proto from all of the batched ingest_infos.
+def _iter_successful_ingest_infos(
+        batch_ingest_info_data: Iterable[BatchIngestInfoData],
+        failed_tasks: Dict[int, BatchIngestInfoData]) -> Iterator[IngestInfo]:
+    """Yields the ingest info from the first successful run of each task.
 
     Args:
-        batch_ingest_info_data_list: A list of BatchIngestInfoData.
+        batch_ingest_info_data: An iterable of BatchIngestInfoData.
+        failed_tasks: Populated with the tasks that never succeeded, keyed by
+            task hash. Only complete once the returned iterator is exhausted.
     Returns:
-        an IngestInfo proto with data from all of the messages.
+        an iterator of the IngestInfo objects from successful tasks.
     """
-    logging.info("Starting generation of proto")
-    ingest_infos: List[IngestInfo] = []
     successful_tasks: Set[int] = set()
-    failed_tasks: Dict[int, BatchIngestInfoData] = {}
-    for batch_ingest_info_datum in batch_ingest_info_data_list:
+    for batch_ingest_info_datum in batch_ingest_info_data:
         # We do this because dicts are not hashable in python and we want to
         # avoid an n2 operation to see which tasks have been seen previously
         # which can be on the order of a million operations.
@@ -98,7 +97,7 @@ def _get_proto_from_batch_ingest_info_data_list(
             if task_hash in failed_tasks:
                 del failed_tasks[task_hash]
             if batch_ingest_info_datum.ingest_info:
-                ingest_infos.append(batch_ingest_info_datum.ingest_info)
+                yield batch_ingest_info_datum.ingest_info
         else:
             # We only add to failed if we didn't see a successful one. This is
             # because its possible a task ran 3 times before passing, meaning
@@ -106,47 +105,64 @@ def _get_proto_from_batch_ingest_info_data_list(
             if task_hash not in successful_tasks:
                 failed_tasks[task_hash] = batch_ingest_info_datum
 
+
+def _get_proto_from_ingest_infos(ingest_infos: Iterable[IngestInfo]) -> \
+        ingest_info_pb2.IngestInfo:
+    """Merges an ingest_info_proto from all of the provided ingest_infos.
+
+    Duplicate people are removed across all of the |ingest_infos| before
+    people with the same id are merged into a single proto person.
+
+    Args:
+        ingest_infos: An iterable of IngestInfo.
+    Returns:
+        an IngestInfo proto with data from all of the ingest_infos.
+    """
+    logging.info("Starting generation of proto")
     deduped_ingest_info = _dedup_people(ingest_infos)
     base_proto = ingest_utils.convert_ingest_info_to_proto(deduped_ingest_info)
     ingest_info_validator.validate(base_proto)
     logging.info("Generated proto for [%s] people", len(base_proto.people))
-    return base_proto, failed_tasks
-
-
-def _get_batch_ingest_info_list(region_code: str,
-                                session_start_time: datetime.datetime) -> \
-        List[BatchIngestInfoData]:
-    """Reads all of the messages from Datastore for the region.
-        Args:
-            region_code (str): The region code of the scraper.
-            session_start_time (datetime): The start time of the scraper.
-        Returns:
-            A list of BatchIngestInfoData.
-        """
+    return base_proto
+
+
+def _iter_batch_ingest_infos(region_code: str,
+                             session_start_time: datetime.datetime) -> \
+        Iterator[BatchIngestInfoData]:
     return datastore_ingest_info \
-        .batch_get_ingest_infos_for_region(region_code, session_start_time)
+        .iter_ingest_infos_for_region(region_code, session_start_time)
 
 
-def _dedup_people(ingest_infos: List[IngestInfo]) -> IngestInfo:
+def _dedup_people(ingest_infos: Iterable[IngestInfo]) -> IngestInfo:
     """Combines a list of IngestInfo objects into a single IngestInfo with
     duplicate People objects removed."""
+    return IngestInfo(people=list(_iter_deduped_people(ingest_infos)))
+
 
-    unique_people: List[Person] = []
-    duplicate_people: List[Person] = []
+def _iter_deduped_people(ingest_infos: Iterable[IngestInfo]) -> \
+        Iterator[Person]:
+    """Yields the people in |ingest_infos| with duplicate People objects
+    removed, in order of first appearance. Duplicates are logged once the
+    iterator is exhausted."""
+
+    # Fingerprints ignore the order of repeated fields.
+    unique_fingerprints: Set[Hashable] = set()
+    duplicate_people: Dict[Hashable, Person] = {}
 
     for ingest_info in ingest_infos:
         for person in ingest_info.people:
-            # Sort deeply so that repeated fields are compared in a consistent
-            # order.
+            # Sort deeply so that unique people are output with repeated fields
+            # in a consistent order.
             person.sort()
-            if person not in unique_people:
-                unique_people.append(person)
-            elif person not in duplicate_people:
-                duplicate_people.append(person)
+            person_fingerprint = person.fingerprint()
+            if person_fingerprint not in unique_fingerprints:
+                unique_fingerprints.add(person_fingerprint)
+                yield person
+            elif person_fingerprint not in duplicate_people:
+                duplicate_people[person_fingerprint] = person
     if duplicate_people:
         logging.info("Removed %d duplicate people: %s", len(duplicate_people),
-                     duplicate_people)
-    return IngestInfo(people=unique_people)
+                     list(duplicate_people.values()))
 
 
 def _should_abort(failed_tasks: int, total_people: int) -> bool:
@@ -185,47 +201,61 @@ def persist_to_database(region_code: str,
                         session_start_time: datetime.datetime) -> bool:
     """Reads all of the ingest infos from Datastore for a region and persists
     them to the database.
+
+    Ingest infos are streamed from Datastore and only the deduped people from
+    successful tasks are kept in memory. All of them are persisted together in
+    a single call to persistence.write.
     """
     region = regions.get_region(region_code)
     overrides = region.get_enum_overrides()
 
-    ingest_info_data_list = _get_batch_ingest_info_list(region_code,
-                                                        session_start_time)
-
-    logging.info("Received %s total ingest infos", len(ingest_info_data_list))
-    if ingest_info_data_list:
-        proto, failed_tasks = _get_proto_from_batch_ingest_info_data_list(
-            ingest_info_data_list)
-
-        if not proto.people:
-            logging.error("Scrape session returned 0 people.")
-            return False
-
-        for batch_ingest_info_datum in failed_tasks.values():
-            logging.error(
-                "Task with trace_id %s failed with error %s",
-                batch_ingest_info_datum.trace_id, batch_ingest_info_datum.error
-            )
-        if _should_abort(len(failed_tasks), len(proto.people)):
-            logging.error(
-                "Too many scraper tasks failed(%s), aborting write",
-                len(failed_tasks))
-            return False
-
-        metadata = IngestMetadata(
-            region=region_code, jurisdiction_id=region.jurisdiction_id,
-            ingest_time=session_start_time,
-            enum_overrides=overrides)
-
-        did_write = persistence.write(proto, metadata)
-        if did_write:
-            datastore_ingest_info.batch_delete_ingest_infos_for_region(
-                region_code)
-
-        return did_write
-
-    logging.error("No ingest infos received from Datastore")
-    return False
+    num_ingest_infos = 0
+
+    def _count_ingest_infos(
+            batch_ingest_info_data: Iterable[BatchIngestInfoData]) -> \
+            Iterator[BatchIngestInfoData]:
+        nonlocal num_ingest_infos
+        for batch_ingest_info_datum in batch_ingest_info_data:
+            num_ingest_infos += 1
+            yield batch_ingest_info_datum
+
+    failed_tasks: Dict[int, BatchIngestInfoData] = {}
+    proto = _get_proto_from_ingest_infos(_iter_successful_ingest_infos(
+        _count_ingest_infos(
+            _iter_batch_ingest_infos(region_code, session_start_time)),
+        failed_tasks))
+
+    logging.info("Received %s total ingest infos", num_ingest_infos)
+    if not num_ingest_infos:
+        logging.error("No ingest infos received from Datastore")
+        return False
+
+    if not proto.people:
+        logging.error("Scrape session returned 0 people.")
+        return False
+
+    for batch_ingest_info_datum in failed_tasks.values():
+        logging.error(
+            "Task with trace_id %s failed with error %s",
+            batch_ingest_info_datum.trace_id, batch_ingest_info_datum.error
+        )
+    if _should_abort(len(failed_tasks), len(proto.people)):
+        logging.error(
+            "Too many scraper tasks failed(%s), aborting write",
+            len(failed_tasks))
+        return False
+
+    metadata = IngestMetadata(
+        region=region_code, jurisdiction_id=region.jurisdiction_id,
+        ingest_time=session_start_time,
+        enum_overrides=overrides)
+
+    did_write = persistence.write(proto, metadata)
+    if did_write:
+        datastore_ingest_info.batch_delete_ingest_infos_for_region(
+            region_code)
+
+    return did_write
 
 
 @batch_blueprint.route('/read_and_persist')
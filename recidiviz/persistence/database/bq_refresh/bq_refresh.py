@@ -18,7 +18,9 @@
 """Helper functions to create and update BigQuery Views."""
 
 import concurrent
+import datetime
 import logging
+from typing import Optional
 
 from google.cloud import bigquery
 from google.cloud import exceptions
@@ -31,6 +33,27 @@ _BQ_LOAD_WAIT_TIMEOUT_SECONDS = 300
 
 TEMP_TABLE_NAME = '{table_name}_temp'
 
+BQ_REFRESH_METADATA_DATASET = 'bq_refresh_metadata'
+
+BQ_REFRESH_WATERMARKS_TABLE = 'bq_refresh_watermarks'
+
+BQ_REFRESH_WATERMARKS_SCHEMA = [
+    bigquery.SchemaField('dataset_id', 'STRING', mode='REQUIRED'),
+    bigquery.SchemaField('table_id', 'STRING', mode='REQUIRED'),
+    bigquery.SchemaField('watermark', 'INTEGER', mode='REQUIRED'),
+    bigquery.SchemaField('refresh_time', 'TIMESTAMP', mode='REQUIRED'),
+    bigquery.SchemaField('refresh_type', 'STRING', mode='REQUIRED'),
+    bigquery.SchemaField('schema_version', 'STRING', mode='NULLABLE'),
+]
+
+FULL_REFRESH_TYPE = 'FULL'
+
+INCREMENTAL_REFRESH_TYPE = 'INCREMENTAL'
+
+# Tables that support incremental refresh are still fully refreshed at least this often, so that changes made without
+# writing history rows (e.g. data migrations) are eventually picked up.
+FULL_REFRESH_INTERVAL = datetime.timedelta(days=7)
+
 
 def refresh_bq_table_from_gcs_export_synchronous(big_query_client: BigQueryClient,
                                                  table_name: str,
@@ -104,6 +127,164 @@ def refresh_bq_table_from_gcs_export_synchronous(big_query_client: BigQueryClien
     delete_temp_table_if_exists(big_query_client, temp_table_name, cloud_sql_to_bq_config)
 
 
+def merge_bq_table_from_gcs_export_synchronous(big_query_client: BigQueryClient,
+                                               table_name: str,
+                                               cloud_sql_to_bq_config: CloudSqlToBQConfig) -> bool:
+    """Merges data from an incremental Cloud SQL export into an existing BQ table.
+
+        For example:
+        1. Load the incremental export from GCS to temp table and wait.
+        2. Merge the temp table into the BQ table and wait. Rows changed since the export's watermark are updated or
+            inserted, and rows that no longer exist in Cloud SQL are deleted.
+        3. Validate that the row count and primary key checksum of the BQ table match the export.
+        4. Delete temporary table.
+
+        Args:
+            big_query_client: A BigQueryClient.
+            table_name: Table to merge into. Table must be defined in the metadata_base class for its corresponding
+                SchemaType, and must already exist in BQ.
+            cloud_sql_to_bq_config: The config class for the given SchemaType.
+        Returns:
+            True if the merged BQ table matches the export, False if it does not and the table should be fully
+            refreshed. If the merge fails it raises a ValueError.
+    """
+    temp_table_name = TEMP_TABLE_NAME.format(table_name=table_name)
+
+    uri = cloud_sql_to_bq_config.get_gcs_export_uri_for_table(table_name)
+    logging.info("GCS URI [%s] in project [%s]", uri, metadata.project_id())
+
+    load_job = big_query_client.load_table_from_cloud_storage_async(
+        source_uri=uri,
+        destination_dataset_ref=cloud_sql_to_bq_config.get_dataset_ref(big_query_client),
+        destination_table_id=temp_table_name,
+        destination_table_schema=cloud_sql_to_bq_config.get_incremental_bq_schema_for_table(table_name))
+
+    if not wait_for_table_load(big_query_client, load_job):
+        raise ValueError(f'Copy from cloud storage to temp table failed. Skipping merge for BQ table [{table_name}]')
+
+    logging.info('Merging temp table [%s] into BQ Table [%s]', temp_table_name, table_name)
+
+    merge_job = big_query_client.run_query_async(
+        cloud_sql_to_bq_config.get_incremental_refresh_merge_query(table_name, temp_table_name))
+    try:
+        merge_job.result(_BQ_LOAD_WAIT_TIMEOUT_SECONDS)
+    except (exceptions.NotFound,
+            exceptions.BadRequest,
+            concurrent.futures.TimeoutError) as e:  # type: ignore
+        raise ValueError(f'Failed to merge temp table [{temp_table_name}] into BigQuery table [{table_name}].') from e
+
+    logging.info('Merged [%s] rows into BQ Table [%s]', merge_job.num_dml_affected_rows, table_name)
+
+    validation_job = big_query_client.run_query_async(
+        cloud_sql_to_bq_config.get_incremental_refresh_validation_query(table_name, temp_table_name))
+    validation_row = next(iter(validation_job.result()))
+    matches_export = validation_row['source_row_count'] == validation_row['destination_row_count'] and \
+        validation_row['source_key_checksum'] == validation_row['destination_key_checksum']
+    if not matches_export:
+        logging.warning('BQ table [%s] has [%s] rows with key checksum [%s] after merge, but the export has [%s] rows '
+                        'with key checksum [%s].', table_name,
+                        validation_row['destination_row_count'], validation_row['destination_key_checksum'],
+                        validation_row['source_row_count'], validation_row['source_key_checksum'])
+
+    delete_temp_table_if_exists(big_query_client, temp_table_name, cloud_sql_to_bq_config)
+
+    return matches_export
+
+
+def get_incremental_refresh_watermark(big_query_client: BigQueryClient,
+                                      table_name: str,
+                                      cloud_sql_to_bq_config: CloudSqlToBQConfig,
+                                      schema_version: Optional[str]) -> Optional[int]:
+    """Returns the watermark that an incremental refresh of the given table should export changes since, or None if
+    the table should be fully refreshed.
+
+    This is the watermark of the refresh before the most recent refresh, rather than of the most recent refresh, so
+    that changes in transactions that were still in progress during the most recent refresh are not missed.
+
+    The table is fully refreshed if it does not support incremental refresh, if fewer than two refreshes of the table
+    have recorded watermarks, if the BQ table does not exist or its schema does not match the Cloud SQL table, if
+    either of those refreshes ran against a different Cloud SQL |schema_version| (i.e. migrations have run since), or
+    if the last full refresh of the table was more than FULL_REFRESH_INTERVAL ago.
+    """
+    if not cloud_sql_to_bq_config.supports_incremental_refresh(table_name):
+        return None
+
+    dataset_ref = cloud_sql_to_bq_config.get_dataset_ref(big_query_client)
+    if not big_query_client.table_exists(dataset_ref=dataset_ref, table_id=table_name):
+        return None
+
+    bq_column_names = {schema_field.name for schema_field in big_query_client.get_table(dataset_ref, table_name).schema}
+    if bq_column_names != {schema_field.name
+                           for schema_field in cloud_sql_to_bq_config.get_bq_schema_for_table(table_name)}:
+        logging.info('Schema of BQ table [%s] does not match Cloud SQL table, falling back to full refresh.',
+                     table_name)
+        return None
+
+    _create_refresh_watermarks_table_if_necessary(big_query_client)
+
+    query = f"""
+        SELECT watermark, schema_version,
+          MAX(IF(refresh_type = '{FULL_REFRESH_TYPE}', refresh_time, NULL)) OVER () AS last_full_refresh_time
+        FROM `{big_query_client.project_id}.{BQ_REFRESH_METADATA_DATASET}.{BQ_REFRESH_WATERMARKS_TABLE}`
+        WHERE dataset_id = @dataset_id AND table_id = @table_id
+        ORDER BY refresh_time DESC
+        LIMIT 2
+    """
+    query_job = big_query_client.run_query_async(query, [
+        bigquery.ScalarQueryParameter('dataset_id', 'STRING', cloud_sql_to_bq_config.dataset_id),
+        bigquery.ScalarQueryParameter('table_id', 'STRING', table_name),
+    ])
+    rows = list(query_job.result())
+
+    if len(rows) < 2:
+        logging.info('Fewer than two refresh watermarks recorded for table [%s], falling back to full refresh.',
+                     table_name)
+        return None
+
+    if schema_version is None or any(row['schema_version'] != schema_version for row in rows):
+        logging.info('Cloud SQL schema version of table [%s] changed since its last refreshes, falling back to full '
+                     'refresh.', table_name)
+        return None
+
+    last_full_refresh_time = rows[0]['last_full_refresh_time']
+    if last_full_refresh_time is None or \
+            last_full_refresh_time < datetime.datetime.now(tz=datetime.timezone.utc) - FULL_REFRESH_INTERVAL:
+        logging.info('Last full refresh of table [%s] was at [%s], falling back to full refresh.',
+                     table_name, last_full_refresh_time)
+        return None
+
+    return rows[1]['watermark']
+
+
+def record_refresh_watermark(big_query_client: BigQueryClient,
+                             table_name: str,
+                             cloud_sql_to_bq_config: CloudSqlToBQConfig,
+                             watermark: int,
+                             is_full_refresh: bool,
+                             schema_version: Optional[str]) -> None:
+    """Records that the given table was refreshed with all changes up to the given watermark, by a full or incremental
+    refresh against the given Cloud SQL schema version."""
+    _create_refresh_watermarks_table_if_necessary(big_query_client)
+
+    big_query_client.stream_into_table(BQ_REFRESH_METADATA_DATASET, BQ_REFRESH_WATERMARKS_TABLE, [{
+        'dataset_id': cloud_sql_to_bq_config.dataset_id,
+        'table_id': table_name,
+        'watermark': watermark,
+        'refresh_time': datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        'refresh_type': FULL_REFRESH_TYPE if is_full_refresh else INCREMENTAL_REFRESH_TYPE,
+        'schema_version': schema_version,
+    }])
+
+
+def _create_refresh_watermarks_table_if_necessary(big_query_client: BigQueryClient) -> None:
+    dataset_ref = big_query_client.dataset_ref_for_id(BQ_REFRESH_METADATA_DATASET)
+    big_query_client.create_dataset_if_necessary(dataset_ref)
+    if not big_query_client.table_exists(dataset_ref, BQ_REFRESH_WATERMARKS_TABLE):
+        big_query_client.create_table_with_schema(BQ_REFRESH_METADATA_DATASET,
+                                                  BQ_REFRESH_WATERMARKS_TABLE,
+                                                  BQ_REFRESH_WATERMARKS_SCHEMA)
+
+
 def load_rows_excluded_from_refresh_into_temp_table_and_wait(big_query_client: BigQueryClient,
                                                              table_name: str,
                                                              cloud_sql_to_bq_config: CloudSqlToBQConfig,
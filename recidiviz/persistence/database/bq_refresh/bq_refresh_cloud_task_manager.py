@@ -20,7 +20,7 @@ exports.
 
 import datetime
 import uuid
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from recidiviz.common.google_cloud.google_cloud_tasks_shared_queues import \
     BIGQUERY_QUEUE_V2, JOB_MONITOR_QUEUE_V2
@@ -53,16 +53,21 @@ class BQRefreshCloudTaskManager:
     def get_bq_queue_info(self) -> CloudTaskQueueInfo:
         return self._get_queue_info(BIGQUERY_QUEUE_V2)
 
-    def create_refresh_bq_table_task(self, table_name: str, schema_type: SchemaType) -> None:
+    def create_refresh_bq_table_task(self, table_name: str, schema_type: SchemaType,
+                                     full_refresh: bool = False) -> None:
         """Create a BigQuery table export path.
 
         Args:
             table_name: Cloud SQL table to export to BQ. Must be defined in
                 one of the base_schema SchemaTypes.
             schema_type: The SchemaType of the table being exported.
+            full_refresh: If True, the whole table is exported even if it
+                supports incremental refresh.
             url: App Engine worker URL.
         """
-        body = {'table_name': table_name, 'schema_type': schema_type.value}
+        body: Dict[str, Any] = {'table_name': table_name, 'schema_type': schema_type.value}
+        if full_refresh:
+            body['full_refresh'] = True
         task_id = '{}-{}-{}-{}'.format(
             table_name,
             schema_type.value,
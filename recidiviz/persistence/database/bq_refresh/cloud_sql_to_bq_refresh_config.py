@@ -53,6 +53,8 @@ from recidiviz.persistence.database.schema_utils import get_table_class_by_name,
 from recidiviz.persistence.database.schema_table_region_filtered_query_builder \
     import CloudSqlSchemaTableRegionFilteredQueryBuilder, BigQuerySchemaTableRegionFilteredQueryBuilder
 
+# The column in incremental exports holding the primary key of every row in the exported table
+INCREMENTAL_REFRESH_KEY_COLUMN = 'refresh_key'
 
 class CloudSqlToBQConfig:
     """Configuration class for exporting tables from Cloud SQL to BigQuery
@@ -188,6 +190,165 @@ class CloudSqlToBQConfig:
                                                              columns_to_include=columns,
                                                              region_codes_to_include=region_codes_to_include)
 
+    def _get_incremental_refresh_history_table(self, table: Table) -> Optional[Table]:
+        """Returns the history table that records changes to rows in the given table, or None if changes to the table
+        cannot be tracked.
+
+        For a master table, this is its history table. For a history table, this is the table itself, since a
+        snapshot row only changes when a newer snapshot is written for the same master row. In both cases, the history
+        table must contain the primary key column of its master table.
+        """
+        master_table_name = table.name[:-len('_history')] if table.name.endswith('_history') else table.name
+        history_table_name = f'{master_table_name}_history'
+        sorted_table_names = {sorted_table.name for sorted_table in self.sorted_tables}
+        if master_table_name not in sorted_table_names or history_table_name not in sorted_table_names:
+            return None
+
+        master_table = get_table_class_by_name(master_table_name, self.sorted_tables)
+        history_table = get_table_class_by_name(history_table_name, self.sorted_tables)
+        if len(master_table.primary_key.columns) != 1 or len(history_table.primary_key.columns) != 1 or \
+                len(table.primary_key.columns) != 1:
+            return None
+
+        master_key_col = self._get_primary_key_col(master_table)
+        if master_key_col not in history_table.columns:
+            return None
+
+        return history_table
+
+    def supports_incremental_refresh(self, table_name: str) -> bool:
+        """Returns True if the given table can be refreshed by merging only the rows that have changed since a
+        previous refresh into the existing BQ table."""
+        table = get_table_class_by_name(table_name, self.sorted_tables)
+        return self._get_incremental_refresh_history_table(table) is not None
+
+    def get_refresh_watermark_query(self, table_name: str) -> str:
+        """Return a formatted SQL query for the current refresh watermark of a given table name: the largest primary
+        key in its history table. Since history table primary keys are assigned in increasing order, every change
+        written after this query runs will be recorded in a history row with a larger primary key."""
+        history_table = self._get_incremental_refresh_history_table(
+            get_table_class_by_name(table_name, self.sorted_tables))
+        if history_table is None:
+            raise ValueError(f'Table [{table_name}] does not support incremental refresh.')
+
+        return f'SELECT COALESCE(MAX({self._get_primary_key_col(history_table)}), 0) FROM {history_table.name}'
+
+    def get_incremental_table_export_query(self, table_name: str, watermark: int) -> str:
+        """Return a formatted SQL query that exports the rows of a given table name that have changed since the
+        given refresh watermark.
+
+        The query returns one row per row in the table that is not in any of the region codes to exclude. The first
+        column, INCREMENTAL_REFRESH_KEY_COLUMN, is the primary key of the row, so that rows deleted since the last
+        refresh can be found. The remaining columns match the full export query for the table, but are only populated
+        for rows whose master row has a history row with a primary key larger than |watermark|.
+        """
+        table = get_table_class_by_name(table_name, self.sorted_tables)
+        history_table = self._get_incremental_refresh_history_table(table)
+        if history_table is None:
+            raise ValueError(f'Table [{table_name}] does not support incremental refresh.')
+
+        primary_key_col = self._get_primary_key_col(table)
+        master_key_col = self._get_primary_key_col(
+            get_table_class_by_name(history_table.name[:-len('_history')], self.sorted_tables))
+
+        query_builder = \
+            CloudSqlSchemaTableRegionFilteredQueryBuilder(self.metadata_base, table,
+                                                          self._get_table_columns_to_export(table),
+                                                          region_codes_to_exclude=self.region_codes_to_exclude)
+        conditions = [f'{table_name}.{master_key_col} IN (SELECT {master_key_col} FROM {history_table.name} '
+                      f'WHERE {self._get_primary_key_col(history_table)} > {int(watermark)})']
+        filter_clause = query_builder.filter_clause()
+        if filter_clause:
+            conditions.insert(0, filter_clause[len('WHERE '):])
+        changed_rows_query = ' '.join(filter(None, [query_builder.select_clause(),
+                                                    query_builder.from_clause(),
+                                                    query_builder.join_clause(),
+                                                    f'WHERE {" AND ".join(conditions)}']))
+
+        all_rows_query = \
+            CloudSqlSchemaTableRegionFilteredQueryBuilder(self.metadata_base, table, [primary_key_col],
+                                                          region_codes_to_exclude=self.region_codes_to_exclude) \
+            .full_query()
+
+        return f'SELECT all_rows.{primary_key_col} AS {INCREMENTAL_REFRESH_KEY_COLUMN}, changed_rows.* ' \
+               f'FROM ({all_rows_query}) all_rows ' \
+               f'LEFT JOIN ({changed_rows_query}) changed_rows ' \
+               f'ON changed_rows.{primary_key_col} = all_rows.{primary_key_col}'
+
+    def get_incremental_bq_schema_for_table(self, table_name: str) -> List[bigquery.SchemaField]:
+        """Return a List of SchemaField objects matching the columns of the incremental export query for a given table
+        name. All fields are nullable, since only changed rows have values outside of the key column."""
+        return [bigquery.SchemaField(INCREMENTAL_REFRESH_KEY_COLUMN, BQ_TYPES[sqlalchemy.Integer], 'NULLABLE')] + [
+            bigquery.SchemaField(schema_field.name, schema_field.field_type, 'NULLABLE')
+            for schema_field in self.get_bq_schema_for_table(table_name)
+        ]
+
+    def get_incremental_refresh_merge_query(self, table_name: str, source_table_id: str) -> str:
+        """Return a formatted BigQuery MERGE statement that applies the results of the incremental export query for a
+        given table name, loaded into the source_table_id table, to the BQ table with the same name.
+
+        Changed rows are updated or inserted, and rows that no longer exist in Cloud SQL are deleted, except for rows
+        in any of the region codes to exclude, which are left as they are.
+        """
+        table = get_table_class_by_name(table_name, self.sorted_tables)
+        primary_key_col = self._get_primary_key_col(table)
+        column_names = [schema_field.name for schema_field in self.get_bq_schema_for_table(table_name)]
+
+        delete_condition = ''
+        if self.region_codes_to_exclude and schema_has_region_code_query_support(self.metadata_base):
+            region_codes = BigQuerySchemaTableRegionFilteredQueryBuilder.format_region_codes_for_sql(
+                self.region_codes_to_exclude)
+            delete_condition = \
+                f' AND destination.{get_region_code_col(self.metadata_base, table)} NOT IN ({region_codes})'
+
+        project_id = self._get_project_id()
+        update_columns = ', '.join(f'{column} = source.{column}' for column in column_names)
+        insert_columns = ', '.join(column_names)
+        insert_values = ', '.join(f'source.{column}' for column in column_names)
+        return f"""
+            MERGE `{project_id}.{self.dataset_id}.{table_name}` destination
+            USING `{project_id}.{self.dataset_id}.{source_table_id}` source
+            ON destination.{primary_key_col} = source.{INCREMENTAL_REFRESH_KEY_COLUMN}
+            WHEN MATCHED AND source.{primary_key_col} IS NOT NULL THEN
+              UPDATE SET {update_columns}
+            WHEN NOT MATCHED BY TARGET AND source.{primary_key_col} IS NOT NULL THEN
+              INSERT ({insert_columns}) VALUES ({insert_values})
+            WHEN NOT MATCHED BY SOURCE{delete_condition} THEN
+              DELETE
+        """
+
+    def get_incremental_refresh_validation_query(self, table_name: str, source_table_id: str) -> str:
+        """Return a formatted BigQuery query that compares the results of the incremental export query for a given
+        table name, loaded into the source_table_id table, with the BQ table with the same name after the merge.
+
+        The query returns a single row with the row count and an order-independent checksum of the primary keys of
+        each: source_row_count, source_key_checksum, destination_row_count and destination_key_checksum. Rows in any
+        of the region codes to exclude are not counted in the BQ table, since they are not in the export.
+        """
+        table = get_table_class_by_name(table_name, self.sorted_tables)
+        primary_key_col = self._get_primary_key_col(table)
+        project_id = self._get_project_id()
+        destination_query = BigQuerySchemaTableRegionFilteredQueryBuilder(
+            project_id, self.dataset_id, self.metadata_base, table, [primary_key_col],
+            region_codes_to_exclude=self.region_codes_to_exclude).full_query()
+
+        return f"""
+            SELECT source_row_count, source_key_checksum, destination_row_count, destination_key_checksum
+            FROM (
+              SELECT COUNT(*) AS source_row_count,
+                BIT_XOR(FARM_FINGERPRINT(CAST({INCREMENTAL_REFRESH_KEY_COLUMN} AS STRING))) AS source_key_checksum
+              FROM `{project_id}.{self.dataset_id}.{source_table_id}`
+            ), (
+              SELECT COUNT(*) AS destination_row_count,
+                BIT_XOR(FARM_FINGERPRINT(CAST({primary_key_col} AS STRING))) AS destination_key_checksum
+              FROM ({destination_query})
+            )
+        """
+
+    @staticmethod
+    def _get_primary_key_col(table: Table) -> str:
+        return list(table.primary_key.columns)[0].name
+
     @staticmethod
     def _get_project_id() -> str:
         project_id = metadata.project_id()
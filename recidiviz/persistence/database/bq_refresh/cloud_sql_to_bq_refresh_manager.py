@@ -26,7 +26,7 @@ Run this export locally with the following command:
 from http import HTTPStatus
 import json
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 
 import flask
 from flask import request
@@ -40,17 +40,26 @@ from recidiviz.persistence.database.bq_refresh.bq_refresh_cloud_task_manager imp
 from recidiviz.persistence.database.sqlalchemy_engine_manager import SchemaType
 from recidiviz.utils.auth import authenticate_request
 from recidiviz.utils import pubsub_helper
+from recidiviz.utils.params import get_bool_param_value
 
 
 def export_table_then_load_table(
         big_query_client: BigQueryClient,
         table: str,
-        cloud_sql_to_bq_config: CloudSqlToBQConfig) -> None:
+        cloud_sql_to_bq_config: CloudSqlToBQConfig,
+        force_full_refresh: bool = False) -> None:
     """Exports a Cloud SQL table to CSV, then loads it into BigQuery.
 
     If a table excludes some region codes, it first loads all the GCS and the excluded region's data to a temp table.
     See for details: load_table_with_excluded_regions
 
+    If the table supports incremental refresh and earlier refreshes recorded watermarks, only the rows changed since
+    those refreshes are exported, and are merged into the existing BigQuery table. Otherwise the whole table is
+    exported and replaces the BigQuery table. See for details: bq_refresh.get_incremental_refresh_watermark
+
+    If the BigQuery table does not match the incremental export after the merge, the whole table is exported and
+    replaces the BigQuery table.
+
     Waits until the BigQuery load is completed.
 
     Args:
@@ -58,16 +67,44 @@ def export_table_then_load_table(
         table: Table to export then import. Table must be defined
             in the metadata_base class for its corresponding SchemaType.
         cloud_sql_to_bq_config: The config class for the given SchemaType.
+        force_full_refresh: If True, the whole table is exported even if it supports incremental refresh. The
+            watermark recorded for it then has no schema version, so the next refresh of the table is also full.
     Returns:
         True if load succeeds, else False.
     """
-    export_success = cloud_sql_to_gcs_export.export_table(table, cloud_sql_to_bq_config)
+    schema_version = None
+    incremental_watermark = None
+    if not force_full_refresh and cloud_sql_to_bq_config.supports_incremental_refresh(table):
+        schema_version = cloud_sql_to_gcs_export.fetch_schema_version(cloud_sql_to_bq_config)
+        incremental_watermark = bq_refresh.get_incremental_refresh_watermark(
+            big_query_client, table, cloud_sql_to_bq_config, schema_version)
+    # Fetched before the export starts, so every change made after the export is recorded after this watermark
+    refresh_watermark = cloud_sql_to_gcs_export.fetch_refresh_watermark(table, cloud_sql_to_bq_config)
+
+    _export_table(table, cloud_sql_to_bq_config, incremental_watermark)
+
+    if incremental_watermark is not None and \
+            not bq_refresh.merge_bq_table_from_gcs_export_synchronous(big_query_client, table, cloud_sql_to_bq_config):
+        logging.warning('BQ table [%s] does not match incremental export, falling back to full refresh.', table)
+        incremental_watermark = None
+        _export_table(table, cloud_sql_to_bq_config, incremental_watermark)
+
+    if incremental_watermark is None:
+        bq_refresh.refresh_bq_table_from_gcs_export_synchronous(big_query_client, table, cloud_sql_to_bq_config)
+
+    if refresh_watermark is not None:
+        bq_refresh.record_refresh_watermark(big_query_client, table, cloud_sql_to_bq_config, refresh_watermark,
+                                            is_full_refresh=incremental_watermark is None,
+                                            schema_version=schema_version)
+
+
+def _export_table(table: str, cloud_sql_to_bq_config: CloudSqlToBQConfig, incremental_watermark: Optional[int]) -> None:
+    export_success = cloud_sql_to_gcs_export.export_table(table, cloud_sql_to_bq_config,
+                                                          incremental_watermark=incremental_watermark)
 
     if not export_success:
         raise ValueError(f"Failure to export CloudSQL table to GCS, skipping BigQuery load of table [{table}].")
 
-    bq_refresh.refresh_bq_table_from_gcs_export_synchronous(big_query_client, table, cloud_sql_to_bq_config)
-
 
 cloud_sql_to_bq_blueprint = flask.Blueprint('export_manager', __name__)
 
@@ -82,11 +119,15 @@ def refresh_bq_table() -> Tuple[str, int]:
     URL Parameters:
         table_name: Table to export then import. Table must be defined
             in one of the base schema types.
+        schema_type: The SchemaType of the table.
+        full_refresh: Optional, if true the whole table is exported even if
+            it supports incremental refresh.
     """
     json_data = request.get_data(as_text=True)
     data = json.loads(json_data)
     table_name = data['table_name']
     schema_type_str = data['schema_type']
+    full_refresh = data.get('full_refresh', False)
 
     try:
         schema_type = SchemaType(schema_type_str)
@@ -98,7 +139,7 @@ def refresh_bq_table() -> Tuple[str, int]:
 
     logging.info("Starting BQ export task for table: %s", table_name)
 
-    export_table_then_load_table(bq_client, table_name, cloud_sql_to_bq_config)
+    export_table_then_load_table(bq_client, table_name, cloud_sql_to_bq_config, force_full_refresh=full_refresh)
     return ('', HTTPStatus.OK)
 
 
@@ -137,15 +178,18 @@ def create_all_jails_bq_refresh_tasks() -> Tuple[str, int]:
 
     A task is created for each table defined in the JailsBase schema.
 
-    Re-creates all tasks if any task fails to be created.
+    Re-creates all tasks if any task fails to be created. If the full_refresh
+    URL parameter is true, every table is fully refreshed, e.g. after a
+    migration that changes rows without writing history rows.
     """
     logging.info("Beginning BQ export for jails schema tables.")
 
     task_manager = BQRefreshCloudTaskManager()
 
+    full_refresh = get_bool_param_value('full_refresh', request.args, default=False)
     cloud_sql_to_bq_config = CloudSqlToBQConfig.for_schema_type(SchemaType.JAILS)
     for table in cloud_sql_to_bq_config.get_tables_to_export():
-        task_manager.create_refresh_bq_table_task(table.name, SchemaType.JAILS)
+        task_manager.create_refresh_bq_table_task(table.name, SchemaType.JAILS, full_refresh=full_refresh)
     return ('', HTTPStatus.OK)
 
 
@@ -156,15 +200,18 @@ def create_all_state_bq_refresh_tasks() -> Tuple[str, int]:
 
     A task is created for each table defined in the StateBase schema.
 
-    Re-creates all tasks if any task fails to be created.
+    Re-creates all tasks if any task fails to be created. If the full_refresh
+    URL parameter is true, every table is fully refreshed, e.g. after a
+    migration that changes rows without writing history rows.
     """
     logging.info("Beginning BQ export for state schema tables.")
 
     task_manager = BQRefreshCloudTaskManager()
 
+    full_refresh = get_bool_param_value('full_refresh', request.args, default=False)
     cloud_sql_to_bq_config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
     for table in cloud_sql_to_bq_config.get_tables_to_export():
-        task_manager.create_refresh_bq_table_task(table.name, SchemaType.STATE)
+        task_manager.create_refresh_bq_table_task(table.name, SchemaType.STATE, full_refresh=full_refresh)
 
     pub_sub_topic = 'v1.calculator.recidivism'
     pub_sub_message = 'State export to BQ complete'
@@ -179,13 +226,16 @@ def create_all_operations_bq_refresh_tasks() -> Tuple[str, int]:
 
     A task is created for each table defined in the OperationsBase schema.
 
-    Re-creates all tasks if any task fails to be created.
+    Re-creates all tasks if any task fails to be created. If the full_refresh
+    URL parameter is true, every table is fully refreshed, e.g. after a
+    migration that changes rows without writing history rows.
     """
     logging.info("Beginning BQ export for operations schema tables.")
 
     task_manager = BQRefreshCloudTaskManager()
 
+    full_refresh = get_bool_param_value('full_refresh', request.args, default=False)
     cloud_sql_to_bq_config = CloudSqlToBQConfig.for_schema_type(SchemaType.OPERATIONS)
     for table in cloud_sql_to_bq_config.get_tables_to_export():
-        task_manager.create_refresh_bq_table_task(table.name, SchemaType.OPERATIONS)
+        task_manager.create_refresh_bq_table_task(table.name, SchemaType.OPERATIONS, full_refresh=full_refresh)
     return ('', HTTPStatus.OK)
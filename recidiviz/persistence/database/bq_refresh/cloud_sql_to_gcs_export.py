@@ -19,12 +19,14 @@
 
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from http import HTTPStatus
 
 import googleapiclient.errors
+from sqlalchemy.exc import ProgrammingError
 
 from recidiviz.persistence.database.bq_refresh.cloud_sql_to_bq_refresh_config import CloudSqlToBQConfig
+from recidiviz.persistence.database.session_factory import SessionFactory
 from recidiviz.persistence.database.sqladmin_client import sqladmin_client
 from recidiviz.persistence.database.sqlalchemy_engine_manager import \
     SQLAlchemyEngineManager, SchemaType
@@ -136,7 +138,52 @@ def get_operation_with_retries(operation_id: str) -> Dict[str, Any]:
     raise ValueError("Operation not set, request for the operation failed.")
 
 
-def export_table(table_name: str, cloud_sql_to_bq_config: CloudSqlToBQConfig) -> bool:
+def fetch_refresh_watermark(table_name: str, cloud_sql_to_bq_config: CloudSqlToBQConfig) -> Optional[int]:
+    """Returns the current refresh watermark for a Cloud SQL table, or None if
+    the table does not support incremental refresh.
+
+    Changes written after the watermark is fetched can be exported with
+    export_table by passing this watermark as the incremental_watermark.
+
+    Args:
+        table_name: Table to fetch the watermark for.
+        cloud_sql_to_bq_config: The export config class for the table's SchemaType.
+    """
+    if not cloud_sql_to_bq_config.supports_incremental_refresh(table_name):
+        return None
+
+    session = SessionFactory.for_schema_base(cloud_sql_to_bq_config.metadata_base)
+    try:
+        return int(session.execute(cloud_sql_to_bq_config.get_refresh_watermark_query(table_name)).scalar())
+    finally:
+        session.close()
+
+
+def fetch_schema_version(cloud_sql_to_bq_config: CloudSqlToBQConfig) -> Optional[str]:
+    """Returns the Alembic revision that the Cloud SQL database for the config's
+    SchemaType is migrated to, or None if it is not tracked, i.e. the database
+    has no alembic_version table.
+
+    Migrations can change rows without writing history rows, so incremental
+    refreshes are only valid while this stays the same.
+
+    Args:
+        cloud_sql_to_bq_config: The export config class for the SchemaType.
+    """
+    session = SessionFactory.for_schema_base(cloud_sql_to_bq_config.metadata_base)
+    try:
+        return session.execute('SELECT version_num FROM alembic_version').scalar()
+    except ProgrammingError as e:
+        logging.warning('Could not fetch the Alembic revision for schema [%s]: %s',
+                        cloud_sql_to_bq_config.schema_type, e)
+        return None
+    finally:
+        session.close()
+
+
+def export_table(table_name: str,
+                 cloud_sql_to_bq_config: CloudSqlToBQConfig,
+                 incremental_watermark: Optional[int] = None) -> bool:
     """Export a Cloud SQL table to a CSV file on GCS.
 
     Given a table name and export_query, retrieve the export URI from
@@ -146,11 +193,17 @@ def export_table(table_name: str, cloud_sql_to_bq_config: CloudSqlToBQConfig) ->
     Args:
         table_name: Table to export.
         cloud_sql_to_bq_config: The export config class for the table's SchemaType.
+        incremental_watermark: Optional refresh watermark. If given, only rows
+            changed since this watermark are exported in full, using the
+            incremental export query for the table.
     Returns:
         True if operation succeeded without errors, False if not.
     """
     schema_type = cloud_sql_to_bq_config.schema_type
-    export_query = cloud_sql_to_bq_config.get_table_export_query(table_name)
+    if incremental_watermark is None:
+        export_query = cloud_sql_to_bq_config.get_table_export_query(table_name)
+    else:
+        export_query = cloud_sql_to_bq_config.get_incremental_table_export_query(table_name, incremental_watermark)
     export_uri = cloud_sql_to_bq_config.get_gcs_export_uri_for_table(table_name)
 
     export_context = create_export_context(schema_type, export_uri, export_query)
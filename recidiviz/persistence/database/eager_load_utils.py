@@ -0,0 +1,113 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ============================================================================
+"""Utilities for building SQLAlchemy loader options that eagerly load a full
+entity tree (e.g. a StatePerson and all of its children) in a fixed number of
+queries, rather than lazy loading one relationship at a time.
+"""
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Type, Any
+
+from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm.strategy_options import Load
+
+from recidiviz.persistence.database.database_entity import DatabaseEntity
+from recidiviz.persistence.entity.entity_utils import \
+    SchemaEdgeDirectionChecker
+
+
+class EagerLoadStrategy(Enum):
+    """The SQLAlchemy strategy used to eagerly load a single relationship."""
+    # Loads the relationship for all parents with one additional
+    # SELECT ... WHERE parent_id IN (...) query.
+    SELECTIN = 'selectin'
+    # Loads the relationship in the same query as its parent via a LEFT OUTER
+    # JOIN.
+    JOINED = 'joined'
+
+
+# Maps (schema class name, relationship name) to the strategy that should be
+# used to load that relationship, overriding the default strategy.
+EagerLoadOverrides = Dict[Tuple[str, str], EagerLoadStrategy]
+
+
+def get_eager_load_options(
+        root_cls: Type[DatabaseEntity],
+        direction_checker: SchemaEdgeDirectionChecker,
+        overrides: Optional[EagerLoadOverrides] = None) -> List[Load]:
+    """Returns a list of loader options that, when applied to a query for
+    objects of type |root_cls|, eagerly load the full tree of objects below
+    each |root_cls| object.
+
+    The tree is derived from the class hierarchy in the |direction_checker|:
+    every forward edge is loaded and traversed. Back edges are not traversed,
+    but many-to-many back edge collections (e.g.
+    StateSupervisionPeriod.supervision_sentences) are loaded so that matching
+    and validation can walk up the tree without issuing additional queries.
+    Many-to-one back edges (e.g. StateCharge.person) are always resolved from
+    the session identity map and are not loaded.
+
+    By default, collections are loaded with SELECTIN and single-valued
+    relationships are loaded with JOINED. The strategy for any individual
+    relationship can be changed via |overrides|.
+    """
+    return _build_loader_options(
+        root_cls, None, direction_checker, overrides or {})
+
+
+def _build_loader_options(
+        cls: Type[DatabaseEntity],
+        parent_loader: Optional[Load],
+        direction_checker: SchemaEdgeDirectionChecker,
+        overrides: EagerLoadOverrides) -> List[Load]:
+    """Recursively builds a loader option for every path from |cls| to a leaf
+    of its tree, where each path is chained onto |parent_loader|.
+    """
+    options: List[Load] = []
+    relationships = cls.get_relationship_property_names_and_properties()
+    for field_name in sorted(relationships.keys()):
+        prop = relationships[field_name]
+        to_cls = prop.mapper.class_
+        if not direction_checker.is_in_class_hierarchy(to_cls):
+            continue
+
+        is_forward_edge = direction_checker.is_higher_ranked(cls, to_cls)
+        if not is_forward_edge and not (prop.uselist and prop.secondary is not None):
+            continue
+
+        default_strategy = \
+            EagerLoadStrategy.SELECTIN if prop.uselist else EagerLoadStrategy.JOINED
+        strategy = overrides.get((cls.__name__, field_name), default_strategy)
+        loader = _chain_loader(parent_loader, strategy, getattr(cls, field_name))
+
+        child_options = []
+        if is_forward_edge:
+            child_options = _build_loader_options(
+                to_cls, loader, direction_checker, overrides)
+        options.extend(child_options or [loader])
+    return options
+
+
+def _chain_loader(parent_loader: Optional[Load],
+                  strategy: EagerLoadStrategy,
+                  relationship_attr: Any) -> Load:
+    if strategy == EagerLoadStrategy.SELECTIN:
+        return parent_loader.selectinload(relationship_attr) \
+            if parent_loader else selectinload(relationship_attr)
+    if strategy == EagerLoadStrategy.JOINED:
+        return parent_loader.joinedload(relationship_attr) \
+            if parent_loader else joinedload(relationship_attr)
+    raise ValueError(f'Unexpected eager load strategy [{strategy}]')
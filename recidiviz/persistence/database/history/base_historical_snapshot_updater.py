@@ -27,11 +27,13 @@ import logging
 from collections import defaultdict
 
 from types import ModuleType
-from typing import List, Generic, Type, Set, Callable, Optional, Dict
+from typing import Any, List, Generic, Type, Set, Callable, Optional, Dict
 
 import attr
 
-from sqlalchemy import text
+from sqlalchemy import and_, func, text
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm.attributes import set_committed_value
 
 from recidiviz.persistence.database.session import Session
 from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
@@ -44,6 +46,12 @@ from recidiviz.persistence.database.schema_utils import \
     HISTORICAL_TABLE_CLASS_SUFFIX
 from recidiviz.persistence.entity.entity_utils import SchemaEdgeDirectionChecker
 
+# Postgres allows at most 65535 bind parameters per statement, and SQLite
+# 32766. Multi-row inserts of new snapshots, and updates closing existing
+# snapshots, are split so that each statement stays under this number of
+# parameters.
+_MAX_SNAPSHOT_INSERT_PARAMETERS = 30000
+
 
 class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
     """
@@ -153,12 +161,18 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
         logging.info(
             "Provided start and end times set for registered entities")
 
+        new_snapshots: List[DatabaseEntity] = []
+        snapshots_to_close: List[DatabaseEntity] = []
         for snapshot_context in context_registry.all_contexts():
-            self._write_snapshots(session, snapshot_context,
-                                  ingest_metadata.ingest_time, schema)
+            self._write_snapshots(snapshot_context,
+                                  ingest_metadata.ingest_time, schema,
+                                  new_snapshots, snapshots_to_close)
 
         logging.info("Flushing snapshots")
         session.flush()
+        self._close_snapshots(session, snapshots_to_close,
+                              ingest_metadata.ingest_time)
+        self._insert_new_snapshots(session, new_snapshots)
         logging.info("All historical snapshots written")
 
     def _fetch_most_recent_snapshots_for_all_entities(
@@ -195,73 +209,106 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
         |entity_ids| with type |master_class|
         """
 
+        history_table_class = _get_historical_class(master_class, schema)
+
+        if session.bind.dialect.name == 'postgresql':
+            snapshots = self._fetch_most_recent_snapshots_postgres(
+                session, master_class, history_table_class, entity_ids)
+        else:
+            snapshots = self._fetch_most_recent_snapshots_generic(
+                session, master_class, history_table_class, entity_ids)
+
+        # Use only snapshots where valid_to is None to exclude any overlapping
+        # non-open snapshots
+        open_snapshots: List[DatabaseEntity] = []
+        for snapshot in snapshots:
+            if not isinstance(snapshot, HistoryTableSharedColumns):
+                raise ValueError(
+                    f"Snapshot class [{type(snapshot)}] must be a subclass of "
+                    f"[{HistoryTableSharedColumns.__name__}]")
+            if snapshot.valid_to is None:
+                open_snapshots.append(snapshot)
+        return open_snapshots
+
+    @staticmethod
+    def _fetch_most_recent_snapshots_postgres(
+            session: Session,
+            master_class: Type,
+            history_table_class: Type,
+            entity_ids: Set[int]) -> List[DatabaseEntity]:
+        """Returns the snapshot with the latest valid_from for each ID in
+        |entity_ids|, preferring open snapshots where several share the latest
+        valid_from. The IDs are passed as a single array parameter, which
+        Postgres joins against the history table's master key index.
+        """
+
         # Get name of historical table in database (as distinct from name of ORM
         # class representing historical table in code)
-        history_table_class = _get_historical_class(master_class, schema)
         history_table_name = history_table_class.__table__.name
-        history_table_primary_key_col_name = \
-            history_table_class.get_primary_key_column_name()
         # See module assumption #2
         master_table_primary_key_col_name = \
             master_class.get_primary_key_column_name()
-        ids_list = ', '.join([str(id) for id in entity_ids])
-
-        # Get snapshot IDs in a separate query. The subquery logic here is ugly
-        # and easier to do as a raw string query than through the ORM query, but
-        # the return type of a raw string query is just a collection of values
-        # rather than an ORM model. Doing this step as a separate query enables
-        # passing just the IDs to the second request, which allows proper ORM
-        # models to be returned as a result.
-        snapshot_ids_query = f'''
-        SELECT
-          history.{history_table_primary_key_col_name},
-          history.{master_table_primary_key_col_name},
-          history.valid_to
+
+        # Postgres sorts NULLs first in descending order, so an open snapshot
+        # is kept over a closed one with the same valid_from
+        most_recent_snapshots_query = text(f'''
+        SELECT DISTINCT ON (history.{master_table_primary_key_col_name})
+          history.*
         FROM {history_table_name} history
-        JOIN (
-          SELECT 
-            {master_table_primary_key_col_name}, 
-            MAX(valid_from) AS valid_from
-          FROM {history_table_name}
-          WHERE {master_table_primary_key_col_name} IN ({ids_list})
-          GROUP BY {master_table_primary_key_col_name}
-        ) AS most_recent_valid_from
-        ON history.{master_table_primary_key_col_name} = 
-            most_recent_valid_from.{master_table_primary_key_col_name}
-        WHERE history.valid_from = most_recent_valid_from.valid_from;
-        '''
-
-        results = session.execute(text(snapshot_ids_query)).fetchall()
-
-        # Use only results where valid_to is None to exclude any overlapping
-        # non-open snapshots
-        snapshot_ids = [snapshot_id for snapshot_id, master_id, valid_to
-                        in results if valid_to is None]
+        JOIN UNNEST(CAST(:entity_ids AS BIGINT[])) AS entity_ids(entity_id)
+        ON history.{master_table_primary_key_col_name} = entity_ids.entity_id
+        ORDER BY
+          history.{master_table_primary_key_col_name},
+          history.valid_from DESC,
+          history.valid_to DESC;
+        ''').bindparams(entity_ids=sorted(entity_ids))
 
-        # Removing the below early return will pass in tests but fail in
-        # production, because SQLite allows "IN ()" but Postgres does not
-        if not snapshot_ids:
-            return []
+        return session.query(history_table_class) \
+            .from_statement(most_recent_snapshots_query) \
+            .all()
 
-        filter_statement = \
-            '{historical_table}.{primary_key_column} IN ({ids_list})'.format(
-                historical_table=history_table_name,
-                primary_key_column=
-                history_table_class.get_primary_key_column_name(),
-                ids_list=', '.join([str(id) for id in snapshot_ids]))
+    @staticmethod
+    def _fetch_most_recent_snapshots_generic(
+            session: Session,
+            master_class: Type,
+            history_table_class: Type,
+            entity_ids: Set[int]) -> List[DatabaseEntity]:
+        """Returns every snapshot with the latest valid_from for each ID in
+        |entity_ids|, for databases that do not support DISTINCT ON.
+        """
+        # See module assumption #2
+        master_key_column = getattr(
+            history_table_class,
+            history_table_class.get_property_name_by_column_name(
+                master_class.get_primary_key_column_name()))
+
+        most_recent_valid_from = session \
+            .query(master_key_column.label('master_key'),
+                   func.max(history_table_class.valid_from)
+                   .label('valid_from')) \
+            .filter(master_key_column.in_(entity_ids)) \
+            .group_by(master_key_column) \
+            .subquery()
 
         return session.query(history_table_class) \
-            .filter(text(filter_statement)) \
+            .join(most_recent_valid_from,
+                  and_(master_key_column ==
+                       most_recent_valid_from.c.master_key,
+                       history_table_class.valid_from ==
+                       most_recent_valid_from.c.valid_from)) \
             .all()
 
     def _write_snapshots(self,
-                         session: Session,
                          context: '_SnapshotContext',
                          snapshot_time: datetime,
-                         schema: ModuleType) -> None:
+                         schema: ModuleType,
+                         new_snapshots: List[DatabaseEntity],
+                         snapshots_to_close: List[DatabaseEntity]) -> None:
         """
         Writes snapshots for any new entities and any entities that have
-        changes.
+        changes. Snapshots to be inserted are added to |new_snapshots|, and
+        existing snapshots to be closed are added to |snapshots_to_close|, to be
+        written together once snapshots for all entities are written.
 
         If an entity has no existing snapshots and has a provided start time
         earlier than |snapshot_time|, will backdate the snapshot to the provided
@@ -292,17 +339,18 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
 
         if context.most_recent_snapshot is None:
             self._write_snapshots_for_new_entities(
-                session, context, snapshot_time, schema)
+                context, snapshot_time, schema, new_snapshots)
         else:
             self._write_snapshots_for_existing_entities(
-                session, context, snapshot_time, schema)
+                context, snapshot_time, schema, new_snapshots,
+                snapshots_to_close)
 
     def _write_snapshots_for_new_entities(
             self,
-            session: Session,
             context: '_SnapshotContext',
             snapshot_time: datetime,
-            schema) -> None:
+            schema,
+            new_snapshots: List[DatabaseEntity]) -> None:
         """Writes snapshots for any new entities, including any required manual
         adjustments based on provided start and end times
         """
@@ -335,10 +383,10 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
         else:
             new_historical_snapshot.valid_from = snapshot_time
 
-        # Snapshot must be merged separately from record tree, as they are not
+        # Snapshot must be written separately from record tree, as they are not
         # included in the ORM model relationships (to avoid needing to load
         # the entire snapshot chain at once)
-        session.merge(new_historical_snapshot)
+        new_snapshots.append(new_historical_snapshot)
 
         # If both start and end time were provided, an earlier snapshot needs to
         # be created, reflecting the state of the entity before its current
@@ -352,13 +400,15 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
 
             self.post_process_initial_snapshot(context, initial_snapshot)
 
-            session.merge(initial_snapshot)
+            new_snapshots.append(initial_snapshot)
 
     def _write_snapshots_for_existing_entities(
             self,
-            session: Session, context: '_SnapshotContext',
+            context: '_SnapshotContext',
             snapshot_time: datetime,
-            schema: ModuleType) -> None:
+            schema: ModuleType,
+            new_snapshots: List[DatabaseEntity],
+            snapshots_to_close: List[DatabaseEntity]) -> None:
         """Writes snapshot updates for entities that already have snapshots
         present in the database
         """
@@ -369,10 +419,10 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
             context.schema_object, new_historical_snapshot)
         new_historical_snapshot.valid_from = snapshot_time
 
-        # Snapshot must be merged separately from record tree, as they are not
+        # Snapshot must be written separately from record tree, as they are not
         # included in the ORM model relationships (to avoid needing to load
         # the entire snapshot chain at once)
-        session.merge(new_historical_snapshot)
+        new_snapshots.append(new_historical_snapshot)
 
         # Close last snapshot if one is present
         if context.most_recent_snapshot is not None:
@@ -383,8 +433,61 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
                     f"must be a subclass of "
                     f"[{HistoryTableSharedColumns.__name__}]")
 
-            context.most_recent_snapshot.valid_to = snapshot_time
-            session.merge(context.most_recent_snapshot)
+            snapshots_to_close.append(context.most_recent_snapshot)
+
+    @staticmethod
+    def _close_snapshots(session: Session,
+                         snapshots_to_close: List[DatabaseEntity],
+                         snapshot_time: datetime) -> None:
+        """Sets valid_to to |snapshot_time| on every snapshot in
+        |snapshots_to_close|, with one UPDATE ... WHERE <primary key> IN (...)
+        statement per history table, rather than one UPDATE per snapshot
+        through the ORM. The loaded snapshots are updated to match without
+        being marked as modified in |session|.
+        """
+        snapshot_ids_by_class: Dict[Type, List[int]] = defaultdict(list)
+        for snapshot in snapshots_to_close:
+            snapshot_id = snapshot.get_primary_key()
+            if snapshot_id is None:
+                raise ValueError(
+                    f"Snapshot of class [{type(snapshot)}] to close has no "
+                    f"primary key")
+            snapshot_ids_by_class[type(snapshot)].append(snapshot_id)
+            set_committed_value(snapshot, 'valid_to', snapshot_time)
+
+        for historical_class, snapshot_ids in snapshot_ids_by_class.items():
+            history_table = historical_class.__table__
+            primary_key_column = history_table.c[
+                historical_class.get_primary_key_column_name()]
+            for start in range(0, len(snapshot_ids),
+                               _MAX_SNAPSHOT_INSERT_PARAMETERS):
+                session.execute(
+                    history_table.update()
+                    .where(primary_key_column.in_(
+                        snapshot_ids[start:start +
+                                     _MAX_SNAPSHOT_INSERT_PARAMETERS]))
+                    .values(valid_to=snapshot_time))
+
+    @staticmethod
+    def _insert_new_snapshots(session: Session,
+                              new_snapshots: List[DatabaseEntity]) -> None:
+        """Inserts |new_snapshots| with one multi-row INSERT statement per
+        history table, rather than one INSERT per snapshot through the ORM.
+        The snapshots are not added to |session|.
+        """
+        snapshot_rows_by_class: Dict[Type, List[Dict[str, Any]]] = \
+            defaultdict(list)
+        for snapshot in new_snapshots:
+            snapshot_rows_by_class[type(snapshot)].append(
+                _get_snapshot_row(snapshot))
+
+        for historical_class, snapshot_rows in snapshot_rows_by_class.items():
+            history_table = historical_class.__table__
+            rows_per_insert = max(
+                1, _MAX_SNAPSHOT_INSERT_PARAMETERS // len(history_table.columns))
+            for start in range(0, len(snapshot_rows), rows_per_insert):
+                session.execute(history_table.insert().values(
+                    snapshot_rows[start:start + rows_per_insert]))
 
     def _assert_all_root_entities_unique(
             self,
@@ -525,6 +628,17 @@ def _get_historical_class(master_class: Type[DatabaseEntity],
     return getattr(schema, historical_class_name)
 
 
+def _get_snapshot_row(snapshot: DatabaseEntity) -> Dict[str, Any]:
+    """Returns the column values of |snapshot| keyed by column, omitting the
+    primary key so that it is generated by the database.
+    """
+    primary_key_column_name = snapshot.get_primary_key_column_name()
+    return {column.key: getattr(snapshot, column_property.key)
+            for column_property in inspect(type(snapshot)).column_attrs
+            for column in column_property.columns
+            if column.name != primary_key_column_name}
+
+
 def _get_master_class(historical_class: Type[DatabaseEntity],
                       schema: ModuleType) -> Type:
     """Returns ORM class of master table associated with the historical table of
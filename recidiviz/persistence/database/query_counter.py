@@ -0,0 +1,67 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ============================================================================
+"""Counts the SQL statements issued through a single SQLAlchemy session."""
+from typing import Any, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+
+from recidiviz.persistence.database.session import Session
+
+
+class SessionQueryCounter:
+    """Counts every SQL statement executed on the provided |session|, across
+    all of the transactions (and therefore connections) the session uses.
+
+    Only statements issued through this session are counted, so it is safe to
+    use while other sessions share the same engine. Statements are counted from
+    the first transaction the session begins after the counter is created, and
+    until the counter is closed. Counting never begins a transaction itself.
+
+    Can be used as a context manager, which closes the counter on exit.
+    """
+
+    def __init__(self, session: Session):
+        self.query_count = 0
+        self._session = session
+        self._connections: List[Connection] = []
+        event.listen(session, 'after_begin', self._on_after_begin)
+
+    def __enter__(self) -> 'SessionQueryCounter':
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops counting and removes all listeners this counter added to the
+        session and its connections. The count so far is kept."""
+        if event.contains(self._session, 'after_begin', self._on_after_begin):
+            event.remove(self._session, 'after_begin', self._on_after_begin)
+        for connection in self._connections:
+            if event.contains(connection, 'before_cursor_execute', self._on_before_cursor_execute):
+                event.remove(connection, 'before_cursor_execute', self._on_before_cursor_execute)
+        self._connections = []
+
+    def _on_after_begin(self, _session: Session, _transaction: Any, connection: Connection) -> None:
+        if any(connection is c for c in self._connections):
+            return
+        self._connections.append(connection)
+        event.listen(connection, 'before_cursor_execute', self._on_before_cursor_execute)
+
+    def _on_before_cursor_execute(self, *_args: Any) -> None:
+        self.query_count += 1
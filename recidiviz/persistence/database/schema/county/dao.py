@@ -19,12 +19,18 @@
 from a SQL Database."""
 
 from collections import defaultdict
+from functools import lru_cache
 import logging
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from sqlalchemy.orm import Session, Query
+from sqlalchemy.orm.strategy_options import Load
 
 from recidiviz.common.constants.county.booking import CustodyStatus
+from recidiviz.persistence.database.eager_load_utils import \
+    get_eager_load_options
+from recidiviz.persistence.entity.entity_utils import \
+    SchemaEdgeDirectionChecker
 from recidiviz.persistence.entity.county import entities
 from recidiviz.persistence.database.schema_entity_converter import (
     schema_entity_converter as converter,
@@ -45,7 +51,7 @@ def read_people(
     Returns:
         List of people matching the surname and birthdate, if provided
     """
-    query = session.query(Person)
+    query = session.query(Person).options(*_get_person_tree_eager_load_options())
     if full_name is not None:
         query = query.filter(Person.full_name == full_name)
     if birthdate is not None:
@@ -68,6 +74,7 @@ def read_people_by_external_ids(
     """
     external_ids = {p.external_id for p in ingested_people}
     query = session.query(Person) \
+        .options(*_get_person_tree_eager_load_options()) \
         .filter(Person.region == region) \
         .filter(Person.external_id.in_(external_ids))
     return _convert_and_normalize_record_trees(query.all())
@@ -124,12 +131,22 @@ def _query_people_and_open_bookings(session, region) -> Query:
     """
     # pylint: disable=W0143
     return session.query(Person, Booking) \
+        .options(*_get_person_tree_eager_load_options()) \
         .filter(Person.person_id == Booking.person_id) \
         .filter(Person.region == region) \
         .filter(Booking.custody_status.notin_(
             CustodyStatus.get_raw_released_statuses()))
 
 
+@lru_cache(maxsize=None)
+def _get_person_tree_eager_load_options() -> Tuple[Load, ...]:
+    """Returns loader options that load each Person's full entity tree in a
+    fixed number of queries.
+    """
+    return tuple(get_eager_load_options(
+        Person, SchemaEdgeDirectionChecker.county_direction_checker()))
+
+
 def _convert_and_normalize_record_trees(
         people: List[Person]) -> List[entities.Person]:
     """Converts schema record trees to persistence layer models and removes
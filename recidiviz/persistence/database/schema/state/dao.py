@@ -18,13 +18,19 @@
 """Data Access Object (DAO) with logic for accessing state-level information
 from a SQL Database."""
 from collections import defaultdict
+from functools import lru_cache
 import logging
-from typing import Dict, List, Type, Iterable
+from typing import Dict, List, Type, Iterable, Tuple
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, Query
+from sqlalchemy.orm.strategy_options import Load
 
 from recidiviz.persistence.database.base_schema import StateBase
+from recidiviz.persistence.database.eager_load_utils import \
+    get_eager_load_options
+from recidiviz.persistence.entity.entity_utils import \
+    SchemaEdgeDirectionChecker
 from recidiviz.persistence.entity.state import entities
 from recidiviz.persistence.database.schema.state import schema
 from recidiviz.persistence.errors import PersistenceError
@@ -65,7 +71,7 @@ def read_people_by_cls_external_ids(
                  schema_cls.__name__,
                  len(person_ids))
 
-    query = session.query(schema.StatePerson) \
+    query = _query_person_trees(session) \
         .filter(schema.StatePerson.person_id.in_(person_ids))
     schema_persons = query.all()
     logging.info("[DAO] Finished read of [%s] persons.", len(schema_persons))
@@ -84,7 +90,7 @@ def read_placeholder_persons(session: Session, state_code: str) -> List[schema.S
     person_ids = [res[0] for res in person_ids_result]
     logging.info("[DAO] Finished read of placeholder person ids. "
                  "Found [%s] person ids.", len(person_ids))
-    query = session.query(schema.StatePerson) \
+    query = _query_person_trees(session) \
         .filter(schema.StatePerson.person_id.in_(person_ids))
     schema_persons = query.all()
     logging.info("[DAO] Finished read of [%s] persons.", len(schema_persons))
@@ -99,7 +105,7 @@ def read_people(
     the surname or birthdate are provided, then read all people."""
     check_not_dirty(session)
 
-    query = session.query(schema.StatePerson)
+    query = _query_person_trees(session)
     if full_name is not None:
         query = query.filter(schema.StatePerson.full_name == full_name)
     if birthdate is not None:
@@ -166,6 +172,21 @@ def read_people_by_external_ids(
     return state_persons
 
 
+@lru_cache(maxsize=None)
+def _get_person_tree_eager_load_options() -> Tuple[Load, ...]:
+    return tuple(get_eager_load_options(
+        schema.StatePerson, SchemaEdgeDirectionChecker.state_direction_checker()))
+
+
+def _query_person_trees(session: Session) -> Query:
+    """Returns a query for StatePerson objects that loads each person's full
+    entity tree in a fixed number of queries, rather than lazy loading each
+    relationship as it is accessed.
+    """
+    return session.query(schema.StatePerson) \
+        .options(*_get_person_tree_eager_load_options())
+
+
 def _normalize_record_trees(
         people: List[schema.StatePerson]) -> List[schema.StatePerson]:
     """Removes any duplicate people created by how SQLAlchemy handles joins"""
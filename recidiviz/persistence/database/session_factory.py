@@ -18,6 +18,10 @@
 Class for generating SQLAlchemy Sessions objects for the appropriate schema.
 """
 
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.declarative import DeclarativeMeta
 
 from recidiviz.persistence.database.base_schema import OperationsBase
@@ -61,5 +65,12 @@ class SessionFactory:
         # https://stackoverflow.com/questions/42288808/why-does-postgresql-serializable-transaction-think-this-as-conflict.
         #
         # TODO(#3928): Once defined in code, set this on the SQL instance itself instead of per session.
+        #
+        # The variable is set as each transaction begins, on the connection that transaction uses, so that creating a
+        # session does not open a transaction as a side effect.
         if session.bind.dialect.name == 'postgresql':
-            session.execute('SET random_page_cost=1;')
+            event.listen(session, 'after_begin', _set_random_page_cost)
+
+
+def _set_random_page_cost(_session: Session, _transaction: Any, connection: Connection) -> None:
+    connection.execute('SET random_page_cost=1;')
@@ -16,7 +16,7 @@
 
 """Utilities for managing ingest infos stored on Datastore."""
 from datetime import datetime
-from typing import List, Optional, Type, TypeVar
+from typing import Iterator, List, Optional, Tuple, Type, TypeVar
 import logging
 import attr
 import cattr
@@ -91,6 +91,10 @@ def clear_ds() -> None:
 
 NUM_GRPC_RETRIES = 2
 
+# The number of entities read from Datastore per query page when streaming the
+# ingest infos for a region.
+INGEST_INFO_PAGE_SIZE = 500
+
 
 @attr.s(frozen=True)
 class BatchIngestInfoData:
@@ -249,6 +253,39 @@ def batch_get_ingest_infos_for_region(region: str,
         _get_ingest_info_entities_for_region(region, session_start_time))
 
 
+def iter_ingest_infos_for_region(
+        region: str, session_start_time: datetime,
+        page_size: int = INGEST_INFO_PAGE_SIZE) -> \
+        Iterator[BatchIngestInfoData]:
+    """Lazily retrieves ingest infos for a particular region, holding at most
+    one page of Datastore entities in memory at a time.
+
+    Args:
+        region: (string) Region to fetch ingest_infos for
+        session_start_time: (datetime) Start time for the scraper
+        page_size: (int) The number of entities to read per Datastore query
+
+    Returns:
+        An iterator of BatchIngestInfoData, in the same order as
+        batch_get_ingest_infos_for_region
+    """
+    logging.info("Streaming ingest info entities for region: [%s] and "
+                 "session_start_time: [%s]", region, session_start_time)
+    cursor = None
+    while True:
+        try:
+            entities, cursor = retry_grpc(
+                NUM_GRPC_RETRIES, _fetch_ingest_info_entity_page, region,
+                session_start_time, page_size, cursor)
+        except Exception as e:
+            raise DatastoreBatchGetError(region) from e
+
+        yield from _batch_ingest_info_data_from_entities(entities)
+
+        if not cursor or len(entities) < page_size:
+            return
+
+
 def batch_delete_ingest_infos_for_region(region: str) -> None:
     """Batch deletes ingest infos for a particular region.
 
@@ -292,14 +329,34 @@ def _batch_ingest_info_data_from_entities(
             in entity_list]
 
 
-def _get_ingest_info_entities_for_region(region: str, session_start_time: datetime = None) \
-        -> List[datastore.Entity]:
-    logging.info("Getting ingest info entities for region: [%s] and "
-                 "session_start_time: [%s]", region, session_start_time)
+def _ingest_info_query_for_region(
+        region: str, session_start_time: Optional[datetime] = None) -> \
+        datastore.query.Query:
     session_query = ds().query(kind=INGEST_INFO_KIND)
     session_query.add_filter('region', '=', region)
     if session_start_time:
         session_query.add_filter('session_start_time', '=', session_start_time)
+    return session_query
+
+
+def _fetch_ingest_info_entity_page(
+        region: str, session_start_time: datetime, page_size: int,
+        cursor: Optional[bytes]) -> \
+        Tuple[List[datastore.Entity], Optional[bytes]]:
+    """Reads the page of at most |page_size| entities starting at |cursor| and
+    returns it along with the cursor for the next page."""
+    query_iter = _ingest_info_query_for_region(
+        region, session_start_time).fetch(limit=page_size,
+                                          start_cursor=cursor)
+    entities = list(next(query_iter.pages, []))
+    return entities, query_iter.next_page_token
+
+
+def _get_ingest_info_entities_for_region(region: str, session_start_time: datetime = None) \
+        -> List[datastore.Entity]:
+    logging.info("Getting ingest info entities for region: [%s] and "
+                 "session_start_time: [%s]", region, session_start_time)
+    session_query = _ingest_info_query_for_region(region, session_start_time)
 
     results = None
     try:
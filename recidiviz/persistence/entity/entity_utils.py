@@ -145,6 +145,12 @@ class SchemaEdgeDirectionChecker:
         return self._class_hierarchy_map[from_class_name] >= \
             self._class_hierarchy_map[to_class_name]
 
+    def is_in_class_hierarchy(self, cls: Type[CoreEntity]) -> bool:
+        """Returns True if the provided |cls| is ranked in this checker's class
+        hierarchy.
+        """
+        return cls.__name__ in self._class_hierarchy_map
+
     def is_higher_ranked(
             self,
             cls_1: Type[CoreEntity],
@@ -47,7 +47,7 @@ from recidiviz.persistence.entity_matching.state.state_matching_utils import \
     convert_to_placeholder, is_multiple_id_entity, \
     get_external_id_keys_from_multiple_id_entity, get_multiple_id_classes, \
     read_db_entity_trees_of_cls_to_merge, get_multiparent_classes, \
-    db_id_or_object_id
+    db_id_or_object_id, EntityTreeIndex
 from recidiviz.persistence.entity.entity_utils import is_placeholder, \
     get_set_entity_field_names, get_all_core_entity_field_names, \
     get_all_db_objs_from_tree, get_all_db_objs_from_trees, \
@@ -716,12 +716,14 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         """
         individual_match_results: List[IndividualMatchResult] = []
         matched_entities_by_db_id: Dict[int, List[DatabaseEntity]] = {}
+        db_entity_tree_index = EntityTreeIndex(db_entity_trees)
         error_count = 0
         for ingested_entity_tree in ingested_entity_trees:
             try:
                 match_result = self._match_entity_tree(
                     ingested_entity_tree=ingested_entity_tree,
                     db_entity_trees=db_entity_trees,
+                    db_entity_tree_index=db_entity_tree_index,
                     matched_entities_by_db_ids=matched_entities_by_db_id,
                     root_entity_cls=root_entity_cls)
                 individual_match_results.append(match_result)
@@ -773,12 +775,14 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
             self,
             *, ingested_entity_tree: EntityTree,
             db_entity_trees: List[EntityTree],
+            db_entity_tree_index: EntityTreeIndex,
             matched_entities_by_db_ids: Dict[int, List[DatabaseEntity]],
             root_entity_cls: Type) -> IndividualMatchResult:
         """Attempts to match the provided |ingested_entity_tree| to one of the
         provided |db_entity_trees|. If a successful match is found, merges the
         ingested entity onto the matching database entity and performs entity
         matching on all children of the matched entities.
+        The |db_entity_tree_index| must be an index over the |db_entity_trees|.
         Returns the results of matching as an IndividualMatchResult.
         """
 
@@ -790,7 +794,7 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
                 root_entity_cls=root_entity_cls)
 
         db_match_tree = self._get_match(ingested_entity_tree,
-                                        db_entity_trees)
+                                        db_entity_tree_index)
 
         if not db_match_tree:
             return self._match_unmatched_tree(
@@ -1220,16 +1224,19 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
     def _get_match(
             self,
             ingested_entity_tree: EntityTree,
-            db_entity_trees: List[EntityTree]
+            db_entity_tree_index: EntityTreeIndex
     ) -> Optional[EntityTree]:
         """With the provided |ingested_entity_tree|, this attempts to find a
-        match among the provided |db_entity_trees|. If a match is found, it is
-        returned.
+        match among the db entity trees in the provided |db_entity_tree_index|.
+        If a match is found, it is returned.
         """
-        db_match_candidates = db_entity_trees
+        db_entity_trees = db_entity_tree_index.entity_trees
         if isinstance(ingested_entity_tree.entity, self.root_entity_cls):
             db_match_candidates = self.get_cached_matches(
                 ingested_entity_tree.entity)
+        else:
+            db_match_candidates = db_entity_tree_index.get_match_candidates(
+                ingested_entity_tree)
 
         # Entities that can have multiple external IDs need special casing to
         # handle the fact that multiple DB entities could match the provided
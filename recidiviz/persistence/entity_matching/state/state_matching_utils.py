@@ -17,7 +17,7 @@
 """State specific utils for entity matching. Utils in this file are generic to any DatabaseEntity."""
 import logging
 from collections import defaultdict
-from typing import List, cast, Optional, Set, Type, Dict, Sequence
+from typing import List, cast, Optional, Set, Type, Dict, Sequence, Hashable, Tuple
 
 from recidiviz.common.constants import enum_canonical_strings
 from recidiviz.common.constants.state.state_agent import StateAgentType
@@ -114,6 +114,94 @@ def _is_match(*,
     return ingested_entity.get_external_id() == db_entity.get_external_id()
 
 
+# Match key for entities that cannot be matched to any other entity by _is_match.
+_NO_MATCH_KEY = 'NO_MATCH'
+
+
+def get_match_key(entity: DatabaseEntity) -> Optional[Hashable]:
+    """Returns a hashable key for the provided |entity| such that two entities
+    of the same class can only be a match (per _is_match) if their keys are
+    equal. Returns None if no such key can be computed for the |entity|, in
+    which case it must be compared against all potential matches.
+
+    Note: Equal keys do not guarantee a match, so keyed candidates must still
+    be checked with _is_match.
+    """
+    if isinstance(entity, schema.StatePerson) or is_multiple_id_entity(entity):
+        return None
+
+    key_prefix = (entity.__class__.__name__, entity.get_field('state_code'))
+
+    if isinstance(entity, schema.StatePersonExternalId):
+        return key_prefix + (entity.external_id, entity.id_type)
+    if isinstance(entity, schema.StatePersonAlias):
+        return key_prefix + (entity.full_name,)
+    if isinstance(entity, schema.StatePersonRace):
+        return key_prefix + (entity.race,)
+    if isinstance(entity, schema.StatePersonEthnicity):
+        return key_prefix + (entity.ethnicity,)
+
+    if isinstance(entity,
+                  (schema.StateSupervisionViolationResponseDecisionEntry,
+                   schema.StateSupervisionViolatedConditionEntry,
+                   schema.StateSupervisionViolationTypeEntry,
+                   schema.StateSupervisionCaseTypeEntry)):
+        # Mirrors _base_entity_match with no skip fields.
+        if is_placeholder(entity):
+            return key_prefix + (_NO_MATCH_KEY, id(entity))
+        if entity.get_external_id():
+            return key_prefix + (entity.get_external_id(),)
+        flat_field_signature = frozenset(
+            (field_name, entity.get_field(field_name))
+            for field_name in get_set_entity_field_names(entity, EntityFieldType.FLAT_FIELD)
+            if field_name != entity.get_class_id_name())
+        try:
+            hash(flat_field_signature)
+        except TypeError:
+            return None
+        return key_prefix + (flat_field_signature,)
+
+    if entity.get_external_id() is None:
+        # Entities without external ids only match other placeholders.
+        if is_placeholder(entity):
+            return key_prefix + (None,)
+        return key_prefix + (_NO_MATCH_KEY, id(entity))
+    return key_prefix + (entity.get_external_id(),)
+
+
+class EntityTreeIndex:
+    """Index over a list of EntityTrees that allows looking up the trees that
+    can possibly match (per is_match) a given ingested EntityTree without
+    comparing it against every tree in the list.
+    """
+
+    def __init__(self, entity_trees: List[EntityTree]):
+        self.entity_trees = entity_trees
+        self._positioned_trees_by_key: Dict[Hashable, List[Tuple[int, EntityTree]]] = defaultdict(list)
+        self._unkeyed_positioned_trees: List[Tuple[int, EntityTree]] = []
+        for position, entity_tree in enumerate(entity_trees):
+            key = get_match_key(entity_tree.entity)
+            if key is None:
+                self._unkeyed_positioned_trees.append((position, entity_tree))
+            else:
+                self._positioned_trees_by_key[key].append((position, entity_tree))
+
+    def get_match_candidates(self, ingested_entity_tree: EntityTree) -> List[EntityTree]:
+        """Returns all trees in this index that could match the provided
+        |ingested_entity_tree|, in the same relative order as in the original
+        list.
+        """
+        key = get_match_key(ingested_entity_tree.entity)
+        if key is None:
+            return self.entity_trees
+
+        positioned_trees = self._positioned_trees_by_key.get(key, [])
+        if self._unkeyed_positioned_trees:
+            positioned_trees = sorted(positioned_trees + self._unkeyed_positioned_trees,
+                                      key=lambda positioned_tree: positioned_tree[0])
+        return [entity_tree for _, entity_tree in positioned_trees]
+
+
 def nonnull_fields_entity_match(
         ingested_entity: EntityTree,
         db_entity: EntityTree,
@@ -463,23 +551,6 @@ def db_id_or_object_id(entity: DatabaseEntity) -> int:
     return entity.get_id() if entity.get_id() else id(entity)
 
 
-def read_persons(
-        session: Session,
-        region: str,
-        ingested_people: List[schema.StatePerson]
-) -> List[schema.StatePerson]:
-    """Looks up all people necessary for entity matching based on the provided
-    |region| and |ingested_people|.
-    """
-    check_all_objs_have_type(ingested_people, schema.StatePerson)
-
-    # TODO(#1868): more specific query
-    db_people = dao.read_people(session)
-    logging.info("Read [%d] people from DB in region [%s]",
-                 len(db_people), region)
-    return db_people
-
-
 def read_db_entity_trees_of_cls_to_merge(
         session: Session,
         state_code: str,
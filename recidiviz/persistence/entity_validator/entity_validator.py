@@ -16,7 +16,7 @@
 # =============================================================================
 """Validates that data in converted Entity objects conforms to data assumptions."""
 
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Iterable
 
 from recidiviz.persistence.entity.county import entities as county_entities
 from recidiviz.persistence.entity.entities import EntityPersonType
@@ -25,9 +25,9 @@ from recidiviz.persistence.entity_validator.county.county_validator import valid
 from recidiviz.persistence.entity_validator.state.state_validator import validate_state_person
 
 
-def validate(people: List[EntityPersonType]) -> Tuple[List[EntityPersonType], int]:
-    """Validates a list of EntityPersonType entities and returns the valid people and the number of people with
-    validation errors.
+def validate(people: Iterable[EntityPersonType]) -> Tuple[List[EntityPersonType], int]:
+    """Validates EntityPersonType entities and returns the valid people and the number of people with validation
+    errors. |people| may be any iterable, including a generator of people that are still being converted.
     """
     data_validation_errors = 0
     validated_people = []
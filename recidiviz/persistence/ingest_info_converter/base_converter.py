@@ -17,10 +17,9 @@
 
 """Converts scraped IngestInfo data to the persistence layer entity."""
 
-import copy
 import logging
 from abc import abstractmethod
-from typing import List, Generic
+from typing import List, Generic, Iterator, Sequence, Iterable, Dict, Any, Optional
 
 import attr
 
@@ -39,54 +38,80 @@ class IngestInfoConversionResult(Generic[EntityPersonType]):
     people: List[EntityPersonType] = attr.ib(factory=list)
 
 
+class LazyIdIndex:
+    """Read-only mapping from id to proto for a repeated field on an IngestInfo, e.g. from state_alias_id to
+    StateAlias. The underlying dictionary is only built the first time an id is looked up, so that ingest_infos which
+    never reference a given type of child object do not pay for indexing it.
+    """
+
+    def __init__(self, protos: Iterable[Any], id_field_name: str):
+        self._protos = protos
+        self._id_field_name = id_field_name
+        self._index: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, proto_id: str) -> Any:
+        if self._index is None:
+            self._index = {getattr(proto, self._id_field_name): proto for proto in self._protos}
+        return self._index[proto_id]
+
+
 class BaseConverter(Generic[EntityPersonType]):
-    """Base class for all data converters of IngestInfo proto objects."""
+    """Base class for all data converters of IngestInfo proto objects.
+
+    The provided IngestInfo is only ever read from, never modified.
+    """
 
     def __init__(self, ingest_info: IngestInfo, metadata: IngestMetadata):
-        self.ingest_info = copy.deepcopy(ingest_info)
+        self.ingest_info = ingest_info
         self.metadata = metadata
 
-    def run_convert(self) -> IngestInfoConversionResult:
-        people: List[EntityPersonType] = []
-        protected_class_errors = 0
-        enum_parsing_errors = 0
-        general_parsing_errors = 0
-        while not self._is_complete():
-            person = self._pop_person()
-            try:
-                converted_person = self._convert_person(person)
-                people.append(converted_person)
-            except EnumParsingError as e:
-                logging.error(str(e))
-                self._compliant_log_person(person)
-                if _is_protected_error(e):
-                    protected_class_errors += 1
-                else:
-                    enum_parsing_errors += 1
-            except Exception as e:
-                logging.error(str(e))
-                general_parsing_errors += 1
-                raise e
+        self.enum_parsing_errors = 0
+        self.general_parsing_errors = 0
+        self.protected_class_errors = 0
 
+    def run_convert(self) -> IngestInfoConversionResult:
+        people: List[EntityPersonType] = list(self.iter_convert())
         return IngestInfoConversionResult(
             people=people,
-            enum_parsing_errors=enum_parsing_errors,
-            general_parsing_errors=general_parsing_errors,
-            protected_class_errors=protected_class_errors)
+            enum_parsing_errors=self.enum_parsing_errors,
+            general_parsing_errors=self.general_parsing_errors,
+            protected_class_errors=self.protected_class_errors)
+
+    def iter_convert(self) -> Iterator[EntityPersonType]:
+        """Converts and yields people one at a time, so that callers can process converted people incrementally
+        without holding the whole converted graph in memory at once.
+
+        Conversion error counts on this converter are updated as people are converted, and are only complete once the
+        returned iterator is exhausted. Enum parsing metrics for the conversion are reported once it stops.
+        """
+        try:
+            # People are converted in reverse order, matching the order in which they were historically popped off of
+            # the ingest_info.
+            for person in reversed(self._get_ingest_people()):
+                try:
+                    yield self._convert_person(person)
+                except EnumParsingError as e:
+                    logging.error(str(e))
+                    self._compliant_log_person(person)
+                    if _is_protected_error(e):
+                        self.protected_class_errors += 1
+                    else:
+                        self.enum_parsing_errors += 1
+                except Exception as e:
+                    logging.error(str(e))
+                    self.general_parsing_errors += 1
+                    raise e
+        finally:
+            self.metadata.enum_overrides.report_parsing_table_metrics()
 
     @abstractmethod
-    def _pop_person(self):
-        """Pops a person from the list of persons to be converted."""
+    def _get_ingest_people(self) -> Sequence:
+        """Returns the list of ingested persons to be converted."""
 
     @abstractmethod
     def _convert_person(self, ingest_person) -> EntityPersonType:
         """Converts the ingested person and all of its children to Entities."""
 
-    @abstractmethod
-    def _is_complete(self) -> bool:
-        """Returns whether or not we've converted all entities in the
-        IngestInfo."""
-
     @abstractmethod
     def _compliant_log_person(self, ingest_person):
         """Logs the ingested person in a security-compliant manner, i.e. only
@@ -18,7 +18,7 @@
 
 import copy
 import logging
-from typing import List
+from typing import List, Sequence
 
 import more_itertools
 
@@ -30,7 +30,7 @@ from recidiviz.ingest.models.ingest_info_pb2 import IngestInfo, Person
 from recidiviz.persistence import persistence_utils
 from recidiviz.persistence.entity.county import entities
 from recidiviz.persistence.ingest_info_converter.base_converter import \
-    BaseConverter
+    BaseConverter, LazyIdIndex
 from recidiviz.persistence.ingest_info_converter.county.entity_helpers import \
     booking, charge, hold, person, sentence, arrest, bond
 from recidiviz.persistence.ingest_info_converter.utils.converter_utils import \
@@ -43,20 +43,15 @@ class CountyConverter(BaseConverter[entities.Person]):
     def __init__(self, ingest_info: IngestInfo, metadata: IngestMetadata):
         super().__init__(ingest_info, metadata)
 
-        self.bookings = {b.booking_id: b for b in ingest_info.bookings}
-        self.arrests = {a.arrest_id: a for a in ingest_info.arrests}
-        self.charges = {c.charge_id: c for c in ingest_info.charges}
-        self.holds = {h.hold_id: h for h in ingest_info.holds}
-        self.bonds = {b.bond_id: b for b in ingest_info.bonds}
-        self.sentences = {s.sentence_id: s for s in ingest_info.sentences}
+        self.bookings = LazyIdIndex(ingest_info.bookings, 'booking_id')
+        self.arrests = LazyIdIndex(ingest_info.arrests, 'arrest_id')
+        self.charges = LazyIdIndex(ingest_info.charges, 'charge_id')
+        self.holds = LazyIdIndex(ingest_info.holds, 'hold_id')
+        self.bonds = LazyIdIndex(ingest_info.bonds, 'bond_id')
+        self.sentences = LazyIdIndex(ingest_info.sentences, 'sentence_id')
 
-    def _is_complete(self) -> bool:
-        if self.ingest_info.people:
-            return False
-        return True
-
-    def _pop_person(self) -> Person:
-        return self.ingest_info.people.pop()
+    def _get_ingest_people(self) -> Sequence[Person]:
+        return self.ingest_info.people
 
     def _compliant_log_person(self, ingest_person: Person):
         logging.info(str(ingest_person))
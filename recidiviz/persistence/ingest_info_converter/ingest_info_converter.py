@@ -16,8 +16,11 @@
 # ============================================================================
 """Converts scraped IngestInfo data to the persistence layer entity."""
 
+from typing import Tuple
+
 from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
 from recidiviz.ingest.models.ingest_info_pb2 import IngestInfo
+from recidiviz.persistence.entity_validator import entity_validator
 from recidiviz.persistence.ingest_info_converter.base_converter import \
     BaseConverter, IngestInfoConversionResult
 from recidiviz.persistence.ingest_info_converter.county.county_converter \
@@ -33,6 +36,25 @@ def convert_to_persistence_entities(
     return converter.run_convert()
 
 
+def convert_and_validate_to_persistence_entities(
+        ingest_info: IngestInfo, metadata: IngestMetadata
+) -> Tuple[IngestInfoConversionResult, int]:
+    """Converts the people in |ingest_info| and validates each converted person as soon as it is produced, so that the
+    full list of unvalidated converted people is never held in memory at once.
+
+    Returns the conversion result, whose people are only those that passed validation, along with the number of people
+    that failed validation.
+    """
+    converter = _get_converter(ingest_info, metadata)
+    people, data_validation_errors = entity_validator.validate(converter.iter_convert())
+    conversion_result = IngestInfoConversionResult(
+        people=people,
+        enum_parsing_errors=converter.enum_parsing_errors,
+        general_parsing_errors=converter.general_parsing_errors,
+        protected_class_errors=converter.protected_class_errors)
+    return conversion_result, data_validation_errors
+
+
 def _get_converter(ingest_info: IngestInfo, metadata: IngestMetadata) \
         -> BaseConverter:
     system_level = metadata.system_level
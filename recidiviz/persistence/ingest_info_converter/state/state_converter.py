@@ -17,6 +17,8 @@
 
 """Converts ingested IngestInfo data to the persistence layer entities."""
 
+from typing import Sequence
+
 from recidiviz.ingest.models.ingest_info_pb2 import StateSentenceGroup, \
     StatePerson, StateSupervisionSentence, StateIncarcerationSentence, \
     StateCharge, StateIncarcerationPeriod, StateSupervisionPeriod, \
@@ -25,7 +27,7 @@ from recidiviz.ingest.models.ingest_info_pb2 import StateSentenceGroup, \
     StateSupervisionViolationResponse, StateProgramAssignment, StateEarlyDischarge, StateSupervisionContact
 from recidiviz.persistence.entity.state import entities
 from recidiviz.persistence.ingest_info_converter.base_converter import \
-    BaseConverter
+    BaseConverter, LazyIdIndex
 from recidiviz.persistence.ingest_info_converter.state.entity_helpers import \
     state_person, state_alias, state_person_race, state_person_ethnicity, \
     state_assessment, state_person_external_id, state_sentence_group, \
@@ -49,93 +51,48 @@ class StateConverter(BaseConverter[entities.StatePerson]):
     def __init__(self, ingest_info, metadata):
         super().__init__(ingest_info, metadata)
 
-        self.aliases = {a.state_alias_id: a for a in ingest_info.state_aliases}
-        self.person_races = {pr.state_person_race_id: pr for pr
-                             in ingest_info.state_person_races}
-        self.person_ethnicities = {pe.state_person_ethnicity_id: pe for pe
-                                   in ingest_info.state_person_ethnicities}
-        self.person_external_ids = {pei.state_person_external_id_id: pei for pei
-                                    in ingest_info.state_person_external_ids}
-        self.assessments = {a.state_assessment_id: a for a
-                            in ingest_info.state_assessments}
-        self.program_assignments = {pa.state_program_assignment_id: pa for
-                                    pa in ingest_info.state_program_assignments}
-        self.agents = {a.state_agent_id: a for a in ingest_info.state_agents}
-        self.sentence_groups = {sg.state_sentence_group_id: sg for sg
-                                in ingest_info.state_sentence_groups}
-        self.supervision_sentences = {
-            ss.state_supervision_sentence_id: ss for ss
-            in ingest_info.state_supervision_sentences}
-        self.incarceration_sentences = {
-            ins.state_incarceration_sentence_id: ins for ins
-            in ingest_info.state_incarceration_sentences}
-        self.early_discharges = {ed.state_early_discharge_id: ed for ed in ingest_info.state_early_discharges}
-        self.fines = {f.state_fine_id: f for f in ingest_info.state_fines}
-        self.charges = {sc.state_charge_id: sc for sc
-                        in ingest_info.state_charges}
-        self.bonds = {b.state_bond_id: b for b in ingest_info.state_bonds}
-        self.court_cases = {cc.state_court_case_id: cc for cc in ingest_info.state_court_cases}
-        self.supervision_periods = {
-            sp.state_supervision_period_id: sp for sp
-            in ingest_info.state_supervision_periods
-        }
-        self.supervision_case_type_entries = {
-            c.state_supervision_case_type_entry_id: c for c in
-            ingest_info.state_supervision_case_type_entries
-        }
-        self.incarceration_periods = {
-            ip.state_incarceration_period_id: ip for ip
-            in ingest_info.state_incarceration_periods
-        }
-        self.parole_decisions = {
-            pd.state_parole_decision_id: pd for pd
-            in ingest_info.state_parole_decisions
-        }
-        self.parole_decisions = {pd.state_parole_decision_id: pd for pd
-                                 in ingest_info.state_parole_decisions}
-        self.incarceration_incidents = {
-            ii.state_incarceration_incident_id: ii
-            for ii in ingest_info.state_incarceration_incidents
-        }
-
-        self.incarceration_incident_outcomes = {
-            iio.state_incarceration_incident_outcome_id: iio
-            for iio in ingest_info.state_incarceration_incident_outcomes
-        }
-
-        self.supervision_contacts = {
-            ii.state_supervision_contact_id: ii for ii in ingest_info.state_supervision_contacts
-        }
-        self.supervision_violations = {
-            sv.state_supervision_violation_id: sv for sv
-            in ingest_info.state_supervision_violations
-        }
-        self.violated_condition_entries = {
-            svce.state_supervision_violated_condition_entry_id: svce for svce
-            in ingest_info.state_supervision_violated_condition_entries
-        }
-        self.violation_type_entries = {
-            svte.state_supervision_violation_type_entry_id: svte for svte
-            in ingest_info.state_supervision_violation_type_entries
-        }
-
-        self.violation_responses = {
-            vr.state_supervision_violation_response_id: vr for vr
-            in ingest_info.state_supervision_violation_responses
-        }
-
-        self.violation_response_decision_entries = {
-            svrdte.state_supervision_violation_response_decision_entry_id:
-            svrdte for svrdte in ingest_info.state_supervision_violation_response_decision_entries
-        }
-
-    def _is_complete(self) -> bool:
-        if self.ingest_info.state_people:
-            return False
-        return True
-
-    def _pop_person(self) -> StatePerson:
-        return self.ingest_info.state_people.pop()
+        self.aliases = LazyIdIndex(ingest_info.state_aliases, 'state_alias_id')
+        self.person_races = LazyIdIndex(ingest_info.state_person_races, 'state_person_race_id')
+        self.person_ethnicities = LazyIdIndex(ingest_info.state_person_ethnicities, 'state_person_ethnicity_id')
+        self.person_external_ids = LazyIdIndex(ingest_info.state_person_external_ids, 'state_person_external_id_id')
+        self.assessments = LazyIdIndex(ingest_info.state_assessments, 'state_assessment_id')
+        self.program_assignments = LazyIdIndex(ingest_info.state_program_assignments, 'state_program_assignment_id')
+        self.agents = LazyIdIndex(ingest_info.state_agents, 'state_agent_id')
+        self.sentence_groups = LazyIdIndex(ingest_info.state_sentence_groups, 'state_sentence_group_id')
+        self.supervision_sentences = LazyIdIndex(
+            ingest_info.state_supervision_sentences, 'state_supervision_sentence_id')
+        self.incarceration_sentences = LazyIdIndex(
+            ingest_info.state_incarceration_sentences, 'state_incarceration_sentence_id')
+        self.early_discharges = LazyIdIndex(ingest_info.state_early_discharges, 'state_early_discharge_id')
+        self.fines = LazyIdIndex(ingest_info.state_fines, 'state_fine_id')
+        self.charges = LazyIdIndex(ingest_info.state_charges, 'state_charge_id')
+        self.bonds = LazyIdIndex(ingest_info.state_bonds, 'state_bond_id')
+        self.court_cases = LazyIdIndex(ingest_info.state_court_cases, 'state_court_case_id')
+        self.supervision_periods = LazyIdIndex(ingest_info.state_supervision_periods, 'state_supervision_period_id')
+        self.supervision_case_type_entries = LazyIdIndex(
+            ingest_info.state_supervision_case_type_entries, 'state_supervision_case_type_entry_id')
+        self.incarceration_periods = LazyIdIndex(
+            ingest_info.state_incarceration_periods, 'state_incarceration_period_id')
+        self.parole_decisions = LazyIdIndex(ingest_info.state_parole_decisions, 'state_parole_decision_id')
+        self.incarceration_incidents = LazyIdIndex(
+            ingest_info.state_incarceration_incidents, 'state_incarceration_incident_id')
+        self.incarceration_incident_outcomes = LazyIdIndex(
+            ingest_info.state_incarceration_incident_outcomes, 'state_incarceration_incident_outcome_id')
+        self.supervision_contacts = LazyIdIndex(ingest_info.state_supervision_contacts, 'state_supervision_contact_id')
+        self.supervision_violations = LazyIdIndex(
+            ingest_info.state_supervision_violations, 'state_supervision_violation_id')
+        self.violated_condition_entries = LazyIdIndex(
+            ingest_info.state_supervision_violated_condition_entries, 'state_supervision_violated_condition_entry_id')
+        self.violation_type_entries = LazyIdIndex(
+            ingest_info.state_supervision_violation_type_entries, 'state_supervision_violation_type_entry_id')
+        self.violation_responses = LazyIdIndex(
+            ingest_info.state_supervision_violation_responses, 'state_supervision_violation_response_id')
+        self.violation_response_decision_entries = LazyIdIndex(
+            ingest_info.state_supervision_violation_response_decision_entries,
+            'state_supervision_violation_response_decision_entry_id')
+
+    def _get_ingest_people(self) -> Sequence[StatePerson]:
+        return self.ingest_info.state_people
 
     def _compliant_log_person(self, ingest_person):
         """Don't log any information about state people."""
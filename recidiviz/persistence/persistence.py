@@ -35,6 +35,7 @@ from recidiviz.ingest.models.ingest_info_pb2 import IngestInfo
 from recidiviz.persistence import persistence_utils
 from recidiviz.persistence.database import database
 from recidiviz.persistence.database.base_schema import JailsBase
+from recidiviz.persistence.database.query_counter import SessionQueryCounter
 from recidiviz.persistence.database.schema.county import dao as county_dao
 from recidiviz.persistence.database.schema_entity_converter import \
     schema_entity_converter as converter
@@ -45,7 +46,6 @@ from recidiviz.persistence.database.session_factory import SessionFactory
 from recidiviz.persistence.database_invariant_validator import database_invariant_validator
 from recidiviz.persistence.entity.county import entities as county_entities
 from recidiviz.persistence.entity_matching import entity_matching
-from recidiviz.persistence.entity_validator import entity_validator
 from recidiviz.persistence.ingest_info_converter import ingest_info_converter
 from recidiviz.persistence.ingest_info_converter.base_converter import \
     IngestInfoConversionResult
@@ -61,6 +61,8 @@ m_errors = measure.MeasureInt("persistence/num_errors",
                               "The number of errors", "1")
 m_retries = measure.MeasureInt("persistence/num_transaction_retries",
                                "The number of transaction retries due to serialization failures", "1")
+m_queries = measure.MeasureInt("persistence/num_queries",
+                               "The number of database queries issued in a single write", "1")
 people_persisted_view = view.View("recidiviz/persistence/num_people",
                                   "The sum of people persisted",
                                   [monitoring.TagKey.REGION,
@@ -80,8 +82,15 @@ retried_transactions_view = view.View("recidiviz/persistence/num_transaction_ret
                                       "The total number of transaction retries",
                                       [monitoring.TagKey.REGION],
                                       m_retries, aggregation.SumAggregation())
+queries_view = view.View("recidiviz/persistence/num_queries",
+                         "The distribution of database queries issued per write",
+                         [monitoring.TagKey.REGION,
+                          monitoring.TagKey.PERSISTED],
+                         m_queries,
+                         aggregation.DistributionAggregation(
+                             [10, 100, 1000, 10000, 100000]))
 monitoring.register_views(
-    [people_persisted_view, aborted_writes_view, errors_persisted_view, retried_transactions_view])
+    [people_persisted_view, aborted_writes_view, errors_persisted_view, retried_transactions_view, queries_view])
 
 OVERALL_THRESHOLD = "overall_threshold"
 ENUM_THRESHOLD = "enum_threshold"
@@ -327,13 +336,11 @@ def write(ingest_info: IngestInfo, metadata: IngestMetadata,
     total_people = _get_total_people(ingest_info, metadata)
     with monitoring.measurements(mtags) as measurements:
 
-        # Convert the people one at a time and count the errors as they happen.
-        conversion_result: IngestInfoConversionResult = \
-            ingest_info_converter.convert_to_persistence_entities(ingest_info,
-                                                                  metadata)
-
-        people, data_validation_errors = entity_validator.validate(
-            conversion_result.people)
+        # Convert and validate the people one at a time and count the errors as they happen.
+        conversion_result, data_validation_errors = \
+            ingest_info_converter.convert_and_validate_to_persistence_entities(
+                ingest_info, metadata)
+        people = conversion_result.people
         logging.info("Converted [%s] people with [%s] enum_parsing_errors, [%s]"
                      " general_parsing_errors, [%s] protected_class_errors and "
                      "[%s] data_validation_errors",
@@ -399,10 +406,10 @@ def write(ingest_info: IngestInfo, metadata: IngestMetadata,
             logging.info("Successfully wrote to the database")
             return True
 
+        session = SessionFactory.for_schema_base(schema_base_for_system_level(metadata.system_level))
+        query_counter = SessionQueryCounter(session)
         try:
-            if not run_txn_fn(
-                    SessionFactory.for_schema_base(schema_base_for_system_level(metadata.system_level)),
-                    measurements, match_and_write_people, 5):
+            if not run_txn_fn(session, measurements, match_and_write_people, 5):
                 return False
 
             mtags[monitoring.TagKey.PERSISTED] = True
@@ -413,6 +420,11 @@ def write(ingest_info: IngestInfo, metadata: IngestMetadata,
             mtags[monitoring.TagKey.ERROR] = type(e).__name__
             measurements.measure_int_put(m_errors, 1)
             raise
+        finally:
+            query_counter.close()
+            logging.info("Issued [%s] database queries while persisting [%s] people",
+                         query_counter.query_count, len(people))
+            measurements.measure_int_put(m_queries, query_counter.query_count)
         return True
 
 
@@ -277,6 +277,31 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.mock_client.create_dataset.assert_called()
         self.mock_client.load_table_from_uri.assert_called()
 
+    def test_stream_into_table(self) -> None:
+        """Tests that the stream_into_table function inserts the rows into the table."""
+        self.mock_client.insert_rows.return_value = []
+        rows = [{'column': 'value'}]
+
+        self.bq_client.stream_into_table(self.mock_dataset_id, self.mock_table_id, rows)
+
+        self.mock_client.insert_rows.assert_called_with(self.mock_client.get_table.return_value, rows)
+
+    def test_stream_into_table_errors(self) -> None:
+        """Tests that the stream_into_table function raises if any rows could not be inserted."""
+        self.mock_client.insert_rows.return_value = [{'index': 0, 'errors': ['invalid']}]
+
+        with pytest.raises(ValueError):
+            self.bq_client.stream_into_table(self.mock_dataset_id, self.mock_table_id, [{'column': 'value'}])
+
+    def test_get_referenced_tables(self) -> None:
+        """Tests that the get_referenced_tables function returns the tables read by a dry run of the query."""
+        table_ref = bigquery.TableReference(bigquery.DatasetReference('fake-project', 'dataset'), 'table')
+        self.mock_client.query.return_value.referenced_tables = [table_ref]
+
+        self.assertEqual([table_ref], self.bq_client.get_referenced_tables('SELECT * FROM `dataset.table`'))
+
+        self.assertTrue(self.mock_client.query.call_args[1]['job_config'].dry_run)
+
     def test_delete_from_table(self) -> None:
         """Tests that the delete_from_table function runs a query."""
         self.bq_client.delete_from_table_async(self.mock_dataset_id, self.mock_table_id, filter_clause="WHERE x > y")
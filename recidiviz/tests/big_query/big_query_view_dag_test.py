@@ -0,0 +1,99 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for big_query_view_dag.py."""
+import unittest
+
+from recidiviz.big_query.big_query_view import BigQueryView
+from recidiviz.big_query.big_query_view_dag import BigQueryViewDag
+
+_PROJECT_ID = 'fake-recidiviz-project'
+
+
+def _view(dataset_id: str, view_id: str, view_query_template: str = 'SELECT NULL LIMIT 0',
+          should_materialize: bool = False) -> BigQueryView:
+    return BigQueryView(project_id=_PROJECT_ID, dataset_id=dataset_id, view_id=view_id,
+                        view_query_template=view_query_template, should_materialize=should_materialize)
+
+
+class BigQueryViewDagTest(unittest.TestCase):
+    """Tests for BigQueryViewDag."""
+
+    def setUp(self) -> None:
+        self.source_view = _view('dataset_1', 'source_view', should_materialize=True)
+        self.middle_view = _view('dataset_2', 'middle_view',
+                                 'SELECT * FROM `{project_id}.dataset_1.source_view_materialized`')
+        self.other_view = _view('dataset_1', 'other_view', 'SELECT * FROM dataset_1.source_view')
+        self.leaf_view = _view('dataset_2', 'leaf_view',
+                               'SELECT * FROM `{project_id}.dataset_2.middle_view` '
+                               'JOIN `{project_id}.dataset_1.other_view` USING (person_id) '
+                               'JOIN `{project_id}.external_dataset.external_table` USING (person_id)')
+        self.independent_view = _view('dataset_3', 'independent_view')
+
+        self.views = [self.leaf_view, self.other_view, self.independent_view, self.middle_view, self.source_view]
+
+    def test_waves(self):
+        dag = BigQueryViewDag(self.views)
+
+        self.assertEqual([[self.source_view, self.independent_view],
+                          [self.other_view, self.middle_view],
+                          [self.leaf_view]],
+                         dag.waves)
+
+    def test_parents(self):
+        dag = BigQueryViewDag(self.views)
+
+        self.assertEqual([self.other_view, self.middle_view], dag.parents(self.leaf_view))
+        self.assertEqual([self.source_view], dag.parents(self.middle_view))
+        self.assertEqual([], dag.parents(self.independent_view))
+
+    def test_descendants(self):
+        dag = BigQueryViewDag(self.views)
+
+        self.assertEqual([self.other_view, self.leaf_view, self.middle_view], dag.descendants(self.source_view))
+        self.assertEqual([self.leaf_view], dag.descendants(self.middle_view))
+        self.assertEqual([], dag.descendants(self.leaf_view))
+
+    def test_critical_path(self):
+        dag = BigQueryViewDag(self.views)
+
+        self.assertEqual([self.source_view, self.other_view, self.leaf_view], dag.critical_path())
+
+    def test_critical_path_no_views(self):
+        self.assertEqual([], BigQueryViewDag([]).critical_path())
+
+    def test_cycle(self):
+        view_1 = _view('dataset_1', 'view_1', 'SELECT * FROM dataset_1.view_2')
+        view_2 = _view('dataset_1', 'view_2', 'SELECT * FROM dataset_1.view_1')
+
+        with self.assertRaises(ValueError):
+            BigQueryViewDag([view_1, view_2, self.independent_view])
+
+    def test_describe(self):
+        description = BigQueryViewDag(self.views).describe()
+
+        self.assertEqual('\n'.join([
+            'Wave 0 (2 views):',
+            '    dataset_1.source_view [materialized]',
+            '    dataset_3.independent_view',
+            'Wave 1 (2 views):',
+            '    dataset_1.other_view <- dataset_1.source_view',
+            '    dataset_2.middle_view <- dataset_1.source_view',
+            'Wave 2 (1 views):',
+            '    dataset_2.leaf_view <- dataset_1.other_view, dataset_2.middle_view',
+            'Critical path (3 views):',
+            '    dataset_1.source_view -> dataset_1.other_view -> dataset_2.leaf_view',
+        ]), description)
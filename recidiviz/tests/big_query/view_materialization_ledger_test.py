@@ -0,0 +1,222 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for view_materialization_ledger.py."""
+import datetime
+import re
+import unittest
+from typing import Dict, List, Optional
+from unittest.mock import create_autospec
+
+from google.cloud import bigquery, exceptions
+
+from recidiviz.big_query.big_query_client import BigQueryClient
+from recidiviz.big_query.big_query_view import BigQueryView
+from recidiviz.big_query.view_materialization_ledger import ViewMaterializationLedger, \
+    VIEW_MATERIALIZATION_LEDGER_TABLE, VIEW_UPDATE_METADATA_DATASET, clear_recorded_fingerprints_cache
+
+_PROJECT_ID = 'fake-recidiviz-project'
+
+_TABLE_REFERENCE_REGEX = re.compile(r'`([\w-]+)\.([\w-]+)\.([\w-]+)`')
+
+
+class ViewMaterializationLedgerTest(unittest.TestCase):
+    """Tests for ViewMaterializationLedger."""
+
+    def setUp(self) -> None:
+        clear_recorded_fingerprints_cache()
+
+        self.mock_bq_client = create_autospec(BigQueryClient)
+        self.mock_bq_client.project_id = _PROJECT_ID
+        self.mock_bq_client.dataset_ref_for_id.side_effect = \
+            lambda dataset_id: bigquery.DatasetReference(_PROJECT_ID, dataset_id)
+        self.mock_bq_client.table_exists.return_value = True
+        self.mock_bq_client.run_query_async.return_value.result.return_value = []
+
+        self.tables: Dict[str, bigquery.Table] = {}
+        self.mock_bq_client.get_table.side_effect = self._get_table
+        self.mock_bq_client.get_referenced_tables.side_effect = self._get_referenced_tables
+
+        self.source_table = self._add_table('source_dataset', 'source_table', datetime.datetime(2020, 1, 1))
+        self._add_view('view_dataset', 'parent_view', 'SELECT * FROM `{project_id}.source_dataset.source_table`')
+
+        self.view = BigQueryView(project_id=_PROJECT_ID,
+                                 dataset_id='view_dataset',
+                                 view_id='child_view',
+                                 view_query_template='SELECT * FROM `{project_id}.view_dataset.parent_view` v '
+                                                     'WHERE v.person_id IS NOT NULL',
+                                 should_materialize=True)
+
+    def _get_table(self, dataset_ref: bigquery.DatasetReference, table_id: str) -> bigquery.Table:
+        address = f'{dataset_ref.dataset_id}.{table_id}'
+        if address not in self.tables:
+            raise exceptions.NotFound(address)
+        return self.tables[address]
+
+    @staticmethod
+    def _get_referenced_tables(query: str) -> List[bigquery.TableReference]:
+        return [bigquery.TableReference(bigquery.DatasetReference(project_id, dataset_id), table_id)
+                for project_id, dataset_id, table_id in _TABLE_REFERENCE_REGEX.findall(query)]
+
+    def _add_table(self, dataset_id: str, table_id: str, modified: datetime.datetime,
+                   table_type: str = 'TABLE') -> bigquery.Table:
+        table = create_autospec(bigquery.Table)
+        table.table_type = table_type
+        table.modified = modified
+        self.tables[f'{dataset_id}.{table_id}'] = table
+        return table
+
+    def _add_view(self, dataset_id: str, view_id: str, view_query_template: str) -> None:
+        table = create_autospec(bigquery.Table)
+        table.table_type = 'VIEW'
+        table.view_query = view_query_template.format(project_id=_PROJECT_ID)
+        self.tables[f'{dataset_id}.{view_id}'] = table
+
+    def _fingerprint(self, view: Optional[BigQueryView] = None) -> Optional[str]:
+        return ViewMaterializationLedger(self.mock_bq_client).fingerprint(view or self.view)
+
+    def test_creates_ledger_table_on_first_record(self):
+        self.mock_bq_client.table_exists.return_value = False
+        self.mock_bq_client.run_query_async.return_value.result.side_effect = exceptions.NotFound('ledger')
+
+        ledger = ViewMaterializationLedger(self.mock_bq_client)
+        self.assertFalse(ledger.is_up_to_date(self.view, 'fingerprint'))
+        self.mock_bq_client.create_table_with_schema.assert_not_called()
+
+        ledger.record(self.view, 'fingerprint')
+        ledger.record(self.view, 'fingerprint')
+
+        self.mock_bq_client.create_table_with_schema.assert_called_once()
+        self.assertEqual((VIEW_UPDATE_METADATA_DATASET, VIEW_MATERIALIZATION_LEDGER_TABLE),
+                         self.mock_bq_client.create_table_with_schema.call_args[0][:2])
+
+    def test_recorded_fingerprints_read_once(self):
+        self.mock_bq_client.run_query_async.return_value.result.return_value = [{
+            'dataset_id': 'view_dataset',
+            'materialized_table_id': 'child_view_materialized',
+            'fingerprint': 'old_fingerprint',
+        }]
+
+        ledger = ViewMaterializationLedger(self.mock_bq_client)
+        self.assertTrue(ledger.is_up_to_date(self.view, 'old_fingerprint'))
+        ledger.record(self.view, 'new_fingerprint')
+
+        ledger = ViewMaterializationLedger(self.mock_bq_client)
+        self.assertFalse(ledger.is_up_to_date(self.view, 'old_fingerprint'))
+        self.assertTrue(ledger.is_up_to_date(self.view, 'new_fingerprint'))
+
+        self.mock_bq_client.run_query_async.assert_called_once()
+        self.mock_bq_client.create_table_with_schema.assert_not_called()
+
+    def test_fingerprint_unchanged(self):
+        self.assertEqual(self._fingerprint(), self._fingerprint())
+
+    def test_fingerprint_upstream_table_modified(self):
+        fingerprint = self._fingerprint()
+
+        self.source_table.modified = datetime.datetime(2020, 1, 2)
+
+        self.assertNotEqual(fingerprint, self._fingerprint())
+
+    def test_fingerprint_upstream_view_query_changed(self):
+        fingerprint = self._fingerprint()
+
+        self._add_view('view_dataset', 'parent_view',
+                       'SELECT * FROM `{project_id}.source_dataset.source_table` WHERE TRUE')
+
+        self.assertNotEqual(fingerprint, self._fingerprint())
+
+    def test_fingerprint_non_deterministic_upstream_view(self):
+        self._add_view('view_dataset', 'parent_view',
+                       'SELECT *, CURRENT_DATE() AS today FROM `{project_id}.source_dataset.source_table`')
+
+        self.assertIsNone(self._fingerprint())
+
+    def test_fingerprint_tables_looked_up_once(self):
+        ledger = ViewMaterializationLedger(self.mock_bq_client)
+
+        self.assertEqual(ledger.fingerprint(self.view), ledger.fingerprint(self.view))
+
+        self.assertEqual(2, self.mock_bq_client.get_table.call_count)
+
+    def test_fingerprint_external_table(self):
+        self._add_table('source_dataset', 'source_table', datetime.datetime(2020, 1, 1), table_type='EXTERNAL')
+
+        self.assertIsNone(self._fingerprint())
+
+    def test_fingerprint_query_does_not_parse(self):
+        self.mock_bq_client.get_referenced_tables.side_effect = exceptions.BadRequest('Not found: Table')
+
+        self.assertIsNone(self._fingerprint())
+
+    def test_fingerprint_other_project(self):
+        view = BigQueryView(project_id=_PROJECT_ID,
+                            dataset_id='view_dataset',
+                            view_id='other_project_view',
+                            view_query_template='SELECT * FROM `other-project.source_dataset.source_table`',
+                            should_materialize=True)
+
+        self.assertIsNone(self._fingerprint(view))
+
+    def test_is_up_to_date(self):
+        fingerprint = self._fingerprint()
+        self.mock_bq_client.run_query_async.return_value.result.return_value = [{
+            'dataset_id': 'view_dataset',
+            'materialized_table_id': 'child_view_materialized',
+            'fingerprint': fingerprint,
+        }]
+
+        ledger = ViewMaterializationLedger(self.mock_bq_client)
+
+        self.assertTrue(ledger.is_up_to_date(self.view, ledger.fingerprint(self.view)))
+
+        self.source_table.modified = datetime.datetime(2020, 1, 2)
+        self.assertFalse(ViewMaterializationLedger(self.mock_bq_client).is_up_to_date(
+            self.view, self._fingerprint()))
+
+    def test_is_up_to_date_materialized_table_deleted(self):
+        fingerprint = self._fingerprint()
+        self.mock_bq_client.run_query_async.return_value.result.return_value = [{
+            'dataset_id': 'view_dataset',
+            'materialized_table_id': 'child_view_materialized',
+            'fingerprint': fingerprint,
+        }]
+        ledger = ViewMaterializationLedger(self.mock_bq_client)
+
+        self.mock_bq_client.table_exists.return_value = False
+
+        self.assertFalse(ledger.is_up_to_date(self.view, fingerprint))
+
+    def test_is_up_to_date_no_fingerprint(self):
+        self.assertFalse(ViewMaterializationLedger(self.mock_bq_client).is_up_to_date(self.view, None))
+
+    def test_record(self):
+        ledger = ViewMaterializationLedger(self.mock_bq_client)
+
+        ledger.record(self.view, 'fingerprint')
+
+        self.mock_bq_client.stream_into_table.assert_called_once()
+        dataset_id, table_id, rows = self.mock_bq_client.stream_into_table.call_args[0]
+        self.assertEqual((VIEW_UPDATE_METADATA_DATASET, VIEW_MATERIALIZATION_LEDGER_TABLE), (dataset_id, table_id))
+        self.assertEqual(1, len(rows))
+        self.assertEqual('view_dataset', rows[0]['dataset_id'])
+        self.assertEqual('child_view_materialized', rows[0]['materialized_table_id'])
+        self.assertEqual('fingerprint', rows[0]['fingerprint'])
+
+    def test_record_no_fingerprint(self):
+        ViewMaterializationLedger(self.mock_bq_client).record(self.view, None)
+
+        self.mock_bq_client.stream_into_table.assert_not_called()
@@ -43,8 +43,15 @@ class ViewManagerTest(unittest.TestCase):
             'recidiviz.big_query.view_update_manager.BigQueryClientImpl')
         self.mock_client = self.client_patcher.start().return_value
 
+        self.ledger_patcher = patch(
+            'recidiviz.big_query.view_update_manager.ViewMaterializationLedger')
+        self.mock_ledger = self.ledger_patcher.start().return_value
+        self.mock_ledger.is_up_to_date.return_value = False
+
     def tearDown(self):
         self.metadata_patcher.stop()
+        self.client_patcher.stop()
+        self.ledger_patcher.stop()
 
     def test_create_dataset_and_update_views_for_view_builders(self):
         """Test that create_dataset_and_update_views_for_view_builders creates a dataset if necessary,
@@ -66,7 +73,7 @@ class ViewManagerTest(unittest.TestCase):
         self.mock_client.dataset_ref_for_id.assert_called_with(_DATASET_NAME)
         self.mock_client.create_dataset_if_necessary.assert_called_with(dataset, None)
         self.mock_client.create_or_update_view.assert_has_calls(
-            [mock.call(dataset, view_builder.build()) for view_builder in mock_view_builders])
+            [mock.call(dataset, view_builder.build()) for view_builder in mock_view_builders], any_order=True)
 
     def test_create_dataset_and_update_views_for_view_builders_materialized_views_only(self):
         """Test that create_dataset_and_update_views_for_view_builders only updates views that have a set
@@ -128,7 +135,7 @@ class ViewManagerTest(unittest.TestCase):
             dataset, view_update_manager.TEMP_DATASET_DEFAULT_TABLE_EXPIRATION_MS)
         self.mock_client.create_or_update_view.assert_has_calls(
             [mock.call(dataset, view_builder.build(dataset_overrides=dataset_overrides))
-             for view_builder in mock_view_builders])
+             for view_builder in mock_view_builders], any_order=True)
 
     def test_create_dataset_and_update_views(self):
         """Test that create_dataset_and_update_views creates a dataset if necessary, and updates all views."""
@@ -147,4 +154,105 @@ class ViewManagerTest(unittest.TestCase):
 
         self.mock_client.dataset_ref_for_id.assert_called_with(_DATASET_NAME)
         self.mock_client.create_dataset_if_necessary.assert_called_with(dataset, None)
-        self.mock_client.create_or_update_view.assert_has_calls([mock.call(dataset, view) for view in mock_views])
+        self.mock_client.create_or_update_view.assert_has_calls([mock.call(dataset, view) for view in mock_views],
+                                                                any_order=True)
+
+    def test_create_dataset_and_update_views_dependency_order(self):
+        """Test that create_dataset_and_update_views materializes a view before updating the views that read from it."""
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+
+        parent_view = BigQueryView(dataset_id=_DATASET_NAME, view_id='parent_view',
+                                   view_query_template='SELECT NULL LIMIT 0', should_materialize=True)
+        child_view = BigQueryView(dataset_id=_DATASET_NAME, view_id='child_view',
+                                  view_query_template=f'SELECT * FROM `{{project_id}}.{_DATASET_NAME}.'
+                                                      f'parent_view_materialized`')
+
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+
+        # pylint: disable=protected-access
+        view_update_manager._create_dataset_and_update_views([child_view, parent_view])
+
+        self.assertEqual([mock.call.create_or_update_view(dataset, parent_view),
+                          mock.call.materialize_view_to_table(parent_view),
+                          mock.call.create_or_update_view(dataset, child_view)],
+                         [call for call in self.mock_client.mock_calls
+                          if call[0] in ('create_or_update_view', 'materialize_view_to_table')])
+
+    def test_create_dataset_and_update_views_skips_up_to_date_materialization(self):
+        """Test that create_dataset_and_update_views does not materialize views whose inputs are unchanged since they
+        were last materialized, and records the fingerprint of views it does materialize."""
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+
+        unchanged_view = BigQueryView(dataset_id=_DATASET_NAME, view_id='unchanged_view',
+                                      view_query_template='SELECT NULL LIMIT 0', should_materialize=True)
+        changed_view = BigQueryView(dataset_id=_DATASET_NAME, view_id='changed_view',
+                                    view_query_template='SELECT NULL LIMIT 0', should_materialize=True)
+
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+        self.mock_ledger.fingerprint.side_effect = lambda view: f'{view.view_id}_fingerprint'
+        self.mock_ledger.is_up_to_date.side_effect = lambda view, _fingerprint: view.view_id == 'unchanged_view'
+
+        # pylint: disable=protected-access
+        view_update_manager._create_dataset_and_update_views([unchanged_view, changed_view])
+
+        self.mock_client.create_or_update_view.assert_has_calls([mock.call(dataset, unchanged_view),
+                                                                 mock.call(dataset, changed_view)],
+                                                                any_order=True)
+        self.mock_client.materialize_view_to_table.assert_called_once_with(changed_view)
+        self.mock_ledger.record.assert_called_once_with(changed_view, 'changed_view_fingerprint')
+
+    def test_create_dataset_and_update_views_force_materialize(self):
+        """Test that create_dataset_and_update_views materializes views with unchanged inputs when force_materialize
+        is set."""
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+
+        view = BigQueryView(dataset_id=_DATASET_NAME, view_id='unchanged_view',
+                            view_query_template='SELECT NULL LIMIT 0', should_materialize=True)
+
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+        self.mock_ledger.is_up_to_date.return_value = True
+
+        # pylint: disable=protected-access
+        view_update_manager._create_dataset_and_update_views([view], force_materialize=True)
+
+        self.mock_client.materialize_view_to_table.assert_called_once_with(view)
+
+    def test_create_dataset_and_update_views_failure_skips_descendants(self):
+        """Test that when a view fails to update, its descendants are skipped, other views are still updated, and the
+        failure is raised."""
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+
+        failing_view = BigQueryView(dataset_id=_DATASET_NAME, view_id='failing_view',
+                                    view_query_template='SELECT NULL LIMIT 0')
+        child_view = BigQueryView(dataset_id=_DATASET_NAME, view_id='child_view',
+                                  view_query_template=f'SELECT * FROM `{{project_id}}.{_DATASET_NAME}.failing_view`')
+        independent_view = BigQueryView(dataset_id=_DATASET_NAME, view_id='independent_view',
+                                        view_query_template='SELECT NULL LIMIT 0')
+
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+
+        def create_or_update_view(_dataset_ref, view):
+            if view.view_id == 'failing_view':
+                raise ValueError('Failed to update view')
+
+        self.mock_client.create_or_update_view.side_effect = create_or_update_view
+
+        with self.assertRaises(ValueError):
+            # pylint: disable=protected-access
+            view_update_manager._create_dataset_and_update_views([failing_view, child_view, independent_view])
+
+        self.mock_client.create_or_update_view.assert_has_calls([mock.call(dataset, failing_view),
+                                                                 mock.call(dataset, independent_view)],
+                                                                any_order=True)
+        self.assertNotIn(mock.call(dataset, child_view), self.mock_client.create_or_update_view.mock_calls)
+
+    def test_create_dataset_and_update_views_for_view_builders_dry_run(self):
+        """Test that create_dataset_and_update_views_for_view_builders does not update any views in a dry run."""
+        mock_view_builders = [SimpleBigQueryViewBuilder(
+            dataset_id=_DATASET_NAME, view_id='my_fake_view', view_query_template='SELECT NULL LIMIT 0')]
+
+        view_update_manager.create_dataset_and_update_views_for_view_builders(
+            BigQueryViewNamespace.VALIDATION, {_DATASET_NAME: mock_view_builders}, dry_run=True)
+
+        self.mock_client.create_dataset_if_necessary.assert_not_called()
+        self.mock_client.create_or_update_view.assert_not_called()
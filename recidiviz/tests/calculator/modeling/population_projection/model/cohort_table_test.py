@@ -49,3 +49,41 @@ class TestCohortTable(unittest.TestCase):
 
         for index, cohort_size in enumerate(cohort_size_list):
             self.assertEqual(cohort_size, cohort.get_cohort_timeline(1999).iloc[index])
+
+    def test_cohorts_must_be_appended_in_order(self):
+        """Tests that time steps and cohorts can only be appended in timeline order"""
+        cohort = CohortTable(starting_ts=2000, transition_table_max_length=1)
+        with self.assertRaises(ValueError):
+            cohort.append_ts_end_count(cohort_sizes=pd.Series({1999: 0}), projection_ts=2001)
+
+        cohort.append_ts_end_count(cohort_sizes=pd.Series({1999: 0}), projection_ts=2000)
+        with self.assertRaises(ValueError):
+            cohort.append_cohort(cohort_size=10, projection_ts=2001)
+        with self.assertRaises(ValueError):
+            cohort.append_cohort(cohort_size=10, projection_ts=1999)
+
+    def test_long_timeline(self):
+        """Tests the CohortTable keeps the full timeline when it grows past its initial capacity"""
+        start_time = 2000
+        num_ts = 3 * CohortTable.INITIAL_TS_CAPACITY
+        cohort = CohortTable(starting_ts=start_time, transition_table_max_length=2)
+        for ts in range(start_time, start_time + num_ts):
+            cohort.append_ts_end_count(cohort_sizes=cohort.get_latest_population() / 2, projection_ts=ts)
+            cohort.append_cohort(cohort_size=64, projection_ts=ts)
+
+        self.assertEqual(list(range(1998, start_time + num_ts)), list(cohort.get_latest_population().index))
+        self.assertEqual(list(range(start_time, start_time + num_ts)), list(cohort.get_per_ts_population().index))
+        self.assertEqual([64, 32, 16, 8], list(cohort.get_cohort_timeline(start_time).iloc[:4]))
+        self.assertAlmostEqual(128, cohort.get_per_ts_population().iloc[-1])
+
+    def test_cross_simulation_cohorts_round_trip(self):
+        """Tests the cohorts popped for the cross-simulation flow can be ingested back unchanged"""
+        cohort = CohortTable(starting_ts=2000, transition_table_max_length=1)
+        for ts, cohort_size in zip(range(2000, 2003), [10, 20, 30]):
+            cohort.append_ts_end_count(cohort_sizes=cohort.get_latest_population(), projection_ts=ts)
+            cohort.append_cohort(cohort_size=cohort_size, projection_ts=ts)
+        cohort_df = cohort.cohort_df
+
+        cohort.ingest_cross_simulation_cohorts(cohort.pop_cohorts())
+
+        pd.testing.assert_frame_equal(cohort_df, cohort.cohort_df)
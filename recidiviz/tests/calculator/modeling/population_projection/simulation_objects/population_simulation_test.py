@@ -15,10 +15,12 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Test the PopulationSimulation object"""
+import os
 import unittest
 from copy import deepcopy
+from functools import partial
 import pandas as pd
-from pandas.testing import assert_index_equal
+from pandas.testing import assert_frame_equal, assert_index_equal
 
 from recidiviz.calculator.modeling.population_projection.population_simulation import PopulationSimulation
 from recidiviz.calculator.modeling.population_projection.incarceration_transitions import IncarceratedTransitions
@@ -165,3 +167,98 @@ class TestPopulationSimulation(unittest.TestCase):
         )
 
         assert_index_equal(projection.index.unique().sort_values(), pd.Int64Index(range(11)))
+
+
+class TestPopulationSimulationParity(unittest.TestCase):
+    """Test the PopulationSimulation results match those of the DataFrame-based cohort engine it replaced"""
+
+    # Projections from the DataFrame-based engine for the scenarios below
+    EXPECTED_PROJECTIONS_PATH = os.path.join(os.path.dirname(__file__), 'test_configurations',
+                                             'population_simulation_parity_projections.csv')
+
+    def setUp(self):
+        self.outflows_data = pd.DataFrame({
+            'total_population': [40, 42, 45, 41, 20, 22, 25, 21, 12, 15, 14, 11, 9, 8, 10, 12],
+            'crime': ['NAR'] * 8 + ['VIO'] * 8,
+            'outflow_to': ['prison'] * 4 + ['supervision'] * 4 + ['prison'] * 4 + ['supervision'] * 4,
+            'compartment': ['pretrial'] * 4 + ['prison'] * 4 + ['pretrial'] * 4 + ['prison'] * 4,
+            'time_step': list(range(-3, 1)) * 4
+        })
+
+        self.transitions_data = pd.DataFrame({
+            'compartment_duration': [1, 2, 3, 5, 8, 14, 1, 2, 4, 2, 6, 12, 13, 3, 5, 2, 10, 15],
+            'total_population': [10, 12, 8, 6, 3, 1, 9, 4, 2, 4, 6, 5, 1, 6, 3, 3, 2, 1],
+            'crime': ['NAR'] * 9 + ['VIO'] * 9,
+            'outflow_to': ['supervision', 'supervision', 'release', 'supervision', 'release', 'release',
+                           'prison', 'release', 'death'] * 2,
+            'compartment': (['prison'] * 6 + ['supervision'] * 2 + ['release']) * 2
+        })
+
+        self.total_population_data = pd.DataFrame({
+            'total_population': [300, 310, 305, 320, 120, 118, 125, 130],
+            'compartment': ['prison'] * 8,
+            'crime': ['NAR'] * 4 + ['VIO'] * 4,
+            'time_step': list(range(-3, 1)) * 2
+        })
+
+        self.simulation_architecture = {
+            'pretrial': None, 'prison': 'incarcerated', 'supervision': 'released', 'release': 'released'
+        }
+
+        self.policy_list = [
+            SparkPolicy(partial(IncarceratedTransitions.apply_reduction, reduction_dict={'supervision': 0.3},
+                                reduction_type='*', retroactive=True),
+                        'prison', {'crime': 'NAR'}, apply_retroactive=True),
+            SparkPolicy(partial(IncarceratedTransitions.apply_reduction, reduction_dict={'release': 1},
+                                reduction_type='+', retroactive=False),
+                        'prison', {'crime': 'VIO'}, apply_retroactive=False)
+        ]
+
+        self.expected_projections = pd.read_csv(self.EXPECTED_PROJECTIONS_PATH)
+
+    def _user_inputs(self, policy_list):
+        return {
+            'projection_time_steps': 24,
+            'policy_time_step': 3,
+            'start_time_step': 0,
+            'policy_list': policy_list,
+            'constant_admissions': True,
+            'speed_run': False
+        }
+
+    def _simulate(self, population_simulation, policy_list, microsim=False):
+        projection = population_simulation.simulate_policies(
+            outflows_data=self.outflows_data,
+            transitions_data=self.transitions_data,
+            total_population_data=self.total_population_data,
+            simulation_compartments=self.simulation_architecture,
+            disaggregation_axes=['crime'],
+            user_inputs=self._user_inputs(policy_list),
+            microsim=microsim,
+            microsim_data=self.transitions_data if microsim else None
+        )
+        return projection.reset_index(drop=True)[['simulation_group', 'compartment', 'time_step', 'total_population']]
+
+    def _assert_projection_matches(self, scenario, projection):
+        expected = self.expected_projections[self.expected_projections.scenario == scenario]
+        assert_frame_equal(expected.drop('scenario', axis=1).reset_index(drop=True), projection, check_dtype=False)
+
+    def test_baseline_matches_dataframe_engine(self):
+        self._assert_projection_matches('baseline', self._simulate(PopulationSimulation(), []))
+
+    def test_policy_matches_dataframe_engine(self):
+        self._assert_projection_matches('policy', self._simulate(PopulationSimulation(), self.policy_list))
+
+    def test_microsim_matches_dataframe_engine(self):
+        self._assert_projection_matches('microsim', self._simulate(PopulationSimulation(), [], microsim=True))
+
+    def test_cross_simulation_flow(self):
+        """Assert that passing the cohorts between sub-simulations each time step does not change the results"""
+
+        class CrossFlowPopulationSimulation(PopulationSimulation):
+            @staticmethod
+            def update_cohort_attributes(cross_simulation_flows):
+                return cross_simulation_flows
+
+        self._assert_projection_matches('policy',
+                                        self._simulate(CrossFlowPopulationSimulation(), self.policy_list))
@@ -29,15 +29,19 @@ QueryStr = str
 DataTablesDict = Dict[str, List[NormalizedDatabaseDict]]
 DataDictQueryFn = Callable[[DatasetStr, QueryStr, DataTablesDict, str], List[NormalizedDatabaseDict]]
 
+# Matches either SELECT * or a SELECT of a list of columns
+SELECTED_COLUMNS_PATTERN = r'(?:\*|[a-z_\d]+(?:, [a-z_\d]+)*)'
+
 ENTITY_TABLE_QUERY_REGEX = re.compile(
-    r'SELECT \* FROM `([a-z\d\-.]+)\.([a-z_]+)`'
+    r'SELECT (' + SELECTED_COLUMNS_PATTERN + r') FROM `([a-z\d\-.]+)\.([a-z_]+)`'
     r'( WHERE ([a-z_]+) IN \(([\'\w\d ,]+)\))?'
 )
 
 ASSOCIATION_TABLE_QUERY_REGEX = re.compile(
     r'SELECT ([a-z_]+\.[a-z_]+), ([a-z_]+\.[a-z_]+) '
     r'FROM `([a-z\d\-.]+)\.([a-z_]+)` ([a-z_]+) '
-    r'JOIN \(SELECT \* FROM `([a-z\d\-.]+)\.([a-z_]+)`( WHERE ([a-z_]+) IN \(([\d ,]+)\))?\) ([a-z_]+) '
+    r'JOIN \(SELECT ' + SELECTED_COLUMNS_PATTERN + r' FROM `([a-z\d\-.]+)\.([a-z_]+)`'
+    r'( WHERE ([a-z_]+) IN \(([\d ,]+)\))?\) ([a-z_]+) '
     r'ON ([a-z_]+\.[a-z_]+) = ([a-z_]+\.[a-z_]+)'
 )
 
@@ -109,17 +113,36 @@ class FakeReadFromBigQueryFactory:
         if not match:
             raise ValueError(f'Query does not match regex: {query}')
 
-        dataset = match.group(1)
+        selected_columns = match.group(1)
+        dataset = match.group(2)
 
         if dataset != expected_dataset:
             raise ValueError(f'Found dataset {dataset} does not match expected dataset {expected_dataset}')
 
-        table_name = match.group(2)
+        table_name = match.group(3)
         if table_name not in data_dict:
             raise ValueError(f'Table {table_name} not in data dict')
 
-        filter_field = match.group(4)
-        filter_field_list_str = match.group(5)
+        results = FakeReadFromBigQueryFactory._do_fake_entity_table_filter(data_dict, table_name, match,
+                                                                           unifying_id_field)
+        if selected_columns == '*':
+            return results
+
+        columns = selected_columns.split(', ')
+        for column in columns:
+            check_field_exists_in_table(table_name, column)
+        return [{column: row[column] for column in columns if column in row} for row in results]
+
+    @staticmethod
+    def _do_fake_entity_table_filter(data_dict: DataTablesDict,
+                                     table_name: str,
+                                     match: re.Match,
+                                     unifying_id_field: str) -> List[NormalizedDatabaseDict]:
+        """Returns the rows of the given table that pass the WHERE clause captured by the given entity table query
+        match, if it has one.
+        """
+        filter_field = match.group(5)
+        filter_field_list_str = match.group(6)
         if filter_field and filter_field_list_str:
             if filter_field == 'state_code':
                 filter_field_list_value = filter_field_list_str.replace("\'", "")
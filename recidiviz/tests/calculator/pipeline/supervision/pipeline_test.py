@@ -50,7 +50,7 @@ from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import \
 from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple
 from recidiviz.calculator.pipeline.utils.entity_hydration_utils import ConvertSentencesToStateSpecificType
 from recidiviz.calculator.pipeline.utils.metric_utils import \
-    MetricMethodologyType
+    MetricMethodologyType, encode_metric_key
 from recidiviz.calculator.pipeline.utils import extractor_utils
 from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata, BuildPersonMetadata, \
     ExtractPersonEventsMetadata
@@ -2826,12 +2826,13 @@ class TestProduceSupervisionMetrics(unittest.TestCase):
         all_pipeline_options['job_timestamp'] = job_timestamp
 
         for metric_value, metric_type in metric_value_to_metric_type.items():
-            metric_key_dict['metric_type'] = metric_value
+            encoded_metric_key = encode_metric_key(metric_type, metric_key_dict)
 
             test_pipeline = TestPipeline()
 
             output = (test_pipeline
-                      | f"Create PCollection for {metric_value}" >> beam.Create([(metric_key_dict, value)])
+                      | f"Create PCollection for {metric_value}" >>
+                      beam.Create([((metric_value, encoded_metric_key), value)])
                       | f"Produce {metric_type}" >>
                       beam.ParDo(pipeline.ProduceSupervisionMetrics(), **all_pipeline_options))
 
@@ -2852,10 +2853,12 @@ class TestProduceSupervisionMetrics(unittest.TestCase):
         job_timestamp = datetime.datetime.now().strftime('%Y-%m-%d_%H_%M_%S.%f')
         all_pipeline_options['job_timestamp'] = job_timestamp
 
+        encoded_metric_key = encode_metric_key(SupervisionPopulationMetric, metric_key_dict)
+
         # This should never happen, and we want the pipeline to fail loudly if it does.
         with pytest.raises(ValueError):
             _ = (test_pipeline
-                 | beam.Create([(metric_key_dict, value)])
+                 | beam.Create([((SupervisionMetricType.SUPERVISION_POPULATION, encoded_metric_key), value)])
                  | 'Produce Supervision Metric' >>
                  beam.ParDo(pipeline.ProduceSupervisionMetrics(),
                             **all_pipeline_options)
@@ -2958,9 +2961,7 @@ class AssertMatchers:
                 actual_combination_counts[key] = 0
 
             for result in output:
-                combination_dict, _ = result
-
-                metric_type = combination_dict.get('metric_type')
+                (metric_type, _), _ = result
 
                 actual_combination_counts[metric_type.value] = actual_combination_counts[metric_type.value] + 1
 
@@ -19,12 +19,25 @@ import unittest
 from datetime import date
 from datetime import datetime
 
+import attr
 import pytest
-
+from mock import patch
+
+from recidiviz.calculator.pipeline.incarceration.incarceration_event import IncarcerationAdmissionEvent, \
+    IncarcerationReleaseEvent
+from recidiviz.calculator.pipeline.incarceration.metrics import IncarcerationAdmissionMetric, \
+    IncarcerationReleaseMetric
+from recidiviz.calculator.pipeline.program.metrics import ProgramParticipationMetric, ProgramReferralMetric
+from recidiviz.calculator.pipeline.program.program_event import ProgramParticipationEvent, ProgramReferralEvent
 from recidiviz.calculator.pipeline.utils import calculator_utils
 from recidiviz.calculator.pipeline.utils.calculator_utils import person_characteristics
+from recidiviz.calculator.pipeline.utils.metric_utils import PersonLevelMetric, RecidivizMetric
 from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata
 from recidiviz.common.constants.person_characteristics import Gender
+from recidiviz.common.constants.state.state_assessment import StateAssessmentType
+from recidiviz.common.constants.state.state_incarceration_period import StateIncarcerationPeriodAdmissionReason, \
+    StateIncarcerationPeriodReleaseReason
+from recidiviz.common.constants.state.state_supervision import StateSupervisionType
 from recidiviz.common.constants.state.state_supervision_violation_response import \
     StateSupervisionViolationResponseDecision
 from recidiviz.persistence.entity.state.entities import StatePerson, \
@@ -626,3 +639,125 @@ class TestGetCalculationMonthUpperBoundDate(unittest.TestCase):
             _ = calculator_utils.get_calculation_month_upper_bound_date(value)
 
         assert "Invalid value for calculation_end_month" in str(e.value)
+
+
+class TestCharacteristicsDictBuilder(unittest.TestCase):
+    """Tests the characteristics_dict_builder function used by all pipelines."""
+
+    def setUp(self) -> None:
+        self.person = StatePerson.new_with_defaults(
+            state_code='US_XX',
+            person_id=12345,
+            birthdate=date(1984, 8, 31),
+            gender=Gender.FEMALE)
+        self.person_metadata = PersonMetadata(prioritized_race_or_ethnicity='ASIAN')
+        self.event = ProgramReferralEvent(
+            state_code='US_XX',
+            event_date=date(2010, 9, 1),
+            program_id='PROGRAM_ID',
+            supervision_type=StateSupervisionType.PAROLE,
+            assessment_score=10,
+            assessment_type=StateAssessmentType.LSIR)
+
+    def _build_characteristics(self, event, metric_class):
+        return calculator_utils.characteristics_dict_builder(pipeline='program',
+                                                             event=event,
+                                                             metric_class=metric_class,
+                                                             person=self.person,
+                                                             event_date=event.event_date,
+                                                             include_person_attributes=True,
+                                                             person_metadata=self.person_metadata)
+
+    def test_characteristics_dict_builder(self):
+        characteristics = self._build_characteristics(self.event, ProgramReferralMetric)
+
+        expected_output = {
+            'person_id': self.person.person_id,
+            'age_bucket': '25-29',
+            'prioritized_race_or_ethnicity': 'ASIAN',
+            'gender': Gender.FEMALE,
+            'program_id': 'PROGRAM_ID',
+            'supervision_type': StateSupervisionType.PAROLE,
+            'assessment_score_bucket': '0-23',
+            'assessment_type': StateAssessmentType.LSIR,
+        }
+
+        self.assertEqual(expected_output, characteristics)
+
+    def test_characteristics_dict_builder_missing_event_field(self):
+        with pytest.raises(ValueError) as e:
+            _ = self._build_characteristics(self.event, ProgramParticipationMetric)
+
+        assert "Did not find expected field [date_of_participation]" in str(e.value)
+
+    def test_characteristics_dict_builder_reflects_once_per_class_pair(self):
+        """Guards against reintroducing per-call reflection on the metric and event classes by counting the
+        attr.fields_dict calls made while building many dicts for the same event and metric classes."""
+        calculator_utils._get_characteristics_plan.cache_clear()  # pylint: disable=protected-access
+
+        with patch.object(attr, 'fields_dict', wraps=attr.fields_dict) as mock_fields_dict:
+            for _ in range(100):
+                self._build_characteristics(self.event, ProgramReferralMetric)
+
+        # Once for the metric class and once for the event class, when the plan for the pair is first built
+        self.assertEqual(2, mock_fields_dict.call_count)
+
+    def test_characteristics_dict_builder_matches_reflection(self):
+        events_and_metric_classes = [
+            (self.event, ProgramReferralMetric),
+            (ProgramReferralEvent(state_code='US_XX', event_date=date(2010, 9, 1), program_id='PROGRAM_ID'),
+             ProgramReferralMetric),
+            (ProgramParticipationEvent(state_code='US_XX', event_date=date(2010, 9, 1), program_id='PROGRAM_ID',
+                                       program_location_id='LOCATION', is_first_day_in_program=True),
+             ProgramParticipationMetric),
+            (IncarcerationAdmissionEvent(state_code='US_XX', event_date=date(2010, 9, 1), facility='FACILITY',
+                                         admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION),
+             IncarcerationAdmissionMetric),
+            (IncarcerationReleaseEvent(state_code='US_XX', event_date=date(2010, 9, 1), county_of_residence='COUNTY',
+                                       release_reason=StateIncarcerationPeriodReleaseReason.SENTENCE_SERVED,
+                                       total_days_incarcerated=100),
+             IncarcerationReleaseMetric),
+        ]
+
+        for event, metric_class in events_and_metric_classes:
+            for include_person_attributes in (True, False):
+                characteristics = calculator_utils.characteristics_dict_builder(
+                    pipeline='program',
+                    event=event,
+                    metric_class=metric_class,
+                    person=self.person,
+                    event_date=event.event_date,
+                    include_person_attributes=include_person_attributes,
+                    person_metadata=self.person_metadata)
+
+                self.assertEqual(
+                    self._build_characteristics_with_reflection(event, metric_class, include_person_attributes),
+                    characteristics)
+
+    def _build_characteristics_with_reflection(self, event, metric_class, include_person_attributes):
+        """Builds the characteristics dict by reflecting on the metric and event on every call, the way
+        characteristics_dict_builder did before it cached the attributes to copy for each event and metric class."""
+        characteristics = {}
+        metric_attributes = attr.fields_dict(metric_class).keys()
+
+        if include_person_attributes:
+            person_attributes = person_characteristics(self.person, event.event_date, self.person_metadata, 'program')
+            for attribute, value in person_attributes.items():
+                if attribute in metric_attributes:
+                    characteristics[attribute] = value
+
+        fields_not_in_events = [*attr.fields_dict(RecidivizMetric).keys(),
+                                *attr.fields_dict(PersonLevelMetric).keys(),
+                                'year', 'month', 'follow_up_period', 'metric_period_months', 'violation_count_type',
+                                'count', 'total_releases', 'recidivated_releases', 'returns', 'recidivism_rate',
+                                'successful_completion_count', 'projected_completion_count', 'average_days_served']
+
+        for metric_attribute in metric_attributes:
+            if hasattr(event, metric_attribute) and metric_attribute not in fields_not_in_events:
+                attribute_value = getattr(event, metric_attribute)
+                if attribute_value is not None:
+                    characteristics[metric_attribute] = attribute_value
+            elif metric_attribute not in fields_not_in_events:
+                raise ValueError(f'Did not find expected field [{metric_attribute}] in {event.__class__}.')
+
+        return characteristics
@@ -0,0 +1,102 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for date_range_index.py."""
+import unittest
+from datetime import date, timedelta
+
+from recidiviz.calculator.pipeline.utils.date_range_index import DateRangeIndex
+from recidiviz.common.date import DateRange, DateRangeDiff
+from recidiviz.persistence.entity.state.entities import StateSupervisionPeriod
+
+
+class TestDateRangeIndex(unittest.TestCase):
+    """Tests the DateRangeIndex class."""
+
+    def setUp(self) -> None:
+        self.long_period = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            start_date=date(2000, 1, 1),
+            termination_date=date(2010, 1, 1))
+        self.nested_period = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=222,
+            start_date=date(2002, 3, 1),
+            termination_date=date(2002, 4, 1))
+        self.adjacent_period = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=333,
+            start_date=date(2010, 1, 1),
+            termination_date=date(2011, 6, 15))
+        self.separate_period = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=444,
+            start_date=date(2015, 5, 5),
+            termination_date=date(2016, 5, 5))
+        self.empty_period = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=555,
+            start_date=date(2013, 1, 1),
+            termination_date=date(2013, 1, 1))
+
+        self.periods = [self.separate_period, self.adjacent_period, self.empty_period, self.nested_period,
+                        self.long_period]
+        self.index = DateRangeIndex(self.periods)
+
+    def test_periods_overlapping_range(self):
+        self.assertEqual([self.long_period, self.nested_period],
+                         self.index.periods_overlapping_range(DateRange(date(2002, 2, 1), date(2002, 3, 2))))
+        self.assertEqual([self.long_period, self.adjacent_period],
+                         self.index.periods_overlapping_range(DateRange(date(2009, 12, 31), date(2010, 1, 2))))
+        self.assertEqual([self.adjacent_period],
+                         self.index.periods_overlapping_range(DateRange(date(2010, 1, 1), date(2010, 1, 2))))
+        self.assertEqual([], self.index.periods_overlapping_range(DateRange(date(2012, 1, 1), date(2015, 5, 5))))
+        self.assertEqual([], self.index.periods_overlapping_range(DateRange(date(2002, 3, 1), date(2002, 3, 1))))
+
+    def test_periods_overlapping_date(self):
+        self.assertEqual([self.long_period], self.index.periods_overlapping_date(date(2002, 4, 1)))
+        self.assertEqual([self.separate_period], self.index.periods_overlapping_date(date(2016, 5, 4)))
+        self.assertEqual([], self.index.periods_overlapping_date(date(2016, 5, 5)))
+        self.assertEqual([], self.index.periods_overlapping_date(date(2013, 1, 1)))
+
+    def test_periods_overlapping_range_matches_scan(self):
+        range_start = date(1999, 12, 1)
+        for offset_days in range(0, 365 * 18, 17):
+            lower_bound = range_start + timedelta(days=offset_days)
+            for length_days in (1, 30, 400):
+                date_range = DateRange(lower_bound, lower_bound + timedelta(days=length_days))
+
+                expected = [period for period in self.periods
+                            if DateRangeDiff(period.duration, date_range).overlapping_range]
+
+                self.assertCountEqual(expected, self.index.periods_overlapping_range(date_range))
+
+    def test_is_range_fully_covered(self):
+        self.assertTrue(self.index.is_range_fully_covered(DateRange(date(2000, 1, 1), date(2011, 6, 15))))
+        self.assertTrue(self.index.is_range_fully_covered(DateRange(date(2015, 5, 5), date(2015, 5, 6))))
+        self.assertFalse(self.index.is_range_fully_covered(DateRange(date(1999, 12, 31), date(2000, 1, 2))))
+        self.assertFalse(self.index.is_range_fully_covered(DateRange(date(2011, 6, 1), date(2011, 6, 16))))
+        self.assertFalse(self.index.is_range_fully_covered(DateRange(date(2011, 6, 1), date(2015, 6, 1))))
+        self.assertFalse(self.index.is_range_fully_covered(DateRange(date(2013, 1, 1), date(2013, 1, 2))))
+        self.assertFalse(self.index.is_range_fully_covered(DateRange(date(2005, 1, 1), date(2005, 1, 1))))
+
+    def test_covered_ranges(self):
+        self.assertEqual([DateRange(date(2000, 1, 1), date(2011, 6, 15)),
+                          DateRange(date(2015, 5, 5), date(2016, 5, 5))],
+                         self.index.covered_ranges)
+
+    def test_no_periods(self):
+        index: DateRangeIndex[StateSupervisionPeriod] = DateRangeIndex([])
+
+        self.assertEqual([], index.periods_overlapping_range(DateRange(date(2000, 1, 1), date(2020, 1, 1))))
+        self.assertFalse(index.is_range_fully_covered(DateRange(date(2000, 1, 1), date(2000, 1, 2))))
+        self.assertEqual([], index.covered_ranges)
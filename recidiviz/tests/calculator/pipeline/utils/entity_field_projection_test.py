@@ -0,0 +1,60 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for utils/entity_field_projection.py."""
+import unittest
+
+from recidiviz.calculator.pipeline.utils.entity_field_projection import EntityFieldProjection
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.entity.state import entities
+
+
+class TestEntityFieldProjection(unittest.TestCase):
+    """Tests for the entity_field_projection module."""
+
+    def test_columns_for_entity(self):
+        projection = EntityFieldProjection({entities.StateIncarcerationPeriod: {'admission_date'}})
+
+        columns = projection.columns_for_entity(entities.StateIncarcerationPeriod,
+                                                schema.StateIncarcerationPeriod,
+                                                ['incarceration_period_id', 'person_id', 'state_code', 'not_a_column'])
+
+        self.assertEqual(['admission_date', 'incarceration_period_id', 'person_id', 'state_code'], columns)
+
+    def test_columns_for_entity_not_projected(self):
+        projection = EntityFieldProjection({entities.StateIncarcerationPeriod: {'admission_date'}})
+
+        columns = projection.columns_for_entity(entities.StateSupervisionPeriod,
+                                                schema.StateSupervisionPeriod,
+                                                ['supervision_period_id', 'person_id', 'state_code'])
+
+        self.assertIsNone(columns)
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            EntityFieldProjection({entities.StateIncarcerationPeriod: {'admission_date', 'not_a_field'}})
+
+    def test_unselected_required_fields(self):
+        unselected_fields = EntityFieldProjection.unselected_required_fields(
+            entities.StateIncarcerationPeriod, ['admission_date', 'incarceration_period_id', 'state_code'])
+
+        self.assertIn('release_date', unselected_fields)
+        self.assertIn('status', unselected_fields)
+        self.assertNotIn('admission_date', unselected_fields)
+        self.assertNotIn('state_code', unselected_fields)
+        # Fields with defaults are set to their default when building the entity
+        self.assertNotIn('incarceration_period_id', unselected_fields)
+        self.assertNotIn('incarceration_sentences', unselected_fields)
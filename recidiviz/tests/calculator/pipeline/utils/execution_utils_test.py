@@ -289,3 +289,14 @@ class TestSelectAllQuery(unittest.TestCase):
                                                           state_code_filter='US_XX',
                                                           unifying_id_field='field_name',
                                                           unifying_id_field_filter_set={1234, 56}))
+
+    def test_select_columns_with_state_code_filter(self):
+        expected_query = \
+            'SELECT person_id, state_code FROM `project-id.my_dataset.TABLE_WHERE_DATA_IS` ' \
+            'WHERE state_code IN (\'US_XX\')'
+
+        self.assertEqual(expected_query, select_all_query(self.dataset, self.table_id,
+                                                          state_code_filter='US_XX',
+                                                          unifying_id_field='person_id',
+                                                          unifying_id_field_filter_set=None,
+                                                          columns=['person_id', 'state_code']))
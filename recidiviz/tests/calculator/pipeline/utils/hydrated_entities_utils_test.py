@@ -0,0 +1,178 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for utils/hydrated_entities_utils.py."""
+import datetime
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, Type
+
+import apache_beam as beam
+from apache_beam.testing.test_pipeline import TestPipeline
+from apache_beam.testing.util import assert_that, equal_to
+
+from recidiviz.calculator.pipeline.utils import hydrated_entities_utils
+from recidiviz.calculator.pipeline.utils.hydrated_entities_utils import ReadHydratedEntities, RootEntityLoader, \
+    build_person_graph, copy_as_root_entity, hydrated_schema_classes
+from recidiviz.common.constants.state.state_assessment import StateAssessmentType
+from recidiviz.persistence.database import schema_utils
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.entity import entity_utils
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.persistence.entity.state import entities
+
+
+def _row(entity_class: Type[Entity], **values: Any) -> Dict[str, Any]:
+    """Returns a table row for the given entity class, with every column not in |values| set to None."""
+    schema_class = schema_utils.get_state_database_entity_with_name(entity_class.__name__)
+    row: Dict[str, Any] = dict.fromkeys(schema_class.get_column_property_names())
+    row.update(values)
+    return row
+
+
+class TestHydratedEntitiesUtils(unittest.TestCase):
+    """Tests for the hydrated_entities_utils module."""
+
+    def setUp(self) -> None:
+        # Load the SQLAlchemy relationship properties before they are inspected
+        _ = schema.StatePerson()
+
+        self.output_dir = tempfile.mkdtemp()
+        self.path_prefix = os.path.join(self.output_dir, 'hydrated_entities')
+
+        schema_classes = hydrated_schema_classes()
+        self.entity_classes_by_table = {
+            schema_class.__tablename__: entity_utils.get_entity_class_in_module_with_name(entities,
+                                                                                          schema_class.__name__)
+            for schema_class in schema_classes
+        }
+        self.edges = hydrated_entities_utils._get_forward_edges(schema_classes)  # pylint: disable=protected-access
+
+    def _write_hydrated_entities(self, person_graphs) -> None:
+        test_pipeline = TestPipeline()
+        _ = (test_pipeline
+             | beam.Create(person_graphs)
+             | beam.io.WriteToTFRecord(self.path_prefix,
+                                       coder=beam.coders.PickleCoder(),
+                                       file_name_suffix=hydrated_entities_utils.HYDRATED_ENTITIES_FILE_SUFFIX))
+        test_pipeline.run()
+
+    def _build_person_graph(self):
+        return build_person_graph({
+            'state_person': [_row(entities.StatePerson, person_id=1, state_code='US_XX')],
+            'state_sentence_group': [_row(entities.StateSentenceGroup, sentence_group_id=2, person_id=1,
+                                          state_code='US_XX', status='SERVING')],
+            'state_supervision_sentence': [_row(entities.StateSupervisionSentence, supervision_sentence_id=3,
+                                                sentence_group_id=2, person_id=1, state_code='US_XX',
+                                                status='SERVING')],
+            'state_supervision_period': [_row(entities.StateSupervisionPeriod, supervision_period_id=4, person_id=1,
+                                              state_code='US_XX', status='UNDER_SUPERVISION')],
+            'state_supervision_sentence_supervision_period_association': [
+                {'supervision_sentence_id': 3, 'supervision_period_id': 4, 'person_id': 1}],
+            'state_supervision_case_type_entry': [_row(entities.StateSupervisionCaseTypeEntry,
+                                                       supervision_case_type_entry_id=5, supervision_period_id=4,
+                                                       person_id=1, state_code='US_XX')],
+            'state_incarceration_period': [_row(entities.StateIncarcerationPeriod, incarceration_period_id=6,
+                                                person_id=1, state_code='US_XX', status='IN_CUSTODY',
+                                                source_supervision_violation_response_id=7)],
+            'state_supervision_violation_response': [_row(entities.StateSupervisionViolationResponse,
+                                                          supervision_violation_response_id=7, person_id=1,
+                                                          state_code='US_XX')],
+        }, self.entity_classes_by_table, self.edges)
+
+    def test_build_person_graph(self):
+        person_graph = self._build_person_graph()
+
+        person = person_graph['state_person'][0]
+        supervision_sentence = person.sentence_groups[0].supervision_sentences[0]
+        supervision_period = supervision_sentence.supervision_periods[0]
+
+        self.assertEqual(4, supervision_period.supervision_period_id)
+        self.assertEqual([supervision_period], person_graph['state_supervision_period'])
+        self.assertEqual(5, supervision_period.case_type_entries[0].supervision_case_type_entry_id)
+
+        # Entities that are not reachable from the person are still part of the graph
+        incarceration_period = person_graph['state_incarceration_period'][0]
+        self.assertEqual(7,
+                         incarceration_period.source_supervision_violation_response.supervision_violation_response_id)
+
+    def test_copy_as_root_entity(self):
+        person_graph = self._build_person_graph()
+        supervision_sentence = person_graph['state_supervision_sentence'][0]
+
+        root_entity = copy_as_root_entity(supervision_sentence, build_related_entities=True)
+
+        self.assertEqual(1, len(root_entity.supervision_periods))
+        self.assertEqual([], root_entity.supervision_periods[0].case_type_entries)
+        self.assertEqual(1, len(supervision_sentence.supervision_periods[0].case_type_entries))
+
+        root_entity = copy_as_root_entity(supervision_sentence, build_related_entities=False)
+
+        self.assertEqual(3, root_entity.supervision_sentence_id)
+        self.assertEqual([], root_entity.supervision_periods)
+        self.assertEqual(1, len(supervision_sentence.supervision_periods))
+
+    def test_root_entity_loader_loads_from_hydrated_entities(self):
+        self._write_hydrated_entities([(1, self._build_person_graph())])
+
+        test_pipeline = TestPipeline()
+        root_entity_loader = RootEntityLoader(pipeline=test_pipeline,
+                                              dataset='project.dataset',
+                                              hydrated_entities_input=self.path_prefix)
+
+        supervision_periods = root_entity_loader.load('Load SupervisionPeriods', entities.StateSupervisionPeriod,
+                                                      build_related_entities=True)
+        supervision_period_ids = (supervision_periods
+                                  | 'Get supervision period ids' >>
+                                  beam.Map(lambda element: (element[0], element[1].supervision_period_id)))
+        case_type_entry_counts = (supervision_periods
+                                  | 'Count case type entries' >>
+                                  beam.Map(lambda element: len(element[1].case_type_entries)))
+
+        assert_that(supervision_period_ids, equal_to([(1, 4)]), label='Assert supervision periods')
+        assert_that(case_type_entry_counts, equal_to([1]), label='Assert case type entries')
+
+        test_pipeline.run()
+
+    def test_read_hydrated_entities_person_filter(self):
+        assessment = entities.StateAssessment.new_with_defaults(
+            assessment_id=3, state_code='US_XX', assessment_type=StateAssessmentType.LSIR,
+            assessment_date=datetime.date(2020, 1, 1))
+
+        self._write_hydrated_entities([
+            (1, {'state_assessment': [assessment]}),
+            (2, {'state_person': [entities.StatePerson.new_with_defaults(person_id=2, state_code='US_XX')]}),
+        ])
+
+        test_pipeline = TestPipeline()
+        hydrated_persons = (test_pipeline | ReadHydratedEntities(input_path_prefix=self.path_prefix,
+                                                                 unifying_id_field_filter_set={1}))
+
+        assert_that(hydrated_persons, equal_to([(1, {'state_assessment': [assessment]})]))
+
+        test_pipeline.run()
+
+    def test_root_entity_loader_unsupported_root_entity(self):
+        self._write_hydrated_entities([(1, self._build_person_graph())])
+
+        test_pipeline = TestPipeline()
+        root_entity_loader = RootEntityLoader(pipeline=test_pipeline,
+                                              dataset='project.dataset',
+                                              hydrated_entities_input=self.path_prefix)
+
+        with self.assertRaises(ValueError):
+            root_entity_loader.load('Load Agents', entities.StateAgent, build_related_entities=False)
@@ -836,3 +836,36 @@ class TestIsFullyIncarceratedForRange(unittest.TestCase):
             range_end_num_days_from_periods_end=5,
             is_fully_incarcerated=False
         )
+
+
+class TestIncarcerationAdmissionsBetweenDates(unittest.TestCase):
+    """Tests the incarceration_admissions_between_dates function."""
+    def test_incarceration_admissions_between_dates(self):
+        incarceration_period_1 = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=111,
+                external_id='ip1',
+                state_code='US_XX',
+                admission_date=date(2018, 6, 8),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2018, 12, 21),
+                release_reason=ReleaseReason.SENTENCE_SERVED
+            )
+
+        incarceration_period_2 = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=222,
+                external_id='ip2',
+                state_code='US_XX',
+                admission_date=date(2019, 3, 1),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2019, 4, 1),
+                release_reason=ReleaseReason.SENTENCE_SERVED
+            )
+
+        index = IncarcerationPeriodIndex([incarceration_period_2, incarceration_period_1])
+
+        self.assertTrue(index.incarceration_admissions_between_dates(date(2018, 6, 8), date(2018, 6, 9)))
+        self.assertTrue(index.incarceration_admissions_between_dates(date(2018, 7, 1), date(2020, 1, 1)))
+        self.assertFalse(index.incarceration_admissions_between_dates(date(2018, 6, 9), date(2019, 3, 1)))
+        self.assertFalse(index.incarceration_admissions_between_dates(date(2019, 3, 2), date(2020, 1, 1)))
@@ -32,7 +32,7 @@ from recidiviz.calculator.pipeline.supervision.metrics import SupervisionMetricT
     SupervisionRevocationAnalysisMetric, SupervisionRevocationViolationTypeAnalysisMetric, SupervisionSuccessMetric, \
     SuccessfulSupervisionSentenceDaysServedMetric, SupervisionCaseComplianceMetric
 from recidiviz.calculator.pipeline.utils.metric_utils import MetricMethodologyType, json_serializable_metric_key, \
-    RecidivizMetric
+    RecidivizMetric, encode_metric_key, decode_metric_key
 from recidiviz.common.constants.person_characteristics import Gender, Race, Ethnicity
 
 
@@ -126,6 +126,36 @@ class TestJsonSerializableMetricKey(unittest.TestCase):
             self.assertEqual(e, "Unexpected list in metric_key for key: invalid_list_key")
 
 
+class TestEncodeMetricKey(unittest.TestCase):
+    """Tests the encode_metric_key and decode_metric_key functions."""
+
+    def test_encode_decode_metric_key(self):
+        metric_key = {'gender': Gender.MALE,
+                      'race': [Race.BLACK],
+                      'methodology': MetricMethodologyType.PERSON,
+                      'year': 1999,
+                      'month': 3,
+                      'state_code': 'CA',
+                      'person_id': 12345}
+
+        encoded_metric_key = encode_metric_key(SupervisionPopulationMetric, metric_key)
+
+        self.assertEqual(hash(encoded_metric_key), hash(encode_metric_key(SupervisionPopulationMetric, metric_key)))
+        self.assertEqual(metric_key, decode_metric_key(SupervisionPopulationMetric, encoded_metric_key))
+
+    def test_encode_metric_key_drops_non_fields(self):
+        metric_key = {'state_code': 'CA',
+                      'year': 1999,
+                      'metric_type': SupervisionMetricType.SUPERVISION_POPULATION,
+                      'not_a_field': 'value',
+                      'supervision_type': None}
+
+        encoded_metric_key = encode_metric_key(SupervisionPopulationMetric, metric_key)
+
+        self.assertEqual({'state_code': 'CA', 'year': 1999},
+                         decode_metric_key(SupervisionPopulationMetric, encoded_metric_key))
+
+
 class TestBQSchemaForMetricTable(unittest.TestCase):
     """Tests the bq_schema_for_metric_table function."""
     def test_bq_schema_for_metric_table(self):
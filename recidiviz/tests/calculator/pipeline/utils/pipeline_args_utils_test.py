@@ -29,7 +29,8 @@ class TestPipelineArgsUtils(unittest.TestCase):
         Namespace(calculation_month_count=1, calculation_end_month=None,
                   data_input='state', output='dataflow_metrics', metric_types={'ALL'},
                   person_filter_ids=None, reference_view_input='reference_views',
-                  static_reference_input='static_reference_tables', state_code=None)
+                  static_reference_input='static_reference_tables', state_code=None,
+                  hydrated_entities_input=None)
 
     DEFAULT_APACHE_BEAM_OPTIONS_DICT = {
         'runner': 'DataflowRunner',
@@ -105,7 +106,8 @@ class TestPipelineArgsUtils(unittest.TestCase):
             Namespace(calculation_month_count=6, calculation_end_month='2009-07',
                       data_input='county', output='dataflow_metrics_2', metric_types={'ALL'},
                       person_filter_ids=None, reference_view_input='reference_views_2',
-                      static_reference_input='static_reference_2', state_code=None)
+                      static_reference_input='static_reference_2', state_code=None,
+                      hydrated_entities_input=None)
 
         self.assertEqual(incarceration_pipeline_args, expected_incarceration_pipeline_args)
 
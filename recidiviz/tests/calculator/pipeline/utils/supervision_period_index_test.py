@@ -22,6 +22,7 @@ from datetime import date
 from recidiviz.calculator.pipeline.utils.supervision_period_index import SupervisionPeriodIndex
 from recidiviz.common.constants.state.state_supervision_period import StateSupervisionPeriodAdmissionReason, \
     StateSupervisionPeriodTerminationReason, StateSupervisionPeriodSupervisionType
+from recidiviz.common.date import DateRange
 from recidiviz.persistence.entity.state.entities import StateSupervisionPeriod
 
 
@@ -516,3 +517,69 @@ class TestSupervisionPeriodsByTerminationMonth(unittest.TestCase):
         }
 
         self.assertEqual(expected_output, supervision_period_index.supervision_periods_by_termination_month)
+
+
+class TestSupervisionPeriodsOverlappingRange(unittest.TestCase):
+    """Tests the supervision_periods_overlapping_range function."""
+    def test_supervision_periods_overlapping_range(self):
+        supervision_period_1 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            start_date=date(2000, 1, 1),
+            termination_date=date(2000, 10, 1),
+            admission_reason=StateSupervisionPeriodAdmissionReason.COURT_SENTENCE
+        )
+
+        supervision_period_2 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=222,
+            start_date=date(2000, 10, 1),
+            admission_reason=StateSupervisionPeriodAdmissionReason.TRANSFER_WITHIN_STATE
+        )
+
+        supervision_period_index = SupervisionPeriodIndex(supervision_periods=[supervision_period_2,
+                                                                               supervision_period_1])
+
+        self.assertEqual([supervision_period_1, supervision_period_2],
+                         supervision_period_index.supervision_periods_overlapping_range(
+                             DateRange(date(2000, 9, 30), date(2000, 10, 2))))
+        self.assertEqual([supervision_period_2],
+                         supervision_period_index.supervision_periods_overlapping_range(
+                             DateRange(date(2019, 1, 1), date(2019, 2, 1))))
+        self.assertEqual([],
+                         supervision_period_index.supervision_periods_overlapping_range(
+                             DateRange(date(1999, 1, 1), date(2000, 1, 1))))
+
+    def test_supervision_periods_overlapping_or_terminated_in_range(self):
+        supervision_period_1 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            start_date=date(2000, 1, 1),
+            termination_date=date(2000, 10, 1),
+            admission_reason=StateSupervisionPeriodAdmissionReason.COURT_SENTENCE
+        )
+
+        # Starts and terminates on the same day, so its duration does not overlap any range
+        supervision_period_2 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=222,
+            start_date=date(2000, 12, 1),
+            termination_date=date(2000, 12, 1),
+            admission_reason=StateSupervisionPeriodAdmissionReason.TRANSFER_WITHIN_STATE
+        )
+
+        supervision_period_3 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=333,
+            start_date=date(2001, 1, 1),
+            admission_reason=StateSupervisionPeriodAdmissionReason.TRANSFER_WITHIN_STATE
+        )
+
+        supervision_period_index = SupervisionPeriodIndex(supervision_periods=[supervision_period_3,
+                                                                               supervision_period_2,
+                                                                               supervision_period_1])
+
+        self.assertEqual([supervision_period_1, supervision_period_2],
+                         supervision_period_index.supervision_periods_overlapping_or_terminated_in_range(
+                             DateRange(date(2000, 10, 1), date(2000, 12, 2))))
+        self.assertEqual([supervision_period_1, supervision_period_2, supervision_period_3],
+                         supervision_period_index.supervision_periods_overlapping_or_terminated_in_range(
+                             DateRange(date(2000, 9, 1), date(2001, 1, 2))))
+        self.assertEqual([],
+                         supervision_period_index.supervision_periods_overlapping_or_terminated_in_range(
+                             DateRange(date(2000, 10, 2), date(2000, 12, 1))))
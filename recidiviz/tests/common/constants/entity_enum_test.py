@@ -19,7 +19,10 @@
 import unittest
 from typing import Optional
 
-from recidiviz.common.constants.entity_enum import EntityEnum, EnumParsingError
+from mock import patch, call
+
+from recidiviz.common.constants.entity_enum import EntityEnum, EnumParsingError, m_enum_parse_cache_hits, \
+    m_enum_parse_cache_misses
 from recidiviz.common.constants.enum_overrides import EnumOverrides
 
 
@@ -117,3 +120,53 @@ class EntityEnumTest(unittest.TestCase):
 
         with self.assertRaises(EnumParsingError):
             FakeEntityEnum.parse('A STRING TO PARSE', overrides)
+
+    def testParse_RepeatedLabels_RunsMapperOncePerNormalizedLabel(self):
+        mapper_calls = []
+
+        def _mapper(label: str) -> Optional[FakeEntityEnum]:
+            mapper_calls.append(label)
+            return FakeEntityEnum.STRAWBERRY if label == 'STRAW' else None
+
+        overrides = EnumOverrides.Builder().add_mapper(_mapper, FakeEntityEnum).build()
+
+        for label in ['straw', 'STRAW', 'straw', 'banana', 'banana.']:
+            FakeEntityEnum.parse(label, overrides)
+
+        parsing_table = overrides.get_parsing_table(FakeEntityEnum)
+        # EnumOverrides.parse calls a mapper a second time to get any non-None value
+        self.assertEqual(['STRAW', 'STRAW', 'BANANA'], mapper_calls)
+        self.assertEqual(2, parsing_table.misses)
+        self.assertEqual(3, parsing_table.hits)
+        self.assertEqual(FakeEntityEnum.STRAWBERRY, FakeEntityEnum.parse('Straw', overrides))
+
+    @patch('recidiviz.common.constants.entity_enum.monitoring.measurements')
+    def testParse_ReportsParsingTableMetricsOnlyWhenAsked(self, mock_measurements):
+        overrides = EnumOverrides.empty()
+        for label in ['banana', 'banana', 'strawberry']:
+            FakeEntityEnum.parse(label, overrides)
+        mock_measurements.assert_not_called()
+
+        overrides.report_parsing_table_metrics()
+        overrides.report_parsing_table_metrics()
+
+        mock_measurements.assert_called_once()
+        mock_measurements.return_value.__enter__.return_value.measure_int_put.assert_has_calls(
+            [call(m_enum_parse_cache_hits, 1), call(m_enum_parse_cache_misses, 2)])
+
+    def testParse_InvalidString_NotMemoized(self):
+        overrides = EnumOverrides.empty()
+        for _ in range(2):
+            with self.assertRaises(EnumParsingError):
+                FakeEntityEnum.parse('invalid', overrides)
+
+        self.assertEqual(2, overrides.get_parsing_table(FakeEntityEnum).misses)
+
+    def testParse_OverridesFromBuilder_DoNotShareMemoizedResults(self):
+        overrides = EnumOverrides.empty()
+        self.assertEqual(FakeEntityEnum.BANANA, FakeEntityEnum.parse('banana', overrides))
+
+        updated_overrides = overrides.to_builder().ignore('BANANA', FakeEntityEnum).build()
+
+        self.assertIsNone(FakeEntityEnum.parse('banana', updated_overrides))
+        self.assertEqual(FakeEntityEnum.BANANA, FakeEntityEnum.parse('banana', overrides))
@@ -18,11 +18,15 @@
 import datetime
 from unittest import TestCase
 
+import dateparser
 import pytest
 
+from recidiviz.common.date import munge_date_string
 from recidiviz.common.str_field_utils import parse_days, parse_dollars, \
     parse_bool, parse_date, parse_datetime, parse_days_from_duration_pieces, parse_int, parse_date_from_date_pieces, \
-    safe_parse_date_from_date_pieces
+    safe_parse_date_from_date_pieces, clear_parse_datetime_caches, get_parse_datetime_path_counts, \
+    PARSE_DATETIME_PATH_EMPTY, PARSE_DATETIME_PATH_YYYYMMDD, PARSE_DATETIME_PATH_FAST, PARSE_DATETIME_PATH_FALLBACK, \
+    PARSE_DATETIME_PATH_DATEPARSER
 
 
 class TestStrFieldUtils(TestCase):
@@ -176,3 +180,49 @@ class TestStrFieldUtils(TestCase):
     def test_parseBadDate(self):
         with pytest.raises(ValueError):
             parse_datetime('ABC')
+
+    def test_parseDateTime_fastPathFormats(self):
+        assert parse_datetime('2016-05-14') == datetime.datetime(2016, 5, 14)
+        assert parse_datetime('2016-05-14T10:11:12') == datetime.datetime(2016, 5, 14, 10, 11, 12)
+        assert parse_datetime('2016-05-14 10:11:12.5') == datetime.datetime(2016, 5, 14, 10, 11, 12, 500000)
+        assert parse_datetime('3/4/2020') == datetime.datetime(2020, 3, 4)
+        assert parse_datetime('3/14/2020 00:00 AM') == datetime.datetime(2020, 3, 14)
+        assert parse_datetime('3/14/2020 1:05 PM') == datetime.datetime(2020, 3, 14, 13, 5)
+        assert parse_datetime('10-11-12') == datetime.datetime(2012, 10, 11)
+        assert parse_datetime('20200314 10:30') == datetime.datetime(2020, 3, 14, 10, 30)
+
+    def test_parseDateTime_fastPathMatchesDateparser(self):
+        for date_string in ['2016-05-14', '2016-05-14 10:11:12', '3/4/2020', '12/31/1999 11:59 PM',
+                            '3/14/2020 12:00 AM', '01-02-03', '10-11-2012']:
+            assert parse_datetime(date_string) == dateparser.parse(
+                munge_date_string(date_string), languages=['en'], settings={'PREFER_DAY_OF_MONTH': 'first'})
+
+    def test_parseDateTime_countsPaths(self):
+        clear_parse_datetime_caches()
+
+        parse_datetime('')
+        parse_datetime('19990629')
+        parse_datetime('2016-05-14')
+        parse_datetime('Jan 1, 2018 1:40')
+        parse_datetime('Jan 1, 2018 1:40')
+        parse_datetime('1y 1m 1d', from_dt=datetime.datetime(2000, 1, 1))
+
+        assert get_parse_datetime_path_counts() == {
+            PARSE_DATETIME_PATH_EMPTY: 1,
+            PARSE_DATETIME_PATH_YYYYMMDD: 1,
+            PARSE_DATETIME_PATH_FAST: 1,
+            PARSE_DATETIME_PATH_FALLBACK: 3,
+            PARSE_DATETIME_PATH_DATEPARSER: 2,
+        }
+
+    def test_parseDateTime_relativeToNowNotMemoized(self):
+        clear_parse_datetime_caches()
+
+        parse_datetime('2 years')
+        parse_datetime('2 years')
+
+        assert get_parse_datetime_path_counts()[PARSE_DATETIME_PATH_DATEPARSER] == 2
+
+    def test_parseDateTime_outOfRangeFastPathValue(self):
+        with pytest.raises(ValueError):
+            parse_datetime('2020-13-45')
@@ -102,6 +102,11 @@ class DirectIngestIngestViewExportManagerTest(unittest.TestCase):
         self.mock_client = self.client_patcher.start().return_value
         project_id_mock = mock.PropertyMock(return_value='recidiviz-456')
         type(self.mock_client).project_id = project_id_mock
+        self.mock_client.table_exists.return_value = False
+
+        self.date_1_table = self.date_bounded_table_name('ingest_view', _DATE_1)
+        self.date_2_table = self.date_bounded_table_name('ingest_view', _DATE_2)
+        self.date_3_table = self.date_bounded_table_name('ingest_view', _DATE_3)
 
     def tearDown(self) -> None:
         self.client_patcher.stop()
@@ -118,6 +123,13 @@ class DirectIngestIngestViewExportManagerTest(unittest.TestCase):
                            are_raw_data_bq_imports_enabled_in_env=True,
                            are_ingest_view_exports_enabled_in_env=ingest_view_exports_enabled)
 
+    def date_bounded_table_name(self, ingest_view_name: str, date_bound: datetime.datetime) -> str:
+        [ingest_view] = _ViewCollector(self.create_fake_region(),
+                                       controller_file_tags=[ingest_view_name],
+                                       is_detect_row_deletion_view=False).collect_views()
+        return DirectIngestIngestViewExportManager._date_bounded_table_name(  # pylint: disable=protected-access
+            ingest_view, date_bound)
+
     def create_export_manager(self, region, is_detect_row_deletion_view=False):
         metadata_manager = PostgresDirectIngestFileMetadataManager(region.region_code)
         return DirectIngestIngestViewExportManager(
@@ -257,14 +269,14 @@ class DirectIngestIngestViewExportManagerTest(unittest.TestCase):
                 overwrite=True,
                 query=mock.ANY,
                 query_parameters=[self.generate_query_params_for_date(export_args.upper_bound_datetime_to_export)],
-                table_id='ingest_view_2020_07_20_00_00_00_upper_bound'),
+                table_id=self.date_2_table),
         ])
         expected_query = \
-            'SELECT * FROM `recidiviz-456.us_xx_ingest_views.ingest_view_2020_07_20_00_00_00_upper_bound` ' \
+            f'SELECT * FROM `recidiviz-456.us_xx_ingest_views.{self.date_2_table}` ' \
             'ORDER BY colA, colC;'
         self.assert_exported_to_gcs_with_query(expected_query)
         self.mock_client.delete_table.assert_has_calls([
-            mock.call(dataset_id='us_xx_ingest_views', table_id='ingest_view_2020_07_20_00_00_00_upper_bound')])
+            mock.call(dataset_id='us_xx_ingest_views', table_id=self.date_2_table)])
         assert_session = SessionFactory.for_schema_base(OperationsBase)
         found_metadata = self.to_entity(one(assert_session.query(schema.DirectIngestIngestFileMetadata).all()))
         self.assertEqual(expected_metadata, found_metadata)
@@ -308,23 +320,23 @@ class DirectIngestIngestViewExportManagerTest(unittest.TestCase):
                 overwrite=True,
                 query=mock.ANY,
                 query_parameters=[self.generate_query_params_for_date(export_args.upper_bound_datetime_to_export)],
-                table_id='ingest_view_2020_07_20_00_00_00_upper_bound'),
+                table_id=self.date_2_table),
             mock.call(
                 dataset_id='us_xx_ingest_views',
                 overwrite=True,
                 query=mock.ANY,
                 query_parameters=[self.generate_query_params_for_date(export_args.upper_bound_datetime_prev)],
-                table_id='ingest_view_2019_07_20_00_00_00_lower_bound'),
+                table_id=self.date_1_table),
         ])
         expected_query = \
-            '(SELECT * FROM `recidiviz-456.us_xx_ingest_views.ingest_view_2020_07_20_00_00_00_upper_bound`) ' \
+            f'(SELECT * FROM `recidiviz-456.us_xx_ingest_views.{self.date_2_table}`) ' \
             'EXCEPT DISTINCT ' \
-            '(SELECT * FROM `recidiviz-456.us_xx_ingest_views.ingest_view_2019_07_20_00_00_00_lower_bound`) ' \
+            f'(SELECT * FROM `recidiviz-456.us_xx_ingest_views.{self.date_1_table}`) ' \
             'ORDER BY colA, colC;'
         self.assert_exported_to_gcs_with_query(expected_query)
         self.mock_client.delete_table.assert_has_calls([
-            mock.call(dataset_id='us_xx_ingest_views', table_id='ingest_view_2020_07_20_00_00_00_upper_bound'),
-            mock.call(dataset_id='us_xx_ingest_views', table_id='ingest_view_2019_07_20_00_00_00_lower_bound'),
+            mock.call(dataset_id='us_xx_ingest_views', table_id=self.date_2_table),
+            mock.call(dataset_id='us_xx_ingest_views', table_id=self.date_1_table),
         ])
 
         assert_session = SessionFactory.for_schema_base(OperationsBase)
@@ -332,6 +344,140 @@ class DirectIngestIngestViewExportManagerTest(unittest.TestCase):
         self.assertEqual(expected_metadata, found_metadata)
         assert_session.close()
 
+    def _add_pending_export_metadata(self, region, file_id, export_args, job_creation_time=_DATE_1):
+        session = SessionFactory.for_schema_base(OperationsBase)
+        session.add(schema.DirectIngestIngestFileMetadata(
+            file_id=file_id,
+            region_code=region.region_code,
+            file_tag=export_args.ingest_view_name,
+            normalized_file_name=f'normalized_file_name_{file_id}',
+            is_invalidated=False,
+            is_file_split=False,
+            job_creation_time=job_creation_time,
+            export_time=None,
+            datetimes_contained_lower_bound_exclusive=export_args.upper_bound_datetime_prev,
+            datetimes_contained_upper_bound_inclusive=export_args.upper_bound_datetime_to_export
+        ))
+        session.commit()
+        session.close()
+
+    def test_exportViewForArgs_keepsUpperBoundTableForNextExport(self):
+        # Arrange
+        region = self.create_fake_region()
+        export_manager = self.create_export_manager(region)
+        export_args = GcsfsIngestViewExportArgs(
+            ingest_view_name='ingest_view',
+            upper_bound_datetime_prev=_DATE_1,
+            upper_bound_datetime_to_export=_DATE_2)
+        next_export_args = GcsfsIngestViewExportArgs(
+            ingest_view_name='ingest_view',
+            upper_bound_datetime_prev=_DATE_2,
+            upper_bound_datetime_to_export=_DATE_3)
+        self._add_pending_export_metadata(region, _ID, export_args)
+        self._add_pending_export_metadata(region, _ID + 1, next_export_args)
+
+        # Act
+        with freeze_time(_DATE_4.isoformat()):
+            export_manager.export_view_for_args(export_args)
+
+        # Assert
+        self.assertEqual(2, self.mock_client.create_table_from_query_async.call_count)
+        self.mock_client.delete_table.assert_called_once_with(
+            dataset_id='us_xx_ingest_views', table_id=self.date_1_table)
+
+    def test_exportViewForArgs_reusesLowerBoundTable(self):
+        # Arrange
+        region = self.create_fake_region()
+        export_manager = self.create_export_manager(region)
+        export_args = GcsfsIngestViewExportArgs(
+            ingest_view_name='ingest_view',
+            upper_bound_datetime_prev=_DATE_2,
+            upper_bound_datetime_to_export=_DATE_3)
+        self._add_pending_export_metadata(region, _ID, export_args, job_creation_time=_DATE_2)
+
+        lower_bound_table_name = self.date_2_table
+        self.mock_client.table_exists.side_effect = lambda _dataset_ref, table_id: table_id == lower_bound_table_name
+        self.mock_client.get_table.return_value.created = _DATE_3.replace(tzinfo=datetime.timezone.utc)
+
+        # Act
+        with freeze_time(_DATE_4.isoformat()):
+            export_manager.export_view_for_args(export_args)
+
+        # Assert
+        self.mock_client.create_table_from_query_async.assert_called_once_with(
+            dataset_id='us_xx_ingest_views',
+            overwrite=True,
+            query=mock.ANY,
+            query_parameters=[self.generate_query_params_for_date(export_args.upper_bound_datetime_to_export)],
+            table_id=self.date_3_table)
+        expected_query = \
+            f'(SELECT * FROM `recidiviz-456.us_xx_ingest_views.{self.date_3_table}`) ' \
+            'EXCEPT DISTINCT ' \
+            f'(SELECT * FROM `recidiviz-456.us_xx_ingest_views.{lower_bound_table_name}`) ' \
+            'ORDER BY colA, colC;'
+        self.assert_exported_to_gcs_with_query(expected_query)
+        self.mock_client.delete_table.assert_has_calls([
+            mock.call(dataset_id='us_xx_ingest_views', table_id=self.date_3_table),
+            mock.call(dataset_id='us_xx_ingest_views', table_id=lower_bound_table_name),
+        ])
+
+    def test_exportViewForArgs_doesNotReuseTableCreatedBeforeJob(self):
+        # Arrange
+        region = self.create_fake_region()
+        export_manager = self.create_export_manager(region)
+        export_args = GcsfsIngestViewExportArgs(
+            ingest_view_name='ingest_view',
+            upper_bound_datetime_prev=_DATE_2,
+            upper_bound_datetime_to_export=_DATE_3)
+        self._add_pending_export_metadata(region, _ID, export_args, job_creation_time=_DATE_3)
+
+        self.mock_client.table_exists.return_value = True
+        self.mock_client.get_table.return_value.created = _DATE_2.replace(tzinfo=datetime.timezone.utc)
+
+        # Act
+        with freeze_time(_DATE_4.isoformat()):
+            export_manager.export_view_for_args(export_args)
+
+        # Assert
+        self.assertEqual(2, self.mock_client.create_table_from_query_async.call_count)
+
+    def test_getIngestViewExportTaskArgs_deletesUnusedDateBoundedTables(self):
+        # Arrange
+        region = self.create_fake_region()
+        export_manager = self.create_export_manager(region)
+        pending_export_args = GcsfsIngestViewExportArgs(
+            ingest_view_name='ingest_view',
+            upper_bound_datetime_prev=_DATE_2,
+            upper_bound_datetime_to_export=_DATE_3)
+        self._add_pending_export_metadata(region, _ID, pending_export_args)
+
+        table_ids = [
+            # Lower bound table of the pending export
+            self.date_2_table,
+            # Kept for a next export that has since been invalidated
+            self.date_1_table,
+            # Created for a previous version of the view query
+            'ingest_view_2020_07_20_00_00_00_0123456789abcdef_date_bounded',
+            # Created before table names included the view query hash
+            'ingest_view_2019_07_20_00_00_00_date_bounded',
+            # Tables for other views
+            self.date_bounded_table_name('ingest_view_extra', _DATE_1),
+            'ingest_view_latest_export',
+        ]
+        self.mock_client.list_tables.return_value = [mock.Mock(table_id=table_id) for table_id in table_ids]
+
+        # Act
+        export_manager.get_ingest_view_export_task_args()
+
+        # Assert
+        self.mock_client.list_tables.assert_called_once_with('us_xx_ingest_views')
+        self.assertEqual([
+            mock.call(dataset_id='us_xx_ingest_views', table_id=self.date_1_table),
+            mock.call(dataset_id='us_xx_ingest_views',
+                      table_id='ingest_view_2020_07_20_00_00_00_0123456789abcdef_date_bounded'),
+            mock.call(dataset_id='us_xx_ingest_views', table_id='ingest_view_2019_07_20_00_00_00_date_bounded'),
+        ], self.mock_client.delete_table.call_args_list)
+
     def test_exportViewForArgs_detectRowDeletionView_noLowerBound(self):
         # Arrange
         region = self.create_fake_region()
@@ -412,24 +558,24 @@ class DirectIngestIngestViewExportManagerTest(unittest.TestCase):
                 overwrite=True,
                 query=mock.ANY,
                 query_parameters=[self.generate_query_params_for_date(export_args.upper_bound_datetime_to_export)],
-                table_id='ingest_view_2020_07_20_00_00_00_upper_bound'),
+                table_id=self.date_2_table),
             mock.call(
                 dataset_id='us_xx_ingest_views',
                 overwrite=True,
                 query=mock.ANY,
                 query_parameters=[self.generate_query_params_for_date(export_args.upper_bound_datetime_prev)],
-                table_id='ingest_view_2019_07_20_00_00_00_lower_bound'),
+                table_id=self.date_1_table),
         ])
         # Lower bound is the first part of the subquery, not upper bound.
         expected_query = \
-            '(SELECT * FROM `recidiviz-456.us_xx_ingest_views.ingest_view_2019_07_20_00_00_00_lower_bound`) ' \
+            f'(SELECT * FROM `recidiviz-456.us_xx_ingest_views.{self.date_1_table}`) ' \
             'EXCEPT DISTINCT ' \
-            '(SELECT * FROM `recidiviz-456.us_xx_ingest_views.ingest_view_2020_07_20_00_00_00_upper_bound`) ' \
+            f'(SELECT * FROM `recidiviz-456.us_xx_ingest_views.{self.date_2_table}`) ' \
             'ORDER BY colA, colC;'
         self.assert_exported_to_gcs_with_query(expected_query)
         self.mock_client.delete_table.assert_has_calls([
-            mock.call(dataset_id='us_xx_ingest_views', table_id='ingest_view_2020_07_20_00_00_00_upper_bound'),
-            mock.call(dataset_id='us_xx_ingest_views', table_id='ingest_view_2019_07_20_00_00_00_lower_bound'),
+            mock.call(dataset_id='us_xx_ingest_views', table_id=self.date_2_table),
+            mock.call(dataset_id='us_xx_ingest_views', table_id=self.date_1_table),
         ])
 
         assert_session = SessionFactory.for_schema_base(OperationsBase)
@@ -16,14 +16,15 @@
 # =============================================================================
 """Tests for the GcsfsCsvReader."""
 
+import os
+import tempfile
 import unittest
 
 import gcsfs
 import pandas as pd
 from mock import create_autospec
 
-from recidiviz.ingest.direct.controllers.gcsfs_csv_reader import GcsfsCsvReader, GcsfsCsvReaderDelegate, \
-    COMMON_RAW_FILE_ENCODINGS
+from recidiviz.ingest.direct.controllers.gcsfs_csv_reader import GcsfsCsvReader, GcsfsCsvReaderDelegate
 from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
 from recidiviz.tests.ingest import fixtures
 
@@ -34,6 +35,7 @@ class TestGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
     def __init__(self):
         self.dataframes = []
         self.encodings_attempted = []
+        self.encoding_switches = []
         self.decode_errors = 0
         self.exceptions = 0
         self.successful_encoding = None
@@ -45,6 +47,9 @@ class TestGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
         self.dataframes.append((encoding, df))
         return True
 
+    def on_encoding_switch(self, from_encoding: str, to_encoding: str, e: UnicodeError) -> None:
+        self.encoding_switches.append((from_encoding, to_encoding))
+
     def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
         self.decode_errors += 1
         return False
@@ -62,14 +67,14 @@ class TestGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
 def _fake_gcsfs_open(
         path_str: str,
         *,
-        encoding: str,
+        mode: str,
         # pylint: disable=unused-argument
         token: str):
     if not path_str.startswith('gs://'):
         raise ValueError(f'Expected gs:// path URI, got this instead: {path_str}')
 
     # Convert to local absolute path
-    return open('/' + path_str[len('gs://'):], encoding=encoding)
+    return open('/' + path_str[len('gs://'):], mode=mode)
 
 
 class GcsfsCsvReaderTest(unittest.TestCase):
@@ -153,13 +158,14 @@ class GcsfsCsvReaderTest(unittest.TestCase):
         delegate = TestGcsfsCsvReaderDelegate()
         self.reader.streaming_read(GcsfsFilePath.from_absolute_path(file_path), delegate=delegate, chunk_size=1)
 
-        index = COMMON_RAW_FILE_ENCODINGS.index('ISO-8859-1')
-        self.assertEqual(index + 1, len(delegate.encodings_attempted))
-        self.assertEqual(COMMON_RAW_FILE_ENCODINGS[:(index+1)], delegate.encodings_attempted)
+        # The file fails to decode as UTF-8 before any chunk has been processed, so the read continues in place with
+        # the next encoding.
+        self.assertEqual(['UTF-8'], delegate.encodings_attempted)
+        self.assertEqual([('UTF-8', 'ISO-8859-1')], delegate.encoding_switches)
         self.assertEqual('ISO-8859-1', delegate.successful_encoding)
         self.assertEqual(4, len(delegate.dataframes))
         self.assertEqual({'ISO-8859-1'}, {encoding for encoding, df in delegate.dataframes})
-        self.assertEqual(1, delegate.decode_errors)
+        self.assertEqual(0, delegate.decode_errors)
         self.assertEqual(0, delegate.exceptions)
 
     def test_read_with_no_failure(self):
@@ -199,3 +205,37 @@ class GcsfsCsvReaderTest(unittest.TestCase):
         self.assertEqual({'UTF-8'}, {encoding for encoding, df in delegate.dataframes})
         self.assertEqual(0, delegate.decode_errors)
         self.assertEqual(1, delegate.exceptions)
+
+    def _write_temp_file(self, contents: bytes) -> str:
+        fd, file_path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(contents)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def test_read_with_failure_after_ascii_chunks_switchesInPlace(self):
+        ascii_rows = ''.join(f'{i},VALUE_{i}\n' for i in range(100000)).encode('ascii')
+        file_path = self._write_temp_file(b'ID,NAME\n' + ascii_rows + 'LAST,CAF\xc9\n'.encode('ISO-8859-1'))
+        delegate = TestGcsfsCsvReaderDelegate()
+
+        self.reader.streaming_read(GcsfsFilePath.from_absolute_path(file_path), delegate=delegate, chunk_size=10000)
+
+        self.assertEqual(['UTF-8'], delegate.encodings_attempted)
+        self.assertEqual([('UTF-8', 'ISO-8859-1')], delegate.encoding_switches)
+        self.assertEqual('ISO-8859-1', delegate.successful_encoding)
+        self.assertEqual(0, delegate.decode_errors)
+        all_rows = pd.concat([df for _, df in delegate.dataframes])
+        self.assertEqual(100001, all_rows.shape[0])
+        self.assertEqual('CAF\xc9', all_rows.iloc[-1]['NAME'])
+
+    def test_read_with_failure_after_non_ascii_chunks_restarts(self):
+        utf_8_rows = ''.join(f'{i},CAF\xc9_{i}\n' for i in range(100000)).encode('UTF-8')
+        file_path = self._write_temp_file(b'ID,NAME\n' + utf_8_rows + 'LAST,CAF\xc9\n'.encode('ISO-8859-1'))
+        delegate = TestGcsfsCsvReaderDelegate()
+
+        self.reader.streaming_read(GcsfsFilePath.from_absolute_path(file_path), delegate=delegate, chunk_size=10000)
+
+        self.assertEqual(['UTF-8', 'ISO-8859-1'], delegate.encodings_attempted)
+        self.assertEqual([], delegate.encoding_switches)
+        self.assertEqual('ISO-8859-1', delegate.successful_encoding)
+        self.assertEqual(1, delegate.decode_errors)
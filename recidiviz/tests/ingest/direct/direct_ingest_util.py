@@ -19,7 +19,7 @@ import datetime
 import os
 import time
 import unittest
-from typing import List, Union, Optional, Dict, Type, TextIO
+from typing import List, Union, Optional, Dict, Type, BinaryIO
 
 import attr
 import gcsfs
@@ -61,12 +61,12 @@ class TestSafeGcsCsvReader(GcsfsCsvReader):
         super().__init__(create_autospec(gcsfs.GCSFileSystem))
         self.fs = fs
 
-    def _file_pointer_for_path(self, path: GcsfsFilePath, encoding: str) -> TextIO:
+    def _file_pointer_for_path(self, path: GcsfsFilePath) -> BinaryIO:
         try:
             path_str = self.fs.real_absolute_path_for_path(path)
         except AttributeError:
             path_str = self.fs.real_absolute_path_for_path(path)
-        return open(path_str, encoding=encoding)
+        return open(path_str, 'rb')
 
 
 class DirectIngestFakeGCSFileSystemDelegate(FakeGCSFileSystemDelegate):
@@ -15,7 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """A fake implementation of BigQueryClient for use in direct ingest tests."""
-from typing import List, Optional, Iterator, Callable
+from typing import Any, Dict, List, Optional, Iterator, Callable
 
 from google.cloud import bigquery
 
@@ -50,7 +50,7 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
         return self._project_id
 
     def dataset_ref_for_id(self, dataset_id: str) -> bigquery.DatasetReference:
-        raise ValueError('Must be implemented for use in tests.')
+        return bigquery.DatasetReference(self.project_id, dataset_id)
 
     def create_dataset_if_necessary(self,
                                     dataset_ref: bigquery.DatasetReference,
@@ -73,7 +73,8 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
         raise ValueError('Must be implemented for use in tests.')
 
     def table_exists(self, dataset_ref: bigquery.DatasetReference, table_id: str) -> bool:
-        raise ValueError('Must be implemented for use in tests.')
+        # Tables created from queries are not stored, so intermediate ingest view tables are never reused
+        return False
 
     def get_table(self, dataset_ref: bigquery.DatasetReference, table_id: str) -> bigquery.Table:
         raise ValueError('Must be implemented for use in tests.')
@@ -82,7 +83,8 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
         raise ValueError('Must be implemented for use in tests.')
 
     def list_tables(self, dataset_id: str) -> Iterator[bigquery.table.TableListItem]:
-        raise ValueError('Must be implemented for use in tests.')
+        # Tables created from queries are not stored, so there are never intermediate ingest view tables to clean up
+        return iter([])
 
     def create_table(self, table: bigquery.Table) -> bigquery.Table:
         raise ValueError('Must be implemented for use in tests.')
@@ -123,6 +125,9 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
             -> bigquery.QueryJob:
         raise ValueError('Must be implemented for use in tests.')
 
+    def get_referenced_tables(self, query_str: str) -> List[bigquery.TableReference]:
+        raise ValueError('Must be implemented for use in tests.')
+
     def paged_read_and_process(self,
                                query_job: bigquery.QueryJob,
                                page_size: int,
@@ -165,6 +170,9 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
             write_disposition: bigquery.WriteDisposition = bigquery.WriteDisposition.WRITE_APPEND) -> bigquery.QueryJob:
         raise ValueError('Must be implemented for use in tests.')
 
+    def stream_into_table(self, dataset_id: str, table_id: str, rows: List[Dict[str, Any]]) -> None:
+        raise ValueError('Must be implemented for use in tests.')
+
     def delete_from_table_async(self, dataset_id: str, table_id: str, filter_clause: str) -> bigquery.QueryJob:
         raise ValueError('Must be implemented for use in tests.')
 
@@ -209,3 +209,42 @@ def _get_content_as_csv(content_filename: str) -> csv.DictReader:
     content = fixtures.as_string('testdata/data_extractor/csv',
                                  content_filename)
     return csv.DictReader(content.splitlines())
+
+
+class CsvDataExtractorColumnPlanTest(unittest.TestCase):
+    """Tests for the per-column extraction plans and cached YAML mappings."""
+
+    def test_get_column_plan(self):
+        extractor = _instantiate_extractor('standard_child_file_csv.yaml')
+
+        plan = extractor._get_column_plan(' IN_OUT_STATUS ')
+
+        self.assertEqual('IN_OUT_STATUS', plan.stripped_key)
+        self.assertEqual('sentence_group.status', plan.lookup_key)
+        self.assertEqual('sentence_group', plan.class_name)
+        self.assertEqual('status', plan.field_name)
+        self.assertFalse(plan.is_child)
+        self.assertIs(plan, extractor._get_column_plan(' IN_OUT_STATUS '))
+
+    def test_get_column_plan_ignoredKey(self):
+        extractor = _instantiate_extractor('standard_child_file_csv.yaml')
+
+        plan = extractor._get_column_plan('BOOKING_NO')
+
+        self.assertIsNone(plan.lookup_key)
+        self.assertIsNone(plan.class_name)
+
+    def test_get_column_plan_unmappedKey(self):
+        extractor = _instantiate_extractor('standard_child_file_csv.yaml')
+
+        with self.assertRaises(ValueError):
+            extractor._get_column_plan('NOT_A_COLUMN')
+
+    def test_manifest_notSharedBetweenExtractors(self):
+        extractor = _instantiate_extractor('standard_child_file_csv.yaml')
+        extractor.keys['NEW_COLUMN'] = 'sentence_group.county_code'
+
+        other_extractor = _instantiate_extractor('standard_child_file_csv.yaml')
+
+        self.assertNotIn('NEW_COLUMN', other_extractor.keys)
+        self.assertIsNot(extractor.manifest, other_extractor.manifest)
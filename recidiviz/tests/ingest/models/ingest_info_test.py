@@ -242,3 +242,24 @@ class TestIngestInfo(unittest.TestCase):
         ii.sort()
         ii_reversed.sort()
         self.assertEqual(ii, ii_reversed)
+
+    def test_fingerprint(self):
+        c1 = ingest_info.Charge(name='a', bond=ingest_info.Bond(amount='1'))
+        c2 = ingest_info.Charge(name='b')
+
+        p = ingest_info.Person(
+            full_name='name', bookings=[ingest_info.Booking(charges=[c1, c2])])
+        p_reversed = ingest_info.Person(
+            full_name='name', bookings=[ingest_info.Booking(charges=[c2, c1])])
+        p_repeated = ingest_info.Person(
+            full_name='name',
+            bookings=[ingest_info.Booking(charges=[c1, c2, c2])])
+        p_other = ingest_info.Person(
+            full_name='name', bookings=[ingest_info.Booking(charges=[c1])])
+
+        self.assertEqual(p.fingerprint(), p_reversed.fingerprint())
+        self.assertEqual(hash(p.fingerprint()), hash(p_reversed.fingerprint()))
+        self.assertNotEqual(p.fingerprint(), p_repeated.fingerprint())
+        self.assertNotEqual(p.fingerprint(), p_other.fingerprint())
+        self.assertNotEqual(ingest_info.Bond().fingerprint(),
+                            ingest_info.Sentence().fingerprint())
@@ -17,6 +17,7 @@
 
 """Tests for base_scraper.py."""
 import datetime
+import threading
 from unittest import TestCase
 
 import flask
@@ -451,3 +452,181 @@ class TestBaseScraper(TestCase):
             scrape_key=scrape_key,
         )
         self.assertEqual(len(scraper.tasks), 0)
+
+    @patch('recidiviz.persistence.persistence.write')
+    @patch.object(BaseScraper, 'populate_data')
+    @patch.object(BaseScraper, 'should_fetch_concurrently')
+    @patch.object(BaseScraper, '_fetch_content')
+    @patch.object(BaseScraper, 'get_more_tasks')
+    def test_get_more_fetches_concurrently(
+            self, mock_get_more, mock_fetch, mock_concurrently, mock_populate,
+            mock_write):
+        detail_tasks = [
+            Task(task_type=constants.TaskType.SCRAPE_DATA,
+                 endpoint='DETAIL_{}'.format(i)) for i in range(3)]
+        mock_get_more.return_value = detail_tasks
+        mock_fetch.return_value = (TEST_HTML, {})
+        mock_concurrently.side_effect = \
+            lambda task_type: task_type == constants.TaskType.SCRAPE_DATA
+        mock_populate.return_value = ScrapedData(
+            ingest_info=self.ii,
+            persist=True,
+        )
+        req = QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=TEST_TASK,
+            scraper_start_time=datetime.datetime.now()
+        )
+
+        scraper = FakeScraper('test')
+        scraper.BATCH_WRITES = False
+        scraper._generic_scrape(req)
+
+        self.assertEqual(mock_fetch.call_count, 4)
+        self.assertCountEqual(
+            [TEST_TASK.endpoint] + [t.endpoint for t in detail_tasks],
+            [args[0] for args, _ in mock_fetch.call_args_list])
+        self.assertEqual(mock_populate.call_count, 3)
+        self.assertEqual(mock_write.call_count, 3)
+        self.assertEqual(len(scraper.tasks), 0)
+
+    @patch('recidiviz.persistence.persistence.write')
+    @patch.object(BaseScraper, 'populate_data')
+    @patch.object(BaseScraper, 'should_fetch_concurrently')
+    @patch.object(BaseScraper, '_fetch_content')
+    @patch.object(BaseScraper, 'get_more_tasks')
+    def test_get_more_fetches_concurrently_queues_failure(
+            self, mock_get_more, mock_fetch, mock_concurrently, mock_populate,
+            mock_write):
+        detail_tasks = [
+            Task(task_type=constants.TaskType.SCRAPE_DATA,
+                 endpoint='DETAIL_{}'.format(i)) for i in range(3)]
+        mock_get_more.return_value = detail_tasks
+
+        def fetch(endpoint, _response_type, **_kwargs):
+            if endpoint == 'DETAIL_1':
+                raise ValueError('TEST ERROR')
+            return TEST_HTML, {}
+        mock_fetch.side_effect = fetch
+        mock_concurrently.side_effect = \
+            lambda task_type: task_type == constants.TaskType.SCRAPE_DATA
+        mock_populate.return_value = ScrapedData(
+            ingest_info=self.ii,
+            persist=True,
+        )
+        start_time = datetime.datetime.now()
+        req = QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=TEST_TASK,
+            scraper_start_time=start_time
+        )
+
+        scraper = FakeScraper('test')
+        scraper.BATCH_WRITES = False
+        scraper._generic_scrape(req)
+
+        expected_tasks = [QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=detail_tasks[1],
+            scraper_start_time=start_time,
+        )]
+
+        self.assertEqual(mock_populate.call_count, 2)
+        self.assertEqual(mock_write.call_count, 2)
+        self.assertCountEqual(expected_tasks, scraper.tasks)
+
+    @patch('recidiviz.persistence.persistence.write')
+    @patch.object(BaseScraper, 'populate_data')
+    @patch.object(BaseScraper, 'should_fetch_concurrently')
+    @patch.object(BaseScraper, '_fetch_content')
+    @patch.object(BaseScraper, 'get_more_tasks')
+    def test_get_more_fetches_concurrently_queues_nested_tasks(
+            self, mock_get_more, mock_fetch, mock_concurrently, mock_populate,
+            mock_write):
+        detail_task = Task(
+            task_type=constants.TaskType.SCRAPE_DATA_AND_MORE,
+            endpoint='DETAIL')
+        nested_task = Task(
+            task_type=constants.TaskType.SCRAPE_DATA_AND_MORE,
+            endpoint='NESTED')
+        mock_get_more.side_effect = \
+            lambda _content, task: [detail_task] \
+            if task.endpoint == TEST_TASK.endpoint else [nested_task]
+        mock_fetch.return_value = (TEST_HTML, {})
+        mock_concurrently.return_value = True
+        mock_populate.return_value = ScrapedData(
+            ingest_info=self.ii,
+            persist=True,
+        )
+        start_time = datetime.datetime.now()
+        req = QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=TEST_TASK,
+            scraper_start_time=start_time
+        )
+
+        scraper = FakeScraper('test')
+        scraper.BATCH_WRITES = False
+        scraper._generic_scrape(req)
+
+        expected_tasks = [QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=nested_task,
+            scraper_start_time=start_time,
+        )]
+
+        self.assertEqual(
+            [TEST_TASK.endpoint, detail_task.endpoint],
+            [args[0] for args, _ in mock_fetch.call_args_list])
+        self.assertEqual(mock_write.call_count, 1)
+        self.assertEqual(expected_tasks, scraper.tasks)
+
+    @patch('recidiviz.persistence.persistence.write')
+    @patch.object(BaseScraper, 'populate_data')
+    @patch.object(BaseScraper, 'should_fetch_concurrently')
+    @patch.object(BaseScraper, '_fetch_content')
+    @patch.object(BaseScraper, 'get_more_tasks')
+    def test_get_more_fetches_concurrently_queues_after_deadline(
+            self, mock_get_more, mock_fetch, mock_concurrently, mock_populate,
+            mock_write):
+        detail_tasks = [
+            Task(task_type=constants.TaskType.SCRAPE_DATA,
+                 endpoint='DETAIL_{}'.format(i)) for i in range(3)]
+        mock_get_more.return_value = detail_tasks
+        slow_fetch_released = threading.Event()
+
+        def fetch(endpoint, _response_type, **_kwargs):
+            if endpoint == 'DETAIL_1':
+                slow_fetch_released.wait(5)
+            return TEST_HTML, {}
+        mock_fetch.side_effect = fetch
+        mock_concurrently.side_effect = \
+            lambda task_type: task_type == constants.TaskType.SCRAPE_DATA
+        mock_populate.return_value = ScrapedData(
+            ingest_info=self.ii,
+            persist=True,
+        )
+        start_time = datetime.datetime.now()
+        req = QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=TEST_TASK,
+            scraper_start_time=start_time
+        )
+
+        scraper = FakeScraper('test')
+        scraper.BATCH_WRITES = False
+        scraper.CONCURRENT_FETCH_TIMEOUT_SECONDS = 0.5
+        try:
+            scraper._generic_scrape(req)
+        finally:
+            slow_fetch_released.set()
+
+        expected_tasks = [QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=detail_tasks[1],
+            scraper_start_time=start_time,
+        )]
+
+        self.assertEqual(mock_populate.call_count, 2)
+        self.assertEqual(mock_write.call_count, 2)
+        self.assertEqual(expected_tasks, scraper.tasks)
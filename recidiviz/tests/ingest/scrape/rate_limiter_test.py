@@ -0,0 +1,66 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for rate_limiter.py."""
+import unittest
+
+from mock import patch
+
+from recidiviz.ingest.scrape.rate_limiter import RateLimiter, \
+    get_rate_limiter_for_region
+
+
+@patch('time.sleep')
+@patch('time.monotonic')
+class RateLimiterTest(unittest.TestCase):
+    """Tests for RateLimiter."""
+
+    def test_wait_spaces_requests(self, mock_monotonic, mock_sleep):
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter(max_per_second=4)
+
+        for _ in range(3):
+            limiter.wait()
+
+        self.assertEqual([0.25, 0.5],
+                         [args[0] for args, _ in mock_sleep.call_args_list])
+
+    def test_wait_after_idle(self, mock_monotonic, mock_sleep):
+        limiter = RateLimiter(max_per_second=4)
+
+        mock_monotonic.return_value = 100.0
+        limiter.wait()
+        mock_monotonic.return_value = 101.0
+        limiter.wait()
+
+        mock_sleep.assert_not_called()
+
+    def test_invalid_rate(self, _mock_monotonic, _mock_sleep):
+        with self.assertRaises(ValueError):
+            RateLimiter(max_per_second=0)
+
+
+class GetRateLimiterForRegionTest(unittest.TestCase):
+    """Tests for get_rate_limiter_for_region."""
+
+    def test_shared_by_region(self):
+        limiter = get_rate_limiter_for_region('us_xx', 5)
+
+        self.assertIs(limiter, get_rate_limiter_for_region('us_xx', 5))
+        self.assertIsNot(limiter, get_rate_limiter_for_region('us_yy', 5))
+
+    def test_no_limit(self):
+        self.assertIsNone(get_rate_limiter_for_region('us_xx', None))
@@ -18,6 +18,9 @@
 """Tests for ingest/scraper.py."""
 
 import datetime
+import http.server
+import threading
+import time
 import unittest
 
 import pytest
@@ -27,7 +30,8 @@ from mock import patch
 from recidiviz.ingest.models.scrape_key import ScrapeKey
 from recidiviz.ingest.scrape import constants, scrape_phase
 from recidiviz.ingest.scrape.constants import BATCH_PUBSUB_TYPE
-from recidiviz.ingest.scrape.scraper import FetchPageError, Scraper
+from recidiviz.ingest.scrape.scraper import FetchPageError, Scraper, \
+    close_http_sessions
 from recidiviz.ingest.scrape.sessions import ScrapeSession
 from recidiviz.ingest.scrape.task_params import QueueRequest, Task
 from recidiviz.utils.regions import Region
@@ -160,12 +164,15 @@ class TestStopScraper(unittest.TestCase):
         mock_task_manager.return_value.purge_scrape_tasks.return_value = None
 
         scraper = FakeScraper(region, initial_task)
+        http_session = scraper.session
         scraper.stop_scrape(scrape_type)
 
         mock_get_region.assert_called_with(region)
         mock_sessions.assert_called_with(region, include_closed=False)
         mock_task_manager.return_value.purge_scrape_tasks.assert_called_with(
             region_code=region, queue_name=queue_name)
+        self.assertIsNot(http_session, scraper.session)
+        close_http_sessions()
 
     @patch('recidiviz.ingest.scrape.scraper.ScraperCloudTaskManager')
     @patch('recidiviz.ingest.scrape.sessions.get_sessions')
@@ -424,9 +431,9 @@ class TestFetchPage(unittest.TestCase):
         response = requests.Response()
         response._content = page  # pylint: disable=protected-access
         response.status_code = 200
-        with patch('requests.get', return_value=response):
+        with patch.object(requests.Session, 'get', return_value=response):
             assert scraper.fetch_page(url).content == page
-            requests.get.assert_called_with(
+            requests.Session.get.assert_called_with(
                 url, proxies=proxies, headers=headers, cookies=None,
                 params=None, verify=False)
 
@@ -434,7 +441,7 @@ class TestFetchPage(unittest.TestCase):
         mock_proxies.assert_called_with()
         mock_headers.assert_called_with()
 
-    @patch('requests.post')
+    @patch.object(requests.Session, 'post')
     @patch('recidiviz.ingest.scrape.scraper_utils.get_headers')
     @patch('recidiviz.ingest.scrape.scraper_utils.get_proxies')
     @patch('recidiviz.utils.regions.get_region')
@@ -470,7 +477,7 @@ class TestFetchPage(unittest.TestCase):
             url, proxies=proxies, headers=headers, cookies=None,
             data=body, json=json_data, verify=False)
 
-    @patch('requests.get')
+    @patch.object(requests.Session, 'get')
     @patch('recidiviz.ingest.scrape.scraper_utils.get_headers')
     @patch('recidiviz.ingest.scrape.scraper_utils.get_proxies')
     @patch('recidiviz.utils.regions.get_region')
@@ -520,7 +527,144 @@ class TestFetchPage(unittest.TestCase):
                 params=None, verify=False)
 
 
-def mock_region(region_code, queue_name=None, is_stoppable=False):
+class _StandInRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Responds to each GET with the next of the server's |statuses|, or 200
+    once those run out, and a cookie. Records the port each request came from
+    and the cookies it sent."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.client_ports.append(self.client_address[1])
+        self.server.request_cookies.append(self.headers.get('Cookie'))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = b'<blink>Get in on the ground floor</blink>'
+        self.send_response(status)
+        self.send_header('Set-Cookie', 'visited=true')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@patch('recidiviz.ingest.scrape.scraper_utils.get_proxies',
+       return_value=None)
+@patch('recidiviz.utils.regions.get_region')
+class TestFetchPageFromServer(unittest.TestCase):
+    """Tests for the Scraper.fetch_page method against a local HTTP server."""
+
+    def setUp(self) -> None:
+        self.task_manager_patcher = \
+            patch('recidiviz.ingest.scrape.scraper.ScraperCloudTaskManager')
+        self.task_manager_patcher.start()
+        self.backoff_patcher = \
+            patch.object(Scraper, 'HTTP_RETRY_BACKOFF_FACTOR', 0)
+        self.backoff_patcher.start()
+
+        self.server = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), _StandInRequestHandler)
+        self.server.statuses = []
+        self.server.client_ports = []
+        self.server.request_cookies = []
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+        self.url = 'http://127.0.0.1:{}/around/the/world'.format(
+            self.server.server_address[1])
+
+    def tearDown(self) -> None:
+        close_http_sessions()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+        self.backoff_patcher.stop()
+        self.task_manager_patcher.stop()
+
+    def _create_scraper(self, mock_get_region, max_requests_per_second=None):
+        mock_get_region.return_value = mock_region(
+            'us_sd', max_requests_per_second=max_requests_per_second)
+        scraper = FakeScraper('us_sd', 'work_it')
+        # Ignore any proxies configured in the environment.
+        scraper.session.trust_env = False
+        return scraper
+
+    def _fetch_page(self, scraper):
+        return scraper.fetch_page(
+            self.url, headers={'User-Agent': 'test_user_agent'})
+
+    def test_fetch_page_reuses_connection(self, mock_get_region, _):
+        scraper = self._create_scraper(mock_get_region)
+
+        for _ in range(3):
+            self.assertEqual(200, self._fetch_page(scraper).status_code)
+
+        self.assertEqual(3, len(self.server.client_ports))
+        self.assertEqual(1, len(set(self.server.client_ports)))
+
+    def test_fetch_page_reuses_connection_across_scrapers(
+            self, mock_get_region, _):
+        for _ in range(3):
+            scraper = self._create_scraper(mock_get_region)
+            self.assertEqual(200, self._fetch_page(scraper).status_code)
+
+        self.assertEqual(3, len(self.server.client_ports))
+        self.assertEqual(1, len(set(self.server.client_ports)))
+
+    def test_fetch_page_new_connection_after_close(self, mock_get_region, _):
+        scraper = self._create_scraper(mock_get_region)
+        self._fetch_page(scraper)
+
+        close_http_sessions('us_sd')
+        scraper.session.trust_env = False
+        self._fetch_page(scraper)
+
+        self.assertEqual(2, len(set(self.server.client_ports)))
+
+    def test_fetch_page_does_not_store_cookies(self, mock_get_region, _):
+        scraper = self._create_scraper(mock_get_region)
+
+        page = self._fetch_page(scraper)
+        self.assertEqual({'visited': 'true'}, page.cookies.get_dict())
+        scraper.fetch_page(self.url, headers={'User-Agent': 'test_user_agent'},
+                           cookies={'flavor': 'oatmeal'})
+        self._fetch_page(scraper)
+
+        self.assertEqual([None, 'flavor=oatmeal', None],
+                         self.server.request_cookies)
+
+    def test_fetch_page_retries_server_error(self, mock_get_region, _):
+        scraper = self._create_scraper(mock_get_region)
+        self.server.statuses = [503, 502]
+
+        self.assertEqual(200, self._fetch_page(scraper).status_code)
+        self.assertEqual(3, len(self.server.client_ports))
+
+    def test_fetch_page_retries_exhausted(self, mock_get_region, _):
+        scraper = self._create_scraper(mock_get_region)
+        self.server.statuses = [500] * (Scraper.HTTP_MAX_RETRIES + 1)
+
+        with pytest.raises(FetchPageError):
+            self._fetch_page(scraper)
+        self.assertEqual(Scraper.HTTP_MAX_RETRIES + 1,
+                         len(self.server.client_ports))
+
+    def test_fetch_page_rate_limited(self, mock_get_region, _):
+        scrapers = [self._create_scraper(mock_get_region,
+                                         max_requests_per_second=20)
+                    for _ in range(2)]
+
+        start = time.monotonic()
+        for scraper in scrapers * 2:
+            self._fetch_page(scraper)
+
+        # The limit is shared by both scrapers, so the four requests are spaced
+        # at least 50ms apart.
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+
+def mock_region(region_code, queue_name=None, is_stoppable=False,
+                max_requests_per_second=None):
     return Region(
         region_code=region_code,
         shared_queue=queue_name or None,
@@ -532,6 +676,7 @@ def mock_region(region_code, queue_name=None, is_stoppable=False):
         environment='production',
         jurisdiction_id='jurisdiction_id',
         is_stoppable=is_stoppable or False,
+        max_requests_per_second=max_requests_per_second,
     )
 
 
@@ -18,11 +18,10 @@
 """Tests for optimized_metric_big_query_view_exporter.py."""
 
 import unittest
-from typing import Dict, Set, List, Callable
+from typing import Dict, List, Callable
 
 from google.cloud import bigquery
 
-import pytest
 from mock import call, create_autospec, patch
 
 from recidiviz.big_query.big_query_client import BigQueryClient
@@ -33,7 +32,7 @@ from recidiviz.metrics.metric_big_query_view import MetricBigQueryViewBuilder
 from recidiviz.cloud_storage.gcsfs_path import GcsfsDirectoryPath
 from recidiviz.metrics.export import optimized_metric_big_query_view_exporter
 from recidiviz.metrics.export.optimized_metric_big_query_view_exporter import OptimizedMetricRepresentation, \
-    OptimizedMetricBigQueryViewExporter
+    OptimizedMetricBigQueryViewExporter, MAX_EXPORT_WORKERS
 
 _DATA_POINTS = [
     {'district': '4', 'year': 2020, 'month': 11, 'supervision_type': 'PAROLE', 'total_revocations': 100},
@@ -67,160 +66,6 @@ _DATA_VALUES = [
 ]
 
 
-class PlaceInCompactMatrixTest(unittest.TestCase):
-    """Tests for place_in_compact_matrix"""
-
-    @staticmethod
-    def _create_new_data_values():
-        return [[], [], [], [], []]
-
-    def test_place_happy_path_single_value(self):
-        fresh_data_values = self._create_new_data_values()
-        optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-            _DATA_POINTS[3], fresh_data_values, _VALUE_KEYS, _DIMENSION_MANIFEST,
-        )
-        self.assertEqual([[1], [0], [1], [0], [41]], fresh_data_values)
-
-        optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-            _DATA_POINTS[8], fresh_data_values, _VALUE_KEYS, _DIMENSION_MANIFEST,
-        )
-        self.assertEqual([[1, 1], [0, 1], [1, 1], [0, 0], [41, 38]], fresh_data_values)
-
-    def test_place_each_data_point_single_value(self):
-        fresh_data_values = self._create_new_data_values()
-        for data_point in _DATA_POINTS:
-            optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-                data_point, fresh_data_values, _VALUE_KEYS, _DIMENSION_MANIFEST,
-            )
-
-        self.assertEqual(_DATA_VALUES, fresh_data_values)
-
-    def test_place_each_data_point_multi_value(self):
-        multi_data_points = [{**dp, 'total_population': 100} for dp in _DATA_POINTS]
-        multi_value_keys = ['total_population', 'total_revocations']
-
-        expected = [
-            [0, 0, 1, 1, 2, 0, 0, 1, 1, 2, 2],
-            [0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1],
-            [0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100],
-            [100, 68, 73, 41, 10, 30, 36, 51, 38, 15, 4],
-        ]
-
-        fresh_data_values = self._create_new_data_values()
-        fresh_data_values.append([])  # Add one more for this test case
-        for data_point in multi_data_points:
-            optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-                data_point, fresh_data_values, multi_value_keys, _DIMENSION_MANIFEST,
-            )
-
-        self.assertEqual(expected, fresh_data_values)
-
-    def test_place_value_not_in_dataset(self):
-        fresh_data_values = self._create_new_data_values()
-        new_data_point = {'district': '6', 'year': 2020, 'month': 11, 'supervision_type': 'PROBATION', 'other_value': 5}
-        optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-            new_data_point, fresh_data_values, _VALUE_KEYS, _DIMENSION_MANIFEST,
-        )
-        self.assertEqual([[2], [0], [1], [0], [0]], fresh_data_values)
-
-    def test_place_dimensions_not_in_dataset(self):
-        fresh_data_values = self._create_new_data_values()
-        with pytest.raises(KeyError) as e:
-            new_data_point = {
-                'district': '4', 'year': 2020, 'month': 5, 'supervision_type': 'PAROLE', 'total_revocations': 10,
-            }
-            optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-                new_data_point, fresh_data_values, _VALUE_KEYS, _DIMENSION_MANIFEST,
-            )
-
-            self.assertIn('month: 5', e.message)
-
-
-class AddToManifestTest(unittest.TestCase):
-    """Tests for add_to_dimension_manifest"""
-
-    def test_add_all_new_dimensions(self):
-        data_point = _DATA_POINTS[2]
-        fresh_manifest: Dict[str, Set[str]] = {
-            'district': set(),
-            'month': set(),
-            'supervision_type': set(),
-            'year': set(),
-        }
-
-        expected = {
-            'district': {'5'},
-            'month': {'11'},
-            'supervision_type': {'parole'},
-            'year': {'2020'},
-        }
-
-        updated_manifest = optimized_metric_big_query_view_exporter.add_to_dimension_manifest(data_point,
-                                                                                              fresh_manifest)
-        self.assertEqual(expected, updated_manifest)
-
-    def test_add_to_existing_dimensions(self):
-        data_point = _DATA_POINTS[2]
-        existing_manifest: Dict[str, Set[str]] = {
-            'district': {'4'},
-            'month': {'11'},
-            'supervision_type': {'parole', 'probation'},
-            'year': {'2020'},
-        }
-
-        expected = {
-            'district': {'4', '5'},
-            'month': {'11'},
-            'supervision_type': {'parole', 'probation'},
-            'year': {'2020'},
-        }
-
-        updated_manifest = optimized_metric_big_query_view_exporter.add_to_dimension_manifest(data_point,
-                                                                                              existing_manifest)
-        self.assertEqual(expected, updated_manifest)
-
-    def test_add_data_point_with_empty_values(self):
-        data_point = {
-            'district': None,
-            'month': None,
-            'supervision_type': None,
-            'year': None,
-        }
-
-        existing_manifest: Dict[str, Set[str]] = {
-            'district': {'4'},
-            'month': {'11'},
-            'supervision_type': {'parole', 'probation'},
-            'year': {'2020'},
-        }
-
-        expected: Dict[str, Set[str]] = {
-            'district': {'4', 'none'},
-            'month': {'11', 'none'},
-            'supervision_type': {'parole', 'probation', 'none'},
-            'year': {'2020', 'none'},
-        }
-
-        updated_manifest = optimized_metric_big_query_view_exporter.add_to_dimension_manifest(data_point,
-                                                                                              existing_manifest)
-        self.assertEqual(expected, updated_manifest)
-
-    @staticmethod
-    def test_add_empty_data_point():
-        data_point = {}
-        existing_manifest: Dict[str, Set[str]] = {
-            'district': {'4'},
-            'month': {'11'},
-            'supervision_type': {'parole', 'probation'},
-            'year': {'2020'},
-        }
-
-        with pytest.raises(KeyError):
-            optimized_metric_big_query_view_exporter.add_to_dimension_manifest(data_point, existing_manifest)
-
-
 class TransformManifestTest(unittest.TestCase):
     """Tests for transform_dimension_manifest"""
 
@@ -330,7 +175,6 @@ class ConvertQueryResultsTest(unittest.TestCase):
         mock_query_job = create_autospec(bigquery.QueryJob)
         mock_query_job.result.side_effect = [
             all_rows,
-            all_rows,
         ]
 
         def fake_paged_process_fn(query_job: bigquery.QueryJob,
@@ -367,14 +211,62 @@ class ConvertQueryResultsTest(unittest.TestCase):
 
         mock_query_job.result.assert_has_calls([
             call(max_results=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE, start_index=0),
-            call(max_results=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE, start_index=0),
         ])
 
-        mock_bq_client.paged_read_and_process.assert_called()
+        mock_bq_client.paged_read_and_process.assert_called_once()
         mock_bq_client.dataset_ref_for_id.assert_called()
         mock_bq_client.get_table.assert_called()
 
 
+class ExportTest(unittest.TestCase):
+    """Tests for OptimizedMetricBigQueryViewExporter.export"""
+
+    def setUp(self) -> None:
+        self.metadata_patcher = patch('recidiviz.utils.metadata.project_id')
+        self.mock_project_id_fn = self.metadata_patcher.start()
+        self.mock_project_id_fn.return_value = 'project-id'
+
+        self.storage_patcher = patch('recidiviz.metrics.export.optimized_metric_big_query_view_exporter.storage')
+        self.mock_storage = self.storage_patcher.start()
+
+    def tearDown(self):
+        self.metadata_patcher.stop()
+        self.storage_patcher.stop()
+
+    def test_export_output_paths_in_config_order(self):
+        mock_bq_client = create_autospec(BigQueryClient)
+        mock_validator = create_autospec(OptimizedMetricBigQueryViewExportValidator)
+        view_exporter = OptimizedMetricBigQueryViewExporter(mock_bq_client, mock_validator)
+
+        export_configs = [
+            ExportBigQueryViewConfig(
+                view=MetricBigQueryViewBuilder(
+                    dataset_id='test_dataset',
+                    view_id=f'test_view_{i}',
+                    view_query_template='you know',
+                    dimensions=['district'],
+                ).build(),
+                view_filter_clause='WHERE state_code = \'US_XX\'',
+                intermediate_table_name=f'tubular_{i}',
+                output_directory=GcsfsDirectoryPath.from_absolute_path('gs://gnarly/blob'),
+            )
+            for i in range(10)
+        ]
+
+        with patch.object(view_exporter, 'convert_query_results_to_optimized_value_matrix') as mock_convert:
+            mock_convert.return_value = OptimizedMetricRepresentation(value_matrix=_DATA_VALUES,
+                                                                      dimension_manifest=_DIMENSION_MANIFEST,
+                                                                      value_keys=_VALUE_KEYS)
+            output_paths = view_exporter.export(export_configs)
+
+        self.assertEqual([config.output_path(extension='txt') for config in export_configs], output_paths)
+        self.assertEqual(len(export_configs), mock_bq_client.run_query_async.call_count)
+        self.assertEqual(len(export_configs),
+                         self.mock_storage.Blob.from_string.return_value.upload_from_string.call_count)
+        # Each export thread creates one storage client
+        self.assertLessEqual(self.mock_storage.Client.call_count, MAX_EXPORT_WORKERS)
+
+
 def _transform_dicts_to_bq_row(data_points: List[Dict]) -> List[bigquery.table.Row]:
     rows: List[bigquery.table.Row] = []
     for data_point in data_points:
@@ -97,8 +97,8 @@ class TestBatchPersistence(TestCase):
 
         batch_persistence.write(ii, scrape_key, t)
 
-        batch_ingest_info_list = batch_persistence._get_batch_ingest_info_list(
-            scrape_key.region_code, mock_session.start)
+        batch_ingest_info_list = list(batch_persistence._iter_batch_ingest_infos(
+            scrape_key.region_code, mock_session.start))
 
         self.assertEqual(len(batch_ingest_info_list), 1)
         self.assertEqual(expected_batch, batch_ingest_info_list[0])
@@ -139,9 +139,10 @@ class TestBatchPersistence(TestCase):
         batch_persistence.write(ii, scrape_key, t)
         batch_persistence.write(ii2, scrape_key, t)
 
-        batch_ingest_info_data_list = batch_persistence \
-            ._get_batch_ingest_info_list(scrape_key.region_code,
-                                         mock_session.start)
+        batch_ingest_info_data_list = list(batch_persistence
+                                           ._iter_batch_ingest_infos(
+                                               scrape_key.region_code,
+                                               mock_session.start))
         self.assertEqual(len(batch_ingest_info_data_list), 2)
         self.assertCountEqual(expected_batches, batch_ingest_info_data_list)
 
@@ -165,8 +166,8 @@ class TestBatchPersistence(TestCase):
 
         batch_persistence.write_error(error, TEST_TRACE, t, scrape_key)
 
-        batch_ingest_info_list = batch_persistence._get_batch_ingest_info_list(
-            scrape_key.region_code, mock_session.start)
+        batch_ingest_info_list = list(batch_persistence._iter_batch_ingest_infos(
+            scrape_key.region_code, mock_session.start))
 
         self.assertEqual(len(batch_ingest_info_list), 1)
         self.assertEqual(expected_batch, batch_ingest_info_list[0])
@@ -287,9 +288,10 @@ class TestBatchPersistence(TestCase):
 
         # We should still have both items still on Datastore because they
         # weren't persisted.
-        batch_ingest_info_data_list = batch_persistence \
-            ._get_batch_ingest_info_list(scrape_key.region_code,
-                                         mock_session.start)
+        batch_ingest_info_data_list = list(batch_persistence
+                                           ._iter_batch_ingest_infos(
+                                               scrape_key.region_code,
+                                               mock_session.start))
         self.assertEqual(len(batch_ingest_info_data_list), 2)
 
     @patch(
@@ -443,6 +445,53 @@ class TestBatchPersistence(TestCase):
         result_proto = mock_write.call_args[0][0]
         self.assertEqual(result_proto, expected_proto)
 
+    @patch(
+        "recidiviz.ingest.scrape.sessions.get_current_session")
+    @patch('recidiviz.utils.regions.get_region')
+    @patch('recidiviz.persistence.persistence.write')
+    def test_persist_to_db_merges_people_across_tasks(self, mock_write,
+                                                      _mock_region,
+                                                      mock_session_return):
+        """Tests that people are deduped across the whole session, and people
+        with the same id from different tasks are merged and written
+        together."""
+        mock_session = mock_session_return.return_value = create_mock_session()
+        scrape_key = ScrapeKey(REGIONS[0], constants.ScrapeType.BACKGROUND)
+        mock_write.return_value = True
+
+        ii = IngestInfo()
+        ii.create_person(person_id=TEST_ID, full_name=TEST_NAME) \
+            .create_booking(booking_id=TEST_ID)
+        ii.create_person(person_id=TEST_ID2, full_name=TEST_NAME2)
+        ii_same_person = IngestInfo()
+        ii_same_person.create_person(person_id=TEST_ID, full_name=TEST_NAME) \
+            .create_booking(booking_id=TEST_ID2)
+        ii_dup = copy.deepcopy(ii)
+
+        for i, ingest_info in enumerate([ii, ii_same_person, ii_dup]):
+            batch_persistence.write(ingest_info, scrape_key, Task(
+                task_type=constants.TaskType.SCRAPE_DATA,
+                endpoint=TEST_ENDPOINT + str(i),
+                response_type=constants.ResponseType.TEXT))
+
+        self.assertTrue(batch_persistence.persist_to_database(
+            scrape_key.region_code, mock_session.start))
+
+        mock_write.assert_called_once()
+        result_proto = mock_write.call_args[0][0]
+        self.assertCountEqual([TEST_ID, TEST_ID2],
+                              [person.person_id
+                               for person in result_proto.people])
+        people_by_id = {person.person_id: person
+                        for person in result_proto.people}
+        self.assertCountEqual([TEST_ID, TEST_ID2],
+                              people_by_id[TEST_ID].booking_ids)
+
+        # After we persist, there should no longer be ingest infos on Datastore
+        ingest_infos = datastore_ingest_info.batch_get_ingest_infos_for_region(
+            REGIONS[0], mock_session.start)
+        self.assertEqual(len(ingest_infos), 0)
+
 
 @pytest.mark.usefixtures("client")
 class TestReadAndPersist(TestCase):
@@ -478,3 +527,33 @@ class TestReadAndPersist(TestCase):
                                     url='/release')
         mock_session_update.assert_called_once_with(
             mock_session, scrape_phase.ScrapePhase.RELEASE)
+
+
+class TestDedupPeople(TestCase):
+    """Tests for _dedup_people"""
+
+    def test_dedup_people_ignores_repeated_field_order(self):
+        ii = IngestInfo()
+        booking = ii.create_person(person_id=TEST_ID, full_name=TEST_NAME) \
+            .create_booking(booking_id=TEST_ID)
+        booking.create_charge(charge_id=TEST_ID)
+        booking.create_charge(charge_id=TEST_ID2)
+
+        ii_reordered = IngestInfo()
+        booking = ii_reordered.create_person(
+            person_id=TEST_ID, full_name=TEST_NAME).create_booking(
+                booking_id=TEST_ID)
+        booking.create_charge(charge_id=TEST_ID2)
+        booking.create_charge(charge_id=TEST_ID)
+
+        ii_other = IngestInfo()
+        ii_other.create_person(person_id=TEST_ID2, full_name=TEST_NAME2)
+
+        with self.assertLogs(level='INFO') as logs:
+            result = batch_persistence._dedup_people(
+                [ii, ii_other, ii_reordered, copy.deepcopy(ii_other)])
+
+        expected = IngestInfo(people=ii.people + ii_other.people)
+        expected.sort()
+        self.assertEqual(result, expected)
+        self.assertIn('Removed 2 duplicate people', logs.output[0])
@@ -92,6 +92,48 @@ class TestBQRefreshCloudTaskManager(unittest.TestCase):
         mock_client.return_value.create_task.assert_called_with(
             parent=queue_path, task=task)
 
+    @patch(f'{CLOUD_TASK_MANAGER_PACKAGE_NAME}.uuid')
+    @patch('google.cloud.tasks_v2.CloudTasksClient')
+    @freeze_time('2019-04-12')
+    def test_create_refresh_bq_table_task_full_refresh(
+            self, mock_client: mock.MagicMock, mock_uuid: mock.MagicMock) -> None:
+        # Arrange
+        uuid = 'random-uuid'
+        mock_uuid.uuid4.return_value = uuid
+
+        project_id = 'recidiviz-456'
+        table_name = 'test_table'
+        schema_type = SchemaType.STATE.value
+        queue_path = f'queue_path/{project_id}/{QUEUES_REGION}'
+        task_id = f'test_table-{schema_type}-2019-04-12-random-uuid'
+        task_path = f'{queue_path}/{task_id}'
+
+        body = {
+            'table_name': table_name,
+            'schema_type': schema_type,
+            'full_refresh': True
+        }
+
+        task = tasks_v2.types.task_pb2.Task(
+            name=task_path,
+            app_engine_http_request={
+                'http_method': 'POST',
+                'relative_uri': '/cloud_sql_to_bq/refresh_bq_table',
+                'body': json.dumps(body).encode()
+            }
+        )
+
+        mock_client.return_value.task_path.return_value = task_path
+        mock_client.return_value.queue_path.return_value = queue_path
+
+        # Act
+        BQRefreshCloudTaskManager(project_id=project_id). \
+            create_refresh_bq_table_task(table_name=table_name, schema_type=SchemaType.STATE, full_refresh=True)
+
+        # Assert
+        mock_client.return_value.create_task.assert_called_with(
+            parent=queue_path, task=task)
+
     @patch(f'{CLOUD_TASK_MANAGER_PACKAGE_NAME}.uuid')
     @patch('google.cloud.tasks_v2.CloudTasksClient')
     @freeze_time('2019-04-13')
@@ -17,9 +17,11 @@
 
 """Tests for bq_refresh.py."""
 
+import datetime
 import unittest
 from unittest import mock
 import collections
+from typing import List, Optional
 
 from google.cloud import bigquery
 from google.cloud import exceptions
@@ -41,6 +43,7 @@ class BqLoadTest(unittest.TestCase):
         self.mock_table_id = 'test_table'
         self.mock_table_schema = [SchemaField('my_column', 'STRING', 'NULLABLE', None, ())]
         self.mock_export_uri = 'gs://fake-export-uri'
+        self.mock_schema_version = 'abc123'
         self.mock_dataset = bigquery.dataset.DatasetReference(
             self.mock_project_id, self.mock_dataset_id)
         self.mock_table = self.mock_dataset.table(self.mock_table_id)
@@ -259,3 +262,201 @@ class BqLoadTest(unittest.TestCase):
                                                    self.mock_bq_refresh_config)
             self.mock_bq_client.delete_table.assert_called_with(dataset_id=self.mock_dataset_id,
                                                                 table_id=temp_table_name)
+
+    @mock.patch(f'{BQ_REFRESH_PACKAGE_NAME}.delete_temp_table_if_exists')
+    @mock.patch(f'{BQ_REFRESH_PACKAGE_NAME}.wait_for_table_load')
+    def test_merge_bq_table_from_gcs_export_synchronous(self,
+                                                        mock_wait: mock.MagicMock,
+                                                        mock_delete_temp_table: mock.MagicMock) -> None:
+        """Test that merge_bq_table_from_gcs_export_synchronous loads the incremental export into the temp table,
+            merges the temp table into the BQ table, and then deletes the temp table.
+        """
+        temp_table_name = f'{self.mock_table_id}_temp'
+        mock_wait.return_value = True
+        self.mock_bq_refresh_config.get_dataset_ref.return_value = self.mock_dataset
+        self.mock_bq_refresh_config.get_gcs_export_uri_for_table.return_value = self.mock_export_uri
+        self.mock_bq_refresh_config.get_incremental_bq_schema_for_table.return_value = self.mock_table_schema
+        self.mock_bq_refresh_config.get_incremental_refresh_merge_query.return_value = 'MERGE fake merge query'
+        self.mock_bq_refresh_config.get_incremental_refresh_validation_query.return_value = 'SELECT fake validation'
+        self.mock_bq_client.run_query_async.return_value.result.return_value = [
+            {'source_row_count': 3, 'source_key_checksum': 123,
+             'destination_row_count': 3, 'destination_key_checksum': 123}]
+
+        self.assertTrue(bq_refresh.merge_bq_table_from_gcs_export_synchronous(self.mock_bq_client, self.mock_table_id,
+                                                                              self.mock_bq_refresh_config))
+
+        self.mock_bq_client.load_table_from_cloud_storage_async.assert_called_with(
+            source_uri=self.mock_export_uri,
+            destination_dataset_ref=self.mock_dataset,
+            destination_table_id=temp_table_name,
+            destination_table_schema=self.mock_table_schema)
+        self.mock_bq_refresh_config.get_incremental_refresh_merge_query.assert_called_with(self.mock_table_id,
+                                                                                            temp_table_name)
+        self.mock_bq_client.run_query_async.assert_has_calls([mock.call('MERGE fake merge query'),
+                                                              mock.call('SELECT fake validation')], any_order=True)
+        self.mock_bq_refresh_config.get_incremental_refresh_validation_query.assert_called_with(self.mock_table_id,
+                                                                                                 temp_table_name)
+        mock_delete_temp_table.assert_called_with(self.mock_bq_client, temp_table_name, self.mock_bq_refresh_config)
+        self.mock_bq_client.load_table_from_table_async.assert_not_called()
+
+    @mock.patch(f'{BQ_REFRESH_PACKAGE_NAME}.delete_temp_table_if_exists')
+    @mock.patch(f'{BQ_REFRESH_PACKAGE_NAME}.wait_for_table_load')
+    def test_merge_bq_table_from_gcs_export_synchronous_mismatch(self,
+                                                                 mock_wait: mock.MagicMock,
+                                                                 mock_delete_temp_table: mock.MagicMock) -> None:
+        """Test that merge_bq_table_from_gcs_export_synchronous returns False and deletes the temp table if the BQ
+            table does not match the export after the merge.
+        """
+        temp_table_name = f'{self.mock_table_id}_temp'
+        mock_wait.return_value = True
+        self.mock_bq_client.run_query_async.return_value.result.return_value = [
+            {'source_row_count': 3, 'source_key_checksum': 123,
+             'destination_row_count': 2, 'destination_key_checksum': 456}]
+
+        with self.assertLogs(level='WARNING'):
+            self.assertFalse(bq_refresh.merge_bq_table_from_gcs_export_synchronous(
+                self.mock_bq_client, self.mock_table_id, self.mock_bq_refresh_config))
+        mock_delete_temp_table.assert_called_with(self.mock_bq_client, temp_table_name, self.mock_bq_refresh_config)
+
+    @mock.patch(f'{BQ_REFRESH_PACKAGE_NAME}.delete_temp_table_if_exists')
+    @mock.patch(f'{BQ_REFRESH_PACKAGE_NAME}.wait_for_table_load')
+    def test_merge_bq_table_from_gcs_export_synchronous_merge_fails(self,
+                                                                    mock_wait: mock.MagicMock,
+                                                                    mock_delete_temp_table: mock.MagicMock) -> None:
+        """Test that merge_bq_table_from_gcs_export_synchronous raises a ValueError if the merge fails and does not
+            delete the temp table.
+        """
+        mock_wait.return_value = True
+        self.mock_bq_client.run_query_async.return_value.result.side_effect = exceptions.BadRequest('!')
+
+        with self.assertRaises(ValueError):
+            bq_refresh.merge_bq_table_from_gcs_export_synchronous(self.mock_bq_client, self.mock_table_id,
+                                                                  self.mock_bq_refresh_config)
+        mock_delete_temp_table.assert_not_called()
+
+    @mock.patch(f'{BQ_REFRESH_PACKAGE_NAME}.wait_for_table_load')
+    def test_merge_bq_table_from_gcs_export_synchronous_load_fails(self, mock_wait: mock.MagicMock) -> None:
+        """Test that merge_bq_table_from_gcs_export_synchronous raises a ValueError and does not merge if the load
+            from GCS fails.
+        """
+        mock_wait.return_value = False
+
+        with self.assertRaises(ValueError):
+            bq_refresh.merge_bq_table_from_gcs_export_synchronous(self.mock_bq_client, self.mock_table_id,
+                                                                  self.mock_bq_refresh_config)
+        self.mock_bq_client.run_query_async.assert_not_called()
+
+    def _set_up_incremental_refresh(self,
+                                    watermarks: List[int],
+                                    schema_versions: Optional[List[str]] = None,
+                                    last_full_refresh_time: Optional[datetime.datetime] = None) -> None:
+        self.mock_bq_client.project_id = self.mock_project_id
+        self.mock_bq_refresh_config.dataset_id = self.mock_dataset_id
+        self.mock_bq_refresh_config.supports_incremental_refresh.return_value = True
+        self.mock_bq_refresh_config.get_bq_schema_for_table.return_value = self.mock_table_schema
+        self.mock_bq_client.table_exists.return_value = True
+        self.mock_bq_client.get_table.return_value.schema = self.mock_table_schema
+        if schema_versions is None:
+            schema_versions = [self.mock_schema_version] * len(watermarks)
+        if last_full_refresh_time is None:
+            last_full_refresh_time = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=1)
+        self.mock_bq_client.run_query_async.return_value.result.return_value = [
+            {'watermark': watermark, 'schema_version': schema_version, 'last_full_refresh_time': last_full_refresh_time}
+            for watermark, schema_version in zip(watermarks, schema_versions)]
+
+    def test_get_incremental_refresh_watermark(self) -> None:
+        """Test that get_incremental_refresh_watermark returns the watermark of the refresh before the most recent
+            refresh."""
+        self._set_up_incremental_refresh(watermarks=[20, 10])
+
+        self.assertEqual(10, bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                          self.mock_bq_refresh_config,
+                                                                          self.mock_schema_version))
+
+    def test_get_incremental_refresh_watermark_one_watermark(self) -> None:
+        """Test that get_incremental_refresh_watermark returns None if only one refresh has recorded a watermark."""
+        self._set_up_incremental_refresh(watermarks=[20])
+
+        self.assertIsNone(bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                       self.mock_bq_refresh_config,
+                                                                       self.mock_schema_version))
+
+    def test_get_incremental_refresh_watermark_not_supported(self) -> None:
+        """Test that get_incremental_refresh_watermark returns None if the table does not support incremental
+            refresh."""
+        self._set_up_incremental_refresh(watermarks=[20, 10])
+        self.mock_bq_refresh_config.supports_incremental_refresh.return_value = False
+
+        self.assertIsNone(bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                       self.mock_bq_refresh_config,
+                                                                       self.mock_schema_version))
+        self.mock_bq_client.run_query_async.assert_not_called()
+
+    def test_get_incremental_refresh_watermark_table_doesnt_exist(self) -> None:
+        """Test that get_incremental_refresh_watermark returns None if the BQ table does not exist."""
+        self._set_up_incremental_refresh(watermarks=[20, 10])
+        self.mock_bq_client.table_exists.return_value = False
+
+        self.assertIsNone(bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                       self.mock_bq_refresh_config,
+                                                                       self.mock_schema_version))
+
+    def test_get_incremental_refresh_watermark_schema_changed(self) -> None:
+        """Test that get_incremental_refresh_watermark returns None if the Cloud SQL table has columns that are not in
+            the BQ table."""
+        self._set_up_incremental_refresh(watermarks=[20, 10])
+        self.mock_bq_refresh_config.get_bq_schema_for_table.return_value = \
+            self.mock_table_schema + [SchemaField('new_column', 'STRING', 'NULLABLE', None, ())]
+
+        with self.assertLogs(level='INFO'):
+            self.assertIsNone(bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                           self.mock_bq_refresh_config,
+                                                                           self.mock_schema_version))
+
+    def test_get_incremental_refresh_watermark_schema_version_changed(self) -> None:
+        """Test that get_incremental_refresh_watermark returns None if migrations have run since either of the last
+            two refreshes."""
+        self._set_up_incremental_refresh(watermarks=[20, 10], schema_versions=[self.mock_schema_version, 'old'])
+
+        with self.assertLogs(level='INFO'):
+            self.assertIsNone(bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                           self.mock_bq_refresh_config,
+                                                                           self.mock_schema_version))
+
+    def test_get_incremental_refresh_watermark_no_schema_version(self) -> None:
+        """Test that get_incremental_refresh_watermark returns None if the Cloud SQL schema version is unknown."""
+        self._set_up_incremental_refresh(watermarks=[20, 10], schema_versions=[None, None])
+
+        with self.assertLogs(level='INFO'):
+            self.assertIsNone(bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                           self.mock_bq_refresh_config, None))
+
+    def test_get_incremental_refresh_watermark_full_refresh_due(self) -> None:
+        """Test that get_incremental_refresh_watermark returns None if the last full refresh of the table was more than
+            FULL_REFRESH_INTERVAL ago."""
+        self._set_up_incremental_refresh(
+            watermarks=[20, 10],
+            last_full_refresh_time=datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=8))
+
+        with self.assertLogs(level='INFO'):
+            self.assertIsNone(bq_refresh.get_incremental_refresh_watermark(self.mock_bq_client, self.mock_table_id,
+                                                                           self.mock_bq_refresh_config,
+                                                                           self.mock_schema_version))
+
+    def test_record_refresh_watermark(self) -> None:
+        """Test that record_refresh_watermark streams the watermark into the watermarks table."""
+        self.mock_bq_refresh_config.dataset_id = self.mock_dataset_id
+
+        bq_refresh.record_refresh_watermark(self.mock_bq_client, self.mock_table_id, self.mock_bq_refresh_config, 20,
+                                            is_full_refresh=False, schema_version=self.mock_schema_version)
+
+        self.mock_bq_client.stream_into_table.assert_called_once()
+        dataset_id, table_id, rows = self.mock_bq_client.stream_into_table.call_args[0]
+        self.assertEqual((bq_refresh.BQ_REFRESH_METADATA_DATASET, bq_refresh.BQ_REFRESH_WATERMARKS_TABLE),
+                         (dataset_id, table_id))
+        self.assertEqual(1, len(rows))
+        self.assertEqual(self.mock_dataset_id, rows[0]['dataset_id'])
+        self.assertEqual(self.mock_table_id, rows[0]['table_id'])
+        self.assertEqual(20, rows[0]['watermark'])
+        self.assertEqual(bq_refresh.INCREMENTAL_REFRESH_TYPE, rows[0]['refresh_type'])
+        self.assertEqual(self.mock_schema_version, rows[0]['schema_version'])
@@ -203,6 +203,110 @@ class CloudSqlToBQConfigTest(unittest.TestCase):
             self.assertIsInstance(query_builder, BigQuerySchemaTableRegionFilteredQueryBuilder)
             self.assertEqual(filter_clause, query_builder.filter_clause())
 
+    def test_supports_incremental_refresh(self) -> None:
+        """Assert that tables with history tables, and the history tables themselves, support incremental refresh,
+            and that association tables do not."""
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
+
+        self.assertTrue(config.supports_incremental_refresh('state_person'))
+        self.assertTrue(config.supports_incremental_refresh('state_person_history'))
+        self.assertFalse(config.supports_incremental_refresh(
+            'state_supervision_period_program_assignment_association'))
+
+        for schema_type in self.schema_types:
+            config = CloudSqlToBQConfig.for_schema_type(schema_type)
+            for table in config.get_tables_to_export():
+                if is_association_table(table.name):
+                    self.assertFalse(config.supports_incremental_refresh(table.name))
+
+    def test_get_refresh_watermark_query(self) -> None:
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
+
+        expected_query = 'SELECT COALESCE(MAX(person_history_id), 0) FROM state_person_history'
+        self.assertEqual(expected_query, config.get_refresh_watermark_query('state_person'))
+        self.assertEqual(expected_query, config.get_refresh_watermark_query('state_person_history'))
+
+        with self.assertRaises(ValueError):
+            config.get_refresh_watermark_query('state_supervision_period_program_assignment_association')
+
+    def test_get_incremental_table_export_query(self) -> None:
+        """Assert that the incremental export query selects the key of every row in regions that are not excluded, and
+            the columns of only the rows changed since the watermark."""
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
+        config.region_codes_to_exclude = ['US_ND']
+
+        query = config.get_incremental_table_export_query('state_person', 10)
+
+        self.assertTrue(query.startswith(
+            'SELECT all_rows.person_id AS refresh_key, changed_rows.* '
+            'FROM (SELECT state_person.person_id,state_person.state_code AS state_code FROM state_person '
+            "WHERE state_code NOT IN ('US_ND')) all_rows LEFT JOIN ("))
+        self.assertIn(config.get_table_export_query('state_person'), query)
+        self.assertIn("WHERE state_code NOT IN ('US_ND') AND state_person.person_id IN "
+                      "(SELECT person_id FROM state_person_history WHERE person_history_id > 10)", query)
+        self.assertTrue(query.endswith('changed_rows ON changed_rows.person_id = all_rows.person_id'))
+
+    def test_get_incremental_table_export_query_history_table(self) -> None:
+        """Assert that the incremental export query for a history table is keyed on the history table's primary key,
+            and includes every snapshot of the master rows changed since the watermark."""
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
+        config.region_codes_to_exclude = []
+
+        query = config.get_incremental_table_export_query('state_person_history', 10)
+
+        self.assertTrue(query.startswith('SELECT all_rows.person_history_id AS refresh_key'))
+        self.assertIn("WHERE state_person_history.person_id IN "
+                      "(SELECT person_id FROM state_person_history WHERE person_history_id > 10)", query)
+
+    def test_get_incremental_bq_schema_for_table(self) -> None:
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
+
+        schema = config.get_incremental_bq_schema_for_table('state_person')
+
+        self.assertEqual(['refresh_key'] + [schema_field.name
+                                            for schema_field in config.get_bq_schema_for_table('state_person')],
+                         [schema_field.name for schema_field in schema])
+        for schema_field in schema:
+            self.assertEqual('NULLABLE', schema_field.mode)
+
+    def test_get_incremental_refresh_merge_query(self) -> None:
+        """Assert that the merge query updates and inserts changed rows, and deletes missing rows in regions that are
+            not excluded."""
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
+        config.region_codes_to_exclude = ['US_ND']
+
+        query = config.get_incremental_refresh_merge_query('state_person', 'state_person_temp')
+
+        self.assertIn(f'MERGE `{self.mock_project_id}.{config.dataset_id}.state_person` destination', query)
+        self.assertIn(f'USING `{self.mock_project_id}.{config.dataset_id}.state_person_temp` source', query)
+        self.assertIn('ON destination.person_id = source.refresh_key', query)
+        self.assertIn('WHEN MATCHED AND source.person_id IS NOT NULL THEN', query)
+        self.assertIn('person_id = source.person_id', query)
+        self.assertIn('WHEN NOT MATCHED BY TARGET AND source.person_id IS NOT NULL THEN', query)
+        self.assertIn("WHEN NOT MATCHED BY SOURCE AND destination.state_code NOT IN ('US_ND') THEN", query)
+
+    def test_get_incremental_refresh_validation_query(self) -> None:
+        """Assert that the validation query compares the row count and key checksum of the export with those of the
+            BQ table in regions that are not excluded."""
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.STATE)
+        config.region_codes_to_exclude = ['US_ND']
+
+        query = config.get_incremental_refresh_validation_query('state_person', 'state_person_temp')
+
+        self.assertIn('BIT_XOR(FARM_FINGERPRINT(CAST(refresh_key AS STRING))) AS source_key_checksum', query)
+        self.assertIn(f'FROM `{self.mock_project_id}.{config.dataset_id}.state_person_temp`', query)
+        self.assertIn('BIT_XOR(FARM_FINGERPRINT(CAST(person_id AS STRING))) AS destination_key_checksum', query)
+        self.assertIn(f'FROM `{self.mock_project_id}.{config.dataset_id}.state_person` state_person '
+                      f"WHERE state_code NOT IN ('US_ND')", query)
+
+    def test_get_incremental_refresh_merge_query_no_excluded_regions(self) -> None:
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.JAILS)
+
+        query = config.get_incremental_refresh_merge_query('person', 'person_temp')
+
+        self.assertIn('ON destination.person_id = source.refresh_key', query)
+        self.assertIn('WHEN NOT MATCHED BY SOURCE THEN', query)
+
     @mock.patch('recidiviz.persistence.database.bq_refresh.cloud_sql_to_bq_refresh_config.metadata.project_id',
                 mock.Mock(return_value='a-new-fake-id'))
     def test_incorrect_environment(self) -> None:
@@ -46,6 +46,7 @@ class CloudSqlToBQExportManagerTest(unittest.TestCase):
         self.cloud_sql_to_gcs_export_patcher = mock.patch(
             f'{CLOUD_SQL_BQ_EXPORT_MANAGER_PACKAGE_NAME}.cloud_sql_to_gcs_export')
         self.mock_cloud_sql_to_gcs_export = self.cloud_sql_to_gcs_export_patcher.start()
+        self.mock_cloud_sql_to_gcs_export.fetch_schema_version.return_value = 'abc123'
 
         self.fake_table_name = 'first_table'
 
@@ -69,15 +70,112 @@ class CloudSqlToBQExportManagerTest(unittest.TestCase):
         """Test that export_table_then_load_table passes the client, table, and config
             to bq_refresh.refresh_bq_table_from_gcs_export_synchronous if the export succeeds.
         """
+        self.mock_bq_refresh_config.supports_incremental_refresh.return_value = False
+        self.mock_cloud_sql_to_gcs_export.fetch_refresh_watermark.return_value = None
 
         cloud_sql_to_bq_refresh_manager.export_table_then_load_table(
             self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
 
+        self.mock_cloud_sql_to_gcs_export.fetch_schema_version.assert_not_called()
+        self.mock_bq_refresh.get_incremental_refresh_watermark.assert_not_called()
         self.mock_cloud_sql_to_gcs_export.export_table.assert_called_with(
-            self.fake_table_name, self.mock_bq_refresh_config)
+            self.fake_table_name, self.mock_bq_refresh_config, incremental_watermark=None)
 
         self.mock_bq_refresh.refresh_bq_table_from_gcs_export_synchronous.assert_called_with(
             self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+        self.mock_bq_refresh.merge_bq_table_from_gcs_export_synchronous.assert_not_called()
+        self.mock_bq_refresh.record_refresh_watermark.assert_not_called()
+
+    def test_export_table_then_load_table_records_watermark(self) -> None:
+        """Test that export_table_then_load_table records the watermark fetched before the export after a full
+            refresh of a table that supports incremental refresh.
+        """
+        self.mock_bq_refresh.get_incremental_refresh_watermark.return_value = None
+        self.mock_cloud_sql_to_gcs_export.fetch_refresh_watermark.return_value = 20
+
+        cloud_sql_to_bq_refresh_manager.export_table_then_load_table(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+
+        self.mock_bq_refresh.refresh_bq_table_from_gcs_export_synchronous.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+        self.mock_bq_refresh.record_refresh_watermark.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config, 20,
+            is_full_refresh=True, schema_version='abc123')
+
+    def test_export_table_then_load_table_incremental(self) -> None:
+        """Test that export_table_then_load_table exports the rows changed since the incremental watermark and merges
+            them into the BQ table when there is an incremental watermark.
+        """
+        self.mock_bq_refresh.get_incremental_refresh_watermark.return_value = 10
+        self.mock_cloud_sql_to_gcs_export.fetch_refresh_watermark.return_value = 20
+        self.mock_bq_refresh.merge_bq_table_from_gcs_export_synchronous.return_value = True
+
+        cloud_sql_to_bq_refresh_manager.export_table_then_load_table(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+
+        self.mock_bq_refresh.get_incremental_refresh_watermark.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config, 'abc123')
+        self.mock_cloud_sql_to_gcs_export.export_table.assert_called_once_with(
+            self.fake_table_name, self.mock_bq_refresh_config, incremental_watermark=10)
+        self.mock_bq_refresh.merge_bq_table_from_gcs_export_synchronous.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+        self.mock_bq_refresh.refresh_bq_table_from_gcs_export_synchronous.assert_not_called()
+        self.mock_bq_refresh.record_refresh_watermark.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config, 20,
+            is_full_refresh=False, schema_version='abc123')
+
+    def test_export_table_then_load_table_incremental_mismatch(self) -> None:
+        """Test that export_table_then_load_table falls back to a full refresh if the BQ table does not match the
+            incremental export after the merge.
+        """
+        self.mock_bq_refresh.get_incremental_refresh_watermark.return_value = 10
+        self.mock_cloud_sql_to_gcs_export.fetch_refresh_watermark.return_value = 20
+        self.mock_bq_refresh.merge_bq_table_from_gcs_export_synchronous.return_value = False
+
+        with self.assertLogs(level='WARNING'):
+            cloud_sql_to_bq_refresh_manager.export_table_then_load_table(
+                self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+
+        self.assertEqual([
+            mock.call(self.fake_table_name, self.mock_bq_refresh_config, incremental_watermark=10),
+            mock.call(self.fake_table_name, self.mock_bq_refresh_config, incremental_watermark=None),
+        ], self.mock_cloud_sql_to_gcs_export.export_table.call_args_list)
+        self.mock_bq_refresh.refresh_bq_table_from_gcs_export_synchronous.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+        self.mock_bq_refresh.record_refresh_watermark.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config, 20,
+            is_full_refresh=True, schema_version='abc123')
+
+    def test_export_table_then_load_table_force_full_refresh(self) -> None:
+        """Test that export_table_then_load_table fully refreshes a table that supports incremental refresh when
+            force_full_refresh is set.
+        """
+        self.mock_bq_refresh.get_incremental_refresh_watermark.return_value = 10
+        self.mock_cloud_sql_to_gcs_export.fetch_refresh_watermark.return_value = 20
+
+        cloud_sql_to_bq_refresh_manager.export_table_then_load_table(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config, force_full_refresh=True)
+
+        self.mock_cloud_sql_to_gcs_export.fetch_schema_version.assert_not_called()
+        self.mock_bq_refresh.get_incremental_refresh_watermark.assert_not_called()
+        self.mock_cloud_sql_to_gcs_export.export_table.assert_called_once_with(
+            self.fake_table_name, self.mock_bq_refresh_config, incremental_watermark=None)
+        self.mock_bq_refresh.merge_bq_table_from_gcs_export_synchronous.assert_not_called()
+        self.mock_bq_refresh.record_refresh_watermark.assert_called_with(
+            self.mock_client, self.fake_table_name, self.mock_bq_refresh_config, 20,
+            is_full_refresh=True, schema_version=None)
+
+    def test_export_table_then_load_table_merge_fails(self) -> None:
+        """Test that export_table_then_load_table does not record a watermark if the merge fails."""
+        self.mock_bq_refresh.get_incremental_refresh_watermark.return_value = 10
+        self.mock_cloud_sql_to_gcs_export.fetch_refresh_watermark.return_value = 20
+        self.mock_bq_refresh.merge_bq_table_from_gcs_export_synchronous.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            cloud_sql_to_bq_refresh_manager.export_table_then_load_table(
+                self.mock_client, self.fake_table_name, self.mock_bq_refresh_config)
+
+        self.mock_bq_refresh.record_refresh_watermark.assert_not_called()
 
     def test_export_table_then_load_table_export_fails(self) -> None:
         """Test that export_table_then_load_table does not pass args to load the table
@@ -114,7 +212,31 @@ class CloudSqlToBQExportManagerTest(unittest.TestCase):
         assert response.status_code == HTTPStatus.OK
         mock_export.assert_called_with(self.mock_client,
                                        table,
-                                       self.mock_bq_refresh_config)
+                                       self.mock_bq_refresh_config,
+                                       force_full_refresh=False)
+
+    @mock.patch('recidiviz.utils.metadata.project_id', Mock(return_value='test-project'))
+    @mock.patch('recidiviz.utils.metadata.project_number', Mock(return_value='123456789'))
+    @mock.patch(f'{CLOUD_SQL_BQ_EXPORT_MANAGER_PACKAGE_NAME}.export_table_then_load_table')
+    def test_refresh_bq_table_full_refresh(self, mock_export: mock.MagicMock) -> None:
+        """Tests that the export is forced to be a full refresh when the
+        /cloud_sql_to_bq/refresh_bq_table endpoint is hit with full_refresh set."""
+        self.mock_bq_refresh_config.for_schema_type.return_value = self.mock_bq_refresh_config
+
+        table = 'fake_table'
+        route = '/refresh_bq_table'
+        data = {"table_name": table, "schema_type": SchemaType.STATE.value, "full_refresh": True}
+
+        response = self.mock_flask_client.post(
+            route,
+            data=json.dumps(data),
+            content_type='application/json',
+            headers={'X-Appengine-Inbound-Appid': 'test-project'})
+        assert response.status_code == HTTPStatus.OK
+        mock_export.assert_called_with(self.mock_client,
+                                       table,
+                                       self.mock_bq_refresh_config,
+                                       force_full_refresh=True)
 
     @mock.patch('recidiviz.utils.metadata.project_id', Mock(return_value='test-project'))
     @mock.patch('recidiviz.utils.metadata.project_number', Mock(return_value='123456789'))
@@ -22,6 +22,7 @@ import unittest
 from unittest import mock
 
 import googleapiclient.errors
+from sqlalchemy.exc import ProgrammingError
 
 from recidiviz.persistence.database.bq_refresh import cloud_sql_to_gcs_export
 from recidiviz.persistence.database.sqlalchemy_engine_manager import SchemaType
@@ -209,6 +210,69 @@ class CloudSqlToGcsExportTest(unittest.TestCase):
             )
             mock_wait.assert_called()
 
+    @mock.patch(f'{CLOUD_SQL_TO_GCS_EXPORT_PACKAGE_NAME}.wait_until_operation_finished')
+    def test_export_table_incremental(self, mock_wait: mock.MagicMock) -> None:
+        """Test that create_export_context is called with the incremental export query when given an incremental
+        watermark.
+        """
+        incremental_query = 'SELECT NULL AS refresh_key LIMIT 0'
+        self.mock_bq_refresh_config.get_incremental_table_export_query.return_value = incremental_query
+        with mock.patch(f'{CLOUD_SQL_TO_GCS_EXPORT_PACKAGE_NAME}.create_export_context') as mock_export_context:
+            cloud_sql_to_gcs_export.export_table(self.mock_table_id, self.mock_bq_refresh_config,
+                                                 incremental_watermark=10)
+            self.mock_bq_refresh_config.get_incremental_table_export_query.assert_called_with(self.mock_table_id, 10)
+            mock_export_context.assert_called_with(
+                self.schema_type,
+                self.mock_export_uri,
+                incremental_query
+            )
+            mock_wait.assert_called()
+
+    @mock.patch(f'{CLOUD_SQL_TO_GCS_EXPORT_PACKAGE_NAME}.SessionFactory')
+    def test_fetch_refresh_watermark(self, mock_session_factory: mock.MagicMock) -> None:
+        """Test that fetch_refresh_watermark runs the watermark query and closes the session."""
+        self.mock_bq_refresh_config.supports_incremental_refresh.return_value = True
+        self.mock_bq_refresh_config.get_refresh_watermark_query.return_value = 'SELECT 20'
+        mock_session = mock_session_factory.for_schema_base.return_value
+        mock_session.execute.return_value.scalar.return_value = 20
+
+        self.assertEqual(20, cloud_sql_to_gcs_export.fetch_refresh_watermark(self.mock_table_id,
+                                                                             self.mock_bq_refresh_config))
+        mock_session.execute.assert_called_with('SELECT 20')
+        mock_session.close.assert_called()
+
+    @mock.patch(f'{CLOUD_SQL_TO_GCS_EXPORT_PACKAGE_NAME}.SessionFactory')
+    def test_fetch_schema_version(self, mock_session_factory: mock.MagicMock) -> None:
+        """Test that fetch_schema_version returns the Alembic revision of the database and closes the session."""
+        mock_session = mock_session_factory.for_schema_base.return_value
+        mock_session.execute.return_value.scalar.return_value = 'abc123'
+
+        self.assertEqual('abc123', cloud_sql_to_gcs_export.fetch_schema_version(self.mock_bq_refresh_config))
+        mock_session.execute.assert_called_with('SELECT version_num FROM alembic_version')
+        mock_session.close.assert_called()
+
+    @mock.patch(f'{CLOUD_SQL_TO_GCS_EXPORT_PACKAGE_NAME}.SessionFactory')
+    def test_fetch_schema_version_untracked(self, mock_session_factory: mock.MagicMock) -> None:
+        """Test that fetch_schema_version returns None and closes the session if the database has no alembic_version
+        table."""
+        mock_session = mock_session_factory.for_schema_base.return_value
+        mock_session.execute.side_effect = ProgrammingError(
+            'SELECT version_num FROM alembic_version', {}, Exception('relation "alembic_version" does not exist'))
+
+        with self.assertLogs(level='WARNING'):
+            self.assertIsNone(cloud_sql_to_gcs_export.fetch_schema_version(self.mock_bq_refresh_config))
+        mock_session.close.assert_called()
+
+    @mock.patch(f'{CLOUD_SQL_TO_GCS_EXPORT_PACKAGE_NAME}.SessionFactory')
+    def test_fetch_refresh_watermark_not_supported(self, mock_session_factory: mock.MagicMock) -> None:
+        """Test that fetch_refresh_watermark returns None without querying for tables that do not support incremental
+        refresh."""
+        self.mock_bq_refresh_config.supports_incremental_refresh.return_value = False
+
+        self.assertIsNone(cloud_sql_to_gcs_export.fetch_refresh_watermark(self.mock_table_id,
+                                                                          self.mock_bq_refresh_config))
+        mock_session_factory.for_schema_base.assert_not_called()
+
     @mock.patch(f'{CLOUD_SQL_TO_GCS_EXPORT_PACKAGE_NAME}.wait_until_operation_finished')
     def test_export_table_api_fail(self, mock_wait: mock.MagicMock) -> None:
         """Test that export_table fails if the export API request fails."""
@@ -17,11 +17,17 @@
 """Tests for StateHistoricalSnapshotUpdater"""
 
 import datetime
-from typing import Optional
+import logging
+import time
+from typing import List, Optional
 
 from more_itertools import one
+from sqlalchemy import event
 
-from recidiviz.common.ingest_metadata import SystemLevel
+from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
+from recidiviz.persistence.database.history.historical_snapshot_update import \
+    update_historical_snapshots
+from recidiviz.persistence.database.session import Session
 from recidiviz.persistence.database.session_factory import SessionFactory
 from recidiviz.persistence.database.schema.state import schema as state_schema
 from recidiviz.persistence.database.base_schema import StateBase
@@ -88,3 +94,99 @@ class TestStateHistoricalSnapshotUpdater(BaseHistoricalSnapshotUpdaterTest):
         self._assert_expected_snapshots_for_schema_object(sentence_group,
                                                           [ingest_time_1])
         assert_session.close()
+
+    def testSnapshotUpdateStatementCountIndependentOfBatchSize(self):
+        """Benchmarks snapshot updates over batches of synthetic person trees,
+        first when every entity is new and then when every entity already has
+        a snapshot that must be closed. The number of statements issued against
+        history tables depends only on the number of entity types, not on the
+        number of entities in the batch."""
+        ingest_time_1 = datetime.datetime(2018, 7, 30)
+        ingest_time_2 = datetime.datetime(2018, 7, 31)
+
+        new_entity_statement_counts: List[int] = []
+        existing_entity_statement_counts: List[int] = []
+        for num_people in (10, 500):
+            session = SessionFactory.for_schema_base(StateBase)
+            people = [_generate_synthetic_person_tree(num_assessments=5)
+                      for _ in range(num_people)]
+            session.add_all(people)
+            session.flush()
+
+            new_entity_statement_counts.append(
+                _count_history_statements_for_update(
+                    session, people, ingest_time_1))
+
+            for person in people:
+                for assessment in person.assessments:
+                    assessment.assessment_score += 100
+            session.flush()
+
+            existing_entity_statement_counts.append(
+                _count_history_statements_for_update(
+                    session, people, ingest_time_2))
+
+            session.commit()
+            session.close()
+
+        self.assertEqual(new_entity_statement_counts[0],
+                         new_entity_statement_counts[1])
+        self.assertEqual(existing_entity_statement_counts[0],
+                         existing_entity_statement_counts[1])
+
+        assert_session = SessionFactory.for_schema_base(StateBase)
+        self.assertEqual(
+            510,
+            assert_session.query(state_schema.StatePersonHistory).count())
+        self.assertEqual(
+            5100,
+            assert_session.query(state_schema.StateAssessmentHistory).count())
+        closed_snapshots = assert_session.query(
+            state_schema.StateAssessmentHistory).filter(
+                state_schema.StateAssessmentHistory.valid_to.isnot(None)).all()
+        self.assertEqual(2550, len(closed_snapshots))
+        self.assertEqual({ingest_time_2},
+                         {snapshot.valid_to for snapshot in closed_snapshots})
+        assert_session.close()
+
+
+def _count_history_statements_for_update(
+        session: Session,
+        people: List[state_schema.StatePerson],
+        ingest_time: datetime.datetime) -> int:
+    """Updates the historical snapshots for |people| and returns the number of
+    statements issued against history tables."""
+    metadata = IngestMetadata(region='somewhere',
+                              jurisdiction_id='12345',
+                              ingest_time=ingest_time,
+                              system_level=SystemLevel.STATE)
+    history_statements: List[str] = []
+
+    def _record_history_statement(_conn, _cursor, statement, *_args):
+        if '_history' in statement:
+            history_statements.append(statement)
+
+    connection = session.connection()
+    event.listen(connection, 'before_cursor_execute',
+                 _record_history_statement)
+
+    start = time.perf_counter()
+    update_historical_snapshots(session, people, [], metadata)
+    logging.info("Updated snapshots for %s person trees in %.3f seconds with "
+                 "%s history table statements",
+                 len(people), time.perf_counter() - start,
+                 len(history_statements))
+
+    event.remove(connection, 'before_cursor_execute',
+                 _record_history_statement)
+    return len(history_statements)
+
+
+def _generate_synthetic_person_tree(
+        num_assessments: int) -> state_schema.StatePerson:
+    person = state_schema.StatePerson(state_code='US_XX', full_name='name')
+    person.assessments = [
+        state_schema.StateAssessment(state_code='US_XX',
+                                     assessment_score=score)
+        for score in range(num_assessments)]
+    return person
@@ -0,0 +1,69 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ============================================================================
+"""Tests for query_counter.py."""
+import unittest
+
+from sqlalchemy import create_engine, event
+
+from recidiviz.persistence.database.query_counter import SessionQueryCounter
+from recidiviz.persistence.database.session import Session
+
+
+class TestSessionQueryCounter(unittest.TestCase):
+    """Tests for SessionQueryCounter."""
+
+    def setUp(self) -> None:
+        self.engine = create_engine('sqlite://')
+
+    def test_countsAcrossTransactions(self):
+        session = Session(bind=self.engine)
+
+        with SessionQueryCounter(session) as query_counter:
+            session.execute('SELECT 1')
+            session.commit()
+            session.execute('SELECT 2')
+            session.execute('SELECT 3')
+
+        self.assertEqual(3, query_counter.query_count)
+        session.close()
+
+    def test_doesNotBeginTransaction(self):
+        session = Session(bind=self.engine)
+        begun_transactions = []
+        event.listen(session, 'after_begin', lambda *args: begun_transactions.append(args))
+
+        with SessionQueryCounter(session):
+            pass
+
+        self.assertEqual([], begun_transactions)
+        session.close()
+
+    def test_close_stopsCountingAndRemovesListeners(self):
+        session = Session(bind=self.engine)
+        query_counter = SessionQueryCounter(session)
+        session.execute('SELECT 1')
+        connection = session.connection()
+
+        query_counter.close()
+        session.execute('SELECT 2')
+        session.commit()
+        session.execute('SELECT 3')
+
+        self.assertEqual(1, query_counter.query_count)
+        self.assertFalse(session.dispatch.after_begin)
+        self.assertFalse(connection.dispatch.before_cursor_execute)
+        session.close()
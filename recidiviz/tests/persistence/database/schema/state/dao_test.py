@@ -21,8 +21,13 @@ import datetime
 from typing import Optional
 from unittest import TestCase
 
+from more_itertools import one
+
 from recidiviz.common.constants.state import external_id_types
 from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
+from recidiviz.common.constants.state.state_supervision_period import \
+    StateSupervisionPeriodStatus
+from recidiviz.persistence.database.query_counter import SessionQueryCounter
 from recidiviz.persistence.database.session_factory import SessionFactory
 from recidiviz.persistence.database.base_schema import StateBase
 from recidiviz.persistence.entity.state import entities
@@ -545,3 +550,49 @@ class TestDao(TestCase):
 
         # Assert
         self.assertEqual(external_ids, [_EXTERNAL_ID])
+
+    def test_readPeopleByRootExternalIds_entireTreeLoadedEagerly(self) -> None:
+        # Arrange
+        person = schema.StatePerson(person_id=1, state_code=_STATE_CODE)
+        person.external_ids = [schema.StatePersonExternalId(
+            person_external_id_id=1,
+            external_id=_EXTERNAL_ID,
+            id_type=external_id_types.US_ND_SID,
+            state_code=_STATE_CODE,
+            person=person)]
+        supervision_violation_response = schema.StateSupervisionViolationResponse(
+            supervision_violation_response_id=1, state_code=_STATE_CODE, person=person)
+        supervision_violation = schema.StateSupervisionViolation(
+            supervision_violation_id=1, state_code=_STATE_CODE, person=person,
+            supervision_violation_responses=[supervision_violation_response])
+        supervision_period = schema.StateSupervisionPeriod(
+            supervision_period_id=1, status=StateSupervisionPeriodStatus.PRESENT_WITHOUT_INFO.value,
+            state_code=_STATE_CODE, person=person, supervision_violation_entries=[supervision_violation])
+        supervision_sentence = schema.StateSupervisionSentence(
+            supervision_sentence_id=1, status=StateSentenceStatus.PRESENT_WITHOUT_INFO.value,
+            state_code=_STATE_CODE, person=person, supervision_periods=[supervision_period])
+        person.sentence_groups = [schema.StateSentenceGroup(
+            sentence_group_id=1, status=StateSentenceStatus.PRESENT_WITHOUT_INFO.value,
+            state_code=_STATE_CODE, person=person, supervision_sentences=[supervision_sentence])]
+
+        session = SessionFactory.for_schema_base(StateBase)
+        session.add(person)
+        session.commit()
+        session.close()
+
+        read_session = SessionFactory.for_schema_base(StateBase)
+
+        # Act
+        with SessionQueryCounter(read_session) as query_counter:
+            people = dao.read_people_by_cls_external_ids(
+                read_session, _STATE_CODE, schema.StatePerson, [_EXTERNAL_ID])
+            queries_after_read = query_counter.query_count
+            read_period = one(one(one(people).sentence_groups).supervision_sentences).supervision_periods[0]
+            read_response = one(one(read_period.supervision_violation_entries).supervision_violation_responses)
+            read_sentence = one(read_period.supervision_sentences)
+            queries_after_traversal = query_counter.query_count
+
+        # Assert
+        self.assertEqual(1, read_response.supervision_violation_response_id)
+        self.assertEqual(1, read_sentence.supervision_sentence_id)
+        self.assertEqual(queries_after_read, queries_after_traversal)
@@ -95,6 +95,37 @@ class TestDatastoreIngestInfo(unittest.TestCase):
         datastore_ingest_info.batch_delete_ingest_infos_for_region(
             'us_state_county')
 
+    def test_iter_ingest_infos_for_region(self):
+        task_hash = hash(json.dumps(
+            Task(task_type=constants.TaskType.SCRAPE_DATA,
+                 endpoint=TEST_ENDPOINT,
+                 response_type=constants.ResponseType.TEXT).to_serializable(),
+            sort_keys=True))
+
+        start_time = datetime.now()
+        for number in ['1', '2', '3']:
+            datastore_ingest_info \
+                .write_ingest_info(region='us_state_county',
+                                   session_start_time=start_time,
+                                   ingest_info=sample_ingest_info(number),
+                                   task_hash=task_hash)
+        datastore_ingest_info \
+            .write_ingest_info(region='unrelated',
+                               session_start_time=start_time,
+                               ingest_info=sample_ingest_info('n/a'),
+                               task_hash=task_hash)
+
+        results = list(datastore_ingest_info.iter_ingest_infos_for_region(
+            'us_state_county', start_time, page_size=2))
+
+        assert results == datastore_ingest_info \
+            .batch_get_ingest_infos_for_region('us_state_county', start_time)
+        assert len(results) == 3
+        datastore_ingest_info.batch_delete_ingest_infos_for_region(
+            'us_state_county')
+        datastore_ingest_info.batch_delete_ingest_infos_for_region(
+            'unrelated')
+
     def test_batch_delete_ingest_infos_for_region(self):
         task_hash = hash(json.dumps(
             Task(task_type=constants.TaskType.SCRAPE_DATA,
@@ -101,7 +101,8 @@ class FakeStateMatchingDelegate(BaseStateMatchingDelegate):
 
     def read_potential_match_db_persons(
             self, session: Session, ingested_persons: List[schema.StatePerson]) -> List[schema.StatePerson]:
-        return state_matching_utils.read_persons(session, self.region_code, ingested_persons)
+        return state_matching_utils.read_persons_by_root_entity_cls(
+            session, self.region_code, ingested_persons, allowed_root_entity_classes=None)
 
 
 class TestStateEntityMatching(BaseStateEntityMatcherTest):
@@ -38,7 +38,7 @@ from recidiviz.persistence.entity_matching.state.state_matching_utils import \
     nonnull_fields_entity_match, get_external_ids_of_cls, \
     get_all_entity_trees_of_cls, default_merge_flat_fields, \
     read_persons_by_root_entity_cls, read_db_entity_trees_of_cls_to_merge, \
-    read_persons
+    get_match_key, EntityTreeIndex
 from recidiviz.persistence.entity.entity_utils import is_placeholder
 
 from recidiviz.persistence.entity_matching.entity_matching_types import \
@@ -157,6 +157,52 @@ class TestStateMatchingUtils(BaseStateMatchingUtilsTest):
         self.assertFalse(
             _is_match(ingested_entity=charge, db_entity=charge_another))
 
+    def test_getMatchKey_consistentWithIsMatch(self):
+        charge = schema.StateCharge(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID, description='description')
+        charge_same_id = schema.StateCharge(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID, description='description_another')
+        charge_other_id = schema.StateCharge(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID_2, description='description')
+        charge_other_state = schema.StateCharge(
+            state_code=_STATE_CODE_ANOTHER, external_id=_EXTERNAL_ID, description='description')
+
+        self.assertEqual(get_match_key(charge), get_match_key(charge_same_id))
+        self.assertNotEqual(get_match_key(charge), get_match_key(charge_other_id))
+        self.assertNotEqual(get_match_key(charge), get_match_key(charge_other_state))
+
+    def test_getMatchKey_entriesUseFlatFields(self):
+        entry = schema.StateSupervisionViolationTypeEntry(
+            state_code=_STATE_CODE, violation_type='TECHNICAL', violation_type_raw_text='T')
+        entry_same = schema.StateSupervisionViolationTypeEntry(
+            supervision_violation_type_entry_id=_ID, state_code=_STATE_CODE,
+            violation_type='TECHNICAL', violation_type_raw_text='T')
+        entry_different = schema.StateSupervisionViolationTypeEntry(
+            state_code=_STATE_CODE, violation_type='TECHNICAL', violation_type_raw_text='TECH')
+
+        self.assertTrue(_is_match(ingested_entity=entry, db_entity=entry_same))
+        self.assertEqual(get_match_key(entry), get_match_key(entry_same))
+        self.assertFalse(_is_match(ingested_entity=entry, db_entity=entry_different))
+        self.assertNotEqual(get_match_key(entry), get_match_key(entry_different))
+
+    def test_getMatchKey_personNotKeyed(self):
+        self.assertIsNone(get_match_key(schema.StatePerson(state_code=_STATE_CODE)))
+
+    def test_entityTreeIndex_getMatchCandidates(self):
+        charge = schema.StateCharge(state_code=_STATE_CODE, external_id=_EXTERNAL_ID)
+        charge_2 = schema.StateCharge(state_code=_STATE_CODE, external_id=_EXTERNAL_ID_2)
+        charge_dup = schema.StateCharge(state_code=_STATE_CODE, external_id=_EXTERNAL_ID)
+        db_trees = [EntityTree(entity=c, ancestor_chain=[]) for c in [charge, charge_2, charge_dup]]
+
+        index = EntityTreeIndex(db_trees)
+        ingested_charge = schema.StateCharge(state_code=_STATE_CODE, external_id=_EXTERNAL_ID)
+
+        candidates = index.get_match_candidates(EntityTree(entity=ingested_charge, ancestor_chain=[]))
+        self.assertEqual([charge, charge_dup], [tree.entity for tree in candidates])
+
+        ingested_charge.external_id = _EXTERNAL_ID_3
+        self.assertEqual([], index.get_match_candidates(EntityTree(entity=ingested_charge, ancestor_chain=[])))
+
     def test_mergeFlatFields_twoDbEntities(self):
         to_entity = schema.StateSentenceGroup(
             sentence_group_id=_ID, county_code='county_code',
@@ -440,18 +486,6 @@ class TestStateMatchingUtils(BaseStateMatchingUtilsTest):
                 ingested_entity=EntityTree(entity=charge, ancestor_chain=[]),
                 db_entity=EntityTree(entity=charge_another, ancestor_chain=[])))
 
-    def test_readPersons_default(self):
-        schema_person = schema.StatePerson(person_id=1, state_code=_STATE_CODE)
-        schema_person_2 = schema.StatePerson(person_id=2, state_code=_STATE_CODE)
-        session = SessionFactory.for_schema_base(StateBase)
-        session.add(schema_person)
-        session.add(schema_person_2)
-        session.commit()
-
-        expected_people = [schema_person, schema_person_2]
-        people = read_persons(session, _STATE_CODE, [])
-        self.assert_schema_object_lists_equal(expected_people, people)
-
     def test_isPlaceholder(self):
         entity = schema.StateSentenceGroup(
             status=StateSentenceStatus.PRESENT_WITHOUT_INFO.value,
@@ -486,3 +486,49 @@ class TestIngestInfoCountyConverter(unittest.TestCase):
         # Act + Assert
         with self.assertRaises(ValueError):
             self._convert_and_throw_on_errors(ingest_info, metadata)
+
+    def testConvert_DoesNotModifyIngestInfo(self):
+        # Arrange
+        metadata = IngestMetadata.new_with_defaults(
+            ingest_time=_INGEST_TIME)
+
+        ingest_info = IngestInfo()
+        ingest_info.people.add(person_id='PERSON_ID1',
+                               booking_ids=['BOOKING_ID'])
+        ingest_info.people.add(person_id='PERSON_ID2')
+        ingest_info.bookings.add(booking_id='BOOKING_ID')
+        expected_ingest_info = IngestInfo()
+        expected_ingest_info.CopyFrom(ingest_info)
+
+        # Act
+        result = self._convert_and_throw_on_errors(ingest_info, metadata)
+
+        # Assert
+        self.assertEqual(2, len(result))
+        self.assertEqual(expected_ingest_info, ingest_info)
+
+    def testConvertAndValidate_DropsInvalidPeople(self):
+        # Arrange
+        metadata = IngestMetadata.new_with_defaults(
+            ingest_time=_INGEST_TIME)
+
+        ingest_info = IngestInfo()
+        ingest_info.people.add(person_id='PERSON_ID1',
+                               booking_ids=['BOOKING_ID1'])
+        ingest_info.people.add(person_id='PERSON_ID2',
+                               booking_ids=['BOOKING_ID2'])
+        ingest_info.bookings.add(booking_id='BOOKING_ID1',
+                                 admission_date='3/14/2020',
+                                 release_date='3/10/2020')
+        ingest_info.bookings.add(booking_id='BOOKING_ID2',
+                                 admission_date='3/14/2020')
+
+        # Act
+        conversion_result, data_validation_errors = \
+            ingest_info_converter.convert_and_validate_to_persistence_entities(
+                ingest_info, metadata)
+
+        # Assert
+        self.assertEqual(['PERSON_ID2'],
+                         [p.external_id for p in conversion_result.people])
+        self.assertEqual(1, data_validation_errors)
@@ -287,11 +287,11 @@ class TestPersistence(TestCase):
         # Assert
         assert not result
 
-    @patch('recidiviz.persistence.ingest_info_converter.ingest_info_converter.convert_to_persistence_entities')
-    @patch('recidiviz.persistence.entity_validator.entity_validator.validate')
+    @patch('recidiviz.persistence.ingest_info_converter.ingest_info_converter.'
+           'convert_and_validate_to_persistence_entities')
     @patch('recidiviz.persistence.persistence.SYSTEM_TYPE_TO_ERROR_THRESHOLD',
            ERROR_THRESHOLDS_WITH_FORTY_PERCENT_RATIOS)
-    def test_enum_error_threshold_should_abort_persistsNone(self, validator, entity_converter):
+    def test_enum_error_threshold_should_abort_persistsNone(self, entity_converter):
         # Arrange
         ingest_info = IngestInfoProto()
         ingest_info.people.add(full_name=FULL_NAME_2)
@@ -301,8 +301,7 @@ class TestPersistence(TestCase):
         entity_converter.return_value = IngestInfoConversionResult(enum_parsing_errors=1,
                                                                    general_parsing_errors=0,
                                                                    protected_class_errors=0,
-                                                                   people=ingest_info.people)
-        validator.return_value = ingest_info.people, 0
+                                                                   people=ingest_info.people), 0
 
         # Act
         self.assertFalse(persistence.write(ingest_info, DEFAULT_METADATA))
@@ -53,6 +53,15 @@ Examples:
     python -m recidiviz.tools.run_calculation_pipelines.py --pipeline incarceration --job_name incarceration-example \
     --region us-central1 --include_race False --save_as_template --calculation_month_count 36
 
+To read and group the state entities once and share them between several pipelines, first run the entity_hydration
+pipeline and then pass the same path prefix to each calculation pipeline:
+
+    python -m recidiviz.tools.run_calculation_pipelines.py --pipeline entity_hydration --job_name hydration-example \
+    --state_code US_XX --hydrated_entities_output gs://bucket/hydrated_entities/US_XX/run
+
+    python -m recidiviz.tools.run_calculation_pipelines.py --pipeline supervision --job_name supervision-example \
+    --state_code US_XX --hydrated_entities_input gs://bucket/hydrated_entities/US_XX/run
+
 You must also include any arguments required by the given pipeline.
 """
 from __future__ import absolute_import
@@ -61,6 +70,8 @@ import logging
 import sys
 import argparse
 
+from recidiviz.calculator.pipeline.entity_hydration import \
+    pipeline as entity_hydration_pipeline
 from recidiviz.calculator.pipeline.incarceration import \
     pipeline as incarceration_pipeline
 from recidiviz.calculator.pipeline.program import \
@@ -75,7 +86,8 @@ PIPELINE_MODULES = {
     'incarceration': incarceration_pipeline,
     'recidivism': recidivism_pipeline,
     'supervision': supervision_pipeline,
-    'program': program_pipeline
+    'program': program_pipeline,
+    'entity_hydration': entity_hydration_pipeline
 }
 
 
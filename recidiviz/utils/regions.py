@@ -69,6 +69,8 @@ class Region:
         environment: (string) The environment the region is allowed to run in.
         base_url: (string) Base URL for scraping
         should_proxy: (string) Whether or not to send requests through the proxy
+        max_requests_per_second: (float) Optional limit on the rate at which
+            scrapers in a single process send requests to this region
         timezone: (string) Timezone in which this region resides. If the region
             is in multiple timezones, this is the timezone in which most of the
             region resides, where "most" is whatever is most useful for that
@@ -100,6 +102,7 @@ class Region:
                 converter=RemovedFromWebsite)
     names_file: Optional[str] = attr.ib(default=None)
     should_proxy: Optional[bool] = attr.ib(default=False)
+    max_requests_per_second: Optional[float] = attr.ib(default=None)
     is_stoppable: Optional[bool] = attr.ib(default=False)
     is_direct_ingest: Optional[bool] = attr.ib(default=False)
     stripe: Optional[str] = attr.ib(default="0")